@@ -26,9 +26,22 @@ from .rss_tags_db_cli import (
 from .rss_scrape_job_database_client import (
     create_rss_scrape_job,
     get_rss_scrape_job_status_read,
-    list_rss_feed_scrape_payloads,
+    insert_rss_scrape_job_feeds_async,
+    list_rss_feed_scrape_payloads_async,
+    list_rss_fetch_latency_reads,
     list_rss_scrape_job_feed_reads,
-    set_rss_scrape_job_status,
+)
+from .rss_feed_schedule_db_cli import (
+    claim_due_rss_feed_ids_async,
+    lease_rss_feed_next_fetch_async,
+)
+from .rss_scrape_job_outbox_db_cli import (
+    claim_pending_rss_scrape_job_outbox_async,
+    insert_rss_scrape_job_outbox_async,
+    mark_rss_scrape_job_outbox_sent_async,
+    mark_rss_scrape_jobs_failed_async,
+    purge_sent_rss_scrape_job_outbox_async,
+    reschedule_rss_scrape_job_outbox,
 )
 
 __all__ = [
@@ -52,7 +65,18 @@ __all__ = [
     # Scrape jobs
     "create_rss_scrape_job",
     "get_rss_scrape_job_status_read",
-    "list_rss_feed_scrape_payloads",
+    "insert_rss_scrape_job_feeds_async",
+    "list_rss_feed_scrape_payloads_async",
+    "list_rss_fetch_latency_reads",
     "list_rss_scrape_job_feed_reads",
-    "set_rss_scrape_job_status",
+    # Feed fetch schedule
+    "claim_due_rss_feed_ids_async",
+    "lease_rss_feed_next_fetch_async",
+    # Scrape job outbox
+    "claim_pending_rss_scrape_job_outbox_async",
+    "insert_rss_scrape_job_outbox_async",
+    "mark_rss_scrape_job_outbox_sent_async",
+    "mark_rss_scrape_jobs_failed_async",
+    "purge_sent_rss_scrape_job_outbox_async",
+    "reschedule_rss_scrape_job_outbox",
 ]
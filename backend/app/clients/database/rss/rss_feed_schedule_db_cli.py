@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rss import RssFeed, RssFeedScraping
+
+from .rss_scrape_job_database_client import build_pending_job_feed_exists
+
+
+async def claim_due_rss_feed_ids_async(
+    db: AsyncSession,
+    *,
+    limit: int,
+) -> list[int]:
+    query = (
+        select(RssFeed.id)
+        .outerjoin(RssFeedScraping, RssFeedScraping.feed_id == RssFeed.id)
+        .where(
+            RssFeed.enabled.is_(True),
+            or_(
+                RssFeedScraping.next_fetch_at.is_(None),
+                RssFeedScraping.next_fetch_at <= func.now(),
+            ),
+            or_(
+                RssFeedScraping.fresh_until.is_(None),
+                RssFeedScraping.fresh_until <= func.now(),
+            ),
+            ~build_pending_job_feed_exists(ingest=True),
+        )
+        .order_by(RssFeedScraping.next_fetch_at.asc().nulls_first(), RssFeed.id.asc())
+        .limit(limit)
+        .with_for_update(of=RssFeed, skip_locked=True)
+    )
+    return list((await db.execute(query)).scalars().all())
+
+
+async def lease_rss_feed_next_fetch_async(
+    db: AsyncSession,
+    *,
+    feed_ids: list[int],
+    lease_seconds: int,
+) -> None:
+    if not feed_ids:
+        return
+
+    leased_until = datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+    statement = insert(RssFeedScraping).values(
+        [{"feed_id": feed_id, "next_fetch_at": leased_until} for feed_id in feed_ids]
+    )
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[RssFeedScraping.feed_id],
+            set_={"next_fetch_at": statement.excluded.next_fetch_at},
+        )
+    )
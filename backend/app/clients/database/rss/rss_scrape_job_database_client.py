@@ -1,87 +1,58 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, case, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, contains_eager, selectinload
 
 from app.models.rss import (
+    RssCompany,
     RssFeed,
+    RssFeedScraping,
     RssScrapeJob,
     RssScrapeJobFeed,
     RssScrapeJobResult,
 )
 from app.models.sources import RssSourceFeed
 from app.schemas.rss import (
+    RssFetchLatencyGroupBy,
+    RssFetchLatencyRead,
     RssScrapeFeedPayloadSchema,
     RssScrapeJobFeedRead,
     RssScrapeJobStatusRead,
 )
 from app.utils import normalize_host
 
+DEFAULT_JOB_FEEDS_INSERT_CHUNK_SIZE = 1000
+ACTIVE_RSS_SCRAPE_JOB_STATUSES = ("queued", "processing")
+PENDING_JOB_FEED_COALESCE_WINDOW = timedelta(hours=1)
 
-def list_rss_feed_scrape_payloads(
-    db: Session,
+
+async def list_rss_feed_scrape_payloads_async(
+    db: AsyncSession,
     *,
     feed_ids: Sequence[int] | None = None,
     enabled_only: bool = False,
+    skip_fresh: bool = False,
+    skip_pending_check_jobs: bool = False,
+    skip_pending_ingest_jobs: bool = False,
 ) -> list[RssScrapeFeedPayloadSchema]:
-    latest_source_subquery = (
-        select(
-            RssSourceFeed.feed_id.label("feed_id"),
-            func.max(RssSourceFeed.published_at).label("last_db_article_published_at"),
-        )
-        .group_by(RssSourceFeed.feed_id)
-        .subquery()
-    )
-
-    query = (
-        select(
-            RssFeed,
-            latest_source_subquery.c.last_db_article_published_at,
-        )
-        .options(
-            selectinload(RssFeed.company),
-            selectinload(RssFeed.scraping),
-        )
-        .outerjoin(
-            latest_source_subquery,
-            latest_source_subquery.c.feed_id == RssFeed.id,
-        )
-        .order_by(RssFeed.id.asc())
+    query = _build_feed_scrape_payloads_query(
+        feed_ids=feed_ids,
+        enabled_only=enabled_only,
+        skip_fresh=skip_fresh,
+        skip_pending_check_jobs=skip_pending_check_jobs,
+        skip_pending_ingest_jobs=skip_pending_ingest_jobs,
     )
-
-    if enabled_only:
-        query = query.where(RssFeed.enabled.is_(True))
-
-    if feed_ids:
-        unique_feed_ids = sorted({feed_id for feed_id in feed_ids if isinstance(feed_id, int) and feed_id > 0})
-        if not unique_feed_ids:
-            return []
-        query = query.where(RssFeed.id.in_(unique_feed_ids))
-
-    payloads: list[RssScrapeFeedPayloadSchema] = []
-    for feed, last_db_article_published_at in db.execute(query).all():
-        scraping = getattr(feed, "scraping", None)
-        company = getattr(feed, "company", None)
-        payloads.append(
-            RssScrapeFeedPayloadSchema(
-                feed_id=feed.id,
-                feed_url=feed.url,
-                company_id=getattr(feed, "company_id", None),
-                host_header=normalize_host(getattr(company, "host", None)),
-                fetchprotection=_resolve_feed_fetchprotection(feed),
-                etag=getattr(scraping, "etag", None),
-                last_update=getattr(scraping, "last_update", None),
-                last_db_article_published_at=_normalize_datetime(last_db_article_published_at),
-            )
-        )
-    return payloads
+    if query is None:
+        return []
+    return _to_feed_scrape_payloads((await db.execute(query)).all())
 
 
 def create_rss_scrape_job(
-    db: Session,
+    db: AsyncSession,
     *,
     job_id: str,
     ingest: bool,
@@ -100,33 +71,29 @@ def create_rss_scrape_job(
         updated_at=datetime.now(timezone.utc),
     )
     db.add(job)
-
-    for feed in feeds:
-        db.add(
-            RssScrapeJobFeed(
-                job_id=job_id,
-                feed_id=feed.feed_id,
-                feed_url=feed.feed_url,
-                last_db_article_published_at=feed.last_db_article_published_at,
-            )
-        )
-
     return job
 
 
-def set_rss_scrape_job_status(
-    db: Session,
+async def insert_rss_scrape_job_feeds_async(
+    db: AsyncSession,
     *,
     job_id: str,
-    status: str,
-) -> bool:
-    job = db.get(RssScrapeJob, job_id)
-    if job is None:
-        return False
-
-    job.status = status
-    job.updated_at = datetime.now(timezone.utc)
-    return True
+    feeds: Sequence[RssScrapeFeedPayloadSchema],
+    chunk_size: int = DEFAULT_JOB_FEEDS_INSERT_CHUNK_SIZE,
+) -> None:
+    for chunk_start in range(0, len(feeds), chunk_size):
+        await db.execute(
+            insert(RssScrapeJobFeed),
+            [
+                {
+                    "job_id": job_id,
+                    "feed_id": feed.feed_id,
+                    "feed_url": feed.feed_url,
+                    "last_db_article_published_at": feed.last_db_article_published_at,
+                }
+                for feed in feeds[chunk_start : chunk_start + chunk_size]
+            ],
+        )
 
 
 def get_rss_scrape_job_status_read(
@@ -205,6 +172,170 @@ def list_rss_scrape_job_feed_reads(
     ]
 
 
+def list_rss_fetch_latency_reads(
+    db: Session,
+    *,
+    group_by: RssFetchLatencyGroupBy,
+    since: datetime,
+    limit: int,
+) -> list[RssFetchLatencyRead]:
+    rows = db.execute(
+        _build_fetch_latency_query(group_by=group_by, since=since, limit=limit)
+    ).mappings().all()
+    return [RssFetchLatencyRead.model_validate(dict(row)) for row in rows]
+
+
+def build_pending_job_feed_exists(*, ingest: bool):
+    return (
+        select(RssScrapeJobFeed.feed_id)
+        .join(RssScrapeJob, RssScrapeJob.job_id == RssScrapeJobFeed.job_id)
+        .outerjoin(
+            RssScrapeJobResult,
+            and_(
+                RssScrapeJobResult.job_id == RssScrapeJobFeed.job_id,
+                RssScrapeJobResult.feed_id == RssScrapeJobFeed.feed_id,
+            ),
+        )
+        .where(
+            RssScrapeJobFeed.feed_id == RssFeed.id,
+            RssScrapeJob.ingest.is_(ingest),
+            RssScrapeJob.status.in_(ACTIVE_RSS_SCRAPE_JOB_STATUSES),
+            RssScrapeJob.requested_at >= datetime.now(timezone.utc) - PENDING_JOB_FEED_COALESCE_WINDOW,
+            RssScrapeJobResult.job_id.is_(None),
+        )
+        .exists()
+    )
+
+
+def _build_fetch_latency_query(
+    *,
+    group_by: RssFetchLatencyGroupBy,
+    since: datetime,
+    limit: int,
+):
+    group_columns = [
+        RssFeed.company_id.label("company_id"),
+        RssCompany.name.label("company_name"),
+    ]
+    if group_by == "feed":
+        group_columns += [RssFeed.id.label("feed_id"), RssFeed.url.label("feed_url")]
+    total_p95_ms = _percentile_ms(0.95, RssScrapeJobResult.total_ms).label("total_p95_ms")
+
+    return (
+        select(
+            *group_columns,
+            func.count().label("sample_count"),
+            func.count().filter(RssScrapeJobResult.status == "error").label("error_count"),
+            _percentile_ms(0.5, RssScrapeJobResult.total_ms).label("total_p50_ms"),
+            total_p95_ms,
+            _percentile_ms(0.99, RssScrapeJobResult.total_ms).label("total_p99_ms"),
+            _percentile_ms(0.95, RssScrapeJobResult.connect_ms).label("connect_p95_ms"),
+            _percentile_ms(0.95, RssScrapeJobResult.ttfb_ms).label("ttfb_p95_ms"),
+            _percentile_ms(0.95, RssScrapeJobResult.download_ms).label("download_p95_ms"),
+            _percentile_ms(0.95, RssScrapeJobResult.parse_ms).label("parse_p95_ms"),
+            func.avg(RssScrapeJobResult.response_bytes).label("avg_response_bytes"),
+        )
+        .select_from(RssScrapeJobResult)
+        .join(RssFeed, RssFeed.id == RssScrapeJobResult.feed_id)
+        .outerjoin(RssCompany, RssCompany.id == RssFeed.company_id)
+        .where(
+            RssScrapeJobResult.processed_at >= since,
+            RssScrapeJobResult.total_ms.is_not(None),
+        )
+        .group_by(*[column.element for column in group_columns])
+        .order_by(total_p95_ms.desc())
+        .limit(limit)
+    )
+
+
+def _percentile_ms(fraction: float, column):
+    return func.percentile_cont(fraction).within_group(column)
+
+
+def _build_feed_scrape_payloads_query(
+    *,
+    feed_ids: Sequence[int] | None,
+    enabled_only: bool,
+    skip_fresh: bool = False,
+    skip_pending_check_jobs: bool = False,
+    skip_pending_ingest_jobs: bool = False,
+):
+    # Feeds that already had articles when the watermark column was added keep a NULL
+    # watermark until their next ingest or the db-manager backfill; only those fall back
+    # to the aggregate over their own links.
+    aggregated_watermark = (
+        select(func.max(RssSourceFeed.published_at))
+        .where(RssSourceFeed.feed_id == RssFeed.id)
+        .scalar_subquery()
+    )
+    last_article_published_at = case(
+        (
+            and_(
+                RssFeedScraping.last_article_published_at.is_(None),
+                RssFeedScraping.article_count > 0,
+            ),
+            aggregated_watermark,
+        ),
+        else_=RssFeedScraping.last_article_published_at,
+    )
+    query = (
+        select(
+            RssFeed,
+            last_article_published_at,
+        )
+        .options(
+            selectinload(RssFeed.company),
+            contains_eager(RssFeed.scraping),
+        )
+        .outerjoin(RssFeedScraping, RssFeedScraping.feed_id == RssFeed.id)
+        .order_by(RssFeed.id.asc())
+    )
+
+    if enabled_only:
+        query = query.where(RssFeed.enabled.is_(True))
+
+    if skip_fresh:
+        query = query.where(
+            or_(
+                RssFeedScraping.fresh_until.is_(None),
+                RssFeedScraping.fresh_until <= func.now(),
+            )
+        )
+
+    if skip_pending_check_jobs:
+        query = query.where(~build_pending_job_feed_exists(ingest=False))
+
+    if skip_pending_ingest_jobs:
+        query = query.where(~build_pending_job_feed_exists(ingest=True))
+
+    if feed_ids:
+        unique_feed_ids = sorted({feed_id for feed_id in feed_ids if isinstance(feed_id, int) and feed_id > 0})
+        if not unique_feed_ids:
+            return None
+        query = query.where(RssFeed.id.in_(unique_feed_ids))
+    return query
+
+
+def _to_feed_scrape_payloads(rows: Sequence) -> list[RssScrapeFeedPayloadSchema]:
+    payloads: list[RssScrapeFeedPayloadSchema] = []
+    for feed, last_db_article_published_at in rows:
+        scraping = getattr(feed, "scraping", None)
+        company = getattr(feed, "company", None)
+        payloads.append(
+            RssScrapeFeedPayloadSchema(
+                feed_id=feed.id,
+                feed_url=feed.url,
+                company_id=getattr(feed, "company_id", None),
+                host_header=normalize_host(getattr(company, "host", None)),
+                fetchprotection=_resolve_feed_fetchprotection(feed),
+                etag=getattr(scraping, "etag", None),
+                last_update=getattr(scraping, "last_update", None),
+                last_db_article_published_at=_normalize_datetime(last_db_article_published_at),
+            )
+        )
+    return payloads
+
+
 def _resolve_feed_fetchprotection(feed: RssFeed) -> int:
     scraping = getattr(feed, "scraping", None)
     scraping_fetchprotection = getattr(scraping, "fetchprotection", None)
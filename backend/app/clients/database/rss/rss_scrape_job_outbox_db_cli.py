@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rss import RssScrapeJob, RssScrapeJobOutbox, RssScrapeJobResult
+
+
+async def insert_rss_scrape_job_outbox_async(
+    db: AsyncSession,
+    *,
+    job_id: str,
+    stream_name: str,
+    payloads: Sequence[dict[str, Any]],
+) -> None:
+    if not payloads:
+        return
+
+    await db.execute(
+        insert(RssScrapeJobOutbox),
+        [
+            {
+                "job_id": job_id,
+                "stream_name": stream_name,
+                "payload": payload,
+                "feed_count": len(payload.get("feeds") or []),
+            }
+            for payload in payloads
+        ],
+    )
+
+
+async def claim_pending_rss_scrape_job_outbox_async(
+    db: AsyncSession,
+    *,
+    limit: int,
+    max_inflight_feeds: int,
+    inflight_window_seconds: int,
+) -> list[RssScrapeJobOutbox]:
+    pending_rows = (
+        select(
+            RssScrapeJobOutbox.id,
+            RssScrapeJobOutbox.job_id,
+            RssScrapeJobOutbox.available_at,
+            RssScrapeJobOutbox.feed_count,
+            func.sum(RssScrapeJobOutbox.feed_count)
+            .over(partition_by=RssScrapeJobOutbox.job_id, order_by=RssScrapeJobOutbox.id)
+            .label("cumulative_feed_count"),
+            func.row_number()
+            .over(partition_by=RssScrapeJobOutbox.job_id, order_by=RssScrapeJobOutbox.id)
+            .label("job_rank"),
+        )
+        .where(
+            RssScrapeJobOutbox.status == "pending",
+            RssScrapeJobOutbox.available_at <= func.now(),
+        )
+        .cte("pending_outbox")
+    )
+    pending_job_ids = select(pending_rows.c.job_id)
+    inflight_since = datetime.now(timezone.utc) - timedelta(seconds=inflight_window_seconds)
+    sent_feeds = (
+        select(
+            RssScrapeJobOutbox.job_id,
+            func.sum(RssScrapeJobOutbox.feed_count)
+            .filter(RssScrapeJobOutbox.sent_at >= inflight_since)
+            .label("recent_feed_count"),
+            func.sum(RssScrapeJobOutbox.feed_count)
+            .filter(RssScrapeJobOutbox.sent_at < inflight_since)
+            .label("earlier_feed_count"),
+        )
+        .where(
+            RssScrapeJobOutbox.status == "sent",
+            RssScrapeJobOutbox.job_id.in_(pending_job_ids),
+        )
+        .group_by(RssScrapeJobOutbox.job_id)
+        .subquery()
+    )
+    processed_feeds = (
+        select(
+            RssScrapeJobResult.job_id,
+            func.count().label("feed_count"),
+        )
+        .where(RssScrapeJobResult.job_id.in_(pending_job_ids))
+        .group_by(RssScrapeJobResult.job_id)
+        .subquery()
+    )
+    # Results are credited to the oldest batches first, and only batches sent within
+    # the window count as in flight: feeds lost by a crashed worker stop holding the
+    # job back once their batch leaves the window.
+    inflight_feed_count = func.coalesce(sent_feeds.c.recent_feed_count, 0) - func.greatest(
+        func.coalesce(processed_feeds.c.feed_count, 0)
+        - func.coalesce(sent_feeds.c.earlier_feed_count, 0),
+        0,
+    )
+
+    # Jobs are interleaved batch by batch, and a job stops being published once its
+    # published-but-unprocessed feeds reach the cap, so one large job cannot fill
+    # the stream ahead of the others.
+    candidate_ids = (
+        select(pending_rows.c.id)
+        .outerjoin(sent_feeds, sent_feeds.c.job_id == pending_rows.c.job_id)
+        .outerjoin(processed_feeds, processed_feeds.c.job_id == pending_rows.c.job_id)
+        .where(
+            inflight_feed_count + pending_rows.c.cumulative_feed_count - pending_rows.c.feed_count
+            < max_inflight_feeds
+        )
+        .order_by(
+            pending_rows.c.job_rank.asc(),
+            pending_rows.c.available_at.asc(),
+            pending_rows.c.id.asc(),
+        )
+        .limit(limit)
+    )
+
+    result = await db.execute(
+        select(RssScrapeJobOutbox)
+        .where(
+            RssScrapeJobOutbox.id.in_(candidate_ids.scalar_subquery()),
+            RssScrapeJobOutbox.status == "pending",
+        )
+        .order_by(RssScrapeJobOutbox.available_at.asc(), RssScrapeJobOutbox.id.asc())
+        .with_for_update(skip_locked=True)
+    )
+    return list(result.scalars().all())
+
+
+async def mark_rss_scrape_job_outbox_sent_async(
+    db: AsyncSession,
+    *,
+    outbox_ids: Sequence[int],
+) -> None:
+    if not outbox_ids:
+        return
+
+    await db.execute(
+        update(RssScrapeJobOutbox)
+        .where(RssScrapeJobOutbox.id.in_(outbox_ids))
+        .values(
+            status="sent",
+            sent_at=func.now(),
+            last_error=None,
+        )
+    )
+
+
+async def purge_sent_rss_scrape_job_outbox_async(
+    db: AsyncSession,
+    *,
+    retention_seconds: int,
+    limit: int,
+) -> int:
+    sent_before = datetime.now(timezone.utc) - timedelta(seconds=retention_seconds)
+    expired_ids = (
+        select(RssScrapeJobOutbox.id)
+        .where(
+            RssScrapeJobOutbox.status == "sent",
+            RssScrapeJobOutbox.sent_at < sent_before,
+        )
+        .order_by(RssScrapeJobOutbox.sent_at.asc())
+        .limit(limit)
+    )
+    result = await db.execute(
+        delete(RssScrapeJobOutbox).where(RssScrapeJobOutbox.id.in_(expired_ids.scalar_subquery()))
+    )
+    return result.rowcount or 0
+
+
+def reschedule_rss_scrape_job_outbox(
+    outbox_rows: Sequence[RssScrapeJobOutbox],
+    *,
+    error_message: str,
+    retry_base_delay_seconds: float,
+    retry_max_delay_seconds: float,
+    max_attempts: int,
+) -> list[str]:
+    now = datetime.now(timezone.utc)
+    exhausted_job_ids: set[str] = set()
+    for outbox_row in outbox_rows:
+        outbox_row.attempts += 1
+        outbox_row.last_error = error_message
+        if outbox_row.attempts >= max_attempts:
+            outbox_row.status = "failed"
+            exhausted_job_ids.add(outbox_row.job_id)
+            continue
+
+        retry_delay_seconds = min(
+            retry_base_delay_seconds * (2 ** (outbox_row.attempts - 1)),
+            retry_max_delay_seconds,
+        )
+        outbox_row.available_at = now + timedelta(seconds=retry_delay_seconds)
+    return sorted(exhausted_job_ids)
+
+
+async def mark_rss_scrape_jobs_failed_async(
+    db: AsyncSession,
+    *,
+    job_ids: Sequence[str],
+) -> None:
+    if not job_ids:
+        return
+
+    await db.execute(
+        update(RssScrapeJob)
+        .where(RssScrapeJob.job_id.in_(job_ids))
+        .values(
+            status="failed",
+            updated_at=func.now(),
+        )
+    )
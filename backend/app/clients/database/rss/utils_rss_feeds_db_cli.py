@@ -1,9 +1,11 @@
 from collections.abc import Sequence
+from datetime import datetime
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, select, text, update
 from sqlalchemy.orm import Session
 
 from app.models.rss import RssCompany, RssFeed, RssFeedScraping, RssTag
+from app.models.sources import RssSourceFeed
 from app.schemas.rss import RssFeedUpsertSchema
 
 
@@ -61,6 +63,8 @@ def link_company_to_feed(
         return False
 
     feed.company_id = company_id
+    db.flush()
+    _refresh_source_listing_rows(db, _list_feed_source_keys(db, [feed_id]))
     return True
 
 
@@ -94,11 +98,36 @@ def delete_company_feeds_not_in_urls(
     if not linked_feed_ids:
         return 0
 
+    source_keys = _list_feed_source_keys(db, linked_feed_ids)
     db.execute(delete(RssFeed).where(RssFeed.id.in_(linked_feed_ids)))
+    _refresh_source_listing_rows(db, source_keys)
 
     return len(linked_feed_ids)
 
 
+def _list_feed_source_keys(db: Session, feed_ids: list[int]) -> list[tuple[int, datetime]]:
+    rows = db.execute(
+        select(RssSourceFeed.source_id, RssSourceFeed.published_at)
+        .where(RssSourceFeed.feed_id.in_(feed_ids))
+        .distinct()
+    ).all()
+    return sorted((row.source_id, row.published_at) for row in rows)
+
+
+def _refresh_source_listing_rows(db: Session, source_keys: list[tuple[int, datetime]]) -> None:
+    # Keeps the denormalized company ids/names of rss_source_listing (and the
+    # company counters maintained by its triggers) in line with feed ownership.
+    if not source_keys:
+        return
+    db.execute(
+        text("SELECT refresh_rss_source_listing(:source_ids, :published_ats)"),
+        {
+            "source_ids": [source_id for source_id, _ in source_keys],
+            "published_ats": [published_at for _, published_at in source_keys],
+        },
+    )
+
+
 def _normalize_fetchprotection(fetchprotection: int | None) -> int:
     if isinstance(fetchprotection, int) and 0 <= fetchprotection <= 2:
         return fetchprotection
@@ -3,17 +3,43 @@ from .get_sources_db_cli import (
     list_rss_sources_by_urls,
     get_rss_source_detail_read_by_id,
 )
+from .search_sources_db_cli import search_rss_sources_read
 from .manage_source_partitions_db_cli import (
     SourcePartitionMaintenanceResult,
     repartition_default_sources_by_published_at,
 )
+from .source_benchmark_db_cli import (
+    analyze_source_tables,
+    capture_executed_statements,
+    delete_source_benchmark_data,
+    explain_analyze_statement,
+    pick_source_benchmark_targets,
+    read_source_benchmark_enqueue_candidates,
+    refresh_source_benchmark_feed_watermarks,
+    seed_source_benchmark_feeds,
+    seed_source_benchmark_week,
+    set_source_benchmark_random_seed,
+)
 
 __all__ = [
     # Sources
     "list_rss_sources_read",
     "list_rss_sources_by_urls",
     "get_rss_source_detail_read_by_id",
+    # Search
+    "search_rss_sources_read",
     # Maintenance
     "SourcePartitionMaintenanceResult",
     "repartition_default_sources_by_published_at",
+    # Benchmark
+    "analyze_source_tables",
+    "capture_executed_statements",
+    "delete_source_benchmark_data",
+    "explain_analyze_statement",
+    "pick_source_benchmark_targets",
+    "read_source_benchmark_enqueue_candidates",
+    "refresh_source_benchmark_feed_watermarks",
+    "seed_source_benchmark_feeds",
+    "seed_source_benchmark_week",
+    "set_source_benchmark_random_seed",
 ]
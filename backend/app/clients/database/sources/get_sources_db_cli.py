@@ -3,12 +3,24 @@ from __future__ import annotations
 from collections.abc import Sequence
 from datetime import datetime, timezone
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session, selectinload
 
-from app.models.rss import RssFeed
-from app.models.sources import RssSource, RssSourceFeed
-from app.schemas.sources import RssSourceDetailRead, RssSourceRead
+from app.models.rss import RssCompany, RssFeed, RssFeedScraping, RssFeedTag, RssTag
+from app.models.sources import (
+    RssCompanySourceCount,
+    RssSource,
+    RssSourceFeed,
+    RssSourceListing,
+)
+from app.schemas.sources import (
+    RssSourceDetailRead,
+    RssSourceListFilters,
+    RssSourceRead,
+    RssSourceTotalMode,
+)
+from app.utils import normalize_country
 
 SOURCE_PUBLISHED_AT_FALLBACK = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
@@ -20,53 +32,60 @@ def list_rss_sources_read(
     offset: int,
     feed_id: int | None = None,
     company_id: int | None = None,
+    filters: RssSourceListFilters | None = None,
+    total_mode: RssSourceTotalMode = "exact",
 ) -> tuple[list[RssSourceRead], int]:
-    source_ids_query = _build_source_ids_query(feed_id=feed_id, company_id=company_id)
-    source_ids_subquery = source_ids_query.subquery()
-
-    total = int(
-        db.execute(
-            select(func.count()).select_from(source_ids_subquery)
-        ).scalar_one()
-        or 0
-    )
-    if total == 0:
+    list_filters = filters or RssSourceListFilters()
+    catalog_feed_ids = _resolve_catalog_feed_ids(db, filters=list_filters)
+    if catalog_feed_ids is not None and not catalog_feed_ids:
         return [], 0
 
-    paged_source_ids = list(
-        db.execute(
-            select(source_ids_subquery.c.source_id)
-            .order_by(
-                source_ids_subquery.c.sort_published_at.desc().nullslast(),
-                source_ids_subquery.c.source_id.desc(),
-            )
-            .limit(limit)
-            .offset(offset)
-        ).scalars().all()
+    conditions = _build_source_listing_filters(
+        feed_id=feed_id,
+        company_id=company_id,
+        published_after=list_filters.published_after,
+        published_before=list_filters.published_before,
+        catalog_feed_ids=catalog_feed_ids,
     )
-    if not paged_source_ids:
-        return [], total
-
-    sources_by_id = _load_sources_by_ids(db=db, source_ids=paged_source_ids)
-    source_reads: list[RssSourceRead] = []
-    for source_id in paged_source_ids:
-        source = sources_by_id.get(source_id)
-        if source is None:
-            continue
 
-        source_reads.append(
-            RssSourceRead(
-                id=source.id,
-                title=source.title,
-                summary=source.summary,
-                author=source.author,
-                url=source.url,
-                published_at=_to_public_published_at(source.published_at),
-                image_url=source.image_url,
-                company_names=_collect_company_names(source),
+    if total_mode == "estimated":
+        if catalog_feed_ids is None and _has_no_time_range(list_filters):
+            total = _estimate_source_listing_total(db, feed_id=feed_id, company_id=company_id)
+        else:
+            total = _explain_row_estimate(
+                db,
+                select(RssSourceListing.source_id).where(*conditions),
             )
+    else:
+        total = int(
+            db.execute(
+                select(func.count()).select_from(RssSourceListing).where(*conditions)
+            ).scalar_one()
+            or 0
         )
+        if total == 0:
+            return [], 0
 
+    listing_rows = db.execute(
+        _build_source_listing_page_query(filters=conditions, limit=limit, offset=offset)
+    ).scalars().all()
+
+    source_reads = [
+        RssSourceRead(
+            id=listing_row.source_id,
+            title=listing_row.title,
+            summary=listing_row.summary,
+            author=listing_row.author,
+            url=listing_row.url,
+            published_at=_to_public_published_at(listing_row.published_at),
+            image_url=listing_row.image_url,
+            company_names=sorted(listing_row.company_names or []),
+        )
+        for listing_row in listing_rows
+    ]
+    if total_mode == "estimated":
+        # Estimates may lag behind; never report fewer rows than the page already reached.
+        total = max(total, offset + len(source_reads))
     return source_reads, total
 
 
@@ -133,45 +152,131 @@ def get_rss_source_detail_read_by_id(
     )
 
 
-def _build_source_ids_query(*, feed_id: int | None, company_id: int | None):
-    source_id_column = RssSource.id.label("source_id")
-    sort_published_at_column = func.max(RssSource.published_at).label("sort_published_at")
-    query = (
-        select(
-            source_id_column,
-            sort_published_at_column,
-        )
-        .select_from(RssSource)
-        .join(
-            RssSourceFeed,
-            and_(
-                RssSourceFeed.source_id == RssSource.id,
-                RssSourceFeed.published_at == RssSource.published_at,
-            ),
-        )
-        .join(RssFeed, RssFeed.id == RssSourceFeed.feed_id)
-    )
+def _build_source_listing_filters(
+    *,
+    feed_id: int | None,
+    company_id: int | None,
+    published_after: datetime | None = None,
+    published_before: datetime | None = None,
+    catalog_feed_ids: list[int] | None = None,
+) -> list:
+    filters = []
+    # Bounds on the partition key stay plain comparisons so the planner prunes weekly partitions.
+    if published_after is not None:
+        filters.append(RssSourceListing.published_at >= published_after)
+    if published_before is not None:
+        filters.append(RssSourceListing.published_at < published_before)
+    if feed_id is not None:
+        filters.append(RssSourceListing.feed_ids.contains([feed_id]))
     if company_id is not None:
-        query = query.where(RssFeed.company_id == company_id)
+        filters.append(RssSourceListing.company_ids.contains([company_id]))
+    if catalog_feed_ids is not None:
+        filters.append(RssSourceListing.feed_ids.overlap(catalog_feed_ids))
+    return filters
 
-    if feed_id is not None:
-        query = query.where(RssSourceFeed.feed_id == feed_id)
 
-    return query.group_by(source_id_column)
+def _resolve_catalog_feed_ids(
+    db: Session,
+    *,
+    filters: RssSourceListFilters,
+) -> list[int] | None:
+    section = _normalize_filter_value(filters.section)
+    country = normalize_country(_normalize_filter_value(filters.country))
+    language = normalize_country(_normalize_filter_value(filters.language))
+    tags = sorted(
+        {
+            normalized_tag
+            for normalized_tag in (_normalize_filter_value(tag) for tag in filters.tags)
+            if normalized_tag
+        }
+    )
+    if section is None and country is None and language is None and not tags:
+        return None
 
+    query = select(RssFeed.id).outerjoin(RssCompany, RssCompany.id == RssFeed.company_id)
+    if section is not None:
+        query = query.where(RssFeed.section == section)
+    if country is not None:
+        query = query.where(RssCompany.country == country)
+    if language is not None:
+        query = query.where(RssCompany.language == language)
+    if tags:
+        query = query.where(
+            RssFeed.id.in_(
+                select(RssFeedTag.feed_id)
+                .join(RssTag, RssTag.id == RssFeedTag.tag_id)
+                .where(func.lower(RssTag.name).in_([tag.lower() for tag in tags]))
+            )
+        )
+    return sorted(db.execute(query.order_by(RssFeed.id.asc())).scalars().all())
 
-def _load_sources_by_ids(db: Session, source_ids: list[int]) -> dict[int, RssSource]:
-    query = (
-        select(RssSource)
-        .options(
-            selectinload(RssSource.feed_links)
-            .selectinload(RssSourceFeed.feed)
-            .selectinload(RssFeed.company),
+
+def _normalize_filter_value(value: str | None) -> str | None:
+    if value is None:
+        return None
+    normalized_value = value.strip()
+    return normalized_value or None
+
+
+def _has_no_time_range(filters: RssSourceListFilters) -> bool:
+    return filters.published_after is None and filters.published_before is None
+
+
+def _build_source_listing_page_query(*, filters: list, limit: int, offset: int):
+    return (
+        select(RssSourceListing)
+        .where(*filters)
+        .order_by(
+            RssSourceListing.published_at.desc(),
+            RssSourceListing.source_id.desc(),
         )
-        .where(RssSource.id.in_(source_ids))
+        .limit(limit)
+        .offset(offset)
     )
-    sources = db.execute(query).scalars().all()
-    return {source.id: source for source in sources}
+
+
+def _estimate_source_listing_total(
+    db: Session,
+    *,
+    feed_id: int | None,
+    company_id: int | None,
+) -> int:
+    if feed_id is not None:
+        estimate = db.execute(
+            select(RssFeedScraping.article_count).where(RssFeedScraping.feed_id == feed_id)
+        ).scalar_one_or_none()
+    elif company_id is not None:
+        estimate = db.execute(
+            select(RssCompanySourceCount.source_count).where(
+                RssCompanySourceCount.company_id == company_id
+            )
+        ).scalar_one_or_none()
+    else:
+        estimate = db.execute(
+            text(
+                """
+                SELECT COALESCE(SUM(GREATEST(child.reltuples, 0)), 0)
+                FROM pg_inherits AS inheritance
+                JOIN pg_class AS child
+                    ON child.oid = inheritance.inhrelid
+                WHERE inheritance.inhparent = 'rss_source_listing'::regclass
+                """
+            )
+        ).scalar_one_or_none()
+    return max(int(estimate or 0), 0)
+
+
+def _explain_row_estimate(db: Session, statement) -> int:
+    compiled_statement = statement.compile(dialect=postgresql.dialect())
+    explain_rows = db.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled_statement}",
+        compiled_statement.params,
+    ).scalar_one_or_none()
+    try:
+        plan_rows = explain_rows[0]["Plan"]["Plan Rows"]
+    except (IndexError, KeyError, TypeError):
+        return 0
+    return max(int(plan_rows or 0), 0)
 
 
 def _collect_company_names(source: RssSource) -> list[str]:
@@ -9,14 +9,17 @@ from sqlalchemy.orm import Session
 SOURCE_PUBLISHED_AT_FALLBACK = datetime(1970, 1, 1, tzinfo=timezone.utc)
 _SOURCES_DEFAULT_BUFFER_TABLE = "tmp_rss_sources_default_buffer"
 _SOURCE_FEEDS_DEFAULT_BUFFER_TABLE = "tmp_rss_source_feeds_default_buffer"
+_SOURCE_LISTING_DEFAULT_BUFFER_TABLE = "tmp_rss_source_listing_default_buffer"
 
 
 @dataclass(slots=True)
 class SourcePartitionMaintenanceResult:
     source_default_rows_repartitioned: int
     source_feed_default_rows_repartitioned: int
+    source_listing_default_rows_repartitioned: int
     source_weekly_partitions_created: int
     source_feed_weekly_partitions_created: int
+    source_listing_weekly_partitions_created: int
     weeks_covered: int
 
 
@@ -27,31 +30,41 @@ def repartition_default_sources_by_published_at(
 
     source_default_rows = _count_table_rows(db, _SOURCES_DEFAULT_BUFFER_TABLE)
     source_feed_default_rows = _count_table_rows(db, _SOURCE_FEEDS_DEFAULT_BUFFER_TABLE)
+    source_listing_default_rows = _count_table_rows(db, _SOURCE_LISTING_DEFAULT_BUFFER_TABLE)
 
     _clear_default_partitions(db)
     week_starts = _list_week_starts_for_all_sources(db)
 
     source_partitions_created = 0
     source_feed_partitions_created = 0
+    source_listing_partitions_created = 0
     for week_start in week_starts:
-        source_created, source_feed_created = _create_weekly_partition_pair(db, week_start)
+        source_created, source_feed_created, source_listing_created = _create_weekly_partitions(
+            db,
+            week_start,
+        )
         source_partitions_created += int(source_created)
         source_feed_partitions_created += int(source_feed_created)
+        source_listing_partitions_created += int(source_listing_created)
 
     _restore_sources_from_buffer(db)
     _restore_source_feeds_from_buffer(db)
+    _restore_source_listing_from_buffer(db)
     _sync_sources_sequence(db)
 
     return SourcePartitionMaintenanceResult(
         source_default_rows_repartitioned=source_default_rows,
         source_feed_default_rows_repartitioned=source_feed_default_rows,
+        source_listing_default_rows_repartitioned=source_listing_default_rows,
         source_weekly_partitions_created=source_partitions_created,
         source_feed_weekly_partitions_created=source_feed_partitions_created,
+        source_listing_weekly_partitions_created=source_listing_partitions_created,
         weeks_covered=len(week_starts),
     )
 
 
 def _prepare_default_partition_buffers(db: Session) -> None:
+    db.execute(text(f"DROP TABLE IF EXISTS pg_temp.{_SOURCE_LISTING_DEFAULT_BUFFER_TABLE}"))
     db.execute(text(f"DROP TABLE IF EXISTS pg_temp.{_SOURCE_FEEDS_DEFAULT_BUFFER_TABLE}"))
     db.execute(text(f"DROP TABLE IF EXISTS pg_temp.{_SOURCES_DEFAULT_BUFFER_TABLE}"))
 
@@ -67,7 +80,8 @@ def _prepare_default_partition_buffers(db: Session) -> None:
                 author,
                 url,
                 COALESCE(published_at, :fallback_published_at) AS published_at,
-                image_url
+                image_url,
+                search_language
             FROM rss_sources_default
             """
         ),
@@ -87,9 +101,31 @@ def _prepare_default_partition_buffers(db: Session) -> None:
         ),
         {"fallback_published_at": SOURCE_PUBLISHED_AT_FALLBACK},
     )
+    db.execute(
+        text(
+            f"""
+            CREATE TEMP TABLE {_SOURCE_LISTING_DEFAULT_BUFFER_TABLE}
+            ON COMMIT DROP AS
+            SELECT
+                source_id,
+                COALESCE(published_at, :fallback_published_at) AS published_at,
+                title,
+                summary,
+                author,
+                url,
+                image_url,
+                feed_ids,
+                company_ids,
+                company_names
+            FROM rss_source_listing_default
+            """
+        ),
+        {"fallback_published_at": SOURCE_PUBLISHED_AT_FALLBACK},
+    )
 
 
 def _clear_default_partitions(db: Session) -> None:
+    db.execute(text("DELETE FROM rss_source_listing_default"))
     db.execute(text("DELETE FROM rss_source_feeds_default"))
     db.execute(text("DELETE FROM rss_sources_default"))
 
@@ -122,16 +158,17 @@ def _list_week_starts_for_all_sources(db: Session) -> list[datetime]:
     return week_starts
 
 
-def _create_weekly_partition_pair(
+def _create_weekly_partitions(
     db: Session,
     week_start: datetime,
-) -> tuple[bool, bool]:
+) -> tuple[bool, bool, bool]:
     normalized_week_start = _normalize_to_utc(week_start)
     week_end = normalized_week_start + timedelta(days=7)
     partition_suffix = normalized_week_start.strftime("%Y%m%d")
 
     source_partition_name = f"rss_sources_w_{partition_suffix}"
     source_feed_partition_name = f"rss_source_feeds_w_{partition_suffix}"
+    source_listing_partition_name = f"rss_source_listing_w_{partition_suffix}"
 
     source_partition_created = _create_partition_if_missing(
         db=db,
@@ -147,7 +184,18 @@ def _create_weekly_partition_pair(
         week_start=normalized_week_start,
         week_end=week_end,
     )
-    return source_partition_created, source_feed_partition_created
+    source_listing_partition_created = _create_partition_if_missing(
+        db=db,
+        table_name=source_listing_partition_name,
+        parent_table_name="rss_source_listing",
+        week_start=normalized_week_start,
+        week_end=week_end,
+    )
+    return (
+        source_partition_created,
+        source_feed_partition_created,
+        source_listing_partition_created,
+    )
 
 
 def _create_partition_if_missing(
@@ -189,7 +237,16 @@ def _restore_sources_from_buffer(db: Session) -> None:
     db.execute(
         text(
             f"""
-            INSERT INTO rss_sources (id, title, summary, author, url, published_at, image_url)
+            INSERT INTO rss_sources (
+                id,
+                title,
+                summary,
+                author,
+                url,
+                published_at,
+                image_url,
+                search_language
+            )
             SELECT
                 id,
                 title,
@@ -197,7 +254,8 @@ def _restore_sources_from_buffer(db: Session) -> None:
                 author,
                 url,
                 published_at,
-                image_url
+                image_url,
+                search_language
             FROM {_SOURCES_DEFAULT_BUFFER_TABLE}
             ORDER BY id ASC
             ON CONFLICT (id, published_at) DO NOTHING
@@ -223,6 +281,41 @@ def _restore_source_feeds_from_buffer(db: Session) -> None:
     )
 
 
+def _restore_source_listing_from_buffer(db: Session) -> None:
+    db.execute(
+        text(
+            f"""
+            INSERT INTO rss_source_listing (
+                source_id,
+                published_at,
+                title,
+                summary,
+                author,
+                url,
+                image_url,
+                feed_ids,
+                company_ids,
+                company_names
+            )
+            SELECT
+                source_id,
+                published_at,
+                title,
+                summary,
+                author,
+                url,
+                image_url,
+                feed_ids,
+                company_ids,
+                company_names
+            FROM {_SOURCE_LISTING_DEFAULT_BUFFER_TABLE}
+            ORDER BY source_id ASC
+            ON CONFLICT (source_id, published_at) DO NOTHING
+            """
+        )
+    )
+
+
 def _sync_sources_sequence(db: Session) -> None:
     db.execute(
         text(
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import and_, cast, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import Session
+
+from app.models.rss import RssCompany
+from app.models.sources import RssSource, RssSourceListing
+from app.schemas.sources import RssSourceSearchItemRead
+
+from .get_sources_db_cli import _to_public_published_at
+
+DEFAULT_SEARCH_CONFIG = "simple"
+
+
+def search_rss_sources_read(
+    db: Session,
+    *,
+    query: str,
+    limit: int,
+    published_after: datetime | None = None,
+    published_before: datetime | None = None,
+    after_rank: float | None = None,
+    after_published_at: datetime | None = None,
+    after_source_id: int | None = None,
+) -> tuple[list[RssSourceSearchItemRead], tuple[float, datetime, int] | None]:
+    search_configs = _list_search_configs(db)
+    search_statement = _build_search_query(
+        query=query,
+        search_configs=search_configs,
+        limit=limit,
+        published_after=published_after,
+        published_before=published_before,
+        after_rank=after_rank,
+        after_published_at=after_published_at,
+        after_source_id=after_source_id,
+    )
+    rows = db.execute(search_statement).mappings().all()
+
+    has_more = len(rows) > limit
+    page_rows = rows[:limit]
+    items = [
+        RssSourceSearchItemRead(
+            id=row["id"],
+            title=row["title"],
+            summary=row["summary"],
+            author=row["author"],
+            url=row["url"],
+            published_at=_to_public_published_at(row["published_at"]),
+            image_url=row["image_url"],
+            company_names=sorted(row["company_names"] or []),
+            rank=float(row["rank"] or 0.0),
+        )
+        for row in page_rows
+    ]
+    if not has_more or not page_rows:
+        return items, None
+
+    # The raw published_at (including the epoch fallback) is what the keyset predicate compares.
+    last_row = page_rows[-1]
+    return items, (float(last_row["rank"] or 0.0), last_row["published_at"], last_row["id"])
+
+
+def _list_search_configs(db: Session) -> list[str]:
+    configs = db.execute(
+        select(func.rss_search_config(RssCompany.language, type_=REGCONFIG))
+        .where(RssCompany.language.is_not(None))
+        .distinct()
+    ).scalars().all()
+    normalized_configs = {str(config) for config in configs if config}
+    normalized_configs.add(DEFAULT_SEARCH_CONFIG)
+    return sorted(normalized_configs)
+
+
+def _build_search_query(
+    *,
+    query: str,
+    search_configs: list[str],
+    limit: int,
+    published_after: datetime | None,
+    published_before: datetime | None,
+    after_rank: float | None,
+    after_published_at: datetime | None,
+    after_source_id: int | None,
+):
+    # Each source is indexed with its own language config, so the query is expanded
+    # once per config in use. The result stays a constant, letting the GIN index apply.
+    ts_query = None
+    for search_config in search_configs:
+        config_query = func.websearch_to_tsquery(cast(literal(search_config), REGCONFIG), query)
+        ts_query = config_query if ts_query is None else ts_query.op("||")(config_query)
+
+    rank_column = func.ts_rank_cd(RssSource.search_vector, ts_query)
+    statement = (
+        select(
+            RssSource.id,
+            RssSource.title,
+            RssSource.summary,
+            RssSource.author,
+            RssSource.url,
+            RssSource.published_at,
+            RssSource.image_url,
+            RssSourceListing.company_names,
+            rank_column.label("rank"),
+        )
+        .select_from(RssSource)
+        .outerjoin(
+            RssSourceListing,
+            and_(
+                RssSourceListing.source_id == RssSource.id,
+                RssSourceListing.published_at == RssSource.published_at,
+            ),
+        )
+        .where(RssSource.search_vector.op("@@")(ts_query))
+    )
+    if published_after is not None:
+        statement = statement.where(RssSource.published_at >= published_after)
+    if published_before is not None:
+        statement = statement.where(RssSource.published_at < published_before)
+    if after_rank is not None and after_published_at is not None and after_source_id is not None:
+        statement = statement.where(
+            tuple_(rank_column, RssSource.published_at, RssSource.id)
+            < tuple_(after_rank, after_published_at, after_source_id)
+        )
+
+    return statement.order_by(
+        rank_column.desc(),
+        RssSource.published_at.desc(),
+        RssSource.id.desc(),
+    ).limit(limit + 1)
+
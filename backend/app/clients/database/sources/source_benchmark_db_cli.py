@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.domain.sources import SourceBenchmarkFeedPlan
+
+from ..rss.rss_scrape_job_database_client import _build_feed_scrape_payloads_query
+
+SOURCE_BENCHMARK_COMPANY_PREFIX = "bench-company-"
+SOURCE_BENCHMARK_URL_PREFIX = "https://bench.invalid/"
+_BENCHMARK_FEED_RATES_TABLE = "tmp_source_benchmark_feed_rates"
+_BENCHMARK_WEEK_SOURCES_TABLE = "tmp_source_benchmark_week_sources"
+
+
+def set_source_benchmark_random_seed(db: Session, *, seed: float) -> None:
+    # Makes random() in the generation statements repeatable for the session.
+    db.execute(text("SELECT setseed(:seed)"), {"seed": seed})
+
+
+def seed_source_benchmark_feeds(
+    db: Session,
+    *,
+    feed_plans: Sequence[SourceBenchmarkFeedPlan],
+) -> list[int]:
+    company_indexes = sorted({feed_plan.company_index for feed_plan in feed_plans})
+    company_ids_by_index = dict(
+        db.execute(
+            text(
+                """
+                INSERT INTO rss_company (name, host, fetchprotection, enabled)
+                SELECT :prefix || company_index, 'bench.invalid', 1, true
+                FROM unnest(CAST(:company_indexes AS INTEGER[])) AS company_index
+                ON CONFLICT (name) DO UPDATE SET enabled = true
+                RETURNING CAST(substring(name FROM length(:prefix) + 1) AS INTEGER), id
+                """
+            ),
+            {"prefix": SOURCE_BENCHMARK_COMPANY_PREFIX, "company_indexes": company_indexes},
+        ).all()
+    )
+
+    db.execute(text(f"DROP TABLE IF EXISTS pg_temp.{_BENCHMARK_FEED_RATES_TABLE}"))
+    db.execute(
+        text(
+            f"""
+            CREATE TEMP TABLE {_BENCHMARK_FEED_RATES_TABLE} (
+                feed_id INTEGER PRIMARY KEY,
+                weekly_articles INTEGER NOT NULL
+            )
+            """
+        )
+    )
+    feed_ids = db.execute(
+        text(
+            f"""
+            WITH planned AS (
+                SELECT *
+                FROM unnest(
+                    CAST(:feed_urls AS VARCHAR[]),
+                    CAST(:company_ids AS INTEGER[]),
+                    CAST(:weekly_articles AS INTEGER[])
+                ) AS plan(url, company_id, weekly_articles)
+            ),
+            upserted AS (
+                INSERT INTO rss_feeds (url, company_id, enabled)
+                SELECT url, company_id, true
+                FROM planned
+                ON CONFLICT (url) DO UPDATE SET
+                    company_id = EXCLUDED.company_id,
+                    enabled = true
+                RETURNING id, url
+            )
+            INSERT INTO {_BENCHMARK_FEED_RATES_TABLE} (feed_id, weekly_articles)
+            SELECT upserted.id, planned.weekly_articles
+            FROM upserted
+            JOIN planned
+                ON planned.url = upserted.url
+            RETURNING feed_id
+            """
+        ),
+        {
+            "feed_urls": [_build_benchmark_feed_url(feed_plan) for feed_plan in feed_plans],
+            "company_ids": [company_ids_by_index[feed_plan.company_index] for feed_plan in feed_plans],
+            "weekly_articles": [feed_plan.weekly_articles for feed_plan in feed_plans],
+        },
+    ).scalars().all()
+    return sorted(feed_ids)
+
+
+def seed_source_benchmark_week(
+    db: Session,
+    *,
+    week_start: datetime,
+    cross_post_rate: float,
+) -> int:
+    # Source ids are drawn up front so feed links and listing rows can reuse them
+    # without a round trip through RETURNING.
+    db.execute(text(f"DROP TABLE IF EXISTS pg_temp.{_BENCHMARK_WEEK_SOURCES_TABLE}"))
+    db.execute(
+        text(
+            f"""
+            CREATE TEMP TABLE {_BENCHMARK_WEEK_SOURCES_TABLE} AS
+            SELECT
+                nextval('rss_sources_id_seq') AS source_id,
+                rate.feed_id,
+                article_number,
+                CAST(:week_start AS TIMESTAMPTZ) + random() * INTERVAL '7 days' AS published_at
+            FROM {_BENCHMARK_FEED_RATES_TABLE} AS rate
+            CROSS JOIN LATERAL generate_series(
+                1,
+                GREATEST(1, round(rate.weekly_articles * (0.5 + random()))::INTEGER)
+            ) AS article_number
+            """
+        ),
+        {"week_start": week_start},
+    )
+    source_count = db.execute(
+        text(
+            f"""
+            INSERT INTO rss_sources (id, title, summary, author, url, published_at, image_url)
+            SELECT
+                source_id,
+                'Benchmark article ' || feed_id || '-' || source_id,
+                repeat('Synthetic benchmark summary. ', 8),
+                'Author ' || (source_id % 97),
+                :url_prefix || 'f' || feed_id || '/' || to_char(:week_start, 'YYYYMMDD') || '/' || article_number,
+                published_at,
+                CASE WHEN source_id % 3 = 0
+                    THEN :url_prefix || 'img/' || source_id || '.jpg'
+                END
+            FROM {_BENCHMARK_WEEK_SOURCES_TABLE}
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"url_prefix": SOURCE_BENCHMARK_URL_PREFIX, "week_start": week_start},
+    ).rowcount
+    db.execute(
+        text(
+            f"""
+            INSERT INTO rss_source_feeds (source_id, feed_id, published_at)
+            SELECT week_source.source_id, week_source.feed_id, week_source.published_at
+            FROM {_BENCHMARK_WEEK_SOURCES_TABLE} AS week_source
+            JOIN rss_sources AS source
+                ON source.id = week_source.source_id
+                AND source.published_at = week_source.published_at
+            WHERE source.published_at >= :week_start
+                AND source.published_at < :week_end
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"week_start": week_start, "week_end": week_start + timedelta(days=7)},
+    )
+    # Cross-posted URLs: the same article linked from a second, random benchmark feed.
+    db.execute(
+        text(
+            f"""
+            WITH feed_pool AS (
+                SELECT array_agg(feed_id ORDER BY feed_id) AS feed_ids
+                FROM {_BENCHMARK_FEED_RATES_TABLE}
+            )
+            INSERT INTO rss_source_feeds (source_id, feed_id, published_at)
+            SELECT
+                source_feed.source_id,
+                feed_pool.feed_ids[1 + floor(random() * cardinality(feed_pool.feed_ids))::INTEGER],
+                source_feed.published_at
+            FROM rss_source_feeds AS source_feed
+            JOIN {_BENCHMARK_WEEK_SOURCES_TABLE} AS week_source
+                ON week_source.source_id = source_feed.source_id
+                AND week_source.published_at = source_feed.published_at
+            CROSS JOIN feed_pool
+            WHERE source_feed.published_at >= :week_start
+                AND source_feed.published_at < :week_end
+                AND random() < :cross_post_rate
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {
+            "week_start": week_start,
+            "week_end": week_start + timedelta(days=7),
+            "cross_post_rate": cross_post_rate,
+        },
+    )
+    db.execute(
+        text(
+            f"""
+            SELECT refresh_rss_source_listing(
+                array_agg(source_id ORDER BY source_id),
+                array_agg(published_at ORDER BY source_id)
+            )
+            FROM {_BENCHMARK_WEEK_SOURCES_TABLE}
+            """
+        )
+    )
+    return int(source_count or 0)
+
+
+def refresh_source_benchmark_feed_watermarks(db: Session) -> None:
+    db.execute(
+        text(
+            f"""
+            INSERT INTO feeds_scraping (feed_id, last_article_published_at, article_count)
+            SELECT
+                rate.feed_id,
+                max(source_feed.published_at),
+                count(source_feed.source_id)
+            FROM {_BENCHMARK_FEED_RATES_TABLE} AS rate
+            LEFT JOIN rss_source_feeds AS source_feed
+                ON source_feed.feed_id = rate.feed_id
+            GROUP BY rate.feed_id
+            ON CONFLICT (feed_id) DO UPDATE SET
+                last_article_published_at = EXCLUDED.last_article_published_at,
+                article_count = EXCLUDED.article_count
+            """
+        )
+    )
+
+
+def analyze_source_tables(db: Session) -> None:
+    db.execute(text("ANALYZE rss_sources, rss_source_feeds, rss_source_listing, feeds_scraping"))
+
+
+def delete_source_benchmark_data(db: Session) -> int:
+    deleted_source_count = db.execute(
+        text("DELETE FROM rss_sources WHERE url LIKE :url_pattern"),
+        {"url_pattern": f"{SOURCE_BENCHMARK_URL_PREFIX}%"},
+    ).rowcount
+    db.execute(
+        text(
+            """
+            DELETE FROM rss_feeds
+            WHERE company_id IN (
+                SELECT id FROM rss_company WHERE name LIKE :company_pattern
+            )
+            """
+        ),
+        {"company_pattern": f"{SOURCE_BENCHMARK_COMPANY_PREFIX}%"},
+    )
+    db.execute(
+        text("DELETE FROM rss_company WHERE name LIKE :company_pattern"),
+        {"company_pattern": f"{SOURCE_BENCHMARK_COMPANY_PREFIX}%"},
+    )
+    return int(deleted_source_count or 0)
+
+
+def pick_source_benchmark_targets(db: Session) -> dict[str, int | None]:
+    # Largest and median feed/company exercise both ends of the GIN selectivity range.
+    row = db.execute(
+        text(
+            """
+            WITH feed_counts AS (
+                SELECT scraping.feed_id, feed.company_id, scraping.article_count
+                FROM feeds_scraping AS scraping
+                JOIN rss_feeds AS feed
+                    ON feed.id = scraping.feed_id
+                JOIN rss_company AS company
+                    ON company.id = feed.company_id
+                WHERE company.name LIKE :company_pattern
+                    AND scraping.article_count > 0
+            ),
+            ranked_feeds AS (
+                SELECT
+                    feed_id,
+                    row_number() OVER (ORDER BY article_count DESC, feed_id) AS rank_desc,
+                    count(*) OVER () AS feed_total
+                FROM feed_counts
+            )
+            SELECT
+                (SELECT feed_id FROM ranked_feeds WHERE rank_desc = 1) AS largest_feed_id,
+                (
+                    SELECT feed_id FROM ranked_feeds
+                    WHERE rank_desc = GREATEST(feed_total / 2, 1)
+                ) AS median_feed_id,
+                (
+                    SELECT company_id FROM feed_counts
+                    GROUP BY company_id
+                    ORDER BY sum(article_count) DESC, company_id
+                    LIMIT 1
+                ) AS largest_company_id,
+                (
+                    SELECT source_id FROM rss_source_listing
+                    ORDER BY published_at DESC, source_id DESC
+                    LIMIT 1
+                ) AS latest_source_id
+            """
+        ),
+        {"company_pattern": f"{SOURCE_BENCHMARK_COMPANY_PREFIX}%"},
+    ).mappings().one()
+    return dict(row)
+
+
+def read_source_benchmark_enqueue_candidates(db: Session) -> int:
+    # Same query as a full-catalog ingest enqueue, including the watermark fallback.
+    query = _build_feed_scrape_payloads_query(
+        feed_ids=None,
+        enabled_only=True,
+        skip_fresh=True,
+        skip_pending_ingest_jobs=True,
+    )
+    return len(db.execute(query).all())
+
+
+@contextmanager
+def capture_executed_statements(db: Session) -> Iterator[list[tuple[str, Any]]]:
+    captured_statements: list[tuple[str, Any]] = []
+    bind = db.get_bind()
+
+    def _capture(_conn, _cursor, statement, parameters, _context, executemany) -> None:
+        if not executemany:
+            captured_statements.append((statement, parameters))
+
+    event.listen(bind, "before_cursor_execute", _capture)
+    try:
+        yield captured_statements
+    finally:
+        event.remove(bind, "before_cursor_execute", _capture)
+
+
+def explain_analyze_statement(db: Session, statement: str, parameters: Any) -> list[str]:
+    explain_rows = db.connection().exec_driver_sql(
+        f"EXPLAIN (ANALYZE, BUFFERS, SETTINGS) {statement}",
+        parameters,
+    ).scalars().all()
+    return [str(explain_row) for explain_row in explain_rows]
+
+
+def _build_benchmark_feed_url(feed_plan: SourceBenchmarkFeedPlan) -> str:
+    return f"{SOURCE_BENCHMARK_URL_PREFIX}c{feed_plan.company_index}/f{feed_plan.feed_index}.xml"
@@ -1,9 +1,23 @@
 from .redis_queue_client import (
+    DEFAULT_REDIS_QUEUE_CHECK,
+    DEFAULT_REDIS_QUEUE_DEAD_LETTERS,
+    DEFAULT_REDIS_QUEUE_ERRORS,
+    DEFAULT_REDIS_QUEUE_INGEST,
+    get_request_shard_count,
     get_requests_stream_name,
-    publish_rss_scrape_job,
+    publish_rss_scrape_job_messages,
+    read_redis_server_time_ms,
+    read_redis_stream_health,
 )
 
 __all__ = [
+    "get_request_shard_count",
     "get_requests_stream_name",
-    "publish_rss_scrape_job",
+    "publish_rss_scrape_job_messages",
+    "DEFAULT_REDIS_QUEUE_CHECK",
+    "DEFAULT_REDIS_QUEUE_DEAD_LETTERS",
+    "DEFAULT_REDIS_QUEUE_ERRORS",
+    "DEFAULT_REDIS_QUEUE_INGEST",
+    "read_redis_server_time_ms",
+    "read_redis_stream_health",
 ]
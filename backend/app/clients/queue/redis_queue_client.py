@@ -1,31 +1,129 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 import json
 import os
 from typing import Any
 
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+from app.utils import resolve_positive_int_env
 
 DEFAULT_REDIS_URL = "redis://localhost:6379/0"
 DEFAULT_REDIS_QUEUE_REQUESTS = "rss_scrape_requests"
+DEFAULT_REDIS_QUEUE_REQUESTS_INTERACTIVE = "rss_scrape_requests_interactive"
+DEFAULT_REQUEST_SHARD_COUNT = 1
+REDIS_REQUEST_SHARD_COUNT_KEY = "rss_scrape_request_shards"
+DEFAULT_REDIS_QUEUE_CHECK = "rss_check_results"
+DEFAULT_REDIS_QUEUE_INGEST = "rss_ingest_results"
+DEFAULT_REDIS_QUEUE_ERRORS = "error_feeds_parsing"
+DEFAULT_REDIS_QUEUE_DEAD_LETTERS = "rss_dead_letters"
 
 _redis_client: Redis | None = None
 
 
-def get_requests_stream_name() -> str:
-    return os.getenv("REDIS_QUEUE_REQUESTS", DEFAULT_REDIS_QUEUE_REQUESTS)
+def get_requests_stream_name(*, interactive: bool = False, shard: int | None = None) -> str:
+    if interactive:
+        stream_name = os.getenv(
+            "REDIS_QUEUE_REQUESTS_INTERACTIVE",
+            DEFAULT_REDIS_QUEUE_REQUESTS_INTERACTIVE,
+        )
+    else:
+        stream_name = os.getenv("REDIS_QUEUE_REQUESTS", DEFAULT_REDIS_QUEUE_REQUESTS)
+    if shard is None:
+        return stream_name
+    return f"{stream_name}:{shard}"
+
+
+def get_request_shard_count() -> int:
+    return resolve_positive_int_env("RSS_SCRAPE_REQUEST_SHARDS", DEFAULT_REQUEST_SHARD_COUNT)
+
+
+async def publish_rss_scrape_job_messages(
+    messages: Sequence[tuple[str, dict[str, Any]]],
+) -> list[str | Exception]:
+    if not messages:
+        return []
+
+    redis_client = _get_redis_client()
+    async with redis_client.pipeline(transaction=False) as pipeline:
+        # Workers compare this with their WORKER_SHARD_COUNT and refuse to start on a
+        # mismatch; it is rewritten with every batch so it survives a Redis flush.
+        pipeline.set(REDIS_REQUEST_SHARD_COUNT_KEY, get_request_shard_count())
+        for stream_name, payload in messages:
+            pipeline.xadd(stream_name, {"payload": json.dumps(payload)})
+        _, *message_ids = await pipeline.execute(raise_on_error=False)
+    return [
+        message_id if isinstance(message_id, Exception) else _decode_redis_value(message_id)
+        for message_id in message_ids
+    ]
+
+
+async def read_redis_server_time_ms() -> int:
+    seconds, microseconds = await _get_redis_client().time()
+    return int(seconds) * 1000 + int(microseconds) // 1000
 
 
-async def publish_rss_scrape_job(payload: dict[str, Any]) -> str:
+async def read_redis_stream_health(stream_name: str) -> dict[str, Any] | None:
     redis_client = _get_redis_client()
-    stream_name = get_requests_stream_name()
-    message_id = await redis_client.xadd(
-        stream_name,
-        {"payload": json.dumps(payload)},
-    )
-    if isinstance(message_id, bytes):
-        return message_id.decode("utf-8")
-    return str(message_id)
+    try:
+        groups = await redis_client.xinfo_groups(stream_name)
+    except ResponseError as exception:
+        if "no such key" in str(exception).lower():
+            return None
+        raise
+    stream_length = await redis_client.xlen(stream_name)
+
+    group_reads = []
+    for group in groups:
+        group_name = _decode_redis_value(group.get("name"))
+        consumers = await redis_client.xinfo_consumers(stream_name, group_name)
+        oldest_pending = []
+        if int(group.get("pending") or 0) > 0:
+            # XPENDING returns entries in id order, so the first one is the oldest.
+            oldest_pending = await redis_client.xpending_range(
+                stream_name,
+                group_name,
+                min="-",
+                max="+",
+                count=1,
+            )
+        group_reads.append(
+            {
+                "name": group_name,
+                "lag": group.get("lag"),
+                "pending": int(group.get("pending") or 0),
+                "last_delivered_id": _decode_redis_value(group.get("last-delivered-id")),
+                "oldest_pending": (
+                    {
+                        "message_id": _decode_redis_value(oldest_pending[0]["message_id"]),
+                        "consumer": _decode_redis_value(oldest_pending[0]["consumer"]),
+                        "idle_ms": int(oldest_pending[0]["time_since_delivered"]),
+                        "delivery_count": int(oldest_pending[0]["times_delivered"]),
+                    }
+                    if oldest_pending
+                    else None
+                ),
+                "consumers": [
+                    {
+                        "name": _decode_redis_value(consumer.get("name")),
+                        "pending": int(consumer.get("pending") or 0),
+                        "idle_ms": int(consumer.get("idle") or 0),
+                        # Only reported by Redis >= 7.2.
+                        "inactive_ms": consumer.get("inactive"),
+                    }
+                    for consumer in consumers
+                ],
+            }
+        )
+    return {"length": int(stream_length), "groups": group_reads}
+
+
+def _decode_redis_value(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
 
 
 def _get_redis_client() -> Redis:
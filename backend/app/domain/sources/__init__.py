@@ -0,0 +1,15 @@
+from .source_benchmark_domain import (
+    SourceBenchmarkFeedPlan,
+    SourceBenchmarkTimings,
+    build_source_benchmark_feed_plans,
+    build_source_benchmark_week_starts,
+    summarize_benchmark_durations,
+)
+
+__all__ = [
+    "SourceBenchmarkFeedPlan",
+    "SourceBenchmarkTimings",
+    "build_source_benchmark_feed_plans",
+    "build_source_benchmark_week_starts",
+    "summarize_benchmark_durations",
+]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import math
+import random
+
+_FEEDS_PER_COMPANY_SIGMA = 0.8
+_ARTICLES_PER_WEEK_SIGMA = 1.0
+
+
+@dataclass(slots=True)
+class SourceBenchmarkFeedPlan:
+    company_index: int
+    feed_index: int
+    weekly_articles: int
+
+
+@dataclass(slots=True)
+class SourceBenchmarkTimings:
+    runs: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+def build_source_benchmark_feed_plans(
+    *,
+    company_count: int,
+    mean_feeds_per_company: float,
+    max_feeds_per_company: int,
+    mean_articles_per_week: float,
+    rng: random.Random,
+) -> list[SourceBenchmarkFeedPlan]:
+    # Log-normal draws give a few large publishers and a long tail of small feeds.
+    feed_plans: list[SourceBenchmarkFeedPlan] = []
+    for company_index in range(company_count):
+        feed_count = _draw_lognormal_count(
+            rng,
+            mean=mean_feeds_per_company,
+            sigma=_FEEDS_PER_COMPANY_SIGMA,
+            maximum=max_feeds_per_company,
+        )
+        for feed_index in range(feed_count):
+            feed_plans.append(
+                SourceBenchmarkFeedPlan(
+                    company_index=company_index,
+                    feed_index=feed_index,
+                    weekly_articles=_draw_lognormal_count(
+                        rng,
+                        mean=mean_articles_per_week,
+                        sigma=_ARTICLES_PER_WEEK_SIGMA,
+                        maximum=int(mean_articles_per_week * 20),
+                    ),
+                )
+            )
+    return feed_plans
+
+
+def build_source_benchmark_week_starts(*, week_count: int, now: datetime) -> list[datetime]:
+    normalized_now = now.astimezone(timezone.utc)
+    current_week_start = datetime(
+        normalized_now.year,
+        normalized_now.month,
+        normalized_now.day,
+        tzinfo=timezone.utc,
+    ) - timedelta(days=normalized_now.weekday())
+    return [
+        current_week_start - timedelta(weeks=week_offset)
+        for week_offset in range(week_count - 1, -1, -1)
+    ]
+
+
+def summarize_benchmark_durations(durations_ms: Sequence[float]) -> SourceBenchmarkTimings:
+    ordered_durations = sorted(durations_ms)
+    if not ordered_durations:
+        return SourceBenchmarkTimings(runs=0, p50_ms=0.0, p95_ms=0.0, max_ms=0.0)
+    return SourceBenchmarkTimings(
+        runs=len(ordered_durations),
+        p50_ms=_nearest_rank(ordered_durations, 0.5),
+        p95_ms=_nearest_rank(ordered_durations, 0.95),
+        max_ms=ordered_durations[-1],
+    )
+
+
+def _draw_lognormal_count(
+    rng: random.Random,
+    *,
+    mean: float,
+    sigma: float,
+    maximum: int,
+) -> int:
+    # mu is shifted so the distribution mean matches the requested mean.
+    mu = math.log(max(mean, 1.0)) - sigma**2 / 2
+    return min(max(int(round(rng.lognormvariate(mu, sigma))), 1), max(maximum, 1))
+
+
+def _nearest_rank(ordered_values: Sequence[float], fraction: float) -> float:
+    rank = max(math.ceil(fraction * len(ordered_values)), 1)
+    return float(ordered_values[rank - 1])
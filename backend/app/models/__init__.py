@@ -5,23 +5,29 @@ from .rss import (
     RssFeedTag,
     RssScrapeJob,
     RssScrapeJobFeed,
+    RssScrapeJobOutbox,
     RssScrapeJobResult,
     RssTag,
 )
 from .sources import (
+    RssCompanySourceCount,
     RssSource,
     RssSourceFeed,
+    RssSourceListing,
 )
 
 __all__ = [
     "RssCompany",
+    "RssCompanySourceCount",
     "RssFeed",
     "RssFeedScraping",
     "RssFeedTag",
     "RssScrapeJob",
     "RssScrapeJobFeed",
+    "RssScrapeJobOutbox",
     "RssScrapeJobResult",
     "RssSource",
     "RssSourceFeed",
+    "RssSourceListing",
     "RssTag",
 ]
@@ -4,6 +4,7 @@ from .rss_feed_scraping_model import RssFeedScraping
 from .rss_feed_tag_model import RssFeedTag
 from .rss_scrape_job_feed_model import RssScrapeJobFeed
 from .rss_scrape_job_model import RssScrapeJob
+from .rss_scrape_job_outbox_model import RssScrapeJobOutbox
 from .rss_scrape_job_result_model import RssScrapeJobResult
 from .rss_tag_model import RssTag
 
@@ -14,6 +15,7 @@ __all__ = [
     "RssFeedTag",
     "RssScrapeJob",
     "RssScrapeJobFeed",
+    "RssScrapeJobOutbox",
     "RssScrapeJobResult",
     "RssTag",
 ]
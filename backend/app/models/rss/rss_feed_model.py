@@ -20,6 +20,7 @@ class RssFeed(Base):
             postgresql_where=sa.text("enabled = true"),
         ),
         sa.Index("idx_rss_feeds_company_id", "company_id"),
+        sa.Index("idx_rss_feeds_section", "section"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
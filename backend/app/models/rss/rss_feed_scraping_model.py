@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
@@ -19,7 +20,20 @@ class RssFeedScraping(Base):
             "error_nbr >= 0",
             name="ck_feeds_scraping_error_nbr",
         ),
+        sa.CheckConstraint(
+            "article_count >= 0",
+            name="ck_feeds_scraping_article_count",
+        ),
+        sa.CheckConstraint(
+            "fetch_interval_seconds > 0",
+            name="ck_feeds_scraping_fetch_interval_seconds",
+        ),
+        sa.CheckConstraint(
+            "ttl_seconds IS NULL OR ttl_seconds > 0",
+            name="ck_feeds_scraping_ttl_seconds",
+        ),
         sa.Index("idx_feeds_scraping_fetchprotection", "fetchprotection"),
+        sa.Index("idx_feeds_scraping_next_fetch_at", "next_fetch_at"),
     )
 
     feed_id: Mapped[int] = mapped_column(
@@ -48,6 +62,37 @@ class RssFeedScraping(Base):
         sa.Text(),
         nullable=True,
     )
+    last_article_published_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=True,
+    )
+    article_count: Mapped[int] = mapped_column(
+        sa.BigInteger(),
+        nullable=False,
+        server_default=sa.text("0"),
+    )
+    fetch_interval_seconds: Mapped[int] = mapped_column(
+        sa.Integer(),
+        nullable=False,
+        server_default=sa.text("3600"),
+    )
+    next_fetch_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=True,
+    )
+    ttl_seconds: Mapped[int | None] = mapped_column(
+        sa.Integer(),
+        nullable=True,
+    )
+    skip_hours: Mapped[list[int]] = mapped_column(
+        ARRAY(sa.SmallInteger()),
+        nullable=False,
+        server_default=sa.text("'{}'"),
+    )
+    fresh_until: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=True,
+    )
 
     feed: Mapped["RssFeed"] = relationship(
         "RssFeed",
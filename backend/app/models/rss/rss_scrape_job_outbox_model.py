@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class RssScrapeJobOutbox(Base):
+    __tablename__ = "rss_scrape_job_outbox"
+    __table_args__ = (
+        sa.ForeignKeyConstraint(
+            ["job_id"],
+            ["rss_scrape_jobs.job_id"],
+            ondelete="CASCADE",
+        ),
+        sa.CheckConstraint("feed_count >= 0", name="ck_rss_scrape_job_outbox_feed_count"),
+        sa.CheckConstraint("attempts >= 0", name="ck_rss_scrape_job_outbox_attempts"),
+        sa.CheckConstraint(
+            "status IN ('pending', 'sent', 'failed')",
+            name="ck_rss_scrape_job_outbox_status",
+        ),
+        sa.Index(
+            "idx_rss_scrape_job_outbox_pending",
+            "available_at",
+            "id",
+            postgresql_where=sa.text("status = 'pending'"),
+        ),
+        sa.Index(
+            "idx_rss_scrape_job_outbox_sent",
+            "sent_at",
+            postgresql_where=sa.text("status = 'sent'"),
+        ),
+        sa.Index("idx_rss_scrape_job_outbox_job_id", "job_id"),
+    )
+
+    id: Mapped[int] = mapped_column(sa.BigInteger(), sa.Identity(always=False), primary_key=True)
+    job_id: Mapped[str] = mapped_column(sa.String(36), nullable=False)
+    stream_name: Mapped[str] = mapped_column(sa.String(100), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB(), nullable=False)
+    feed_count: Mapped[int] = mapped_column(sa.Integer(), nullable=False)
+    status: Mapped[str] = mapped_column(
+        sa.String(20),
+        nullable=False,
+        server_default=sa.text("'pending'"),
+    )
+    attempts: Mapped[int] = mapped_column(
+        sa.Integer(),
+        nullable=False,
+        server_default=sa.text("0"),
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=True,
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        sa.Text(),
+        nullable=True,
+    )
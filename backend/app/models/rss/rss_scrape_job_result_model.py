@@ -29,6 +29,11 @@ class RssScrapeJobResult(Base):
             "queue_kind IN ('check', 'ingest', 'error')",
             name="ck_rss_scrape_job_results_queue_kind",
         ),
+        sa.Index(
+            "idx_rss_scrape_job_results_timed_processed_at",
+            "processed_at",
+            postgresql_where=sa.text("total_ms IS NOT NULL"),
+        ),
     )
 
     job_id: Mapped[str] = mapped_column(sa.String(36), primary_key=True)
@@ -42,6 +47,14 @@ class RssScrapeJobResult(Base):
         sa.DateTime(timezone=True),
         nullable=True,
     )
+    connect_ms: Mapped[int | None] = mapped_column(sa.Integer(), nullable=True)
+    ttfb_ms: Mapped[int | None] = mapped_column(sa.Integer(), nullable=True)
+    download_ms: Mapped[int | None] = mapped_column(sa.Integer(), nullable=True)
+    parse_ms: Mapped[int | None] = mapped_column(sa.Integer(), nullable=True)
+    total_ms: Mapped[int | None] = mapped_column(sa.Integer(), nullable=True)
+    response_bytes: Mapped[int | None] = mapped_column(sa.Integer(), nullable=True)
+    entries_parsed: Mapped[int | None] = mapped_column(sa.Integer(), nullable=True)
+    entries_kept: Mapped[int | None] = mapped_column(sa.Integer(), nullable=True)
     processed_at: Mapped[datetime] = mapped_column(
         sa.DateTime(timezone=True),
         nullable=False,
@@ -1,7 +1,11 @@
+from .rss_company_source_count_model import RssCompanySourceCount
 from .rss_source_feed_model import RssSourceFeed
+from .rss_source_listing_model import RssSourceListing
 from .rss_source_model import RssSource
 
 __all__ = [
+    "RssCompanySourceCount",
     "RssSource",
     "RssSourceFeed",
+    "RssSourceListing",
 ]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class RssCompanySourceCount(Base):
+    __tablename__ = "rss_company_source_counts"
+    __table_args__ = (
+        sa.CheckConstraint(
+            "source_count >= 0",
+            name="ck_rss_company_source_counts_source_count",
+        ),
+    )
+
+    company_id: Mapped[int] = mapped_column(
+        sa.ForeignKey("rss_company.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    source_count: Mapped[int] = mapped_column(
+        sa.BigInteger(),
+        nullable=False,
+        server_default=sa.text("0"),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
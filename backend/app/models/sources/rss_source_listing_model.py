@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class RssSourceListing(Base):
+    __tablename__ = "rss_source_listing"
+    __table_args__ = (
+        sa.ForeignKeyConstraint(
+            ["source_id", "published_at"],
+            ["rss_sources.id", "rss_sources.published_at"],
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        sa.Index("idx_rss_source_listing_published_at_source_id", "published_at", "source_id"),
+        sa.Index("idx_rss_source_listing_feed_ids", "feed_ids", postgresql_using="gin"),
+        sa.Index("idx_rss_source_listing_company_ids", "company_ids", postgresql_using="gin"),
+        {
+            "postgresql_partition_by": "RANGE (published_at)",
+        },
+    )
+
+    source_id: Mapped[int] = mapped_column(primary_key=True)
+    published_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        server_default=sa.text("TIMESTAMPTZ '1970-01-01 00:00:00+00'"),
+    )
+    title: Mapped[str] = mapped_column(sa.String(500), nullable=False)
+    summary: Mapped[str | None] = mapped_column(sa.Text(), nullable=True)
+    author: Mapped[str | None] = mapped_column(sa.String(255), nullable=True)
+    url: Mapped[str] = mapped_column(sa.String(1000), nullable=False)
+    image_url: Mapped[str | None] = mapped_column(sa.String(1000), nullable=True)
+    feed_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(sa.Integer()),
+        nullable=False,
+        server_default=sa.text("'{}'"),
+    )
+    company_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(sa.Integer()),
+        nullable=False,
+        server_default=sa.text("'{}'"),
+    )
+    company_names: Mapped[list[str]] = mapped_column(
+        ARRAY(sa.String(50)),
+        nullable=False,
+        server_default=sa.text("'{}'"),
+    )
@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
@@ -17,6 +18,7 @@ class RssSource(Base):
             name="uq_rss_sources_url_published_at",
         ),
         sa.Index("idx_rss_sources_published_at", "published_at"),
+        sa.Index("idx_rss_sources_search_vector", "search_vector", postgresql_using="gin"),
         {
             "postgresql_partition_by": "RANGE (published_at)",
         },
@@ -39,6 +41,22 @@ class RssSource(Base):
         server_default=sa.text("TIMESTAMPTZ '1970-01-01 00:00:00+00'"),
     )
     image_url: Mapped[str | None] = mapped_column(sa.String(1000), nullable=True)
+    search_language: Mapped[str] = mapped_column(
+        REGCONFIG(),
+        nullable=False,
+        server_default=sa.text("'simple'::regconfig"),
+    )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector(search_language, COALESCE(title, '')), 'A') "
+            "|| setweight(to_tsvector(search_language, COALESCE(summary, '')), 'B') "
+            "|| setweight(to_tsvector(search_language, COALESCE(author, '')), 'C')",
+            persisted=True,
+        ),
+        nullable=True,
+        deferred=True,
+    )
 
     feed_links: Mapped[list["RssSourceFeed"]] = relationship(
         "RssSourceFeed",
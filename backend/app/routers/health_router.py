@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.schemas.health import HealthRead
-from app.services.health import get_health_status
+from app.schemas.health import HealthRead, QueueHealthRead
+from app.services.health import get_health_status, get_queue_health
 from database import get_db_session
 
 health_router = APIRouter(prefix="/health", tags=["health"])
@@ -11,3 +11,8 @@ health_router = APIRouter(prefix="/health", tags=["health"])
 @health_router.get("/", response_model=HealthRead)
 def read_health(db: Session = Depends(get_db_session)) -> HealthRead:
     return get_health_status(db)
+
+
+@health_router.get("/queues", response_model=QueueHealthRead)
+async def read_queue_health() -> QueueHealthRead:
+    return await get_queue_health()
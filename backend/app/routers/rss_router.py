@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.errors.rss import RssJobAlreadyRunningError, RssRepositorySyncError
@@ -8,19 +9,22 @@ from app.schemas.rss import (
     RssFeedEnabledToggleRead,
     RssEnabledTogglePayload,
     RssFeedRead,
+    RssFetchLatencyGroupBy,
+    RssFetchLatencyRead,
     RssScrapeJobQueuedRead,
     RssSyncRead,
 )
 from app.services.rss import (
     enqueue_rss_feed_check_job,
     get_rss_feeds_read,
+    get_rss_fetch_latency,
     get_rss_icon_file_path,
     sync_rss_catalog,
     toggle_rss_company_enabled,
     toggle_rss_feed_enabled,
 )
 from app.utils import JobAlreadyRunning, job_lock, GitRepositorySyncError
-from database import get_db_session
+from database import get_async_db_session, get_db_session
 
 rss_router = APIRouter(prefix="/rss", tags=["rss"])
 
@@ -81,9 +85,25 @@ def sync_rss_feeds(
 @rss_router.post("/feeds/check", response_model=RssScrapeJobQueuedRead)
 async def check_rss_feed_urls(
     feed_ids: list[int] | None = Query(default=None),
-    db: Session = Depends(get_db_session),
+    force: bool = Query(default=False),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> RssScrapeJobQueuedRead:
-    return await enqueue_rss_feed_check_job(db, feed_ids=feed_ids)
+    return await enqueue_rss_feed_check_job(db, feed_ids=feed_ids, force=force)
+
+
+@rss_router.get("/latency", response_model=list[RssFetchLatencyRead])
+def read_rss_fetch_latency(
+    group_by: RssFetchLatencyGroupBy = Query(default="company"),
+    window_hours: int = Query(default=24, ge=1, le=720),
+    limit: int = Query(default=50, ge=1, le=500),
+    db: Session = Depends(get_db_session),
+) -> list[RssFetchLatencyRead]:
+    return get_rss_fetch_latency(
+        db,
+        group_by=group_by,
+        window_hours=window_hours,
+        limit=limit,
+    )
 
 
 @rss_router.get("/img/{icon_url:path}")
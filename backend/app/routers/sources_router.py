@@ -1,35 +1,64 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, Path, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.errors.rss import RssJobAlreadyRunningError
 from app.schemas.rss import RssScrapeJobQueuedRead
 from app.schemas.sources import (
     RssSourceDetailRead,
+    RssSourceListFilters,
     RssSourcePartitionMaintenanceRead,
     RssSourcePageRead,
+    RssSourceSearchPageRead,
+    RssSourceTotalMode,
 )
 from app.services.sources import (
     enqueue_sources_ingest_job,
     get_rss_source_by_id,
     get_rss_sources,
     repartition_rss_source_partitions,
+    search_rss_sources,
 )
 from app.utils import JobAlreadyRunning, job_lock
-from database import get_db_session
+from database import get_async_db_session, get_db_session
 
 sources_router = APIRouter(prefix="/sources", tags=["sources"])
 
 
+def _read_source_list_filters(
+    published_after: datetime | None = Query(default=None),
+    published_before: datetime | None = Query(default=None),
+    section: str | None = Query(default=None, min_length=1, max_length=50),
+    country: str | None = Query(default=None, min_length=2, max_length=2),
+    language: str | None = Query(default=None, min_length=2, max_length=2),
+    tags: list[str] | None = Query(default=None),
+) -> RssSourceListFilters:
+    return RssSourceListFilters(
+        published_after=published_after,
+        published_before=published_before,
+        section=section,
+        country=country,
+        language=language,
+        tags=tags or [],
+    )
+
+
 @sources_router.get("/", response_model=RssSourcePageRead)
 def read_sources(
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    total_mode: RssSourceTotalMode = Query(default="exact"),
+    filters: RssSourceListFilters = Depends(_read_source_list_filters),
     db: Session = Depends(get_db_session),
 ) -> RssSourcePageRead:
     return get_rss_sources(
         db,
         limit=limit,
         offset=offset,
+        filters=filters,
+        total_mode=total_mode,
     )
 
 
@@ -38,6 +67,8 @@ def read_sources_by_feed(
     feed_id: int = Path(ge=1),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    total_mode: RssSourceTotalMode = Query(default="exact"),
+    filters: RssSourceListFilters = Depends(_read_source_list_filters),
     db: Session = Depends(get_db_session),
 ) -> RssSourcePageRead:
     return get_rss_sources(
@@ -45,6 +76,8 @@ def read_sources_by_feed(
         limit=limit,
         offset=offset,
         feed_id=feed_id,
+        filters=filters,
+        total_mode=total_mode,
     )
 
 
@@ -53,6 +86,8 @@ def read_sources_by_company(
     company_id: int = Path(ge=1),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    total_mode: RssSourceTotalMode = Query(default="exact"),
+    filters: RssSourceListFilters = Depends(_read_source_list_filters),
     db: Session = Depends(get_db_session),
 ) -> RssSourcePageRead:
     return get_rss_sources(
@@ -60,6 +95,27 @@ def read_sources_by_company(
         limit=limit,
         offset=offset,
         company_id=company_id,
+        filters=filters,
+        total_mode=total_mode,
+    )
+
+
+@sources_router.get("/search", response_model=RssSourceSearchPageRead)
+def search_sources(
+    q: str = Query(min_length=1, max_length=200),
+    published_after: datetime | None = Query(default=None),
+    published_before: datetime | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = Query(default=None, max_length=512),
+    db: Session = Depends(get_db_session),
+) -> RssSourceSearchPageRead:
+    return search_rss_sources(
+        db,
+        query=q,
+        limit=limit,
+        published_after=published_after,
+        published_before=published_before,
+        cursor=cursor,
     )
 
 
@@ -74,9 +130,10 @@ def read_source_by_id(
 @sources_router.post("/ingest", response_model=RssScrapeJobQueuedRead)
 async def ingest_sources(
     feed_ids: list[int] | None = Query(default=None, min_length=1),
-    db: Session = Depends(get_db_session),
+    force: bool = Query(default=False),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> RssScrapeJobQueuedRead:
-    return await enqueue_sources_ingest_job(db, feed_ids=feed_ids)
+    return await enqueue_sources_ingest_job(db, feed_ids=feed_ids, force=force)
 
 
 @sources_router.post(
@@ -1,5 +1,17 @@
 from .health_schema import HealthRead
+from .queue_health_schema import (
+    QueueConsumerHealthRead,
+    QueueGroupHealthRead,
+    QueueHealthRead,
+    QueueHealthStatus,
+    QueueStreamHealthRead,
+)
 
 __all__ = [
     "HealthRead",
+    "QueueConsumerHealthRead",
+    "QueueGroupHealthRead",
+    "QueueHealthRead",
+    "QueueHealthStatus",
+    "QueueStreamHealthRead",
 ]
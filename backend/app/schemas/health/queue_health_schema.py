@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+QueueHealthStatus = Literal["ok", "unavailable"]
+
+
+class QueueConsumerHealthRead(BaseModel):
+    name: str
+    pending: int = Field(ge=0)
+    idle_seconds: float = Field(ge=0)
+    inactive_seconds: float | None = None
+
+
+class QueueGroupHealthRead(BaseModel):
+    name: str
+    lag: int | None = None
+    pending: int = Field(ge=0)
+    last_delivered_id: str
+    oldest_pending_id: str | None = None
+    oldest_pending_age_seconds: float | None = None
+    oldest_pending_idle_seconds: float | None = None
+    oldest_pending_delivery_count: int | None = None
+    consumers: list[QueueConsumerHealthRead] = Field(default_factory=list)
+
+
+class QueueStreamHealthRead(BaseModel):
+    stream: str
+    exists: bool
+    length: int = Field(ge=0)
+    groups: list[QueueGroupHealthRead] = Field(default_factory=list)
+
+
+class QueueHealthRead(BaseModel):
+    status: QueueHealthStatus
+    generated_at: datetime
+    total_lag: int = Field(ge=0)
+    total_pending: int = Field(ge=0)
+    max_oldest_pending_age_seconds: float | None = None
+    streams: list[QueueStreamHealthRead] = Field(default_factory=list)
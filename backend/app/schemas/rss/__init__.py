@@ -8,6 +8,8 @@ from .rss_enabled_toggle_schema import (
 
 from .rss_feed_schema import RssFeedRead
 from .rss_scrape_job_schema import (
+    RssFetchLatencyGroupBy,
+    RssFetchLatencyRead,
     RssScrapeFeedPayloadSchema,
     RssScrapeJobFeedRead,
     RssScrapeJobQueuedRead,
@@ -24,6 +26,8 @@ __all__ = [
     "RssFeedEnabledToggleRead",
     "RssEnabledTogglePayload",
     "RssFeedRead",
+    "RssFetchLatencyGroupBy",
+    "RssFetchLatencyRead",
     "RssScrapeFeedPayloadSchema",
     "RssScrapeJobFeedRead",
     "RssScrapeJobQueuedRead",
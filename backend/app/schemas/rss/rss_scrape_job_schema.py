@@ -13,6 +13,7 @@ RssScrapeJobStatus = Literal[
     "failed",
 ]
 RssScrapeResultStatus = Literal["success", "not_modified", "error", "pending"]
+RssFetchLatencyGroupBy = Literal["company", "feed"]
 
 
 class RssScrapeFeedPayloadSchema(BaseModel):
@@ -60,3 +61,20 @@ class RssScrapeJobFeedRead(BaseModel):
     fetchprotection: int | None = Field(default=None, ge=0, le=2)
     new_etag: str | None = None
     new_last_update: datetime | None = None
+
+
+class RssFetchLatencyRead(BaseModel):
+    company_id: int | None = None
+    company_name: str | None = None
+    feed_id: int | None = None
+    feed_url: str | None = None
+    sample_count: int = Field(ge=0)
+    error_count: int = Field(ge=0)
+    total_p50_ms: float | None = None
+    total_p95_ms: float | None = None
+    total_p99_ms: float | None = None
+    connect_p95_ms: float | None = None
+    ttfb_p95_ms: float | None = None
+    download_p95_ms: float | None = None
+    parse_p95_ms: float | None = None
+    avg_response_bytes: float | None = None
@@ -1,13 +1,23 @@
 from .source_schema import (
     RssSourceDetailRead,
+    RssSourceListFilters,
     RssSourcePageRead,
     RssSourceRead,
+    RssSourceTotalMode,
 )
 from .source_partition_schema import RssSourcePartitionMaintenanceRead
+from .source_search_schema import (
+    RssSourceSearchItemRead,
+    RssSourceSearchPageRead,
+)
 
 __all__ = [
     "RssSourceDetailRead",
+    "RssSourceListFilters",
     "RssSourcePageRead",
     "RssSourceRead",
+    "RssSourceTotalMode",
     "RssSourcePartitionMaintenanceRead",
+    "RssSourceSearchItemRead",
+    "RssSourceSearchPageRead",
 ]
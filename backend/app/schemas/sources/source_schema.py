@@ -1,7 +1,10 @@
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
+RssSourceTotalMode = Literal["exact", "estimated"]
+
 
 class RssSourceRead(BaseModel):
     id: int
@@ -14,9 +17,19 @@ class RssSourceRead(BaseModel):
     company_names: list[str] = Field(default_factory=list)
 
 
+class RssSourceListFilters(BaseModel):
+    published_after: datetime | None = None
+    published_before: datetime | None = None
+    section: str | None = None
+    country: str | None = None
+    language: str | None = None
+    tags: list[str] = Field(default_factory=list)
+
+
 class RssSourcePageRead(BaseModel):
     items: list[RssSourceRead] = Field(default_factory=list)
     total: int = Field(ge=0, default=0)
+    total_mode: RssSourceTotalMode = "exact"
     limit: int = Field(ge=1)
     offset: int = Field(ge=0)
 
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+from .source_schema import RssSourceRead
+
+
+class RssSourceSearchItemRead(RssSourceRead):
+    rank: float = Field(ge=0)
+
+
+class RssSourceSearchPageRead(BaseModel):
+    items: list[RssSourceSearchItemRead] = Field(default_factory=list)
+    limit: int = Field(ge=1)
+    next_cursor: str | None = None
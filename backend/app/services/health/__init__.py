@@ -1,5 +1,7 @@
 from .health_service import get_health_status
+from .queue_health_service import get_queue_health
 
 __all__ = [
     "get_health_status",
+    "get_queue_health",
 ]
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timezone
+import logging
+import time
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from app.clients.queue import (
+    DEFAULT_REDIS_QUEUE_CHECK,
+    DEFAULT_REDIS_QUEUE_DEAD_LETTERS,
+    DEFAULT_REDIS_QUEUE_ERRORS,
+    DEFAULT_REDIS_QUEUE_INGEST,
+    get_request_shard_count,
+    get_requests_stream_name,
+    read_redis_server_time_ms,
+    read_redis_stream_health,
+)
+from app.schemas.health import (
+    QueueConsumerHealthRead,
+    QueueGroupHealthRead,
+    QueueHealthRead,
+    QueueStreamHealthRead,
+)
+from app.utils import resolve_positive_float_env
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_HEALTH_CACHE_SECONDS = 5.0
+
+_queue_health_cache: tuple[float, QueueHealthRead] | None = None
+_queue_health_lock = asyncio.Lock()
+
+
+async def get_queue_health(
+    *,
+    monotonic: Callable[[], float] = time.monotonic,
+) -> QueueHealthRead:
+    global _queue_health_cache
+    cache_seconds = resolve_positive_float_env(
+        "QUEUE_HEALTH_CACHE_SECONDS",
+        DEFAULT_QUEUE_HEALTH_CACHE_SECONDS,
+    )
+    cached_queue_health = _read_cached_queue_health(monotonic(), cache_seconds)
+    if cached_queue_health is not None:
+        return cached_queue_health
+
+    # Concurrent pollers wait for the refresh in flight instead of all hitting Redis.
+    async with _queue_health_lock:
+        cached_queue_health = _read_cached_queue_health(monotonic(), cache_seconds)
+        if cached_queue_health is not None:
+            return cached_queue_health
+        queue_health = await _read_queue_health()
+        _queue_health_cache = (monotonic(), queue_health)
+        return queue_health
+
+
+def list_queue_health_stream_names() -> list[str]:
+    stream_names = [
+        get_requests_stream_name(interactive=True),
+        get_requests_stream_name(),
+    ]
+    shard_count = get_request_shard_count()
+    if shard_count > 1:
+        for interactive in (True, False):
+            stream_names.extend(
+                get_requests_stream_name(interactive=interactive, shard=shard)
+                for shard in range(shard_count)
+            )
+    stream_names.extend(
+        (
+            DEFAULT_REDIS_QUEUE_CHECK,
+            DEFAULT_REDIS_QUEUE_INGEST,
+            DEFAULT_REDIS_QUEUE_ERRORS,
+            DEFAULT_REDIS_QUEUE_DEAD_LETTERS,
+        )
+    )
+    return stream_names
+
+
+def _read_cached_queue_health(now: float, cache_seconds: float) -> QueueHealthRead | None:
+    if _queue_health_cache is None:
+        return None
+    cached_at, queue_health = _queue_health_cache
+    if now - cached_at >= cache_seconds:
+        return None
+    return queue_health
+
+
+async def _read_queue_health() -> QueueHealthRead:
+    generated_at = datetime.now(timezone.utc)
+    try:
+        server_time_ms = await read_redis_server_time_ms()
+        stream_reads = [
+            _to_stream_health_read(
+                stream_name,
+                await read_redis_stream_health(stream_name),
+                server_time_ms=server_time_ms,
+            )
+            for stream_name in list_queue_health_stream_names()
+        ]
+    except RedisError as exception:
+        logger.warning("Unable to read Redis queue health: %s", exception)
+        return QueueHealthRead(
+            status="unavailable",
+            generated_at=generated_at,
+            total_lag=0,
+            total_pending=0,
+        )
+
+    group_reads = [group_read for stream_read in stream_reads for group_read in stream_read.groups]
+    oldest_pending_ages = [
+        group_read.oldest_pending_age_seconds
+        for group_read in group_reads
+        if group_read.oldest_pending_age_seconds is not None
+    ]
+    return QueueHealthRead(
+        status="ok",
+        generated_at=generated_at,
+        total_lag=sum(group_read.lag or 0 for group_read in group_reads),
+        total_pending=sum(group_read.pending for group_read in group_reads),
+        max_oldest_pending_age_seconds=max(oldest_pending_ages, default=None),
+        streams=stream_reads,
+    )
+
+
+def _to_stream_health_read(
+    stream_name: str,
+    stream_health: dict[str, Any] | None,
+    *,
+    server_time_ms: int,
+) -> QueueStreamHealthRead:
+    if stream_health is None:
+        return QueueStreamHealthRead(stream=stream_name, exists=False, length=0)
+    return QueueStreamHealthRead(
+        stream=stream_name,
+        exists=True,
+        length=stream_health["length"],
+        groups=[
+            _to_group_health_read(group, server_time_ms=server_time_ms)
+            for group in stream_health["groups"]
+        ],
+    )
+
+
+def _to_group_health_read(group: dict[str, Any], *, server_time_ms: int) -> QueueGroupHealthRead:
+    oldest_pending = group["oldest_pending"]
+    return QueueGroupHealthRead(
+        name=group["name"],
+        lag=int(group["lag"]) if group["lag"] is not None else None,
+        pending=group["pending"],
+        last_delivered_id=group["last_delivered_id"],
+        oldest_pending_id=oldest_pending["message_id"] if oldest_pending else None,
+        oldest_pending_age_seconds=(
+            _message_age_seconds(oldest_pending["message_id"], server_time_ms=server_time_ms)
+            if oldest_pending
+            else None
+        ),
+        oldest_pending_idle_seconds=oldest_pending["idle_ms"] / 1000 if oldest_pending else None,
+        oldest_pending_delivery_count=oldest_pending["delivery_count"] if oldest_pending else None,
+        consumers=[
+            QueueConsumerHealthRead(
+                name=consumer["name"],
+                pending=consumer["pending"],
+                idle_seconds=consumer["idle_ms"] / 1000,
+                inactive_seconds=(
+                    consumer["inactive_ms"] / 1000
+                    if consumer["inactive_ms"] is not None and int(consumer["inactive_ms"]) >= 0
+                    else None
+                ),
+            )
+            for consumer in group["consumers"]
+        ],
+    )
+
+
+def _message_age_seconds(message_id: str, *, server_time_ms: int) -> float:
+    # Stream ids start with the millisecond timestamp of the XADD.
+    created_at_ms = int(message_id.split("-", 1)[0])
+    return max(server_time_ms - created_at_ms, 0) / 1000
@@ -2,9 +2,15 @@ from .rss_feed_service import get_rss_feeds_read
 from .rss_icon_service import get_rss_icon_file_path
 from .rss_scrape_job_service import (
     enqueue_rss_feed_check_job,
+    get_rss_fetch_latency,
     get_rss_scrape_job_status,
     list_rss_scrape_job_feeds,
 )
+from .rss_scrape_job_outbox_service import (
+    is_rss_scrape_job_outbox_relay_enabled,
+    run_rss_scrape_job_outbox_relay,
+    stop_rss_scrape_job_outbox_relay,
+)
 from .rss_sync_service import sync_rss_catalog
 from .rss_toggle_service import (
     toggle_rss_company_enabled,
@@ -14,9 +20,13 @@ from .rss_toggle_service import (
 __all__ = [
     "get_rss_feeds_read",
     "enqueue_rss_feed_check_job",
+    "get_rss_fetch_latency",
     "get_rss_icon_file_path",
     "get_rss_scrape_job_status",
     "list_rss_scrape_job_feeds",
+    "is_rss_scrape_job_outbox_relay_enabled",
+    "run_rss_scrape_job_outbox_relay",
+    "stop_rss_scrape_job_outbox_relay",
     "sync_rss_catalog",
     "toggle_rss_company_enabled",
     "toggle_rss_feed_enabled",
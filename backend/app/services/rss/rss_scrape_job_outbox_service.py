@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.clients.database.rss import (
+    claim_pending_rss_scrape_job_outbox_async,
+    mark_rss_scrape_job_outbox_sent_async,
+    mark_rss_scrape_jobs_failed_async,
+    purge_sent_rss_scrape_job_outbox_async,
+    reschedule_rss_scrape_job_outbox,
+)
+from app.clients.queue import publish_rss_scrape_job_messages
+from app.utils import (
+    resolve_bool_env,
+    resolve_positive_float_env,
+    resolve_positive_int_env,
+)
+from database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTBOX_BATCH_SIZE = 100
+DEFAULT_OUTBOX_POLL_SECONDS = 1.0
+DEFAULT_OUTBOX_MAX_ATTEMPTS = 10
+DEFAULT_JOB_MAX_INFLIGHT_FEEDS = 500
+DEFAULT_JOB_INFLIGHT_WINDOW_SECONDS = 600
+DEFAULT_OUTBOX_RETENTION_HOURS = 24
+OUTBOX_PURGE_INTERVAL_SECONDS = 300.0
+OUTBOX_PURGE_BATCH_SIZE = 1000
+OUTBOX_RETRY_BASE_DELAY_SECONDS = 1.0
+OUTBOX_RETRY_MAX_DELAY_SECONDS = 60.0
+
+_relay_wakeup: asyncio.Event | None = None
+
+
+def is_rss_scrape_job_outbox_relay_enabled() -> bool:
+    return resolve_bool_env("RSS_SCRAPE_OUTBOX_RELAY_ENABLED", True)
+
+
+def wake_rss_scrape_job_outbox_relay() -> None:
+    if _relay_wakeup is not None:
+        _relay_wakeup.set()
+
+
+async def run_rss_scrape_job_outbox_relay(stop_event: asyncio.Event) -> None:
+    global _relay_wakeup
+    wakeup = asyncio.Event()
+    _relay_wakeup = wakeup
+
+    batch_size = resolve_positive_int_env("RSS_SCRAPE_OUTBOX_BATCH_SIZE", DEFAULT_OUTBOX_BATCH_SIZE)
+    max_attempts = resolve_positive_int_env("RSS_SCRAPE_OUTBOX_MAX_ATTEMPTS", DEFAULT_OUTBOX_MAX_ATTEMPTS)
+    poll_seconds = resolve_positive_float_env("RSS_SCRAPE_OUTBOX_POLL_SECONDS", DEFAULT_OUTBOX_POLL_SECONDS)
+    max_inflight_feeds = resolve_positive_int_env(
+        "RSS_SCRAPE_JOB_MAX_INFLIGHT_FEEDS",
+        DEFAULT_JOB_MAX_INFLIGHT_FEEDS,
+    )
+    inflight_window_seconds = resolve_positive_int_env(
+        "RSS_SCRAPE_JOB_INFLIGHT_WINDOW_SECONDS",
+        DEFAULT_JOB_INFLIGHT_WINDOW_SECONDS,
+    )
+    retention_hours = resolve_positive_int_env(
+        "RSS_SCRAPE_OUTBOX_RETENTION_HOURS",
+        DEFAULT_OUTBOX_RETENTION_HOURS,
+    )
+    loop = asyncio.get_running_loop()
+    next_purge_at = loop.time()
+
+    try:
+        while not stop_event.is_set():
+            wakeup.clear()
+            if loop.time() >= next_purge_at:
+                await _purge_sent_outbox(retention_seconds=retention_hours * 3600)
+                next_purge_at = loop.time() + OUTBOX_PURGE_INTERVAL_SECONDS
+            try:
+                async with AsyncSessionLocal() as db:
+                    relayed_count = await relay_pending_rss_scrape_job_outbox(
+                        db,
+                        batch_size=batch_size,
+                        max_attempts=max_attempts,
+                        max_inflight_feeds=max_inflight_feeds,
+                        inflight_window_seconds=inflight_window_seconds,
+                    )
+            except Exception as exception:
+                logger.exception("RSS scrape job outbox relay error: %s", exception)
+                relayed_count = 0
+
+            if relayed_count >= batch_size:
+                continue
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        if _relay_wakeup is wakeup:
+            _relay_wakeup = None
+
+
+async def stop_rss_scrape_job_outbox_relay(
+    relay_task: asyncio.Task,
+    stop_event: asyncio.Event,
+) -> None:
+    stop_event.set()
+    wake_rss_scrape_job_outbox_relay()
+    await relay_task
+
+
+async def relay_pending_rss_scrape_job_outbox(
+    db: AsyncSession,
+    *,
+    batch_size: int = DEFAULT_OUTBOX_BATCH_SIZE,
+    max_attempts: int = DEFAULT_OUTBOX_MAX_ATTEMPTS,
+    max_inflight_feeds: int = DEFAULT_JOB_MAX_INFLIGHT_FEEDS,
+    inflight_window_seconds: int = DEFAULT_JOB_INFLIGHT_WINDOW_SECONDS,
+) -> int:
+    outbox_rows = await claim_pending_rss_scrape_job_outbox_async(
+        db,
+        limit=batch_size,
+        max_inflight_feeds=max_inflight_feeds,
+        inflight_window_seconds=inflight_window_seconds,
+    )
+    if not outbox_rows:
+        await db.rollback()
+        return 0
+
+    try:
+        publish_results = await publish_rss_scrape_job_messages(
+            [(outbox_row.stream_name, outbox_row.payload) for outbox_row in outbox_rows]
+        )
+    except Exception as exception:
+        await _reschedule_unpublished_outbox_rows(
+            db,
+            outbox_rows,
+            exception=exception,
+            max_attempts=max_attempts,
+        )
+        await db.commit()
+        return 0
+
+    # Pipelines are not transactional: mark every row by its own XADD result, so rows
+    # that did reach Redis are not published again with the ones that failed.
+    sent_rows = []
+    failed_rows = []
+    publish_error: Exception | None = None
+    for outbox_row, publish_result in zip(outbox_rows, publish_results):
+        if isinstance(publish_result, Exception):
+            failed_rows.append(outbox_row)
+            publish_error = publish_error or publish_result
+        else:
+            sent_rows.append(outbox_row)
+
+    await mark_rss_scrape_job_outbox_sent_async(
+        db,
+        outbox_ids=[outbox_row.id for outbox_row in sent_rows],
+    )
+    if publish_error is not None:
+        await _reschedule_unpublished_outbox_rows(
+            db,
+            failed_rows,
+            exception=publish_error,
+            max_attempts=max_attempts,
+        )
+    await db.commit()
+    return len(sent_rows)
+
+
+async def purge_sent_rss_scrape_job_outbox(
+    db: AsyncSession,
+    *,
+    retention_seconds: int,
+    batch_size: int = OUTBOX_PURGE_BATCH_SIZE,
+) -> int:
+    purged_count = 0
+    while True:
+        deleted_count = await purge_sent_rss_scrape_job_outbox_async(
+            db,
+            retention_seconds=retention_seconds,
+            limit=batch_size,
+        )
+        await db.commit()
+        purged_count += deleted_count
+        if deleted_count < batch_size:
+            return purged_count
+
+
+async def _purge_sent_outbox(*, retention_seconds: int) -> None:
+    try:
+        async with AsyncSessionLocal() as db:
+            purged_count = await purge_sent_rss_scrape_job_outbox(
+                db,
+                retention_seconds=retention_seconds,
+            )
+    except Exception as exception:
+        logger.exception("RSS scrape job outbox purge error: %s", exception)
+        return
+    if purged_count:
+        logger.info("Purged %s sent RSS scrape job outbox messages", purged_count)
+
+
+async def _reschedule_unpublished_outbox_rows(
+    db: AsyncSession,
+    outbox_rows: list,
+    *,
+    exception: Exception,
+    max_attempts: int,
+) -> None:
+    exhausted_job_ids = reschedule_rss_scrape_job_outbox(
+        outbox_rows,
+        error_message=str(exception) or exception.__class__.__name__,
+        retry_base_delay_seconds=OUTBOX_RETRY_BASE_DELAY_SECONDS,
+        retry_max_delay_seconds=OUTBOX_RETRY_MAX_DELAY_SECONDS,
+        max_attempts=max_attempts,
+    )
+    await mark_rss_scrape_jobs_failed_async(db, job_ids=exhausted_job_ids)
+    logger.warning(
+        "Unable to publish %s RSS scrape job outbox messages: %s",
+        len(outbox_rows),
+        exception,
+    )
@@ -2,37 +2,44 @@ from __future__ import annotations
 
 from collections import defaultdict, deque
 from collections.abc import Iterator
-from datetime import datetime, timezone
-import os
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
+import zlib
 
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.clients.database.rss import (
     create_rss_scrape_job,
     get_rss_scrape_job_status_read,
-    list_rss_feed_scrape_payloads,
+    insert_rss_scrape_job_feeds_async,
+    insert_rss_scrape_job_outbox_async,
+    list_rss_feed_scrape_payloads_async,
+    list_rss_fetch_latency_reads,
     list_rss_scrape_job_feed_reads,
-    set_rss_scrape_job_status,
 )
-from app.clients.queue import publish_rss_scrape_job
-from app.errors.rss import RssJobQueuePublishError
+from app.clients.queue import get_request_shard_count, get_requests_stream_name
 from app.schemas.rss import (
+    RssFetchLatencyGroupBy,
+    RssFetchLatencyRead,
     RssScrapeFeedPayloadSchema,
     RssScrapeJobFeedRead,
     RssScrapeJobQueuedRead,
     RssScrapeJobRequestSchema,
     RssScrapeJobStatusRead,
 )
+from app.services.rss.rss_scrape_job_outbox_service import wake_rss_scrape_job_outbox_relay
+from app.utils import resolve_positive_int_env
 
 DEFAULT_QUEUE_BATCH_SIZE = 50
 
 
 async def enqueue_rss_feed_check_job(
-    db: Session,
+    db: AsyncSession,
     *,
     feed_ids: list[int] | None = None,
+    force: bool = False,
 ) -> RssScrapeJobQueuedRead:
     return await _enqueue_rss_scrape_job(
         db=db,
@@ -40,13 +47,15 @@ async def enqueue_rss_feed_check_job(
         requested_by="rss_feeds_check_endpoint",
         feed_ids=feed_ids,
         enabled_only=False,
+        force=force,
     )
 
 
 async def enqueue_rss_sources_ingest_job(
-    db: Session,
+    db: AsyncSession,
     *,
     feed_ids: list[int] | None = None,
+    force: bool = False,
 ) -> RssScrapeJobQueuedRead:
     return await _enqueue_rss_scrape_job(
         db=db,
@@ -54,6 +63,34 @@ async def enqueue_rss_sources_ingest_job(
         requested_by="sources_ingest_endpoint",
         feed_ids=feed_ids,
         enabled_only=True,
+        force=force,
+    )
+
+
+async def list_scheduled_rss_sources_ingest_feeds(
+    db: AsyncSession,
+    *,
+    feed_ids: list[int],
+) -> list[RssScrapeFeedPayloadSchema]:
+    return await list_rss_feed_scrape_payloads_async(
+        db,
+        feed_ids=feed_ids,
+        enabled_only=True,
+        skip_fresh=True,
+        skip_pending_ingest_jobs=True,
+    )
+
+
+async def enqueue_scheduled_rss_sources_ingest_job(
+    db: AsyncSession,
+    *,
+    feeds: list[RssScrapeFeedPayloadSchema],
+) -> RssScrapeJobQueuedRead:
+    return await _queue_rss_scrape_job(
+        db=db,
+        ingest=True,
+        requested_by="sources_ingest_scheduler",
+        feeds=feeds,
     )
 
 
@@ -79,20 +116,53 @@ def list_rss_scrape_job_feeds(
     return list_rss_scrape_job_feed_reads(db, job_id=job_id)
 
 
+def get_rss_fetch_latency(
+    db: Session,
+    *,
+    group_by: RssFetchLatencyGroupBy,
+    window_hours: int,
+    limit: int,
+) -> list[RssFetchLatencyRead]:
+    return list_rss_fetch_latency_reads(
+        db,
+        group_by=group_by,
+        since=datetime.now(timezone.utc) - timedelta(hours=window_hours),
+        limit=limit,
+    )
+
+
 async def _enqueue_rss_scrape_job(
     *,
-    db: Session,
+    db: AsyncSession,
     ingest: bool,
     requested_by: str,
     feed_ids: list[int] | None,
     enabled_only: bool,
+    force: bool,
 ) -> RssScrapeJobQueuedRead:
-    feeds = list_rss_feed_scrape_payloads(
+    feeds = await list_rss_feed_scrape_payloads_async(
         db,
         feed_ids=feed_ids,
         enabled_only=enabled_only,
+        skip_fresh=not force,
+        skip_pending_check_jobs=not force and not ingest,
+        skip_pending_ingest_jobs=not force and ingest,
+    )
+    return await _queue_rss_scrape_job(
+        db=db,
+        ingest=ingest,
+        requested_by=requested_by,
+        feeds=feeds,
     )
 
+
+async def _queue_rss_scrape_job(
+    *,
+    db: AsyncSession,
+    ingest: bool,
+    requested_by: str,
+    feeds: list[RssScrapeFeedPayloadSchema],
+) -> RssScrapeJobQueuedRead:
     requested_at = datetime.now(timezone.utc)
     job_id = str(uuid4())
     initial_status = "queued" if feeds else "completed"
@@ -107,38 +177,78 @@ async def _enqueue_rss_scrape_job(
         feeds=feeds,
     )
 
-    try:
-        db.commit()
-    except Exception:
-        db.rollback()
-        raise
-
     if feeds:
-        mixed_feeds = _mix_feeds_by_company(feeds)
-        queue_batch_size = _resolve_queue_batch_size()
-        try:
-            for feed_batch in _iter_feed_batches(mixed_feeds, batch_size=queue_batch_size):
-                payload = RssScrapeJobRequestSchema(
+        await insert_rss_scrape_job_feeds_async(db, job_id=job_id, feeds=feeds)
+        for stream_name, stream_feeds in _route_feeds_to_request_streams(feeds, interactive=not ingest):
+            await insert_rss_scrape_job_outbox_async(
+                db,
+                job_id=job_id,
+                stream_name=stream_name,
+                payloads=_build_rss_scrape_job_payloads(
                     job_id=job_id,
                     requested_at=requested_at,
                     ingest=ingest,
                     requested_by=requested_by,
-                    feeds=feed_batch,
-                ).model_dump(mode="json")
-                await publish_rss_scrape_job(payload)
-        except Exception as exception:
-            _mark_job_as_failed_after_publish_error(db, job_id=job_id)
-            raise RssJobQueuePublishError("Unable to publish RSS scrape job") from exception
+                    feeds=stream_feeds,
+                ),
+            )
+
+    try:
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    if feeds:
+        wake_rss_scrape_job_outbox_relay()
 
     return RssScrapeJobQueuedRead(job_id=job_id, status=initial_status)
 
 
-def _mark_job_as_failed_after_publish_error(db: Session, *, job_id: str) -> None:
-    try:
-        if set_rss_scrape_job_status(db, job_id=job_id, status="failed"):
-            db.commit()
-    except Exception:
-        db.rollback()
+def _route_feeds_to_request_streams(
+    feeds: list[RssScrapeFeedPayloadSchema],
+    *,
+    interactive: bool,
+) -> list[tuple[str, list[RssScrapeFeedPayloadSchema]]]:
+    shard_count = get_request_shard_count()
+    if shard_count <= 1:
+        return [(get_requests_stream_name(interactive=interactive), feeds)]
+
+    feeds_by_shard: dict[int, list[RssScrapeFeedPayloadSchema]] = defaultdict(list)
+    for feed in feeds:
+        feeds_by_shard[_resolve_company_shard(feed, shard_count=shard_count)].append(feed)
+    return [
+        (get_requests_stream_name(interactive=interactive, shard=shard), feeds_by_shard[shard])
+        for shard in sorted(feeds_by_shard)
+    ]
+
+
+def _resolve_company_shard(feed: RssScrapeFeedPayloadSchema, *, shard_count: int) -> int:
+    # Same key as the worker's per-company rate limiter, so one shard sees all the
+    # traffic a limiter is meant to bound.
+    return zlib.crc32(_resolve_company_key(feed).encode("utf-8")) % shard_count
+
+
+def _build_rss_scrape_job_payloads(
+    *,
+    job_id: str,
+    requested_at: datetime,
+    ingest: bool,
+    requested_by: str,
+    feeds: list[RssScrapeFeedPayloadSchema],
+) -> list[dict]:
+    mixed_feeds = _mix_feeds_by_company(feeds)
+    queue_batch_size = _resolve_queue_batch_size()
+    return [
+        RssScrapeJobRequestSchema(
+            job_id=job_id,
+            requested_at=requested_at,
+            ingest=ingest,
+            requested_by=requested_by,
+            feeds=feed_batch,
+        ).model_dump(mode="json")
+        for feed_batch in _iter_feed_batches(mixed_feeds, batch_size=queue_batch_size)
+    ]
 
 
 def _iter_feed_batches(
@@ -190,11 +300,4 @@ def _resolve_company_key(feed: RssScrapeFeedPayloadSchema) -> str:
 
 
 def _resolve_queue_batch_size() -> int:
-    raw_value = os.getenv("RSS_SCRAPE_QUEUE_BATCH_SIZE", str(DEFAULT_QUEUE_BATCH_SIZE))
-    try:
-        parsed = int(raw_value)
-    except (TypeError, ValueError):
-        return DEFAULT_QUEUE_BATCH_SIZE
-    if parsed <= 0:
-        return DEFAULT_QUEUE_BATCH_SIZE
-    return parsed
+    return resolve_positive_int_env("RSS_SCRAPE_QUEUE_BATCH_SIZE", DEFAULT_QUEUE_BATCH_SIZE)
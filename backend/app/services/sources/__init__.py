@@ -1,13 +1,37 @@
+from .source_benchmark_service import (
+    SourceBenchmarkSeedSettings,
+    SourceReadBenchmarkResult,
+    cleanup_source_benchmark,
+    run_source_read_benchmark,
+    seed_source_benchmark,
+)
 from .source_ingest_enqueue_service import enqueue_sources_ingest_job
+from .source_ingest_scheduler_service import (
+    enqueue_due_sources_ingest_job,
+    is_source_ingest_scheduler_enabled,
+    run_source_ingest_scheduler,
+    stop_source_ingest_scheduler,
+)
 from .source_partition_service import repartition_rss_source_partitions
 from .source_service import (
     get_rss_source_by_id,
     get_rss_sources,
+    search_rss_sources,
 )
 
 __all__ = [
     "get_rss_source_by_id",
     "get_rss_sources",
+    "search_rss_sources",
     "enqueue_sources_ingest_job",
+    "enqueue_due_sources_ingest_job",
+    "is_source_ingest_scheduler_enabled",
+    "run_source_ingest_scheduler",
+    "stop_source_ingest_scheduler",
     "repartition_rss_source_partitions",
+    "SourceBenchmarkSeedSettings",
+    "SourceReadBenchmarkResult",
+    "cleanup_source_benchmark",
+    "run_source_read_benchmark",
+    "seed_source_benchmark",
 ]
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import logging
+import random
+import time
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.clients.database.sources import (
+    analyze_source_tables,
+    capture_executed_statements,
+    delete_source_benchmark_data,
+    explain_analyze_statement,
+    get_rss_source_detail_read_by_id,
+    list_rss_sources_read,
+    pick_source_benchmark_targets,
+    read_source_benchmark_enqueue_candidates,
+    refresh_source_benchmark_feed_watermarks,
+    repartition_default_sources_by_published_at,
+    seed_source_benchmark_feeds,
+    seed_source_benchmark_week,
+    set_source_benchmark_random_seed,
+)
+from app.domain.sources import (
+    SourceBenchmarkTimings,
+    build_source_benchmark_feed_plans,
+    build_source_benchmark_week_starts,
+    summarize_benchmark_durations,
+)
+
+logger = logging.getLogger(__name__)
+
+SOURCE_BENCHMARK_PAGE_SIZE = 50
+SOURCE_BENCHMARK_DEEP_OFFSET = 5000
+
+
+@dataclass(slots=True)
+class SourceBenchmarkSeedSettings:
+    company_count: int
+    mean_feeds_per_company: float
+    max_feeds_per_company: int
+    mean_articles_per_week: float
+    week_count: int
+    cross_post_rate: float
+    seed: int
+
+
+@dataclass(slots=True)
+class SourceReadBenchmarkResult:
+    name: str
+    timings: SourceBenchmarkTimings
+    plans: list[list[str]] = field(default_factory=list)
+
+
+def seed_source_benchmark(
+    db: Session,
+    *,
+    settings: SourceBenchmarkSeedSettings,
+    now: datetime | None = None,
+) -> int:
+    # Temp tables live on the session connection: db must stay bound to one connection.
+    rng = random.Random(settings.seed)
+    feed_plans = build_source_benchmark_feed_plans(
+        company_count=settings.company_count,
+        mean_feeds_per_company=settings.mean_feeds_per_company,
+        max_feeds_per_company=settings.max_feeds_per_company,
+        mean_articles_per_week=settings.mean_articles_per_week,
+        rng=rng,
+    )
+    set_source_benchmark_random_seed(db, seed=rng.uniform(-1.0, 1.0))
+    feed_ids = seed_source_benchmark_feeds(db, feed_plans=feed_plans)
+    db.commit()
+    logger.info(
+        "source_benchmark - seeded %s companies and %s feeds",
+        settings.company_count,
+        len(feed_ids),
+    )
+
+    source_count = 0
+    week_starts = build_source_benchmark_week_starts(
+        week_count=settings.week_count,
+        now=now or datetime.now(timezone.utc),
+    )
+    for week_number, week_start in enumerate(week_starts, start=1):
+        source_count += seed_source_benchmark_week(
+            db,
+            week_start=week_start,
+            cross_post_rate=settings.cross_post_rate,
+        )
+        db.commit()
+        logger.info(
+            "source_benchmark - week %s/%s seeded, %s sources so far",
+            week_number,
+            len(week_starts),
+            source_count,
+        )
+
+    repartition_result = repartition_default_sources_by_published_at(db)
+    refresh_source_benchmark_feed_watermarks(db)
+    analyze_source_tables(db)
+    db.commit()
+    logger.info(
+        "source_benchmark - %s weekly partitions created",
+        repartition_result.source_weekly_partitions_created,
+    )
+    return source_count
+
+
+def run_source_read_benchmark(
+    db: Session,
+    *,
+    runs: int,
+    explain: bool = True,
+) -> list[SourceReadBenchmarkResult]:
+    targets = pick_source_benchmark_targets(db)
+    db.rollback()
+
+    results: list[SourceReadBenchmarkResult] = []
+    for name, read_path in _build_read_paths(targets).items():
+        # One warm-up call so the timings compare cached plans and buffers.
+        read_path(db)
+        db.rollback()
+        durations_ms: list[float] = []
+        for _ in range(runs):
+            started_at = time.perf_counter()
+            read_path(db)
+            durations_ms.append((time.perf_counter() - started_at) * 1000)
+            db.rollback()
+
+        plans: list[list[str]] = []
+        if explain:
+            with capture_executed_statements(db) as captured_statements:
+                read_path(db)
+            plans = [
+                explain_analyze_statement(db, statement, parameters)
+                for statement, parameters in captured_statements
+            ]
+            db.rollback()
+
+        result = SourceReadBenchmarkResult(
+            name=name,
+            timings=summarize_benchmark_durations(durations_ms),
+            plans=plans,
+        )
+        logger.info(
+            "source_benchmark - %s p50=%.1fms p95=%.1fms max=%.1fms",
+            name,
+            result.timings.p50_ms,
+            result.timings.p95_ms,
+            result.timings.max_ms,
+        )
+        results.append(result)
+    return results
+
+
+def cleanup_source_benchmark(db: Session) -> int:
+    try:
+        deleted_source_count = delete_source_benchmark_data(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return deleted_source_count
+
+
+def _build_read_paths(targets: dict[str, int | None]) -> dict[str, Callable[[Session], Any]]:
+    read_paths: dict[str, Callable[[Session], Any]] = {
+        "list": lambda db: list_rss_sources_read(db, limit=SOURCE_BENCHMARK_PAGE_SIZE, offset=0),
+        "list_estimated": lambda db: list_rss_sources_read(
+            db,
+            limit=SOURCE_BENCHMARK_PAGE_SIZE,
+            offset=0,
+            total_mode="estimated",
+        ),
+        "list_deep_page": lambda db: list_rss_sources_read(
+            db,
+            limit=SOURCE_BENCHMARK_PAGE_SIZE,
+            offset=SOURCE_BENCHMARK_DEEP_OFFSET,
+            total_mode="estimated",
+        ),
+        "enqueue_watermarks": read_source_benchmark_enqueue_candidates,
+    }
+    for target_name in ("largest_feed_id", "median_feed_id"):
+        feed_id = targets.get(target_name)
+        if feed_id is not None:
+            read_paths[f"by_feed_{target_name.removesuffix('_feed_id')}"] = (
+                lambda db, feed_id=feed_id: list_rss_sources_read(
+                    db,
+                    limit=SOURCE_BENCHMARK_PAGE_SIZE,
+                    offset=0,
+                    feed_id=feed_id,
+                )
+            )
+    company_id = targets.get("largest_company_id")
+    if company_id is not None:
+        read_paths["by_company"] = lambda db: list_rss_sources_read(
+            db,
+            limit=SOURCE_BENCHMARK_PAGE_SIZE,
+            offset=0,
+            company_id=company_id,
+        )
+    source_id = targets.get("latest_source_id")
+    if source_id is not None:
+        read_paths["detail"] = lambda db: get_rss_source_detail_read_by_id(db, source_id)
+    return read_paths
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.rss import RssScrapeJobQueuedRead
 from app.services.rss.rss_scrape_job_service import enqueue_rss_sources_ingest_job
 
 
 async def enqueue_sources_ingest_job(
-    db: Session,
+    db: AsyncSession,
     *,
     feed_ids: list[int] | None = None,
+    force: bool = False,
 ) -> RssScrapeJobQueuedRead:
     return await enqueue_rss_sources_ingest_job(
         db,
         feed_ids=feed_ids,
+        force=force,
     )
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.clients.database.rss import (
+    claim_due_rss_feed_ids_async,
+    lease_rss_feed_next_fetch_async,
+)
+from app.services.rss.rss_scrape_job_service import (
+    enqueue_scheduled_rss_sources_ingest_job,
+    list_scheduled_rss_sources_ingest_feeds,
+)
+from app.utils import (
+    resolve_bool_env,
+    resolve_positive_float_env,
+    resolve_positive_int_env,
+)
+from database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEDULER_BATCH_SIZE = 500
+DEFAULT_SCHEDULER_POLL_SECONDS = 60.0
+DEFAULT_SCHEDULER_LEASE_SECONDS = 3600
+
+
+def is_source_ingest_scheduler_enabled() -> bool:
+    return resolve_bool_env("SOURCES_INGEST_SCHEDULER_ENABLED", False)
+
+
+async def run_source_ingest_scheduler(stop_event: asyncio.Event) -> None:
+    batch_size = resolve_positive_int_env("SOURCES_INGEST_SCHEDULER_BATCH_SIZE", DEFAULT_SCHEDULER_BATCH_SIZE)
+    lease_seconds = resolve_positive_int_env(
+        "SOURCES_INGEST_SCHEDULER_LEASE_SECONDS",
+        DEFAULT_SCHEDULER_LEASE_SECONDS,
+    )
+    poll_seconds = resolve_positive_float_env(
+        "SOURCES_INGEST_SCHEDULER_POLL_SECONDS",
+        DEFAULT_SCHEDULER_POLL_SECONDS,
+    )
+
+    while not stop_event.is_set():
+        try:
+            async with AsyncSessionLocal() as db:
+                scheduled_count = await enqueue_due_sources_ingest_job(
+                    db,
+                    batch_size=batch_size,
+                    lease_seconds=lease_seconds,
+                )
+        except Exception as exception:
+            logger.exception("Sources ingest scheduler error: %s", exception)
+            scheduled_count = 0
+
+        if scheduled_count >= batch_size:
+            continue
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=poll_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def stop_source_ingest_scheduler(
+    scheduler_task: asyncio.Task,
+    stop_event: asyncio.Event,
+) -> None:
+    stop_event.set()
+    await scheduler_task
+
+
+async def enqueue_due_sources_ingest_job(
+    db: AsyncSession,
+    *,
+    batch_size: int = DEFAULT_SCHEDULER_BATCH_SIZE,
+    lease_seconds: int = DEFAULT_SCHEDULER_LEASE_SECONDS,
+) -> int:
+    due_feed_ids = await claim_due_rss_feed_ids_async(db, limit=batch_size)
+    if not due_feed_ids:
+        await db.rollback()
+        return 0
+
+    feeds = await list_scheduled_rss_sources_ingest_feeds(db, feed_ids=due_feed_ids)
+    if not feeds:
+        await db.rollback()
+        return 0
+
+    # The lease is committed together with the job, so a feed is never enqueued twice
+    # before its result arrives; db-manager then replaces it with the adaptive schedule.
+    await lease_rss_feed_next_fetch_async(
+        db,
+        feed_ids=[feed.feed_id for feed in feeds],
+        lease_seconds=lease_seconds,
+    )
+    queued_job = await enqueue_scheduled_rss_sources_ingest_job(db, feeds=feeds)
+    logger.info(
+        "Sources ingest scheduler queued job %s for %s due feeds",
+        queued_job.job_id,
+        len(feeds),
+    )
+    return len(feeds)
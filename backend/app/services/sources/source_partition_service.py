@@ -17,7 +17,9 @@ def repartition_rss_source_partitions(
     return RssSourcePartitionMaintenanceRead(
         source_default_rows_repartitioned=repartition_result.source_default_rows_repartitioned,
         source_feed_default_rows_repartitioned=repartition_result.source_feed_default_rows_repartitioned,
+        source_listing_default_rows_repartitioned=repartition_result.source_listing_default_rows_repartitioned,
         source_weekly_partitions_created=repartition_result.source_weekly_partitions_created,
         source_feed_weekly_partitions_created=repartition_result.source_feed_weekly_partitions_created,
+        source_listing_weekly_partitions_created=repartition_result.source_listing_weekly_partitions_created,
         weeks_covered=repartition_result.weeks_covered,
     )
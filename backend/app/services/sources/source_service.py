@@ -1,14 +1,21 @@
+from datetime import datetime
+
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.clients.database.sources import (
     get_rss_source_detail_read_by_id,
     list_rss_sources_read,
+    search_rss_sources_read,
 )
 from app.schemas.sources import (
     RssSourceDetailRead,
+    RssSourceListFilters,
     RssSourcePageRead,
+    RssSourceSearchPageRead,
+    RssSourceTotalMode,
 )
+from app.utils import InvalidCursorError, decode_keyset_cursor, encode_keyset_cursor
 
 
 def get_rss_sources(
@@ -18,6 +25,8 @@ def get_rss_sources(
     offset: int,
     feed_id: int | None = None,
     company_id: int | None = None,
+    filters: RssSourceListFilters | None = None,
+    total_mode: RssSourceTotalMode = "exact",
 ) -> RssSourcePageRead:
     items, total = list_rss_sources_read(
         db,
@@ -25,10 +34,13 @@ def get_rss_sources(
         offset=offset,
         feed_id=feed_id,
         company_id=company_id,
+        filters=filters,
+        total_mode=total_mode,
     )
     return RssSourcePageRead(
         items=items,
         total=total,
+        total_mode=total_mode,
         limit=limit,
         offset=offset,
     )
@@ -46,3 +58,61 @@ def get_rss_source_by_id(
             detail=f"RSS source {source_id} not found",
         )
     return source
+
+
+def search_rss_sources(
+    db: Session,
+    *,
+    query: str,
+    limit: int,
+    published_after: datetime | None = None,
+    published_before: datetime | None = None,
+    cursor: str | None = None,
+) -> RssSourceSearchPageRead:
+    after_rank, after_published_at, after_source_id = _resolve_search_cursor(cursor)
+    items, next_key = search_rss_sources_read(
+        db,
+        query=query,
+        limit=limit,
+        published_after=published_after,
+        published_before=published_before,
+        after_rank=after_rank,
+        after_published_at=after_published_at,
+        after_source_id=after_source_id,
+    )
+
+    next_cursor = None
+    if next_key is not None:
+        next_rank, next_published_at, next_source_id = next_key
+        next_cursor = encode_keyset_cursor(
+            {
+                "rank": next_rank,
+                "published_at": next_published_at.isoformat(),
+                "id": next_source_id,
+            }
+        )
+    return RssSourceSearchPageRead(
+        items=items,
+        limit=limit,
+        next_cursor=next_cursor,
+    )
+
+
+def _resolve_search_cursor(
+    cursor: str | None,
+) -> tuple[float | None, datetime | None, int | None]:
+    if not cursor:
+        return None, None, None
+
+    try:
+        values = decode_keyset_cursor(cursor)
+        return (
+            float(values["rank"]),
+            datetime.fromisoformat(values["published_at"]),
+            int(values["id"]),
+        )
+    except (InvalidCursorError, KeyError, TypeError, ValueError) as exception:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid search cursor",
+        ) from exception
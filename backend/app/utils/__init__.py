@@ -32,6 +32,18 @@ from .job_lock import (
     job_lock,
 )
 
+from .cursor_utils import (
+    InvalidCursorError,
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+)
+
+from .env_utils import (
+    resolve_bool_env,
+    resolve_positive_float_env,
+    resolve_positive_int_env,
+)
+
 __all__ = [
     #rss_repo
     "get_rss_feeds_repository_branch",
@@ -55,4 +67,12 @@ __all__ = [
     #job_lock
     "JobAlreadyRunning",
     "job_lock",
+    #cursor_utils
+    "InvalidCursorError",
+    "decode_keyset_cursor",
+    "encode_keyset_cursor",
+    #env_utils
+    "resolve_bool_env",
+    "resolve_positive_float_env",
+    "resolve_positive_int_env",
 ]
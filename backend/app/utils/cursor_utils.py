@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a keyset pagination cursor cannot be decoded."""
+
+
+def encode_keyset_cursor(values: dict[str, Any]) -> str:
+    raw_cursor = json.dumps(values, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw_cursor).decode("ascii").rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> dict[str, Any]:
+    padded_cursor = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw_cursor = base64.urlsafe_b64decode(padded_cursor.encode("ascii"))
+        values = json.loads(raw_cursor.decode("utf-8"))
+    except (UnicodeError, binascii.Error, ValueError) as exception:
+        raise InvalidCursorError("Invalid pagination cursor") from exception
+
+    if not isinstance(values, dict):
+        raise InvalidCursorError("Invalid pagination cursor")
+    return values
@@ -0,0 +1,101 @@
+import argparse
+import json
+import logging
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from app.services.sources import (
+    SourceBenchmarkSeedSettings,
+    cleanup_source_benchmark,
+    run_source_read_benchmark,
+    seed_source_benchmark,
+)
+from database import engine
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="backend")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = subparsers.add_parser(
+        "seed-source-benchmark",
+        help="Populate rss_sources/rss_source_feeds with synthetic benchmark articles",
+    )
+    seed_parser.add_argument("--companies", type=int, default=200)
+    seed_parser.add_argument("--mean-feeds-per-company", type=float, default=5.0)
+    seed_parser.add_argument("--max-feeds-per-company", type=int, default=60)
+    seed_parser.add_argument("--mean-articles-per-week", type=float, default=30.0)
+    seed_parser.add_argument("--weeks", type=int, default=52)
+    seed_parser.add_argument("--cross-post-rate", type=float, default=0.05)
+    seed_parser.add_argument("--seed", type=int, default=42)
+
+    benchmark_parser = subparsers.add_parser(
+        "benchmark-sources",
+        help="Time the source read paths and capture EXPLAIN ANALYZE plans",
+    )
+    benchmark_parser.add_argument("--runs", type=int, default=20)
+    benchmark_parser.add_argument("--output-dir", type=Path, default=Path("benchmark_output"))
+    benchmark_parser.add_argument("--no-explain", action="store_true")
+
+    subparsers.add_parser(
+        "cleanup-source-benchmark",
+        help="Delete benchmark companies, feeds and articles",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    args = build_parser().parse_args(argv)
+
+    # One connection per command: the seeding temp tables must survive commits.
+    with engine.connect() as connection, Session(bind=connection) as db:
+        if args.command == "seed-source-benchmark":
+            seed_source_benchmark(
+                db,
+                settings=SourceBenchmarkSeedSettings(
+                    company_count=args.companies,
+                    mean_feeds_per_company=args.mean_feeds_per_company,
+                    max_feeds_per_company=args.max_feeds_per_company,
+                    mean_articles_per_week=args.mean_articles_per_week,
+                    week_count=args.weeks,
+                    cross_post_rate=args.cross_post_rate,
+                    seed=args.seed,
+                ),
+            )
+        elif args.command == "benchmark-sources":
+            results = run_source_read_benchmark(db, runs=args.runs, explain=not args.no_explain)
+            _write_benchmark_output(args.output_dir, results)
+        elif args.command == "cleanup-source-benchmark":
+            cleanup_source_benchmark(db)
+
+
+def _write_benchmark_output(output_dir: Path, results) -> None:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary = {}
+    for result in results:
+        summary[result.name] = {
+            "runs": result.timings.runs,
+            "p50_ms": round(result.timings.p50_ms, 3),
+            "p95_ms": round(result.timings.p95_ms, 3),
+            "max_ms": round(result.timings.max_ms, 3),
+        }
+        if result.plans:
+            (output_dir / f"{result.name}.plan.txt").write_text(
+                "\n\n".join("\n".join(plan) for plan in result.plans) + "\n",
+                encoding="utf-8",
+            )
+    (output_dir / "summary.json").write_text(
+        json.dumps(summary, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+    for name, timings in summary.items():
+        print(
+            f"{name}: p50 {timings['p50_ms']:.1f}ms, p95 {timings['p95_ms']:.1f}ms, "
+            f"max {timings['max_ms']:.1f}ms ({timings['runs']} runs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
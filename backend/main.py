@@ -1,4 +1,7 @@
+import asyncio
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from logging.config import dictConfig
 from typing import List, Tuple
 
@@ -32,6 +35,17 @@ from app.routers import (
     rss_router,
     sources_router,
 )
+from app.services.rss import (
+    is_rss_scrape_job_outbox_relay_enabled,
+    run_rss_scrape_job_outbox_relay,
+    stop_rss_scrape_job_outbox_relay,
+)
+from app.services.sources import (
+    is_source_ingest_scheduler_enabled,
+    run_source_ingest_scheduler,
+    stop_source_ingest_scheduler,
+)
+from database import async_engine
 
 
 def _configure_app_logging() -> None:
@@ -75,9 +89,29 @@ def _parse_cors_origins() -> Tuple[List[str], bool]:
     return ["http://localhost:3000", "http://localhost:3001"], True
 
 
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    relay_stop_event = asyncio.Event()
+    relay_task: asyncio.Task | None = None
+    if is_rss_scrape_job_outbox_relay_enabled():
+        relay_task = asyncio.create_task(run_rss_scrape_job_outbox_relay(relay_stop_event))
+    scheduler_stop_event = asyncio.Event()
+    scheduler_task: asyncio.Task | None = None
+    if is_source_ingest_scheduler_enabled():
+        scheduler_task = asyncio.create_task(run_source_ingest_scheduler(scheduler_stop_event))
+    try:
+        yield
+    finally:
+        if scheduler_task is not None:
+            await stop_source_ingest_scheduler(scheduler_task, scheduler_stop_event)
+        if relay_task is not None:
+            await stop_rss_scrape_job_outbox_relay(relay_task, relay_stop_event)
+        await async_engine.dispose()
+
+
 def create_app() -> FastAPI:
     _configure_app_logging()
-    app = FastAPI(title="Manifeed API")
+    app = FastAPI(title="Manifeed API", lifespan=_lifespan)
 
     cors_origins, allow_credentials = _parse_cors_origins()
     app.add_middleware(
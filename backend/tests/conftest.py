@@ -1,12 +1,13 @@
-from collections.abc import Generator
-from unittest.mock import Mock
+from collections.abc import AsyncGenerator, Generator
+from unittest.mock import AsyncMock, Mock
 
 import anyio
 import httpx
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from database import get_db_session
+from database import get_async_db_session, get_db_session
 from main import app
 
 
@@ -41,12 +42,24 @@ def mock_db_session() -> Mock:
     return Mock(spec=Session)
 
 
+@pytest.fixture
+def mock_async_db_session() -> AsyncMock:
+    return AsyncMock(spec=AsyncSession)
+
+
 @pytest.fixture(autouse=True)
-def override_db_session(mock_db_session: Mock) -> Generator[None, None, None]:
+def override_db_session(
+    mock_db_session: Mock,
+    mock_async_db_session: AsyncMock,
+) -> Generator[None, None, None]:
     def _override_db_session() -> Generator[Mock, None, None]:
         yield mock_db_session
 
+    async def _override_async_db_session() -> AsyncGenerator[AsyncMock, None]:
+        yield mock_async_db_session
+
     app.dependency_overrides[get_db_session] = _override_db_session
+    app.dependency_overrides[get_async_db_session] = _override_async_db_session
     yield
     app.dependency_overrides.clear()
 
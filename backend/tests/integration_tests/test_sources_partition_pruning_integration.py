@@ -0,0 +1,73 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+
+import app.clients.database.sources.get_sources_db_cli as get_sources_db_cli_module
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "").strip()
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL,
+    reason="TEST_DATABASE_URL is not set (requires a migrated PostgreSQL database)",
+)
+
+_WEEK_STARTS = (
+    datetime(2026, 2, 9, tzinfo=timezone.utc),
+    datetime(2026, 2, 16, tzinfo=timezone.utc),
+    datetime(2026, 2, 23, tzinfo=timezone.utc),
+)
+
+
+def _collect_relation_names(plan: dict) -> set[str]:
+    relation_names: set[str] = set()
+    if "Relation Name" in plan:
+        relation_names.add(plan["Relation Name"])
+    for child_plan in plan.get("Plans", []):
+        relation_names |= _collect_relation_names(child_plan)
+    return relation_names
+
+
+def test_time_range_filter_prunes_listing_partitions() -> None:
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            for week_start in _WEEK_STARTS:
+                partition_name = f"rss_source_listing_w_{week_start.strftime('%Y%m%d')}"
+                connection.execute(
+                    text(
+                        f"""
+                        CREATE TABLE IF NOT EXISTS {partition_name}
+                        PARTITION OF rss_source_listing
+                        FOR VALUES FROM (:week_start) TO (:week_end)
+                        """
+                    ),
+                    {"week_start": week_start, "week_end": week_start + timedelta(days=7)},
+                )
+
+            filters = get_sources_db_cli_module._build_source_listing_filters(
+                feed_id=None,
+                company_id=None,
+                published_after=datetime(2026, 2, 17, tzinfo=timezone.utc),
+                published_before=datetime(2026, 2, 18, tzinfo=timezone.utc),
+                catalog_feed_ids=[1, 2],
+            )
+            statement = get_sources_db_cli_module._build_source_listing_page_query(
+                filters=filters,
+                limit=50,
+                offset=0,
+            )
+            compiled_statement = statement.compile(dialect=postgresql.dialect())
+            explain_output = connection.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {compiled_statement}",
+                compiled_statement.params,
+            ).scalar_one()
+
+            scanned_relations = _collect_relation_names(explain_output[0]["Plan"])
+            assert scanned_relations == {"rss_source_listing_w_20260216"}
+        finally:
+            transaction.rollback()
+    engine.dispose()
@@ -0,0 +1,226 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+import app.clients.database.sources.get_sources_db_cli as get_sources_db_cli_module
+from app.schemas.sources import RssSourceListFilters
+
+
+def _compile(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_source_listing_page_query_reads_listing_table_without_joins() -> None:
+    filters = get_sources_db_cli_module._build_source_listing_filters(feed_id=3, company_id=7)
+    query = get_sources_db_cli_module._build_source_listing_page_query(
+        filters=filters,
+        limit=50,
+        offset=0,
+    )
+
+    compiled_query = _compile(query)
+
+    assert "JOIN" not in compiled_query
+    assert "FROM rss_source_listing" in compiled_query
+    assert "rss_source_listing.feed_ids @>" in compiled_query
+    assert "rss_source_listing.company_ids @>" in compiled_query
+    assert (
+        "ORDER BY rss_source_listing.published_at DESC, rss_source_listing.source_id DESC"
+        in compiled_query
+    )
+
+
+def test_list_rss_sources_read_maps_listing_rows() -> None:
+    db = Mock(spec=Session)
+    count_result = Mock()
+    count_result.scalar_one.return_value = 2
+    rows_result = Mock()
+    rows_result.scalars.return_value.all.return_value = [
+        SimpleNamespace(
+            source_id=11,
+            title="Title",
+            summary=None,
+            author=None,
+            url="https://example.com/a",
+            published_at=datetime(2026, 2, 20, tzinfo=timezone.utc),
+            image_url=None,
+            company_names=["Zeta", "Alpha"],
+        ),
+        SimpleNamespace(
+            source_id=10,
+            title="Undated",
+            summary=None,
+            author=None,
+            url="https://example.com/b",
+            published_at=get_sources_db_cli_module.SOURCE_PUBLISHED_AT_FALLBACK,
+            image_url=None,
+            company_names=[],
+        ),
+    ]
+    db.execute.side_effect = [count_result, rows_result]
+
+    items, total = get_sources_db_cli_module.list_rss_sources_read(db, limit=50, offset=0)
+
+    assert total == 2
+    assert [item.id for item in items] == [11, 10]
+    assert items[0].company_names == ["Alpha", "Zeta"]
+    assert items[1].published_at is None
+    assert db.execute.call_count == 2
+
+
+def test_list_rss_sources_read_skips_page_query_when_empty() -> None:
+    db = Mock(spec=Session)
+    count_result = Mock()
+    count_result.scalar_one.return_value = 0
+    db.execute.return_value = count_result
+
+    items, total = get_sources_db_cli_module.list_rss_sources_read(db, limit=50, offset=0, feed_id=1)
+
+    assert items == []
+    assert total == 0
+    db.execute.assert_called_once()
+
+
+def test_list_rss_sources_read_estimated_total_uses_feed_counter() -> None:
+    db = Mock(spec=Session)
+    estimate_result = Mock()
+    estimate_result.scalar_one_or_none.return_value = 40
+    rows_result = Mock()
+    rows_result.scalars.return_value.all.return_value = []
+    db.execute.side_effect = [estimate_result, rows_result]
+
+    items, total = get_sources_db_cli_module.list_rss_sources_read(
+        db,
+        limit=50,
+        offset=0,
+        feed_id=3,
+        total_mode="estimated",
+    )
+
+    assert items == []
+    assert total == 40
+    estimate_query = _compile(db.execute.call_args_list[0].args[0])
+    assert "feeds_scraping.article_count" in estimate_query
+    assert "count(" not in estimate_query.lower()
+
+
+def test_list_rss_sources_read_estimated_total_never_lags_behind_page() -> None:
+    db = Mock(spec=Session)
+    estimate_result = Mock()
+    estimate_result.scalar_one_or_none.return_value = None
+    rows_result = Mock()
+    rows_result.scalars.return_value.all.return_value = [
+        SimpleNamespace(
+            source_id=5,
+            title="Title",
+            summary=None,
+            author=None,
+            url="https://example.com/c",
+            published_at=datetime(2026, 2, 21, tzinfo=timezone.utc),
+            image_url=None,
+            company_names=["ACME"],
+        )
+    ]
+    db.execute.side_effect = [estimate_result, rows_result]
+
+    items, total = get_sources_db_cli_module.list_rss_sources_read(
+        db,
+        limit=50,
+        offset=100,
+        total_mode="estimated",
+    )
+
+    assert [item.id for item in items] == [5]
+    assert total == 101
+    assert "pg_class" in str(db.execute.call_args_list[0].args[0])
+
+
+def test_source_listing_filters_bound_partition_key_and_overlap_catalog_feeds() -> None:
+    filters = get_sources_db_cli_module._build_source_listing_filters(
+        feed_id=None,
+        company_id=None,
+        published_after=datetime(2026, 2, 20, tzinfo=timezone.utc),
+        published_before=datetime(2026, 2, 21, tzinfo=timezone.utc),
+        catalog_feed_ids=[4, 8],
+    )
+    query = get_sources_db_cli_module._build_source_listing_page_query(
+        filters=filters,
+        limit=50,
+        offset=0,
+    )
+
+    compiled_query = _compile(query)
+
+    assert "rss_source_listing.published_at >= %(published_at_1)s" in compiled_query
+    assert "rss_source_listing.published_at < %(published_at_2)s" in compiled_query
+    assert "rss_source_listing.feed_ids && " in compiled_query
+    assert "JOIN" not in compiled_query
+
+
+def test_list_rss_sources_read_returns_empty_page_when_no_catalog_feed_matches() -> None:
+    db = Mock(spec=Session)
+    catalog_result = Mock()
+    catalog_result.scalars.return_value.all.return_value = []
+    db.execute.return_value = catalog_result
+
+    items, total = get_sources_db_cli_module.list_rss_sources_read(
+        db,
+        limit=50,
+        offset=0,
+        filters=RssSourceListFilters(section="World", tags=[" Politics "]),
+    )
+
+    assert items == []
+    assert total == 0
+    catalog_query = _compile(db.execute.call_args.args[0])
+    assert "rss_feeds.section = " in catalog_query
+    assert "lower(rss_tags.name) IN" in catalog_query
+
+
+def test_list_rss_sources_read_estimates_filtered_total_from_plan(monkeypatch) -> None:
+    db = Mock(spec=Session)
+    rows_result = Mock()
+    rows_result.scalars.return_value.all.return_value = []
+    db.execute.return_value = rows_result
+    explained_statements: list[str] = []
+
+    def fake_explain_row_estimate(_db, statement):
+        explained_statements.append(_compile(statement))
+        return 321
+
+    monkeypatch.setattr(get_sources_db_cli_module, "_explain_row_estimate", fake_explain_row_estimate)
+
+    items, total = get_sources_db_cli_module.list_rss_sources_read(
+        db,
+        limit=50,
+        offset=0,
+        company_id=3,
+        filters=RssSourceListFilters(published_after=datetime(2026, 2, 20, tzinfo=timezone.utc)),
+        total_mode="estimated",
+    )
+
+    assert items == []
+    assert total == 321
+    assert "rss_source_listing.published_at >= " in explained_statements[0]
+
+
+def test_catalog_filters_normalize_country_and_language_codes() -> None:
+    db = Mock(spec=Session)
+    catalog_result = Mock()
+    catalog_result.scalars.return_value.all.return_value = []
+    db.execute.return_value = catalog_result
+
+    get_sources_db_cli_module.list_rss_sources_read(
+        db,
+        limit=50,
+        offset=0,
+        filters=RssSourceListFilters(country=" FRA ", language="EN", section="  "),
+    )
+
+    catalog_query = db.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+    assert catalog_query.params["country_1"] == "fr"
+    assert catalog_query.params["language_1"] == "en"
+    assert "rss_feeds.section" not in str(catalog_query)
@@ -22,7 +22,11 @@ def test_repartition_default_sources_by_published_at_orchestrates_steps(monkeypa
     monkeypatch.setattr(
         manage_source_partitions_db_cli_module,
         "_count_table_rows",
-        lambda _db, table_name: 5 if "sources_default" in table_name else 9,
+        lambda _db, table_name: {
+            manage_source_partitions_db_cli_module._SOURCES_DEFAULT_BUFFER_TABLE: 5,
+            manage_source_partitions_db_cli_module._SOURCE_FEEDS_DEFAULT_BUFFER_TABLE: 9,
+            manage_source_partitions_db_cli_module._SOURCE_LISTING_DEFAULT_BUFFER_TABLE: 4,
+        }[table_name],
     )
     monkeypatch.setattr(
         manage_source_partitions_db_cli_module,
@@ -35,16 +39,16 @@ def test_repartition_default_sources_by_published_at_orchestrates_steps(monkeypa
         lambda _db: week_starts,
     )
 
-    def fake_create_weekly_partition_pair(_db, week_start):
+    def fake_create_weekly_partitions(_db, week_start):
         call_sequence.append(f"partition:{week_start.date().isoformat()}")
         if week_start == week_starts[0]:
-            return True, True
-        return False, True
+            return True, True, True
+        return False, True, False
 
     monkeypatch.setattr(
         manage_source_partitions_db_cli_module,
-        "_create_weekly_partition_pair",
-        fake_create_weekly_partition_pair,
+        "_create_weekly_partitions",
+        fake_create_weekly_partitions,
     )
     monkeypatch.setattr(
         manage_source_partitions_db_cli_module,
@@ -56,6 +60,11 @@ def test_repartition_default_sources_by_published_at_orchestrates_steps(monkeypa
         "_restore_source_feeds_from_buffer",
         lambda _db: call_sequence.append("restore_source_feeds"),
     )
+    monkeypatch.setattr(
+        manage_source_partitions_db_cli_module,
+        "_restore_source_listing_from_buffer",
+        lambda _db: call_sequence.append("restore_source_listing"),
+    )
     monkeypatch.setattr(
         manage_source_partitions_db_cli_module,
         "_sync_sources_sequence",
@@ -68,6 +77,8 @@ def test_repartition_default_sources_by_published_at_orchestrates_steps(monkeypa
     assert result.source_feed_default_rows_repartitioned == 9
     assert result.source_weekly_partitions_created == 1
     assert result.source_feed_weekly_partitions_created == 2
+    assert result.source_listing_default_rows_repartitioned == 4
+    assert result.source_listing_weekly_partitions_created == 1
     assert result.weeks_covered == 2
     assert call_sequence == [
         "prepare",
@@ -76,5 +87,6 @@ def test_repartition_default_sources_by_published_at_orchestrates_steps(monkeypa
         "partition:2026-02-23",
         "restore_sources",
         "restore_source_feeds",
+        "restore_source_listing",
         "sync_sequence",
     ]
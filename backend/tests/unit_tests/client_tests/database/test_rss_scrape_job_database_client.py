@@ -0,0 +1,164 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.clients.database.rss.rss_scrape_job_database_client as rss_scrape_job_db_client_module
+from app.schemas.rss import RssScrapeFeedPayloadSchema
+
+
+def _build_feed_row():
+    feed = SimpleNamespace(
+        id=3,
+        url="https://example.com/rss.xml",
+        company_id=9,
+        company=SimpleNamespace(host="WWW.Example.com", fetchprotection=2),
+        scraping=SimpleNamespace(etag="etag-1", last_update=None, fetchprotection=None),
+    )
+    return feed, datetime(2026, 2, 20, 10, 0)
+
+
+def test_feed_payload_listing_maps_feed_rows() -> None:
+    async_db = AsyncMock(spec=AsyncSession)
+    async_result = Mock()
+    async_result.all.return_value = [_build_feed_row()]
+    async_db.execute.return_value = async_result
+
+    payloads = asyncio.run(
+        rss_scrape_job_db_client_module.list_rss_feed_scrape_payloads_async(
+            async_db,
+            feed_ids=[3],
+        )
+    )
+
+    assert payloads[0].feed_id == 3
+    assert payloads[0].host_header == "www.example.com"
+    assert payloads[0].fetchprotection == 2
+    assert payloads[0].last_db_article_published_at == datetime(2026, 2, 20, 10, 0, tzinfo=timezone.utc)
+
+
+def test_feed_payload_query_reads_persisted_watermark_and_aggregates_only_missing_ones() -> None:
+    query = rss_scrape_job_db_client_module._build_feed_scrape_payloads_query(
+        feed_ids=[3],
+        enabled_only=True,
+    )
+
+    compiled_query = " ".join(str(query).lower().split())
+    assert "feeds_scraping.last_article_published_at" in compiled_query
+    assert "left outer join feeds_scraping" in compiled_query
+    assert (
+        "case when (feeds_scraping.last_article_published_at is null "
+        "and feeds_scraping.article_count > :article_count_1) "
+        "then (select max(rss_source_feeds.published_at)"
+    ) in compiled_query
+    assert "where rss_source_feeds.feed_id = rss_feeds.id" in compiled_query
+    assert "group by" not in compiled_query
+
+
+def test_feed_payload_query_skips_fresh_feeds_only_when_requested() -> None:
+    fresh_query = rss_scrape_job_db_client_module._build_feed_scrape_payloads_query(
+        feed_ids=None,
+        enabled_only=True,
+        skip_fresh=True,
+    )
+    forced_query = rss_scrape_job_db_client_module._build_feed_scrape_payloads_query(
+        feed_ids=None,
+        enabled_only=True,
+    )
+
+    assert "feeds_scraping.fresh_until <= now()" in str(fresh_query).lower()
+    assert "fresh_until <=" not in str(forced_query).lower()
+
+
+def test_feed_payload_query_skips_feeds_pending_in_active_jobs_of_same_kind() -> None:
+    query = rss_scrape_job_db_client_module._build_feed_scrape_payloads_query(
+        feed_ids=None,
+        enabled_only=True,
+        skip_pending_ingest_jobs=True,
+    )
+
+    compiled_query = str(query.compile(compile_kwargs={"literal_binds": True})).lower()
+    assert "not (exists (select rss_scrape_job_feeds.feed_id" in compiled_query
+    assert "rss_scrape_jobs.ingest is true" in compiled_query
+    assert "rss_scrape_jobs.status in ('queued', 'processing')" in compiled_query
+    assert "rss_scrape_job_results.job_id is null" in compiled_query
+    assert "rss_scrape_jobs.ingest is false" not in compiled_query
+
+
+def test_async_feed_payload_listing_skips_query_for_invalid_feed_ids() -> None:
+    async_db = AsyncMock(spec=AsyncSession)
+
+    payloads = asyncio.run(
+        rss_scrape_job_db_client_module.list_rss_feed_scrape_payloads_async(
+            async_db,
+            feed_ids=[0, -4],
+        )
+    )
+
+    assert payloads == []
+    async_db.execute.assert_not_awaited()
+
+
+def test_insert_rss_scrape_job_feeds_async_writes_multi_row_chunks() -> None:
+    async_db = AsyncMock(spec=AsyncSession)
+    feeds = [
+        RssScrapeFeedPayloadSchema(
+            feed_id=feed_id,
+            feed_url=f"https://example.com/{feed_id}.xml",
+            fetchprotection=1,
+        )
+        for feed_id in range(1, 6)
+    ]
+
+    asyncio.run(
+        rss_scrape_job_db_client_module.insert_rss_scrape_job_feeds_async(
+            async_db,
+            job_id="job-1",
+            feeds=feeds,
+            chunk_size=2,
+        )
+    )
+
+    assert async_db.execute.await_count == 3
+    statement, rows = async_db.execute.call_args_list[0].args
+    assert str(statement).startswith("INSERT INTO rss_scrape_job_feeds")
+    assert rows == [
+        {
+            "job_id": "job-1",
+            "feed_id": 1,
+            "feed_url": "https://example.com/1.xml",
+            "last_db_article_published_at": None,
+        },
+        {
+            "job_id": "job-1",
+            "feed_id": 2,
+            "feed_url": "https://example.com/2.xml",
+            "last_db_article_published_at": None,
+        },
+    ]
+    assert [len(call.args[1]) for call in async_db.execute.call_args_list] == [2, 2, 1]
+
+
+def test_fetch_latency_query_groups_by_company_or_feed_with_percentiles() -> None:
+    since = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    company_query = rss_scrape_job_db_client_module._build_fetch_latency_query(
+        group_by="company",
+        since=since,
+        limit=20,
+    )
+    feed_query = rss_scrape_job_db_client_module._build_fetch_latency_query(
+        group_by="feed",
+        since=since,
+        limit=20,
+    )
+
+    compiled_company_query = " ".join(str(company_query).lower().split())
+    compiled_feed_query = " ".join(str(feed_query).lower().split())
+    assert "percentile_cont(:percentile_cont_1) within group (order by rss_scrape_job_results.total_ms)" in (
+        compiled_company_query
+    )
+    assert "rss_scrape_job_results.total_ms is not null" in compiled_company_query
+    assert "group by rss_feeds.company_id, rss_company.name order by total_p95_ms desc" in compiled_company_query
+    assert "group by rss_feeds.company_id, rss_company.name, rss_feeds.id, rss_feeds.url" in compiled_feed_query
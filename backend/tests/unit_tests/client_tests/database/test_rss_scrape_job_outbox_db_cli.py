@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.clients.database.rss.rss_scrape_job_outbox_db_cli as outbox_db_cli_module
+
+
+def _compile(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_claim_pending_outbox_interleaves_jobs_and_caps_inflight_feeds() -> None:
+    db = AsyncMock(spec=AsyncSession)
+    result = Mock()
+    result.scalars.return_value.all.return_value = []
+    db.execute.return_value = result
+
+    claimed_rows = asyncio.run(
+        outbox_db_cli_module.claim_pending_rss_scrape_job_outbox_async(
+            db,
+            limit=10,
+            max_inflight_feeds=500,
+            inflight_window_seconds=600,
+        )
+    )
+
+    assert claimed_rows == []
+    claim_query = _compile(db.execute.call_args.args[0])
+    assert "WITH pending_outbox AS" in claim_query
+    assert "row_number() OVER (PARTITION BY rss_scrape_job_outbox.job_id" in claim_query
+    assert "FROM rss_scrape_job_results" in claim_query
+    assert "FILTER (WHERE rss_scrape_job_outbox.sent_at >= %(sent_at_1)s)" in claim_query
+    assert "greatest(" in claim_query
+    assert "ORDER BY pending_outbox.job_rank ASC" in claim_query
+    assert claim_query.endswith("FOR UPDATE SKIP LOCKED")
+
+
+def test_insert_outbox_writes_one_row_per_payload() -> None:
+    db = AsyncMock(spec=AsyncSession)
+    payloads = [
+        {"job_id": "job-1", "feeds": [{"feed_id": 1}, {"feed_id": 2}]},
+        {"job_id": "job-1", "feeds": [{"feed_id": 3}]},
+    ]
+
+    asyncio.run(
+        outbox_db_cli_module.insert_rss_scrape_job_outbox_async(
+            db,
+            job_id="job-1",
+            stream_name="rss_scrape_requests",
+            payloads=payloads,
+        )
+    )
+
+    statement, rows = db.execute.call_args.args
+    assert str(statement).startswith("INSERT INTO rss_scrape_job_outbox")
+    assert [row["feed_count"] for row in rows] == [2, 1]
+    assert {row["stream_name"] for row in rows} == {"rss_scrape_requests"}
+
+
+def test_reschedule_outbox_backs_off_and_reports_exhausted_jobs(monkeypatch) -> None:
+    now = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    outbox_rows = [
+        SimpleNamespace(job_id="job-1", attempts=2, status="pending", available_at=None, last_error=None),
+        SimpleNamespace(job_id="job-2", attempts=4, status="pending", available_at=None, last_error=None),
+        SimpleNamespace(job_id="job-3", attempts=9, status="pending", available_at=None, last_error=None),
+    ]
+    monkeypatch.setattr(
+        outbox_db_cli_module,
+        "datetime",
+        SimpleNamespace(now=lambda tz=None: now),
+    )
+
+    exhausted_job_ids = outbox_db_cli_module.reschedule_rss_scrape_job_outbox(
+        outbox_rows,
+        error_message="redis down",
+        retry_base_delay_seconds=1.0,
+        retry_max_delay_seconds=5.0,
+        max_attempts=10,
+    )
+
+    assert exhausted_job_ids == ["job-3"]
+    assert (outbox_rows[0].available_at - now).total_seconds() == 4.0
+    assert (outbox_rows[1].available_at - now).total_seconds() == 5.0
+    assert outbox_rows[2].status == "failed"
+    assert all(outbox_row.last_error == "redis down" for outbox_row in outbox_rows)
+
+
+def test_purge_sent_outbox_deletes_only_expired_sent_rows() -> None:
+    db = AsyncMock(spec=AsyncSession)
+    db.execute.return_value = SimpleNamespace(rowcount=3)
+
+    deleted_count = asyncio.run(
+        outbox_db_cli_module.purge_sent_rss_scrape_job_outbox_async(
+            db,
+            retention_seconds=3600,
+            limit=100,
+        )
+    )
+
+    assert deleted_count == 3
+    purge_query = _compile(db.execute.call_args.args[0])
+    assert purge_query.startswith("DELETE FROM rss_scrape_job_outbox")
+    assert "rss_scrape_job_outbox.status = %(status_1)s" in purge_query
+    assert "rss_scrape_job_outbox.sent_at < %(sent_at_1)s" in purge_query
+    assert "LIMIT %(param_1)s" in purge_query
@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+import app.clients.database.sources.search_sources_db_cli as search_sources_db_cli_module
+
+
+def test_build_search_query_combines_configs_and_keyset_filters() -> None:
+    query = search_sources_db_cli_module._build_search_query(
+        query="climate",
+        search_configs=["english", "french", "simple"],
+        limit=20,
+        published_after=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        published_before=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        after_rank=0.5,
+        after_published_at=datetime(2026, 1, 15, tzinfo=timezone.utc),
+        after_source_id=12,
+    )
+
+    compiled_query = str(query.compile(dialect=postgresql.dialect()))
+
+    assert compiled_query.count("websearch_to_tsquery(") >= 3
+    assert "rss_sources.search_vector @@" in compiled_query
+    assert "rss_sources.published_at >= " in compiled_query
+    assert "rss_sources.published_at < " in compiled_query
+    assert "rss_sources.published_at, rss_sources.id) < (" in compiled_query
+    assert "LEFT OUTER JOIN rss_source_listing" in compiled_query
+
+
+def test_search_rss_sources_read_returns_next_key_when_more_rows_exist() -> None:
+    db = Mock(spec=Session)
+    configs_result = Mock()
+    configs_result.scalars.return_value.all.return_value = ["english"]
+    rows_result = Mock()
+    rows_result.mappings.return_value.all.return_value = [
+        {
+            "id": source_id,
+            "title": f"Article {source_id}",
+            "summary": None,
+            "author": None,
+            "url": f"https://example.com/{source_id}",
+            "published_at": datetime(2026, 2, source_id, tzinfo=timezone.utc),
+            "image_url": None,
+            "company_names": ["ACME"],
+            "rank": 0.1 * source_id,
+        }
+        for source_id in (3, 2, 1)
+    ]
+    db.execute.side_effect = [configs_result, rows_result]
+
+    items, next_key = search_sources_db_cli_module.search_rss_sources_read(
+        db,
+        query="article",
+        limit=2,
+    )
+
+    assert [item.id for item in items] == [3, 2]
+    assert next_key == (items[1].rank, datetime(2026, 2, 2, tzinfo=timezone.utc), 2)
@@ -0,0 +1,36 @@
+from unittest.mock import Mock
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+import app.clients.database.sources.source_benchmark_db_cli as source_benchmark_db_cli_module
+
+
+def test_capture_executed_statements_records_statements_until_exit() -> None:
+    engine = create_engine("sqlite://")
+    with Session(engine) as db:
+        with source_benchmark_db_cli_module.capture_executed_statements(db) as captured_statements:
+            db.execute(text("SELECT :value"), {"value": 1})
+        db.execute(text("SELECT 2"))
+
+    assert captured_statements == [("SELECT ?", (1,))]
+
+
+def test_explain_analyze_statement_wraps_the_driver_statement() -> None:
+    db = Mock(spec=Session)
+    db.connection.return_value.exec_driver_sql.return_value.scalars.return_value.all.return_value = [
+        "Limit  (actual rows=50 loops=1)",
+        "Execution Time: 1.2 ms",
+    ]
+
+    plan_lines = source_benchmark_db_cli_module.explain_analyze_statement(
+        db,
+        "SELECT * FROM rss_source_listing WHERE feed_ids @> %(feed_ids)s",
+        {"feed_ids": [3]},
+    )
+
+    assert plan_lines == ["Limit  (actual rows=50 loops=1)", "Execution Time: 1.2 ms"]
+    db.connection.return_value.exec_driver_sql.assert_called_once_with(
+        "EXPLAIN (ANALYZE, BUFFERS, SETTINGS) SELECT * FROM rss_source_listing WHERE feed_ids @> %(feed_ids)s",
+        {"feed_ids": [3]},
+    )
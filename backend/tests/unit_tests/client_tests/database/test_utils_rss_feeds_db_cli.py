@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from sqlalchemy.orm import Session
+
+import app.clients.database.rss.utils_rss_feeds_db_cli as utils_rss_feeds_db_cli_module
+
+
+def test_delete_company_feeds_not_in_urls_refreshes_listing_of_their_sources() -> None:
+    db = Mock(spec=Session)
+    published_at = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+    feed_ids_result = Mock()
+    feed_ids_result.scalars.return_value.all.return_value = [4, 5]
+    source_keys_result = Mock()
+    source_keys_result.all.return_value = [
+        SimpleNamespace(source_id=12, published_at=published_at),
+        SimpleNamespace(source_id=11, published_at=published_at),
+    ]
+    db.execute.side_effect = [feed_ids_result, source_keys_result, Mock(), Mock()]
+
+    deleted_count = utils_rss_feeds_db_cli_module.delete_company_feeds_not_in_urls(
+        db,
+        company_id=9,
+        expected_urls={"https://example.com/rss.xml"},
+    )
+
+    assert deleted_count == 2
+    delete_statement = db.execute.call_args_list[2].args[0]
+    refresh_statement, refresh_params = db.execute.call_args_list[3].args
+    assert str(delete_statement).startswith("DELETE FROM rss_feeds")
+    assert "refresh_rss_source_listing" in str(refresh_statement)
+    assert refresh_params == {
+        "source_ids": [11, 12],
+        "published_ats": [published_at, published_at],
+    }
+
+
+def test_link_company_to_feed_refreshes_listing_when_company_changes() -> None:
+    db = Mock(spec=Session)
+    feed = SimpleNamespace(id=4, company_id=1)
+    feed_result = Mock()
+    feed_result.scalar_one_or_none.return_value = feed
+    source_keys_result = Mock()
+    source_keys_result.all.return_value = []
+    db.execute.side_effect = [feed_result, source_keys_result]
+
+    assert utils_rss_feeds_db_cli_module.link_company_to_feed(db, company_id=2, feed_id=4) is True
+
+    assert feed.company_id == 2
+    db.flush.assert_called_once()
+    assert db.execute.call_count == 2
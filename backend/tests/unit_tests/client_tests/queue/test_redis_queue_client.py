@@ -0,0 +1,123 @@
+import asyncio
+
+from redis.exceptions import ResponseError
+
+import app.clients.queue.redis_queue_client as redis_queue_client_module
+
+
+def test_publish_messages_sets_shard_count_and_returns_per_message_results(monkeypatch) -> None:
+    commands: list[tuple] = []
+    xadd_error = RuntimeError("OOM command not allowed")
+
+    class FakePipeline:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            return False
+
+        def set(self, key, value):
+            commands.append(("set", key, value))
+
+        def xadd(self, stream_name, fields):
+            commands.append(("xadd", stream_name, fields["payload"]))
+
+        async def execute(self, raise_on_error):
+            assert raise_on_error is False
+            return [True, b"1-0", xadd_error]
+
+    class FakeRedis:
+        def pipeline(self, transaction):
+            assert transaction is False
+            return FakePipeline()
+
+    monkeypatch.setenv("RSS_SCRAPE_REQUEST_SHARDS", "4")
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    results = asyncio.run(
+        redis_queue_client_module.publish_rss_scrape_job_messages(
+            [
+                ("rss_scrape_requests:0", {"job_id": "job-1"}),
+                ("rss_scrape_requests:1", {"job_id": "job-1"}),
+            ]
+        )
+    )
+
+    assert results == ["1-0", xadd_error]
+    assert commands == [
+        ("set", "rss_scrape_request_shards", 4),
+        ("xadd", "rss_scrape_requests:0", '{"job_id": "job-1"}'),
+        ("xadd", "rss_scrape_requests:1", '{"job_id": "job-1"}'),
+    ]
+
+
+def test_read_redis_stream_health_collects_groups_consumers_and_oldest_pending(monkeypatch) -> None:
+    class FakeRedis:
+        async def xinfo_groups(self, stream_name):
+            assert stream_name == "rss_ingest_results"
+            return [
+                {"name": b"db_manager_group", "lag": 12, "pending": 2, "last-delivered-id": b"1700000005000-0"},
+                {"name": b"idle_group", "lag": None, "pending": 0, "last-delivered-id": b"0-0"},
+            ]
+
+        async def xlen(self, stream_name):
+            return 40
+
+        async def xinfo_consumers(self, stream_name, group_name):
+            if group_name == "idle_group":
+                return []
+            return [{"name": b"db_manager_1", "pending": 2, "idle": 1500, "inactive": 900}]
+
+        async def xpending_range(self, stream_name, group_name, *, min, max, count):
+            assert (group_name, min, max, count) == ("db_manager_group", "-", "+", 1)
+            return [
+                {
+                    "message_id": b"1700000001000-0",
+                    "consumer": b"db_manager_1",
+                    "time_since_delivered": 4200,
+                    "times_delivered": 3,
+                }
+            ]
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    stream_health = asyncio.run(redis_queue_client_module.read_redis_stream_health("rss_ingest_results"))
+
+    assert stream_health == {
+        "length": 40,
+        "groups": [
+            {
+                "name": "db_manager_group",
+                "lag": 12,
+                "pending": 2,
+                "last_delivered_id": "1700000005000-0",
+                "oldest_pending": {
+                    "message_id": "1700000001000-0",
+                    "consumer": "db_manager_1",
+                    "idle_ms": 4200,
+                    "delivery_count": 3,
+                },
+                "consumers": [
+                    {"name": "db_manager_1", "pending": 2, "idle_ms": 1500, "inactive_ms": 900}
+                ],
+            },
+            {
+                "name": "idle_group",
+                "lag": None,
+                "pending": 0,
+                "last_delivered_id": "0-0",
+                "oldest_pending": None,
+                "consumers": [],
+            },
+        ],
+    }
+
+
+def test_read_redis_stream_health_returns_none_for_missing_stream(monkeypatch) -> None:
+    class FakeRedis:
+        async def xinfo_groups(self, stream_name):
+            raise ResponseError("no such key")
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    assert asyncio.run(redis_queue_client_module.read_redis_stream_health("rss_check_results")) is None
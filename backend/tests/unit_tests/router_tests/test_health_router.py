@@ -1,6 +1,7 @@
+from datetime import datetime, timezone
 import importlib
 
-from app.schemas.health import HealthRead
+from app.schemas.health import HealthRead, QueueHealthRead, QueueStreamHealthRead
 
 health_router_module = importlib.import_module("app.routers.health_router")
 
@@ -18,3 +19,24 @@ def test_health_route_returns_service_payload(client, mock_db_session, monkeypat
 
     assert response.status_code == 200
     assert response.json() == expected.model_dump()
+
+
+def test_queue_health_route_returns_service_payload(client, monkeypatch) -> None:
+    expected = QueueHealthRead(
+        status="ok",
+        generated_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+        total_lag=3,
+        total_pending=1,
+        max_oldest_pending_age_seconds=4.5,
+        streams=[QueueStreamHealthRead(stream="rss_check_results", exists=True, length=10)],
+    )
+
+    async def fake_get_queue_health():
+        return expected
+
+    monkeypatch.setattr(health_router_module, "get_queue_health", fake_get_queue_health)
+
+    response = client.get("/health/queues")
+
+    assert response.status_code == 200
+    assert response.json() == expected.model_dump(mode="json")
@@ -6,6 +6,7 @@ from app.schemas.rss import (
     RssCompanyEnabledToggleRead,
     RssFeedEnabledToggleRead,
     RssFeedRead,
+    RssFetchLatencyRead,
     RssScrapeJobQueuedRead,
     RssSyncRead,
 )
@@ -40,6 +41,38 @@ def test_read_rss_feeds_returns_service_payload(client, mock_db_session, monkeyp
     assert response.json() == [item.model_dump() for item in expected]
 
 
+def test_read_rss_fetch_latency_route_passes_window_and_grouping(client, mock_db_session, monkeypatch) -> None:
+    expected = [
+        RssFetchLatencyRead(
+            company_id=4,
+            company_name="Example",
+            feed_id=9,
+            feed_url="https://example.com/rss",
+            sample_count=12,
+            error_count=1,
+            total_p95_ms=850.0,
+        )
+    ]
+
+    def fake_get_rss_fetch_latency(db, *, group_by, window_hours, limit):
+        assert db is mock_db_session
+        assert (group_by, window_hours, limit) == ("feed", 6, 10)
+        return expected
+
+    monkeypatch.setattr(rss_router_module, "get_rss_fetch_latency", fake_get_rss_fetch_latency)
+
+    response = client.get("/rss/latency?group_by=feed&window_hours=6&limit=10")
+
+    assert response.status_code == 200
+    assert response.json() == [item.model_dump() for item in expected]
+
+
+def test_read_rss_fetch_latency_route_rejects_unknown_grouping(client) -> None:
+    response = client.get("/rss/latency?group_by=host")
+
+    assert response.status_code == 422
+
+
 def test_sync_rss_route_passes_force_parameter(client, mock_db_session, monkeypatch) -> None:
     monkeypatch.setattr(rss_router_module, "job_lock", _no_op_job_lock)
 
@@ -90,10 +123,11 @@ def test_patch_company_enabled_route_delegates_to_service(client, mock_db_sessio
     assert response.json() == {"company_id": 2, "enabled": True}
 
 
-def test_check_rss_feeds_route_passes_feed_ids(client, mock_db_session, monkeypatch) -> None:
-    async def fake_enqueue_rss_feed_check_job(db, feed_ids):
-        assert db is mock_db_session
+def test_check_rss_feeds_route_passes_feed_ids(client, mock_async_db_session, monkeypatch) -> None:
+    async def fake_enqueue_rss_feed_check_job(db, feed_ids, force):
+        assert db is mock_async_db_session
         assert feed_ids == [7, 8]
+        assert force is True
         return RssScrapeJobQueuedRead(job_id="job-123", status="queued")
 
     monkeypatch.setattr(
@@ -102,7 +136,7 @@ def test_check_rss_feeds_route_passes_feed_ids(client, mock_db_session, monkeypa
         fake_enqueue_rss_feed_check_job,
     )
 
-    response = client.post("/rss/feeds/check?feed_ids=7&feed_ids=8")
+    response = client.post("/rss/feeds/check?feed_ids=7&feed_ids=8&force=true")
 
     assert response.status_code == 200
     assert response.json() == {"job_id": "job-123", "status": "queued"}
@@ -4,9 +4,11 @@ from fastapi import HTTPException
 
 from app.schemas.sources import (
     RssSourceDetailRead,
+    RssSourceListFilters,
     RssSourcePartitionMaintenanceRead,
     RssSourcePageRead,
     RssSourceRead,
+    RssSourceSearchPageRead,
 )
 from app.utils import JobAlreadyRunning
 
@@ -33,12 +35,14 @@ def test_read_sources_route_returns_service_payload(client, mock_db_session, mon
         offset=0,
     )
 
-    def fake_get_rss_sources(db, limit, offset, feed_id=None, company_id=None):
+    def fake_get_rss_sources(db, limit, offset, feed_id=None, company_id=None, filters=None, total_mode="exact"):
         assert db is mock_db_session
         assert limit == 50
         assert offset == 0
         assert feed_id is None
         assert company_id is None
+        assert filters == RssSourceListFilters()
+        assert total_mode == "exact"
         return expected
 
     monkeypatch.setattr(sources_router_module, "get_rss_sources", fake_get_rss_sources)
@@ -49,6 +53,58 @@ def test_read_sources_route_returns_service_payload(client, mock_db_session, mon
     assert response.json() == expected.model_dump(mode="json")
 
 
+def test_read_sources_by_company_route_passes_estimated_total_mode(
+    client,
+    mock_db_session,
+    monkeypatch,
+) -> None:
+    def fake_get_rss_sources(db, limit, offset, feed_id=None, company_id=None, filters=None, total_mode="exact"):
+        assert db is mock_db_session
+        assert company_id == 4
+        assert total_mode == "estimated"
+        return RssSourcePageRead(
+            total=120,
+            total_mode=total_mode,
+            limit=limit,
+            offset=offset,
+        )
+
+    monkeypatch.setattr(sources_router_module, "get_rss_sources", fake_get_rss_sources)
+
+    response = client.get("/sources/companies/4?total_mode=estimated")
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 120
+    assert response.json()["total_mode"] == "estimated"
+
+
+def test_read_sources_by_feed_route_passes_list_filters(client, mock_db_session, monkeypatch) -> None:
+    def fake_get_rss_sources(db, limit, offset, feed_id=None, company_id=None, filters=None, total_mode="exact"):
+        assert feed_id == 2
+        assert filters.published_after.isoformat() == "2026-02-20T00:00:00+00:00"
+        assert filters.published_before is None
+        assert filters.section == "World"
+        assert filters.country == "fr"
+        assert filters.language == "fr"
+        assert filters.tags == ["politics", "economy"]
+        return RssSourcePageRead(limit=limit, offset=offset)
+
+    monkeypatch.setattr(sources_router_module, "get_rss_sources", fake_get_rss_sources)
+
+    response = client.get(
+        "/sources/feeds/2?published_after=2026-02-20T00:00:00Z&section=World"
+        "&country=fr&language=fr&tags=politics&tags=economy"
+    )
+
+    assert response.status_code == 200
+
+
+def test_read_sources_route_rejects_unknown_total_mode(client) -> None:
+    response = client.get("/sources/?total_mode=fast")
+
+    assert response.status_code == 422
+
+
 def test_read_source_by_id_returns_404_when_not_found(client, mock_db_session, monkeypatch) -> None:
     monkeypatch.setattr(
         sources_router_module,
@@ -64,10 +120,11 @@ def test_read_source_by_id_returns_404_when_not_found(client, mock_db_session, m
     assert response.json() == {"detail": "RSS source 999 not found"}
 
 
-def test_ingest_sources_route_passes_feed_ids(client, mock_db_session, monkeypatch) -> None:
-    async def fake_enqueue_sources_ingest_job(db, feed_ids=None):
-        assert db is mock_db_session
+def test_ingest_sources_route_passes_feed_ids(client, mock_async_db_session, monkeypatch) -> None:
+    async def fake_enqueue_sources_ingest_job(db, feed_ids=None, force=False):
+        assert db is mock_async_db_session
         assert feed_ids == [3, 4]
+        assert force is False
         return {"job_id": "job-456", "status": "queued"}
 
     monkeypatch.setattr(
@@ -94,8 +151,10 @@ def test_repartition_sources_default_route_returns_service_payload(
         return RssSourcePartitionMaintenanceRead(
             source_default_rows_repartitioned=5,
             source_feed_default_rows_repartitioned=7,
+            source_listing_default_rows_repartitioned=5,
             source_weekly_partitions_created=2,
             source_feed_weekly_partitions_created=2,
+            source_listing_weekly_partitions_created=2,
             weeks_covered=2,
         )
 
@@ -112,8 +171,10 @@ def test_repartition_sources_default_route_returns_service_payload(
         "status": "completed",
         "source_default_rows_repartitioned": 5,
         "source_feed_default_rows_repartitioned": 7,
+        "source_listing_default_rows_repartitioned": 5,
         "source_weekly_partitions_created": 2,
         "source_feed_weekly_partitions_created": 2,
+        "source_listing_weekly_partitions_created": 2,
         "weeks_covered": 2,
     }
 
@@ -157,3 +218,36 @@ def test_read_source_by_id_route_returns_payload(client, mock_db_session, monkey
 
     assert response.status_code == 200
     assert response.json() == expected.model_dump(mode="json")
+
+
+def test_search_sources_route_passes_filters(client, mock_db_session, monkeypatch) -> None:
+    def fake_search_rss_sources(
+        db,
+        query,
+        limit,
+        published_after=None,
+        published_before=None,
+        cursor=None,
+    ):
+        assert db is mock_db_session
+        assert query == "climate paris"
+        assert limit == 20
+        assert published_after is not None and published_after.year == 2026
+        assert published_before is None
+        assert cursor == "abc"
+        return RssSourceSearchPageRead(limit=limit, next_cursor="next")
+
+    monkeypatch.setattr(sources_router_module, "search_rss_sources", fake_search_rss_sources)
+
+    response = client.get(
+        "/sources/search?q=climate%20paris&limit=20&published_after=2026-01-01T00:00:00Z&cursor=abc"
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "limit": 20, "next_cursor": "next"}
+
+
+def test_search_sources_route_requires_query(client) -> None:
+    response = client.get("/sources/search")
+
+    assert response.status_code == 422
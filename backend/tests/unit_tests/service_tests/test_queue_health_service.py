@@ -0,0 +1,112 @@
+import asyncio
+from itertools import count
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+import app.services.health.queue_health_service as queue_health_service_module
+
+
+def _stream_health(lag: int, pending: int) -> dict:
+    return {
+        "length": 100,
+        "groups": [
+            {
+                "name": "worker_rss_scrapper_group",
+                "lag": lag,
+                "pending": pending,
+                "last_delivered_id": "1700000009000-0",
+                "oldest_pending": (
+                    {
+                        "message_id": "1700000000000-0",
+                        "consumer": "worker-1",
+                        "idle_ms": 2500,
+                        "delivery_count": 2,
+                    }
+                    if pending
+                    else None
+                ),
+                "consumers": [
+                    {"name": "worker-1", "pending": pending, "idle_ms": 1200, "inactive_ms": -1}
+                ],
+            }
+        ],
+    }
+
+
+def test_get_queue_health_aggregates_streams_and_caches_the_result(monkeypatch) -> None:
+    redis_reads: list[str] = []
+
+    async def fake_read_redis_stream_health(stream_name: str):
+        redis_reads.append(stream_name)
+        if stream_name == "rss_scrape_requests":
+            return _stream_health(lag=30, pending=4)
+        if stream_name == "rss_ingest_results":
+            return _stream_health(lag=5, pending=0)
+        return None
+
+    async def fake_read_redis_server_time_ms() -> int:
+        return 1700000012000
+
+    monkeypatch.setenv("RSS_SCRAPE_REQUEST_SHARDS", "1")
+    monkeypatch.setattr(queue_health_service_module, "_queue_health_cache", None)
+    monkeypatch.setattr(queue_health_service_module, "read_redis_stream_health", fake_read_redis_stream_health)
+    monkeypatch.setattr(queue_health_service_module, "read_redis_server_time_ms", fake_read_redis_server_time_ms)
+    clock = iter([0.0, 0.0, 0.0, 2.0, 10.0, 10.0, 10.0])
+
+    first = asyncio.run(queue_health_service_module.get_queue_health(monotonic=lambda: next(clock)))
+    cached = asyncio.run(queue_health_service_module.get_queue_health(monotonic=lambda: next(clock)))
+    refreshed = asyncio.run(queue_health_service_module.get_queue_health(monotonic=lambda: next(clock)))
+
+    assert cached is first
+    assert refreshed is not first
+    assert redis_reads == [
+        "rss_scrape_requests_interactive",
+        "rss_scrape_requests",
+        "rss_check_results",
+        "rss_ingest_results",
+        "error_feeds_parsing",
+        "rss_dead_letters",
+    ] * 2
+    assert first.status == "ok"
+    assert first.total_lag == 35
+    assert first.total_pending == 4
+    assert first.max_oldest_pending_age_seconds == 12.0
+    requests_stream = first.streams[1]
+    assert requests_stream.exists is True
+    assert requests_stream.groups[0].oldest_pending_idle_seconds == 2.5
+    assert requests_stream.groups[0].consumers[0].idle_seconds == 1.2
+    assert requests_stream.groups[0].consumers[0].inactive_seconds is None
+    assert first.streams[0].exists is False
+
+
+def test_list_queue_health_stream_names_includes_request_shards(monkeypatch) -> None:
+    monkeypatch.setenv("RSS_SCRAPE_REQUEST_SHARDS", "2")
+
+    assert queue_health_service_module.list_queue_health_stream_names() == [
+        "rss_scrape_requests_interactive",
+        "rss_scrape_requests",
+        "rss_scrape_requests_interactive:0",
+        "rss_scrape_requests_interactive:1",
+        "rss_scrape_requests:0",
+        "rss_scrape_requests:1",
+        "rss_check_results",
+        "rss_ingest_results",
+        "error_feeds_parsing",
+        "rss_dead_letters",
+    ]
+
+
+def test_get_queue_health_reports_unavailable_when_redis_fails(monkeypatch) -> None:
+    async def fake_read_redis_server_time_ms() -> int:
+        raise RedisConnectionError("connection refused")
+
+    monkeypatch.setattr(queue_health_service_module, "_queue_health_cache", None)
+    monkeypatch.setattr(queue_health_service_module, "read_redis_server_time_ms", fake_read_redis_server_time_ms)
+
+    result = asyncio.run(
+        queue_health_service_module.get_queue_health(monotonic=count().__next__)
+    )
+
+    assert result.status == "unavailable"
+    assert result.streams == []
+    assert result.total_lag == 0
@@ -0,0 +1,188 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.services.rss.rss_scrape_job_outbox_service as outbox_service_module
+
+
+def _build_outbox_row(outbox_id: int, *, job_id: str = "job-1", attempts: int = 0):
+    return SimpleNamespace(
+        id=outbox_id,
+        job_id=job_id,
+        stream_name="rss_scrape_requests",
+        payload={"job_id": job_id, "feeds": [{"feed_id": outbox_id}]},
+        status="pending",
+        attempts=attempts,
+        available_at=None,
+        last_error=None,
+    )
+
+
+def test_relay_pending_outbox_publishes_in_bulk_and_marks_sent(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    outbox_rows = [_build_outbox_row(1), _build_outbox_row(2)]
+    published_messages: list = []
+    sent_ids: list = []
+
+    async def fake_publish(messages):
+        published_messages.append(messages)
+        return ["1-0", "1-1"]
+
+    async def fake_mark_sent(_db, *, outbox_ids):
+        sent_ids.append(outbox_ids)
+
+    monkeypatch.setattr(
+        outbox_service_module,
+        "claim_pending_rss_scrape_job_outbox_async",
+        AsyncMock(return_value=outbox_rows),
+    )
+    monkeypatch.setattr(outbox_service_module, "publish_rss_scrape_job_messages", fake_publish)
+    monkeypatch.setattr(outbox_service_module, "mark_rss_scrape_job_outbox_sent_async", fake_mark_sent)
+
+    relayed_count = asyncio.run(outbox_service_module.relay_pending_rss_scrape_job_outbox(db, batch_size=10))
+
+    assert relayed_count == 2
+    assert published_messages == [
+        [
+            ("rss_scrape_requests", outbox_rows[0].payload),
+            ("rss_scrape_requests", outbox_rows[1].payload),
+        ]
+    ]
+    assert sent_ids == [[1, 2]]
+    db.commit.assert_awaited_once()
+
+
+def test_relay_pending_outbox_reschedules_rows_when_publish_fails(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    outbox_rows = [_build_outbox_row(1, job_id="job-1"), _build_outbox_row(2, job_id="job-2", attempts=2)]
+    failed_job_ids: list = []
+
+    async def fake_mark_jobs_failed(_db, *, job_ids):
+        failed_job_ids.append(job_ids)
+
+    monkeypatch.setattr(
+        outbox_service_module,
+        "claim_pending_rss_scrape_job_outbox_async",
+        AsyncMock(return_value=outbox_rows),
+    )
+    monkeypatch.setattr(
+        outbox_service_module,
+        "publish_rss_scrape_job_messages",
+        AsyncMock(side_effect=RuntimeError("redis down")),
+    )
+    monkeypatch.setattr(outbox_service_module, "mark_rss_scrape_jobs_failed_async", fake_mark_jobs_failed)
+
+    relayed_count = asyncio.run(
+        outbox_service_module.relay_pending_rss_scrape_job_outbox(db, batch_size=10, max_attempts=3)
+    )
+
+    assert relayed_count == 0
+    assert outbox_rows[0].status == "pending"
+    assert outbox_rows[0].attempts == 1
+    assert outbox_rows[0].available_at is not None
+    assert outbox_rows[0].last_error == "redis down"
+    assert outbox_rows[1].status == "failed"
+    assert failed_job_ids == [["job-2"]]
+    db.commit.assert_awaited_once()
+
+
+def test_relay_pending_outbox_marks_rows_by_their_own_publish_result(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    outbox_rows = [_build_outbox_row(1), _build_outbox_row(2), _build_outbox_row(3)]
+    sent_ids: list = []
+
+    async def fake_mark_sent(_db, *, outbox_ids):
+        sent_ids.append(outbox_ids)
+
+    monkeypatch.setattr(
+        outbox_service_module,
+        "claim_pending_rss_scrape_job_outbox_async",
+        AsyncMock(return_value=outbox_rows),
+    )
+    monkeypatch.setattr(
+        outbox_service_module,
+        "publish_rss_scrape_job_messages",
+        AsyncMock(return_value=["1-0", RuntimeError("OOM command not allowed"), "1-1"]),
+    )
+    monkeypatch.setattr(outbox_service_module, "mark_rss_scrape_job_outbox_sent_async", fake_mark_sent)
+    monkeypatch.setattr(outbox_service_module, "mark_rss_scrape_jobs_failed_async", AsyncMock())
+
+    relayed_count = asyncio.run(outbox_service_module.relay_pending_rss_scrape_job_outbox(db, batch_size=10))
+
+    assert relayed_count == 2
+    assert sent_ids == [[1, 3]]
+    assert outbox_rows[1].attempts == 1
+    assert outbox_rows[1].last_error == "OOM command not allowed"
+    assert outbox_rows[0].attempts == 0
+    assert outbox_rows[2].attempts == 0
+    db.commit.assert_awaited_once()
+
+
+def test_purge_sent_outbox_deletes_in_batches_until_drained(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    purge = AsyncMock(side_effect=[2, 2, 1])
+    monkeypatch.setattr(outbox_service_module, "purge_sent_rss_scrape_job_outbox_async", purge)
+
+    purged_count = asyncio.run(
+        outbox_service_module.purge_sent_rss_scrape_job_outbox(db, retention_seconds=3600, batch_size=2)
+    )
+
+    assert purged_count == 5
+    assert purge.await_count == 3
+    assert purge.await_args.kwargs == {"retention_seconds": 3600, "limit": 2}
+    assert db.commit.await_count == 3
+
+
+def test_relay_pending_outbox_returns_zero_without_pending_rows(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    publish = AsyncMock()
+    monkeypatch.setattr(
+        outbox_service_module,
+        "claim_pending_rss_scrape_job_outbox_async",
+        AsyncMock(return_value=[]),
+    )
+    monkeypatch.setattr(outbox_service_module, "publish_rss_scrape_job_messages", publish)
+
+    relayed_count = asyncio.run(outbox_service_module.relay_pending_rss_scrape_job_outbox(db))
+
+    assert relayed_count == 0
+    publish.assert_not_awaited()
+    db.commit.assert_not_awaited()
+
+
+def test_run_outbox_relay_drains_full_batches_then_stops(monkeypatch) -> None:
+    relayed_counts = iter([2, 1])
+    calls: list[int] = []
+
+    class FakeSessionContext:
+        async def __aenter__(self):
+            return AsyncMock(spec=AsyncSession)
+
+        async def __aexit__(self, *args):
+            return False
+
+    async def fake_relay(_db, *, batch_size, max_attempts, max_inflight_feeds, inflight_window_seconds):
+        calls.append(batch_size)
+        return next(relayed_counts)
+
+    async def run_relay() -> None:
+        stop_event = asyncio.Event()
+        relay_task = asyncio.create_task(outbox_service_module.run_rss_scrape_job_outbox_relay(stop_event))
+        while len(calls) < 2:
+            await asyncio.sleep(0)
+        await outbox_service_module.stop_rss_scrape_job_outbox_relay(relay_task, stop_event)
+
+    monkeypatch.setenv("RSS_SCRAPE_OUTBOX_BATCH_SIZE", "2")
+    monkeypatch.setenv("RSS_SCRAPE_OUTBOX_POLL_SECONDS", "30")
+    monkeypatch.setattr(outbox_service_module, "AsyncSessionLocal", FakeSessionContext)
+    monkeypatch.setattr(outbox_service_module, "relay_pending_rss_scrape_job_outbox", fake_relay)
+    purge = AsyncMock()
+    monkeypatch.setattr(outbox_service_module, "_purge_sent_outbox", purge)
+
+    asyncio.run(asyncio.wait_for(run_relay(), timeout=5))
+
+    assert calls == [2, 2]
+    purge.assert_awaited_once_with(retention_seconds=24 * 3600)
+    assert outbox_service_module._relay_wakeup is None
@@ -1,78 +1,82 @@
 import asyncio
 from datetime import datetime, timezone
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from fastapi import HTTPException
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.errors.rss import RssJobQueuePublishError
 import app.services.rss.rss_scrape_job_service as rss_scrape_job_service_module
 from app.schemas.rss import RssScrapeFeedPayloadSchema, RssScrapeJobStatusRead
 
 
-def test_enqueue_rss_feed_check_job_publishes_message(monkeypatch) -> None:
-    db = Mock(spec=Session)
-    feeds = [
-        RssScrapeFeedPayloadSchema(
-            feed_id=1,
-            feed_url="https://example.com/rss.xml",
-            fetchprotection=1,
-        )
-    ]
+def _patch_enqueue_dependencies(monkeypatch, feeds: list[RssScrapeFeedPayloadSchema]) -> dict[str, list]:
+    calls: dict[str, list] = {"jobs": [], "job_feeds": [], "outbox": [], "wakeups": []}
 
     monkeypatch.setattr(
         rss_scrape_job_service_module,
-        "list_rss_feed_scrape_payloads",
-        lambda _db, feed_ids=None, enabled_only=False: feeds,
+        "list_rss_feed_scrape_payloads_async",
+        AsyncMock(return_value=feeds),
     )
 
-    created_jobs: list[dict] = []
-
-    def fake_create_rss_scrape_job(
-        _db,
-        *,
-        job_id,
-        ingest,
-        requested_by,
-        requested_at,
-        status,
-        feeds,
-    ):
-        created_jobs.append(
-            {
-                "job_id": job_id,
-                "ingest": ingest,
-                "requested_by": requested_by,
-                "requested_at": requested_at,
-                "status": status,
-                "feeds": feeds,
-            }
-        )
+    def fake_create_rss_scrape_job(_db, **kwargs):
+        calls["jobs"].append(kwargs)
         return object()
 
-    monkeypatch.setattr(rss_scrape_job_service_module, "create_rss_scrape_job", fake_create_rss_scrape_job)
+    async def fake_insert_rss_scrape_job_feeds_async(_db, *, job_id, feeds):
+        calls["job_feeds"].append((job_id, feeds))
 
-    published_payloads: list[dict] = []
+    async def fake_insert_rss_scrape_job_outbox_async(_db, *, job_id, stream_name, payloads):
+        calls["outbox"].append((job_id, stream_name, payloads))
 
-    async def fake_publish_rss_scrape_job(payload):
-        published_payloads.append(payload)
-        return "1-0"
+    monkeypatch.setattr(rss_scrape_job_service_module, "create_rss_scrape_job", fake_create_rss_scrape_job)
+    monkeypatch.setattr(
+        rss_scrape_job_service_module,
+        "insert_rss_scrape_job_feeds_async",
+        fake_insert_rss_scrape_job_feeds_async,
+    )
+    monkeypatch.setattr(
+        rss_scrape_job_service_module,
+        "insert_rss_scrape_job_outbox_async",
+        fake_insert_rss_scrape_job_outbox_async,
+    )
+    monkeypatch.setattr(
+        rss_scrape_job_service_module,
+        "wake_rss_scrape_job_outbox_relay",
+        lambda: calls["wakeups"].append(True),
+    )
+    return calls
 
-    monkeypatch.setattr(rss_scrape_job_service_module, "publish_rss_scrape_job", fake_publish_rss_scrape_job)
+
+def test_enqueue_rss_feed_check_job_writes_outbox_in_job_transaction(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    feeds = [
+        RssScrapeFeedPayloadSchema(
+            feed_id=1,
+            feed_url="https://example.com/rss.xml",
+            fetchprotection=1,
+        )
+    ]
+    calls = _patch_enqueue_dependencies(monkeypatch, feeds)
 
     result = asyncio.run(rss_scrape_job_service_module.enqueue_rss_feed_check_job(db, feed_ids=[1]))
 
     assert result.status == "queued"
-    assert len(created_jobs) == 1
-    assert len(published_payloads) == 1
-    assert published_payloads[0]["ingest"] is False
-    assert published_payloads[0]["feeds"][0]["feed_id"] == 1
-    db.commit.assert_called_once()
-
-
-def test_enqueue_rss_feed_check_job_commits_before_publish(monkeypatch) -> None:
-    db = Mock(spec=Session)
+    assert len(calls["jobs"]) == 1
+    assert calls["job_feeds"] == [(result.job_id, feeds)]
+    job_id, stream_name, payloads = calls["outbox"][0]
+    assert job_id == result.job_id
+    assert stream_name == "rss_scrape_requests_interactive"
+    assert len(payloads) == 1
+    assert payloads[0]["ingest"] is False
+    assert payloads[0]["feeds"][0]["feed_id"] == 1
+    db.commit.assert_awaited_once()
+    assert calls["wakeups"] == [True]
+
+
+def test_enqueue_rss_sources_ingest_job_uses_bulk_lane(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
     feeds = [
         RssScrapeFeedPayloadSchema(
             feed_id=1,
@@ -80,31 +84,43 @@ def test_enqueue_rss_feed_check_job_commits_before_publish(monkeypatch) -> None:
             fetchprotection=1,
         )
     ]
-
-    monkeypatch.setattr(
-        rss_scrape_job_service_module,
-        "list_rss_feed_scrape_payloads",
-        lambda _db, feed_ids=None, enabled_only=False: feeds,
-    )
-    monkeypatch.setattr(
-        rss_scrape_job_service_module,
-        "create_rss_scrape_job",
-        lambda *args, **kwargs: object(),
+    calls = _patch_enqueue_dependencies(monkeypatch, feeds)
+
+    asyncio.run(rss_scrape_job_service_module.enqueue_rss_sources_ingest_job(db, feed_ids=[1]))
+
+    _, stream_name, payloads = calls["outbox"][0]
+    assert stream_name == "rss_scrape_requests"
+    assert payloads[0]["ingest"] is True
+    rss_scrape_job_service_module.list_rss_feed_scrape_payloads_async.assert_awaited_once_with(
+        db,
+        feed_ids=[1],
+        enabled_only=True,
+        skip_fresh=True,
+        skip_pending_check_jobs=False,
+        skip_pending_ingest_jobs=True,
     )
 
-    async def fake_publish_rss_scrape_job(payload):
-        assert db.commit.call_count == 1
-        return "1-0"
 
-    monkeypatch.setattr(rss_scrape_job_service_module, "publish_rss_scrape_job", fake_publish_rss_scrape_job)
+def test_enqueue_rss_feed_check_job_force_includes_fresh_and_pending_feeds(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    _patch_enqueue_dependencies(monkeypatch, [])
 
-    asyncio.run(rss_scrape_job_service_module.enqueue_rss_feed_check_job(db, feed_ids=[1]))
+    result = asyncio.run(rss_scrape_job_service_module.enqueue_rss_feed_check_job(db, feed_ids=[1], force=True))
 
-    assert db.commit.call_count == 1
+    assert result.status == "completed"
+    rss_scrape_job_service_module.list_rss_feed_scrape_payloads_async.assert_awaited_once_with(
+        db,
+        feed_ids=[1],
+        enabled_only=False,
+        skip_fresh=False,
+        skip_pending_check_jobs=False,
+        skip_pending_ingest_jobs=False,
+    )
 
 
-def test_enqueue_rss_feed_check_job_marks_failed_if_publish_fails(monkeypatch) -> None:
-    db = Mock(spec=Session)
+def test_enqueue_rss_feed_check_job_rolls_back_and_skips_wakeup_if_commit_fails(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    db.commit.side_effect = RuntimeError("database unavailable")
     feeds = [
         RssScrapeFeedPayloadSchema(
             feed_id=1,
@@ -112,32 +128,26 @@ def test_enqueue_rss_feed_check_job_marks_failed_if_publish_fails(monkeypatch) -
             fetchprotection=1,
         )
     ]
+    calls = _patch_enqueue_dependencies(monkeypatch, feeds)
 
-    monkeypatch.setattr(
-        rss_scrape_job_service_module,
-        "list_rss_feed_scrape_payloads",
-        lambda _db, feed_ids=None, enabled_only=False: feeds,
-    )
-    monkeypatch.setattr(
-        rss_scrape_job_service_module,
-        "create_rss_scrape_job",
-        lambda *args, **kwargs: object(),
-    )
-    monkeypatch.setattr(
-        rss_scrape_job_service_module,
-        "set_rss_scrape_job_status",
-        lambda _db, *, job_id, status: status == "failed",
-    )
+    with pytest.raises(RuntimeError):
+        asyncio.run(rss_scrape_job_service_module.enqueue_rss_feed_check_job(db, feed_ids=[1]))
 
-    async def fake_publish_rss_scrape_job(payload):
-        raise RuntimeError("redis down")
+    db.rollback.assert_awaited_once()
+    assert calls["wakeups"] == []
 
-    monkeypatch.setattr(rss_scrape_job_service_module, "publish_rss_scrape_job", fake_publish_rss_scrape_job)
 
-    with pytest.raises(RssJobQueuePublishError):
-        asyncio.run(rss_scrape_job_service_module.enqueue_rss_feed_check_job(db, feed_ids=[1]))
+def test_enqueue_rss_feed_check_job_without_feeds_completes_immediately(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    calls = _patch_enqueue_dependencies(monkeypatch, [])
+
+    result = asyncio.run(rss_scrape_job_service_module.enqueue_rss_feed_check_job(db, feed_ids=[1]))
 
-    assert db.commit.call_count == 2
+    assert result.status == "completed"
+    assert calls["job_feeds"] == []
+    assert calls["outbox"] == []
+    assert calls["wakeups"] == []
+    db.commit.assert_awaited_once()
 
 
 def test_get_rss_scrape_job_status_raises_404_when_missing(monkeypatch) -> None:
@@ -219,7 +229,7 @@ def test_mix_feeds_by_company_round_robin() -> None:
 
 
 def test_enqueue_rss_feed_check_job_batches_and_mixes_company_feeds(monkeypatch) -> None:
-    db = Mock(spec=Session)
+    db = AsyncMock(spec=AsyncSession)
     feeds = [
         RssScrapeFeedPayloadSchema(
             feed_id=1,
@@ -253,31 +263,47 @@ def test_enqueue_rss_feed_check_job_batches_and_mixes_company_feeds(monkeypatch)
         ),
     ]
 
-    monkeypatch.setattr(
-        rss_scrape_job_service_module,
-        "list_rss_feed_scrape_payloads",
-        lambda _db, feed_ids=None, enabled_only=False: feeds,
-    )
-    monkeypatch.setattr(
-        rss_scrape_job_service_module,
-        "create_rss_scrape_job",
-        lambda *args, **kwargs: object(),
-    )
+    calls = _patch_enqueue_dependencies(monkeypatch, feeds)
     monkeypatch.setenv("RSS_SCRAPE_QUEUE_BATCH_SIZE", "2")
 
-    published_payloads: list[dict] = []
-
-    async def fake_publish_rss_scrape_job(payload):
-        published_payloads.append(payload)
-        return "1-0"
-
-    monkeypatch.setattr(rss_scrape_job_service_module, "publish_rss_scrape_job", fake_publish_rss_scrape_job)
-
     asyncio.run(rss_scrape_job_service_module.enqueue_rss_feed_check_job(db, feed_ids=[1, 2, 3, 4, 5]))
 
-    assert len(published_payloads) == 3
-    assert [[feed["feed_id"] for feed in payload["feeds"]] for payload in published_payloads] == [
+    payloads = calls["outbox"][0][2]
+    assert len(payloads) == 3
+    assert [[feed["feed_id"] for feed in payload["feeds"]] for payload in payloads] == [
         [1, 3],
         [5, 2],
         [4],
     ]
+
+
+def test_enqueue_rss_sources_ingest_job_shards_outbox_by_company_key(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    feeds = [
+        RssScrapeFeedPayloadSchema(
+            feed_id=feed_id,
+            feed_url=feed_url,
+            company_id=company_id,
+            fetchprotection=1,
+        )
+        for feed_id, feed_url, company_id in (
+            (1, "https://alpha.example.com/rss.xml", 7),
+            (2, "https://cdn.example.net/alpha.xml", 7),
+            (3, "https://beta.example.org/rss.xml", 9),
+            (4, "https://beta.example.org/other.xml", None),
+        )
+    ]
+    calls = _patch_enqueue_dependencies(monkeypatch, feeds)
+    monkeypatch.setenv("RSS_SCRAPE_REQUEST_SHARDS", "8")
+
+    asyncio.run(rss_scrape_job_service_module.enqueue_rss_sources_ingest_job(db, feed_ids=[1, 2, 3, 4]))
+
+    feed_ids_by_stream = {
+        stream_name: sorted(feed["feed_id"] for payload in payloads for feed in payload["feeds"])
+        for _, stream_name, payloads in calls["outbox"]
+    }
+    company_shard = rss_scrape_job_service_module._resolve_company_shard(feeds[0], shard_count=8)
+    standalone_shard = rss_scrape_job_service_module._resolve_company_shard(feeds[3], shard_count=8)
+    assert {1, 2} <= set(feed_ids_by_stream[f"rss_scrape_requests:{company_shard}"])
+    assert 4 in feed_ids_by_stream[f"rss_scrape_requests:{standalone_shard}"]
+    assert sum(len(feed_ids) for feed_ids in feed_ids_by_stream.values()) == 4
@@ -0,0 +1,193 @@
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import random
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from sqlalchemy.orm import Session
+
+from app.domain.sources import (
+    build_source_benchmark_feed_plans,
+    build_source_benchmark_week_starts,
+    summarize_benchmark_durations,
+)
+import app.services.sources.source_benchmark_service as source_benchmark_service_module
+
+
+def test_build_source_benchmark_feed_plans_is_reproducible_and_bounded() -> None:
+    def build(seed: int):
+        return build_source_benchmark_feed_plans(
+            company_count=50,
+            mean_feeds_per_company=5.0,
+            max_feeds_per_company=12,
+            mean_articles_per_week=30.0,
+            rng=random.Random(seed),
+        )
+
+    feed_plans = build(7)
+
+    assert feed_plans == build(7)
+    assert {feed_plan.company_index for feed_plan in feed_plans} == set(range(50))
+    feeds_per_company = [
+        sum(1 for feed_plan in feed_plans if feed_plan.company_index == company_index)
+        for company_index in range(50)
+    ]
+    assert max(feeds_per_company) <= 12
+    assert min(feeds_per_company) >= 1
+    assert all(1 <= feed_plan.weekly_articles <= 600 for feed_plan in feed_plans)
+    assert len({feed_plan.weekly_articles for feed_plan in feed_plans}) > 10
+
+
+def test_build_source_benchmark_week_starts_ends_at_current_monday() -> None:
+    week_starts = build_source_benchmark_week_starts(
+        week_count=3,
+        now=datetime(2026, 3, 12, 15, 30, tzinfo=timezone.utc),
+    )
+
+    assert week_starts == [
+        datetime(2026, 2, 23, tzinfo=timezone.utc),
+        datetime(2026, 3, 2, tzinfo=timezone.utc),
+        datetime(2026, 3, 9, tzinfo=timezone.utc),
+    ]
+
+
+def test_summarize_benchmark_durations_uses_nearest_rank() -> None:
+    timings = summarize_benchmark_durations([float(value) for value in range(20, 0, -1)])
+
+    assert (timings.runs, timings.p50_ms, timings.p95_ms, timings.max_ms) == (20, 10.0, 19.0, 20.0)
+
+
+def test_seed_source_benchmark_commits_each_week_then_repartitions(monkeypatch) -> None:
+    db = Mock(spec=Session)
+    calls: list[str] = []
+    db.commit.side_effect = lambda: calls.append("commit")
+
+    monkeypatch.setattr(
+        source_benchmark_service_module,
+        "set_source_benchmark_random_seed",
+        lambda _db, *, seed: calls.append("setseed"),
+    )
+    monkeypatch.setattr(
+        source_benchmark_service_module,
+        "seed_source_benchmark_feeds",
+        lambda _db, *, feed_plans: calls.append("feeds") or [1, 2, 3],
+    )
+    monkeypatch.setattr(
+        source_benchmark_service_module,
+        "seed_source_benchmark_week",
+        lambda _db, *, week_start, cross_post_rate: calls.append(f"week {week_start:%m-%d}") or 10,
+    )
+    monkeypatch.setattr(
+        source_benchmark_service_module,
+        "repartition_default_sources_by_published_at",
+        lambda _db: calls.append("repartition") or SimpleNamespace(source_weekly_partitions_created=2),
+    )
+    monkeypatch.setattr(
+        source_benchmark_service_module,
+        "refresh_source_benchmark_feed_watermarks",
+        lambda _db: calls.append("watermarks"),
+    )
+    monkeypatch.setattr(
+        source_benchmark_service_module,
+        "analyze_source_tables",
+        lambda _db: calls.append("analyze"),
+    )
+
+    source_count = source_benchmark_service_module.seed_source_benchmark(
+        db,
+        settings=source_benchmark_service_module.SourceBenchmarkSeedSettings(
+            company_count=2,
+            mean_feeds_per_company=2.0,
+            max_feeds_per_company=4,
+            mean_articles_per_week=5.0,
+            week_count=2,
+            cross_post_rate=0.1,
+            seed=1,
+        ),
+        now=datetime(2026, 3, 12, tzinfo=timezone.utc),
+    )
+
+    assert source_count == 20
+    assert calls == [
+        "setseed",
+        "feeds",
+        "commit",
+        "week 03-02",
+        "commit",
+        "week 03-09",
+        "commit",
+        "repartition",
+        "watermarks",
+        "analyze",
+        "commit",
+    ]
+
+
+def test_run_source_read_benchmark_times_each_read_path_and_explains_its_statements(
+    monkeypatch,
+) -> None:
+    db = Mock(spec=Session)
+    executed: list[str] = []
+    captured: list[tuple[str, dict]] = []
+
+    monkeypatch.setattr(
+        source_benchmark_service_module,
+        "pick_source_benchmark_targets",
+        lambda _db: {
+            "largest_feed_id": 3,
+            "median_feed_id": None,
+            "largest_company_id": 9,
+            "latest_source_id": 44,
+        },
+    )
+
+    def fake_list_rss_sources_read(_db, **kwargs):
+        executed.append(f"list {sorted(kwargs.items())}")
+        captured.append(("SELECT listing", kwargs))
+        return [], 0
+
+    def fake_get_detail(_db, source_id):
+        executed.append(f"detail {source_id}")
+        captured.append(("SELECT source", {"id": source_id}))
+
+    def fake_enqueue_candidates(_db):
+        captured.append(("SELECT feeds", {}))
+        return 0
+
+    @contextmanager
+    def fake_capture(_db):
+        captured.clear()
+        yield captured
+
+    monkeypatch.setattr(source_benchmark_service_module, "list_rss_sources_read", fake_list_rss_sources_read)
+    monkeypatch.setattr(source_benchmark_service_module, "get_rss_source_detail_read_by_id", fake_get_detail)
+    monkeypatch.setattr(
+        source_benchmark_service_module,
+        "read_source_benchmark_enqueue_candidates",
+        fake_enqueue_candidates,
+    )
+    monkeypatch.setattr(source_benchmark_service_module, "capture_executed_statements", fake_capture)
+    monkeypatch.setattr(
+        source_benchmark_service_module,
+        "explain_analyze_statement",
+        lambda _db, statement, parameters: [f"plan for {statement}"],
+    )
+
+    results = source_benchmark_service_module.run_source_read_benchmark(db, runs=3)
+
+    assert [result.name for result in results] == [
+        "list",
+        "list_estimated",
+        "list_deep_page",
+        "enqueue_watermarks",
+        "by_feed_largest",
+        "by_company",
+        "detail",
+    ]
+    assert all(result.timings.runs == 3 for result in results)
+    assert results[0].plans == [["plan for SELECT listing"]]
+    assert results[3].plans == [["plan for SELECT feeds"]]
+    assert results[-1].plans == [["plan for SELECT source"]]
+    assert executed.count("detail 44") == 5
+    assert any("('feed_id', 3)" in call for call in executed)
+    assert any("('company_id', 9)" in call for call in executed)
@@ -0,0 +1,88 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.services.sources.source_ingest_scheduler_service as scheduler_service_module
+from app.schemas.rss import RssScrapeFeedPayloadSchema, RssScrapeJobQueuedRead
+
+
+def _build_feed(feed_id: int) -> RssScrapeFeedPayloadSchema:
+    return RssScrapeFeedPayloadSchema(
+        feed_id=feed_id,
+        feed_url=f"https://example.com/{feed_id}.xml",
+        company_id=1,
+        host_header=None,
+        fetchprotection=1,
+        etag=None,
+        last_update=None,
+        last_db_article_published_at=None,
+    )
+
+
+def test_enqueue_due_sources_ingest_job_leases_and_enqueues_due_feeds(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    claim_mock = AsyncMock(return_value=[3, 7])
+    feeds = [_build_feed(3), _build_feed(7)]
+    list_feeds_mock = AsyncMock(return_value=feeds)
+    lease_mock = AsyncMock()
+    enqueue_mock = AsyncMock(return_value=RssScrapeJobQueuedRead(job_id="job-1", status="queued"))
+
+    monkeypatch.setattr(scheduler_service_module, "claim_due_rss_feed_ids_async", claim_mock)
+    monkeypatch.setattr(scheduler_service_module, "list_scheduled_rss_sources_ingest_feeds", list_feeds_mock)
+    monkeypatch.setattr(scheduler_service_module, "lease_rss_feed_next_fetch_async", lease_mock)
+    monkeypatch.setattr(scheduler_service_module, "enqueue_scheduled_rss_sources_ingest_job", enqueue_mock)
+
+    scheduled_count = asyncio.run(
+        scheduler_service_module.enqueue_due_sources_ingest_job(db, batch_size=50, lease_seconds=600)
+    )
+
+    assert scheduled_count == 2
+    claim_mock.assert_awaited_once_with(db, limit=50)
+    list_feeds_mock.assert_awaited_once_with(db, feed_ids=[3, 7])
+    lease_mock.assert_awaited_once_with(db, feed_ids=[3, 7], lease_seconds=600)
+    enqueue_mock.assert_awaited_once_with(db, feeds=feeds)
+
+
+def test_enqueue_due_sources_ingest_job_skips_job_and_lease_when_all_feeds_filtered(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    lease_mock = AsyncMock()
+    enqueue_mock = AsyncMock()
+
+    monkeypatch.setattr(scheduler_service_module, "claim_due_rss_feed_ids_async", AsyncMock(return_value=[3]))
+    monkeypatch.setattr(
+        scheduler_service_module,
+        "list_scheduled_rss_sources_ingest_feeds",
+        AsyncMock(return_value=[]),
+    )
+    monkeypatch.setattr(scheduler_service_module, "lease_rss_feed_next_fetch_async", lease_mock)
+    monkeypatch.setattr(scheduler_service_module, "enqueue_scheduled_rss_sources_ingest_job", enqueue_mock)
+
+    scheduled_count = asyncio.run(scheduler_service_module.enqueue_due_sources_ingest_job(db))
+
+    assert scheduled_count == 0
+    lease_mock.assert_not_awaited()
+    enqueue_mock.assert_not_awaited()
+    db.rollback.assert_awaited_once()
+
+
+def test_enqueue_due_sources_ingest_job_skips_when_no_feed_is_due(monkeypatch) -> None:
+    db = AsyncMock(spec=AsyncSession)
+    enqueue_mock = AsyncMock()
+
+    monkeypatch.setattr(scheduler_service_module, "claim_due_rss_feed_ids_async", AsyncMock(return_value=[]))
+    monkeypatch.setattr(scheduler_service_module, "enqueue_scheduled_rss_sources_ingest_job", enqueue_mock)
+
+    scheduled_count = asyncio.run(scheduler_service_module.enqueue_due_sources_ingest_job(db))
+
+    assert scheduled_count == 0
+    enqueue_mock.assert_not_awaited()
+    db.rollback.assert_awaited_once()
+
+
+def test_is_source_ingest_scheduler_enabled_reads_env(monkeypatch) -> None:
+    monkeypatch.delenv("SOURCES_INGEST_SCHEDULER_ENABLED", raising=False)
+    assert scheduler_service_module.is_source_ingest_scheduler_enabled() is False
+
+    monkeypatch.setenv("SOURCES_INGEST_SCHEDULER_ENABLED", "true")
+    assert scheduler_service_module.is_source_ingest_scheduler_enabled() is True
@@ -15,8 +15,10 @@ def test_repartition_rss_source_partitions_commits_and_returns_schema(monkeypatc
         lambda _db: source_partition_db_cli_module.SourcePartitionMaintenanceResult(
             source_default_rows_repartitioned=3,
             source_feed_default_rows_repartitioned=4,
+            source_listing_default_rows_repartitioned=3,
             source_weekly_partitions_created=2,
             source_feed_weekly_partitions_created=2,
+            source_listing_weekly_partitions_created=2,
             weeks_covered=2,
         ),
     )
@@ -28,6 +30,8 @@ def test_repartition_rss_source_partitions_commits_and_returns_schema(monkeypatc
     assert result.source_feed_default_rows_repartitioned == 4
     assert result.source_weekly_partitions_created == 2
     assert result.source_feed_weekly_partitions_created == 2
+    assert result.source_listing_default_rows_repartitioned == 3
+    assert result.source_listing_weekly_partitions_created == 2
     assert result.weeks_covered == 2
     db.commit.assert_called_once()
     db.rollback.assert_not_called()
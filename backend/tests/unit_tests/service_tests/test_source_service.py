@@ -1,5 +1,8 @@
+from datetime import datetime, timezone
 from unittest.mock import Mock
 
+import pytest
+from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 import app.services.sources.source_service as source_service_module
@@ -19,9 +22,10 @@ def test_get_rss_sources_builds_paginated_response(monkeypatch) -> None:
         )
     ]
 
-    def fake_list_rss_sources_read(db, limit, offset, feed_id=None, company_id=None):
+    def fake_list_rss_sources_read(db, limit, offset, feed_id=None, company_id=None, filters=None, total_mode="exact"):
         assert feed_id == 2
         assert company_id is None
+        assert total_mode == "estimated"
         assert limit == 20
         assert offset == 40
         return expected_items, 73
@@ -33,10 +37,12 @@ def test_get_rss_sources_builds_paginated_response(monkeypatch) -> None:
         limit=20,
         offset=40,
         feed_id=2,
+        total_mode="estimated",
     )
 
     assert result.items == expected_items
     assert result.total == 73
+    assert result.total_mode == "estimated"
     assert result.limit == 20
     assert result.offset == 40
 
@@ -60,3 +66,38 @@ def test_get_rss_source_by_id_returns_client_result(monkeypatch) -> None:
     result = source_service_module.get_rss_source_by_id(db, source_id=9)
 
     assert result == expected
+
+
+def test_search_rss_sources_round_trips_keyset_cursor(monkeypatch) -> None:
+    db = Mock(spec=Session)
+    captured_calls: list[dict] = []
+    next_key = (0.25, datetime(2026, 2, 20, 8, 0, tzinfo=timezone.utc), 31)
+
+    def fake_search_rss_sources_read(db, **kwargs):
+        captured_calls.append(kwargs)
+        return [], next_key
+
+    monkeypatch.setattr(source_service_module, "search_rss_sources_read", fake_search_rss_sources_read)
+
+    first_page = source_service_module.search_rss_sources(db, query="climate", limit=10)
+    source_service_module.search_rss_sources(
+        db,
+        query="climate",
+        limit=10,
+        cursor=first_page.next_cursor,
+    )
+
+    assert first_page.next_cursor is not None
+    assert captured_calls[0]["after_rank"] is None
+    assert captured_calls[1]["after_rank"] == 0.25
+    assert captured_calls[1]["after_published_at"] == next_key[1]
+    assert captured_calls[1]["after_source_id"] == 31
+
+
+def test_search_rss_sources_rejects_invalid_cursor() -> None:
+    db = Mock(spec=Session)
+
+    with pytest.raises(HTTPException) as exception_info:
+        source_service_module.search_rss_sources(db, query="climate", limit=10, cursor="not-a-cursor")
+
+    assert exception_info.value.status_code == 400
@@ -0,0 +1,144 @@
+"""add denormalized source listing read model
+
+Revision ID: 0007_source_listing
+Revises: 0006_scrape_jobs_v2
+Create Date: 2026-03-02 10:00:00.000000
+
+"""
+
+from alembic import op
+
+
+revision = "0007_source_listing"
+down_revision = "0006_scrape_jobs_v2"
+branch_labels = None
+depends_on = None
+
+EPOCH_PUBLISHED_AT_SQL = "TIMESTAMPTZ '1970-01-01 00:00:00+00'"
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        CREATE TABLE rss_source_listing (
+            source_id INTEGER NOT NULL,
+            published_at TIMESTAMPTZ NOT NULL DEFAULT {EPOCH_PUBLISHED_AT_SQL},
+            title VARCHAR(500) NOT NULL,
+            summary TEXT,
+            author VARCHAR(255),
+            url VARCHAR(1000) NOT NULL,
+            image_url VARCHAR(1000),
+            feed_ids INTEGER[] NOT NULL DEFAULT '{{}}',
+            company_ids INTEGER[] NOT NULL DEFAULT '{{}}',
+            company_names VARCHAR(50)[] NOT NULL DEFAULT '{{}}',
+            CONSTRAINT rss_source_listing_pkey PRIMARY KEY (source_id, published_at),
+            CONSTRAINT fk_rss_source_listing_source
+                FOREIGN KEY (source_id, published_at)
+                REFERENCES rss_sources (id, published_at)
+                ON DELETE CASCADE
+                ON UPDATE CASCADE
+        ) PARTITION BY RANGE (published_at)
+        """
+    )
+    op.create_index(
+        "idx_rss_source_listing_published_at_source_id",
+        "rss_source_listing",
+        ["published_at", "source_id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_rss_source_listing_feed_ids",
+        "rss_source_listing",
+        ["feed_ids"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "idx_rss_source_listing_company_ids",
+        "rss_source_listing",
+        ["company_ids"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS rss_source_listing_default
+        PARTITION OF rss_source_listing DEFAULT
+        """
+    )
+
+    # Mirror the weekly partitions already created for rss_sources.
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            source_partition RECORD;
+        BEGIN
+            FOR source_partition IN
+                SELECT
+                    child.relname AS partition_name,
+                    pg_get_expr(child.relpartbound, child.oid) AS partition_bound
+                FROM pg_inherits AS inheritance
+                JOIN pg_class AS child
+                    ON child.oid = inheritance.inhrelid
+                WHERE inheritance.inhparent = 'rss_sources'::regclass
+                    AND child.relname LIKE 'rss\\_sources\\_w\\_%'
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF rss_source_listing %s',
+                    replace(source_partition.partition_name, 'rss_sources_w_', 'rss_source_listing_w_'),
+                    source_partition.partition_bound
+                );
+            END LOOP;
+        END
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO rss_source_listing (
+            source_id,
+            published_at,
+            title,
+            summary,
+            author,
+            url,
+            image_url,
+            feed_ids,
+            company_ids,
+            company_names
+        )
+        SELECT
+            source.id,
+            source.published_at,
+            source.title,
+            source.summary,
+            source.author,
+            source.url,
+            source.image_url,
+            array_agg(DISTINCT source_link.feed_id),
+            COALESCE(
+                array_agg(DISTINCT feed.company_id) FILTER (WHERE feed.company_id IS NOT NULL),
+                '{}'
+            ),
+            COALESCE(
+                array_agg(DISTINCT company.name) FILTER (WHERE company.name IS NOT NULL),
+                '{}'
+            )
+        FROM rss_sources AS source
+        JOIN rss_source_feeds AS source_link
+            ON source_link.source_id = source.id
+            AND source_link.published_at = source.published_at
+        JOIN rss_feeds AS feed
+            ON feed.id = source_link.feed_id
+        LEFT JOIN rss_company AS company
+            ON company.id = feed.company_id
+        GROUP BY source.id, source.published_at
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS rss_source_listing CASCADE")
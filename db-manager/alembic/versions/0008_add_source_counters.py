@@ -0,0 +1,91 @@
+"""add feed and company source counters
+
+Revision ID: 0008_source_counters
+Revises: 0007_source_listing
+Create Date: 2026-03-03 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008_source_counters"
+down_revision = "0007_source_listing"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rss_feed_source_counts",
+        sa.Column("feed_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "source_count",
+            sa.BigInteger(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            "source_count >= 0",
+            name="ck_rss_feed_source_counts_source_count",
+        ),
+        sa.ForeignKeyConstraint(["feed_id"], ["rss_feeds.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("feed_id"),
+    )
+    op.create_table(
+        "rss_company_source_counts",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "source_count",
+            sa.BigInteger(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            "source_count >= 0",
+            name="ck_rss_company_source_counts_source_count",
+        ),
+        sa.ForeignKeyConstraint(["company_id"], ["rss_company.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id"),
+    )
+
+    op.execute(
+        """
+        INSERT INTO rss_feed_source_counts (feed_id, source_count)
+        SELECT listing_feed.feed_id, COUNT(*)
+        FROM rss_source_listing AS listing
+        CROSS JOIN LATERAL unnest(listing.feed_ids) AS listing_feed(feed_id)
+        JOIN rss_feeds AS feed
+            ON feed.id = listing_feed.feed_id
+        GROUP BY listing_feed.feed_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO rss_company_source_counts (company_id, source_count)
+        SELECT listing_company.company_id, COUNT(*)
+        FROM rss_source_listing AS listing
+        CROSS JOIN LATERAL unnest(listing.company_ids) AS listing_company(company_id)
+        JOIN rss_company AS company
+            ON company.id = listing_company.company_id
+        GROUP BY listing_company.company_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rss_company_source_counts")
+    op.drop_table("rss_feed_source_counts")
@@ -0,0 +1,103 @@
+"""add full text search over sources
+
+Revision ID: 0009_source_search
+Revises: 0008_source_counters
+Create Date: 2026-03-04 09:00:00.000000
+
+"""
+
+from alembic import op
+
+
+revision = "0009_source_search"
+down_revision = "0008_source_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION rss_search_config(language_code TEXT)
+        RETURNS REGCONFIG
+        LANGUAGE SQL
+        IMMUTABLE
+        PARALLEL SAFE
+        AS $$
+            SELECT CASE lower(trim(language_code))
+                WHEN 'da' THEN 'danish'::regconfig
+                WHEN 'de' THEN 'german'::regconfig
+                WHEN 'en' THEN 'english'::regconfig
+                WHEN 'es' THEN 'spanish'::regconfig
+                WHEN 'fi' THEN 'finnish'::regconfig
+                WHEN 'fr' THEN 'french'::regconfig
+                WHEN 'hu' THEN 'hungarian'::regconfig
+                WHEN 'it' THEN 'italian'::regconfig
+                WHEN 'nl' THEN 'dutch'::regconfig
+                WHEN 'no' THEN 'norwegian'::regconfig
+                WHEN 'pt' THEN 'portuguese'::regconfig
+                WHEN 'ro' THEN 'romanian'::regconfig
+                WHEN 'ru' THEN 'russian'::regconfig
+                WHEN 'sv' THEN 'swedish'::regconfig
+                WHEN 'tr' THEN 'turkish'::regconfig
+                ELSE 'simple'::regconfig
+            END
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE rss_sources
+        ADD COLUMN search_language REGCONFIG NOT NULL DEFAULT 'simple'::regconfig
+        """
+    )
+    op.execute(
+        """
+        UPDATE rss_sources AS source
+        SET search_language = source_language.search_language
+        FROM (
+            SELECT DISTINCT ON (source_link.source_id, source_link.published_at)
+                source_link.source_id,
+                source_link.published_at,
+                rss_search_config(company.language) AS search_language
+            FROM rss_source_feeds AS source_link
+            JOIN rss_feeds AS feed
+                ON feed.id = source_link.feed_id
+            JOIN rss_company AS company
+                ON company.id = feed.company_id
+            WHERE company.language IS NOT NULL
+            ORDER BY source_link.source_id, source_link.published_at, source_link.feed_id
+        ) AS source_language
+        WHERE source.id = source_language.source_id
+            AND source.published_at = source_language.published_at
+            AND source.search_language <> source_language.search_language
+        """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE rss_sources
+        ADD COLUMN search_vector TSVECTOR
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector(search_language, COALESCE(title, '')), 'A')
+            || setweight(to_tsvector(search_language, COALESCE(summary, '')), 'B')
+            || setweight(to_tsvector(search_language, COALESCE(author, '')), 'C')
+        ) STORED
+        """
+    )
+    # Created on the partitioned parent so every current and future partition gets its own GIN index.
+    op.create_index(
+        "idx_rss_sources_search_vector",
+        "rss_sources",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_rss_sources_search_vector", table_name="rss_sources")
+    op.execute("ALTER TABLE rss_sources DROP COLUMN IF EXISTS search_vector")
+    op.execute("ALTER TABLE rss_sources DROP COLUMN IF EXISTS search_language")
+    op.execute("DROP FUNCTION IF EXISTS rss_search_config(TEXT)")
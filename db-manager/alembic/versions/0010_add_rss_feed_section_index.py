@@ -0,0 +1,28 @@
+"""add rss feed section index
+
+Revision ID: 0010_feed_section_index
+Revises: 0009_source_search
+Create Date: 2026-03-05 09:00:00.000000
+
+"""
+
+from alembic import op
+
+
+revision = "0010_feed_section_index"
+down_revision = "0009_source_search"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_rss_feeds_section",
+        "rss_feeds",
+        ["section"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_rss_feeds_section", table_name="rss_feeds")
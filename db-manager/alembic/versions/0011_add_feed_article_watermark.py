@@ -0,0 +1,86 @@
+"""add feed article watermark and count to feeds scraping
+
+Revision ID: 0011_feed_article_watermark
+Revises: 0010_feed_section_index
+Create Date: 2026-03-06 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0011_feed_article_watermark"
+down_revision = "0010_feed_section_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "feeds_scraping",
+        sa.Column("last_article_published_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "feeds_scraping",
+        sa.Column(
+            "article_count",
+            sa.BigInteger(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+    )
+    op.create_check_constraint(
+        "ck_feeds_scraping_article_count",
+        "feeds_scraping",
+        "article_count >= 0",
+    )
+
+    # The per-feed counter now lives on feeds_scraping; keep the values already maintained.
+    # Watermarks are populated by the `backfill-feed-watermarks` db-manager command.
+    op.execute(
+        """
+        INSERT INTO feeds_scraping (feed_id, article_count)
+        SELECT feed_id, source_count
+        FROM rss_feed_source_counts
+        ON CONFLICT (feed_id) DO UPDATE SET
+            article_count = EXCLUDED.article_count
+        """
+    )
+    op.drop_table("rss_feed_source_counts")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "rss_feed_source_counts",
+        sa.Column("feed_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "source_count",
+            sa.BigInteger(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            "source_count >= 0",
+            name="ck_rss_feed_source_counts_source_count",
+        ),
+        sa.ForeignKeyConstraint(["feed_id"], ["rss_feeds.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("feed_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO rss_feed_source_counts (feed_id, source_count)
+        SELECT feed_id, article_count
+        FROM feeds_scraping
+        WHERE article_count > 0
+        """
+    )
+    op.drop_constraint("ck_feeds_scraping_article_count", "feeds_scraping", type_="check")
+    op.drop_column("feeds_scraping", "article_count")
+    op.drop_column("feeds_scraping", "last_article_published_at")
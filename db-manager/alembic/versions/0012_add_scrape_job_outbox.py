@@ -0,0 +1,81 @@
+"""add scrape job outbox
+
+Revision ID: 0012_scrape_job_outbox
+Revises: 0011_feed_article_watermark
+Create Date: 2026-03-07 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0012_scrape_job_outbox"
+down_revision = "0011_feed_article_watermark"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rss_scrape_job_outbox",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False), nullable=False),
+        sa.Column("job_id", sa.String(length=36), nullable=False),
+        sa.Column("stream_name", sa.String(length=100), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("feed_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.String(length=20),
+            server_default=sa.text("'pending'"),
+            nullable=False,
+        ),
+        sa.Column(
+            "attempts",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "available_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.CheckConstraint("feed_count >= 0", name="ck_rss_scrape_job_outbox_feed_count"),
+        sa.CheckConstraint("attempts >= 0", name="ck_rss_scrape_job_outbox_attempts"),
+        sa.CheckConstraint(
+            "status IN ('pending', 'sent', 'failed')",
+            name="ck_rss_scrape_job_outbox_status",
+        ),
+        sa.ForeignKeyConstraint(["job_id"], ["rss_scrape_jobs.job_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_rss_scrape_job_outbox_pending",
+        "rss_scrape_job_outbox",
+        ["available_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "idx_rss_scrape_job_outbox_job_id",
+        "rss_scrape_job_outbox",
+        ["job_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_rss_scrape_job_outbox_job_id", table_name="rss_scrape_job_outbox")
+    op.drop_index("idx_rss_scrape_job_outbox_pending", table_name="rss_scrape_job_outbox")
+    op.drop_table("rss_scrape_job_outbox")
@@ -0,0 +1,54 @@
+"""add adaptive fetch schedule to feeds scraping
+
+Revision ID: 0013_feed_fetch_schedule
+Revises: 0012_scrape_job_outbox
+Create Date: 2026-03-08 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0013_feed_fetch_schedule"
+down_revision = "0012_scrape_job_outbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "feeds_scraping",
+        sa.Column(
+            "fetch_interval_seconds",
+            sa.Integer(),
+            server_default=sa.text("3600"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "feeds_scraping",
+        sa.Column("next_fetch_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_check_constraint(
+        "ck_feeds_scraping_fetch_interval_seconds",
+        "feeds_scraping",
+        "fetch_interval_seconds > 0",
+    )
+    op.create_index(
+        "idx_feeds_scraping_next_fetch_at",
+        "feeds_scraping",
+        ["next_fetch_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_feeds_scraping_next_fetch_at", table_name="feeds_scraping")
+    op.drop_constraint(
+        "ck_feeds_scraping_fetch_interval_seconds",
+        "feeds_scraping",
+        type_="check",
+    )
+    op.drop_column("feeds_scraping", "next_fetch_at")
+    op.drop_column("feeds_scraping", "fetch_interval_seconds")
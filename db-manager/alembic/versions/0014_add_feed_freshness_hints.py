@@ -0,0 +1,49 @@
+"""add feed freshness hints to feeds scraping
+
+Revision ID: 0014_feed_freshness_hints
+Revises: 0013_feed_fetch_schedule
+Create Date: 2026-03-08 14:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0014_feed_freshness_hints"
+down_revision = "0013_feed_fetch_schedule"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "feeds_scraping",
+        sa.Column("ttl_seconds", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "feeds_scraping",
+        sa.Column(
+            "skip_hours",
+            postgresql.ARRAY(sa.SmallInteger()),
+            server_default=sa.text("'{}'"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "feeds_scraping",
+        sa.Column("fresh_until", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_check_constraint(
+        "ck_feeds_scraping_ttl_seconds",
+        "feeds_scraping",
+        "ttl_seconds IS NULL OR ttl_seconds > 0",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_feeds_scraping_ttl_seconds", "feeds_scraping", type_="check")
+    op.drop_column("feeds_scraping", "fresh_until")
+    op.drop_column("feeds_scraping", "skip_hours")
+    op.drop_column("feeds_scraping", "ttl_seconds")
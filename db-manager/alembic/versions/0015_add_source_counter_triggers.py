@@ -0,0 +1,282 @@
+"""maintain source counters with triggers on the listing read model
+
+Revision ID: 0015_source_counter_triggers
+Revises: 0014_feed_freshness_hints
+Create Date: 2026-03-09 09:00:00.000000
+
+"""
+
+from alembic import op
+
+
+revision = "0015_source_counter_triggers"
+down_revision = "0014_feed_freshness_hints"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION adjust_rss_company_source_counts(
+            delta_company_ids INTEGER[],
+            delta_counts BIGINT[]
+        ) RETURNS VOID
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            PERFORM 1
+            FROM rss_company_source_counts
+            WHERE company_id = ANY(delta_company_ids)
+            ORDER BY company_id
+            FOR UPDATE;
+
+            INSERT INTO rss_company_source_counts (company_id, source_count, updated_at)
+            SELECT delta.company_id, delta.source_count, now()
+            FROM unnest(delta_company_ids, delta_counts) AS delta(company_id, source_count)
+            JOIN rss_company AS company
+                ON company.id = delta.company_id
+            WHERE delta.source_count > 0
+            ORDER BY delta.company_id
+            ON CONFLICT (company_id) DO UPDATE SET
+                source_count = rss_company_source_counts.source_count + EXCLUDED.source_count,
+                updated_at = EXCLUDED.updated_at;
+
+            UPDATE rss_company_source_counts AS counts
+            SET
+                source_count = GREATEST(counts.source_count + delta.source_count, 0),
+                updated_at = now()
+            FROM unnest(delta_company_ids, delta_counts) AS delta(company_id, source_count)
+            WHERE delta.source_count < 0
+                AND counts.company_id = delta.company_id;
+        END
+        $$
+        """
+    )
+
+    # Transition tables hold the row versions each statement actually wrote, so
+    # concurrent upserts of the same source are counted once, and cascaded deletes
+    # are counted too.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION count_rss_source_listing_companies() RETURNS TRIGGER
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            delta_company_ids INTEGER[];
+            delta_counts BIGINT[];
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                SELECT array_agg(company_id ORDER BY company_id), array_agg(source_count ORDER BY company_id)
+                INTO delta_company_ids, delta_counts
+                FROM (
+                    SELECT listing_company.company_id, COUNT(*) AS source_count
+                    FROM new_listing
+                    CROSS JOIN LATERAL unnest(new_listing.company_ids) AS listing_company(company_id)
+                    GROUP BY listing_company.company_id
+                ) AS deltas;
+            ELSIF TG_OP = 'DELETE' THEN
+                SELECT array_agg(company_id ORDER BY company_id), array_agg(-source_count ORDER BY company_id)
+                INTO delta_company_ids, delta_counts
+                FROM (
+                    SELECT listing_company.company_id, COUNT(*) AS source_count
+                    FROM old_listing
+                    CROSS JOIN LATERAL unnest(old_listing.company_ids) AS listing_company(company_id)
+                    GROUP BY listing_company.company_id
+                ) AS deltas;
+            ELSE
+                SELECT array_agg(company_id ORDER BY company_id), array_agg(source_count ORDER BY company_id)
+                INTO delta_company_ids, delta_counts
+                FROM (
+                    SELECT listing_company.company_id, SUM(listing_company.delta) AS source_count
+                    FROM (
+                        SELECT refreshed_company.company_id, 1 AS delta
+                        FROM new_listing
+                        CROSS JOIN LATERAL unnest(new_listing.company_ids) AS refreshed_company(company_id)
+                        UNION ALL
+                        SELECT previous_company.company_id, -1 AS delta
+                        FROM old_listing
+                        CROSS JOIN LATERAL unnest(old_listing.company_ids) AS previous_company(company_id)
+                    ) AS listing_company
+                    GROUP BY listing_company.company_id
+                    HAVING SUM(listing_company.delta) <> 0
+                ) AS deltas;
+            END IF;
+
+            IF delta_company_ids IS NOT NULL THEN
+                PERFORM adjust_rss_company_source_counts(delta_company_ids, delta_counts);
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_rss_source_listing_count_insert
+        AFTER INSERT ON rss_source_listing
+        REFERENCING NEW TABLE AS new_listing
+        FOR EACH STATEMENT EXECUTE FUNCTION count_rss_source_listing_companies()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_rss_source_listing_count_update
+        AFTER UPDATE ON rss_source_listing
+        REFERENCING OLD TABLE AS old_listing NEW TABLE AS new_listing
+        FOR EACH STATEMENT EXECUTE FUNCTION count_rss_source_listing_companies()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_rss_source_listing_count_delete
+        AFTER DELETE ON rss_source_listing
+        REFERENCING OLD TABLE AS old_listing
+        FOR EACH STATEMENT EXECUTE FUNCTION count_rss_source_listing_companies()
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uncount_rss_source_feed_links() RETURNS TRIGGER
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            UPDATE feeds_scraping AS scraping
+            SET article_count = GREATEST(scraping.article_count - deleted_links.article_count, 0)
+            FROM (
+                SELECT feed_id, COUNT(*) AS article_count
+                FROM old_links
+                GROUP BY feed_id
+            ) AS deleted_links
+            WHERE scraping.feed_id = deleted_links.feed_id;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_rss_source_feeds_uncount_delete
+        AFTER DELETE ON rss_source_feeds
+        REFERENCING OLD TABLE AS old_links
+        FOR EACH STATEMENT EXECUTE FUNCTION uncount_rss_source_feed_links()
+        """
+    )
+
+    # One refresh implementation shared by db-manager (after ingest) and backend
+    # (after feeds are deleted or moved to another company). Sources left without
+    # any feed link are removed from the listing.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION refresh_rss_source_listing(
+            target_source_ids INTEGER[],
+            target_published_ats TIMESTAMPTZ[]
+        ) RETURNS VOID
+        LANGUAGE sql
+        AS $$
+            WITH target_sources AS (
+                SELECT DISTINCT target.source_id, target.published_at
+                FROM unnest(target_source_ids, target_published_ats) AS target(source_id, published_at)
+            ),
+            unlinked_listing AS (
+                DELETE FROM rss_source_listing AS listing
+                USING target_sources
+                WHERE listing.source_id = target_sources.source_id
+                    AND listing.published_at = target_sources.published_at
+                    AND NOT EXISTS (
+                        SELECT 1
+                        FROM rss_source_feeds AS source_link
+                        WHERE source_link.source_id = listing.source_id
+                            AND source_link.published_at = listing.published_at
+                    )
+            )
+            INSERT INTO rss_source_listing (
+                source_id,
+                published_at,
+                title,
+                summary,
+                author,
+                url,
+                image_url,
+                feed_ids,
+                company_ids,
+                company_names
+            )
+            SELECT
+                source.id,
+                source.published_at,
+                source.title,
+                source.summary,
+                source.author,
+                source.url,
+                source.image_url,
+                array_agg(DISTINCT source_link.feed_id),
+                COALESCE(
+                    array_agg(DISTINCT feed.company_id) FILTER (WHERE feed.company_id IS NOT NULL),
+                    '{}'
+                ),
+                COALESCE(
+                    array_agg(DISTINCT company.name) FILTER (WHERE company.name IS NOT NULL),
+                    '{}'
+                )
+            FROM target_sources
+            JOIN rss_sources AS source
+                ON source.id = target_sources.source_id
+                AND source.published_at = target_sources.published_at
+            JOIN rss_source_feeds AS source_link
+                ON source_link.source_id = source.id
+                AND source_link.published_at = source.published_at
+            JOIN rss_feeds AS feed
+                ON feed.id = source_link.feed_id
+            LEFT JOIN rss_company AS company
+                ON company.id = feed.company_id
+            GROUP BY source.id, source.published_at
+            ORDER BY source.id, source.published_at
+            ON CONFLICT (source_id, published_at) DO UPDATE SET
+                title = EXCLUDED.title,
+                summary = EXCLUDED.summary,
+                author = EXCLUDED.author,
+                url = EXCLUDED.url,
+                image_url = EXCLUDED.image_url,
+                feed_ids = EXCLUDED.feed_ids,
+                company_ids = EXCLUDED.company_ids,
+                company_names = EXCLUDED.company_names
+        $$
+        """
+    )
+
+    # Reconcile counters that drifted while they were maintained by the consumer.
+    op.execute("DELETE FROM rss_company_source_counts")
+    op.execute(
+        """
+        INSERT INTO rss_company_source_counts (company_id, source_count)
+        SELECT listing_company.company_id, COUNT(*)
+        FROM rss_source_listing AS listing
+        CROSS JOIN LATERAL unnest(listing.company_ids) AS listing_company(company_id)
+        JOIN rss_company AS company
+            ON company.id = listing_company.company_id
+        GROUP BY listing_company.company_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE feeds_scraping AS scraping
+        SET article_count = (
+            SELECT COUNT(*)
+            FROM rss_source_feeds AS source_link
+            WHERE source_link.feed_id = scraping.feed_id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS refresh_rss_source_listing(INTEGER[], TIMESTAMPTZ[])")
+    op.execute("DROP TRIGGER IF EXISTS trg_rss_source_feeds_uncount_delete ON rss_source_feeds")
+    op.execute("DROP FUNCTION IF EXISTS uncount_rss_source_feed_links()")
+    op.execute("DROP TRIGGER IF EXISTS trg_rss_source_listing_count_delete ON rss_source_listing")
+    op.execute("DROP TRIGGER IF EXISTS trg_rss_source_listing_count_update ON rss_source_listing")
+    op.execute("DROP TRIGGER IF EXISTS trg_rss_source_listing_count_insert ON rss_source_listing")
+    op.execute("DROP FUNCTION IF EXISTS count_rss_source_listing_companies()")
+    op.execute("DROP FUNCTION IF EXISTS adjust_rss_company_source_counts(INTEGER[], BIGINT[])")
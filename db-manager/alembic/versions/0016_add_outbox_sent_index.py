@@ -0,0 +1,30 @@
+"""index sent outbox rows for retention purge
+
+Revision ID: 0016_outbox_sent_index
+Revises: 0015_source_counter_triggers
+Create Date: 2026-03-09 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0016_outbox_sent_index"
+down_revision = "0015_source_counter_triggers"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_rss_scrape_job_outbox_sent",
+        "rss_scrape_job_outbox",
+        ["sent_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'sent'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_rss_scrape_job_outbox_sent", table_name="rss_scrape_job_outbox")
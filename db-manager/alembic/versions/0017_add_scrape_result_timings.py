@@ -0,0 +1,51 @@
+"""add fetch timings to scrape job results
+
+Revision ID: 0017_scrape_result_timings
+Revises: 0016_outbox_sent_index
+Create Date: 2026-03-10 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0017_scrape_result_timings"
+down_revision = "0016_outbox_sent_index"
+branch_labels = None
+depends_on = None
+
+TIMING_COLUMNS = (
+    "connect_ms",
+    "ttfb_ms",
+    "download_ms",
+    "parse_ms",
+    "total_ms",
+    "response_bytes",
+    "entries_parsed",
+    "entries_kept",
+)
+
+
+def upgrade() -> None:
+    for column_name in TIMING_COLUMNS:
+        op.add_column(
+            "rss_scrape_job_results",
+            sa.Column(column_name, sa.Integer(), nullable=True),
+        )
+    op.create_index(
+        "idx_rss_scrape_job_results_timed_processed_at",
+        "rss_scrape_job_results",
+        ["processed_at"],
+        unique=False,
+        postgresql_where=sa.text("total_ms IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_rss_scrape_job_results_timed_processed_at",
+        table_name="rss_scrape_job_results",
+    )
+    for column_name in reversed(TIMING_COLUMNS):
+        op.drop_column("rss_scrape_job_results", column_name)
@@ -1,17 +1,35 @@
 from .rss_scraping_db_client import (
+    disable_synchronous_commit,
+    get_feed_fetch_interval_seconds,
     insert_job_result_if_new,
+    insert_replay_job_if_missing,
+    list_feeds_for_export,
+    update_feed_fetch_schedule,
+    update_feed_fresh_until,
     upsert_feed_scraping_state,
     refresh_rss_scrape_job_status,
 )
 from .source_ingest_db_client import (
+    backfill_feed_article_watermarks,
+    copy_sources_for_results,
     upsert_sources_for_feed,
+    refresh_source_listing_rows,
 )
 
 __all__ = [
     # RSS scraping
+    "disable_synchronous_commit",
+    "get_feed_fetch_interval_seconds",
     "insert_job_result_if_new",
+    "insert_replay_job_if_missing",
+    "list_feeds_for_export",
+    "update_feed_fetch_schedule",
+    "update_feed_fresh_until",
     "upsert_feed_scraping_state",
     "refresh_rss_scrape_job_status",
     # Source ingestion
+    "backfill_feed_article_watermarks",
+    "copy_sources_for_results",
     "upsert_sources_for_feed",
-]
\ No newline at end of file
+    "refresh_source_listing_rows",
+]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
@@ -23,7 +25,15 @@ def insert_job_result_if_new(
                 error_message,
                 fetchprotection,
                 new_etag,
-                new_last_update
+                new_last_update,
+                connect_ms,
+                ttfb_ms,
+                download_ms,
+                parse_ms,
+                total_ms,
+                response_bytes,
+                entries_parsed,
+                entries_kept
             )
             SELECT
                 :job_id,
@@ -33,7 +43,15 @@ def insert_job_result_if_new(
                 :error_message,
                 :fetchprotection,
                 :new_etag,
-                :new_last_update
+                :new_last_update,
+                :connect_ms,
+                :ttfb_ms,
+                :download_ms,
+                :parse_ms,
+                :total_ms,
+                :response_bytes,
+                :entries_parsed,
+                :entries_kept
             WHERE EXISTS (
                 SELECT 1
                 FROM rss_scrape_jobs
@@ -52,18 +70,68 @@ def insert_job_result_if_new(
             "fetchprotection": payload.fetchprotection,
             "new_etag": payload.new_etag,
             "new_last_update": payload.new_last_update,
+            "connect_ms": payload.connect_ms,
+            "ttfb_ms": payload.ttfb_ms,
+            "download_ms": payload.download_ms,
+            "parse_ms": payload.parse_ms,
+            "total_ms": payload.total_ms,
+            "response_bytes": payload.response_bytes,
+            "entries_parsed": payload.entries_parsed,
+            "entries_kept": payload.entries_kept,
         },
     ).scalar_one_or_none()
     return inserted is not None
 
 
+def insert_replay_job_if_missing(
+    db: Session,
+    *,
+    job_id: str,
+    ingest: bool,
+    requested_at: datetime,
+) -> None:
+    # Jobs created after the restored snapshot are gone; a placeholder lets their
+    # replayed results pass the job existence check of insert_job_result_if_new.
+    db.execute(
+        text(
+            """
+            INSERT INTO rss_scrape_jobs (
+                job_id,
+                ingest,
+                requested_by,
+                requested_at,
+                feed_count,
+                status
+            ) VALUES (
+                :job_id,
+                :ingest,
+                'result_replay',
+                :requested_at,
+                0,
+                'completed'
+            )
+            ON CONFLICT (job_id) DO NOTHING
+            """
+        ),
+        {
+            "job_id": job_id,
+            "ingest": ingest,
+            "requested_at": requested_at,
+        },
+    )
+
+
+def disable_synchronous_commit(db: Session) -> None:
+    db.execute(text("SET LOCAL synchronous_commit TO OFF"))
+
+
 def upsert_feed_scraping_state(
     db: Session,
     *,
     payload: WorkerResultSchema,
-) -> None:
+) -> tuple[int | None, list[int]]:
     is_error = payload.status == "error"
-    db.execute(
+    freshness_row = db.execute(
         text(
             """
             INSERT INTO feeds_scraping (
@@ -72,14 +140,18 @@ def upsert_feed_scraping_state(
                 last_update,
                 etag,
                 error_nbr,
-                error_msg
+                error_msg,
+                ttl_seconds,
+                skip_hours
             ) VALUES (
                 :feed_id,
                 :fetchprotection,
                 :last_update,
                 :etag,
                 :error_nbr,
-                :error_msg
+                :error_msg,
+                :ttl_seconds,
+                CAST(:skip_hours AS SMALLINT[])
             )
             ON CONFLICT (feed_id) DO UPDATE SET
                 fetchprotection = EXCLUDED.fetchprotection,
@@ -92,7 +164,16 @@ def upsert_feed_scraping_state(
                 error_msg = CASE
                     WHEN :is_error THEN :error_msg
                     ELSE NULL
+                END,
+                ttl_seconds = CASE
+                    WHEN :is_parsed THEN EXCLUDED.ttl_seconds
+                    ELSE feeds_scraping.ttl_seconds
+                END,
+                skip_hours = CASE
+                    WHEN :is_parsed THEN EXCLUDED.skip_hours
+                    ELSE feeds_scraping.skip_hours
                 END
+            RETURNING ttl_seconds, skip_hours
             """
         ),
         {
@@ -103,6 +184,77 @@ def upsert_feed_scraping_state(
             "error_nbr": 1 if is_error else 0,
             "error_msg": payload.error_message if is_error else None,
             "is_error": is_error,
+            "is_parsed": payload.status == "success",
+            "ttl_seconds": payload.ttl_seconds,
+            "skip_hours": payload.skip_hours,
+        },
+    ).mappings().first()
+    if freshness_row is None:
+        return None, []
+    return freshness_row["ttl_seconds"], list(freshness_row["skip_hours"] or [])
+
+
+def update_feed_fresh_until(
+    db: Session,
+    *,
+    feed_id: int,
+    fresh_until: datetime | None,
+) -> None:
+    db.execute(
+        text(
+            """
+            UPDATE feeds_scraping
+            SET fresh_until = :fresh_until
+            WHERE feed_id = :feed_id
+            """
+        ),
+        {
+            "feed_id": feed_id,
+            "fresh_until": fresh_until,
+        },
+    )
+
+
+def get_feed_fetch_interval_seconds(
+    db: Session,
+    *,
+    feed_id: int,
+) -> int | None:
+    return db.execute(
+        text(
+            """
+            SELECT fetch_interval_seconds
+            FROM feeds_scraping
+            WHERE feed_id = :feed_id
+            FOR UPDATE
+            """
+        ),
+        {"feed_id": feed_id},
+    ).scalar_one_or_none()
+
+
+def update_feed_fetch_schedule(
+    db: Session,
+    *,
+    feed_id: int,
+    fetch_interval_seconds: int,
+) -> None:
+    db.execute(
+        text(
+            """
+            UPDATE feeds_scraping
+            SET
+                fetch_interval_seconds = :fetch_interval_seconds,
+                next_fetch_at = GREATEST(
+                    now() + make_interval(secs => :fetch_interval_seconds),
+                    fresh_until
+                )
+            WHERE feed_id = :feed_id
+            """
+        ),
+        {
+            "feed_id": feed_id,
+            "fetch_interval_seconds": fetch_interval_seconds,
         },
     )
 
@@ -165,3 +317,43 @@ def refresh_rss_scrape_job_status(
             "status": status,
         },
     )
+
+
+def list_feeds_for_export(
+    db: Session,
+    *,
+    feed_urls: list[str] | None,
+    enabled_only: bool,
+) -> list[dict]:
+    # No etag or last update: an offline ingest wants every body in full.
+    rows = db.execute(
+        text(
+            """
+            SELECT
+                feed.id AS feed_id,
+                feed.url AS feed_url,
+                feed.company_id,
+                company.host AS company_host,
+                COALESCE(scraping.fetchprotection, company.fetchprotection, 1) AS fetchprotection
+            FROM rss_feeds AS feed
+            LEFT JOIN rss_company AS company
+                ON company.id = feed.company_id
+            LEFT JOIN feeds_scraping AS scraping
+                ON scraping.feed_id = feed.id
+            WHERE (
+                NOT :enabled_only
+                OR (feed.enabled AND COALESCE(company.enabled, true))
+            )
+            AND (
+                CAST(:feed_urls AS VARCHAR[]) IS NULL
+                OR feed.url = ANY(CAST(:feed_urls AS VARCHAR[]))
+            )
+            ORDER BY feed.id
+            """
+        ),
+        {
+            "feed_urls": feed_urls,
+            "enabled_only": enabled_only,
+        },
+    ).mappings().all()
+    return [dict(row) for row in rows]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import csv
 from datetime import datetime, timezone
+import io
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -8,16 +10,28 @@ from sqlalchemy.orm import Session
 from app.schemas import WorkerResultSchema
 
 SOURCE_PUBLISHED_AT_FALLBACK = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SOURCE_COPY_STAGING_COLUMNS = (
+    "ordinal",
+    "feed_id",
+    "title",
+    "summary",
+    "author",
+    "url",
+    "published_at",
+    "image_url",
+)
 
 
 def upsert_sources_for_feed(
     db: Session,
     *,
     payload: WorkerResultSchema,
-) -> None:
+) -> tuple[list[tuple[int, datetime]], int]:
     if payload.status != "success":
-        return
+        return [], 0
 
+    linked_source_keys: list[tuple[int, datetime]] = []
+    new_link_count = 0
     for source in payload.sources:
         published_at = _normalize_published_at(source.published_at)
         upserted_source = db.execute(
@@ -29,14 +43,25 @@ def upsert_sources_for_feed(
                     author,
                     url,
                     published_at,
-                    image_url
+                    image_url,
+                    search_language
                 ) VALUES (
                     :title,
                     :summary,
                     :author,
                     :url,
                     :published_at,
-                    :image_url
+                    :image_url,
+                    COALESCE(
+                        (
+                            SELECT rss_search_config(company.language)
+                            FROM rss_feeds AS feed
+                            JOIN rss_company AS company
+                                ON company.id = feed.company_id
+                            WHERE feed.id = :feed_id
+                        ),
+                        'simple'::regconfig
+                    )
                 )
                 ON CONFLICT (url, published_at) DO UPDATE SET
                     title = EXCLUDED.title,
@@ -53,17 +78,19 @@ def upsert_sources_for_feed(
                 "url": source.url,
                 "published_at": published_at,
                 "image_url": source.image_url,
+                "feed_id": payload.feed_id,
             },
         ).mappings().first()
         if upserted_source is None:
             continue
 
-        db.execute(
+        inserted_link = db.execute(
             text(
                 """
                 INSERT INTO rss_source_feeds (source_id, feed_id, published_at)
                 VALUES (:source_id, :feed_id, :published_at)
                 ON CONFLICT (source_id, feed_id, published_at) DO NOTHING
+                RETURNING source_id
                 """
             ),
             {
@@ -71,7 +98,280 @@ def upsert_sources_for_feed(
                 "feed_id": payload.feed_id,
                 "published_at": upserted_source["published_at"],
             },
+        ).scalar_one_or_none()
+        if inserted_link is not None:
+            new_link_count += 1
+        linked_source_keys.append((upserted_source["id"], upserted_source["published_at"]))
+
+    if linked_source_keys:
+        _advance_feed_article_watermark(
+            db,
+            feed_id=payload.feed_id,
+            latest_published_at=max(published_at for _, published_at in linked_source_keys),
+            new_article_count=new_link_count,
+        )
+
+    return linked_source_keys, new_link_count
+
+
+def copy_sources_for_results(
+    db: Session,
+    *,
+    payloads: list[WorkerResultSchema],
+) -> tuple[list[tuple[int, datetime]], int]:
+    # Bulk counterpart of upsert_sources_for_feed: the sources of many results
+    # are streamed with COPY into a staging table, then upserted and linked in
+    # one set-based statement instead of two round-trips per source.
+    rows = [
+        (
+            ordinal,
+            payload.feed_id,
+            source.title,
+            source.summary,
+            source.author,
+            source.url,
+            _normalize_published_at(source.published_at).isoformat(),
+            source.image_url,
+        )
+        for ordinal, (payload, source) in enumerate(
+            (payload, source)
+            for payload in payloads
+            if payload.status == "success"
+            for source in payload.sources
+        )
+    ]
+    if not rows:
+        return [], 0
+
+    db.execute(
+        text(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS rss_source_copy_staging (
+                ordinal INTEGER NOT NULL,
+                feed_id INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                summary TEXT,
+                author TEXT,
+                url TEXT NOT NULL,
+                published_at TIMESTAMPTZ NOT NULL,
+                image_url TEXT
+            ) ON COMMIT DROP
+            """
+        )
+    )
+    db.execute(text("TRUNCATE rss_source_copy_staging"))
+    _copy_rows(db, table_name="rss_source_copy_staging", columns=_SOURCE_COPY_STAGING_COLUMNS, rows=rows)
+
+    # Sources of feeds deleted since the fetch are dropped by the joins on rss_feeds;
+    # a URL seen twice keeps its last fields, as successive upserts would.
+    linked_rows = db.execute(
+        text(
+            """
+            WITH staged AS (
+                SELECT DISTINCT ON (staging.url, staging.published_at)
+                    staging.title,
+                    staging.summary,
+                    staging.author,
+                    staging.url,
+                    staging.published_at,
+                    staging.image_url,
+                    COALESCE(rss_search_config(company.language), 'simple'::regconfig) AS search_language
+                FROM rss_source_copy_staging AS staging
+                JOIN rss_feeds AS feed
+                    ON feed.id = staging.feed_id
+                LEFT JOIN rss_company AS company
+                    ON company.id = feed.company_id
+                ORDER BY staging.url, staging.published_at, staging.ordinal DESC
+            ),
+            upserted AS (
+                INSERT INTO rss_sources (
+                    title,
+                    summary,
+                    author,
+                    url,
+                    published_at,
+                    image_url,
+                    search_language
+                )
+                SELECT title, summary, author, url, published_at, image_url, search_language
+                FROM staged
+                ORDER BY url, published_at
+                ON CONFLICT (url, published_at) DO UPDATE SET
+                    title = EXCLUDED.title,
+                    summary = COALESCE(EXCLUDED.summary, rss_sources.summary),
+                    author = COALESCE(EXCLUDED.author, rss_sources.author),
+                    image_url = COALESCE(EXCLUDED.image_url, rss_sources.image_url)
+                RETURNING id, url, published_at
+            ),
+            feed_links AS (
+                SELECT DISTINCT
+                    upserted.id AS source_id,
+                    staging.feed_id,
+                    upserted.published_at
+                FROM upserted
+                JOIN rss_source_copy_staging AS staging
+                    ON staging.url = upserted.url
+                    AND staging.published_at = upserted.published_at
+                JOIN rss_feeds AS feed
+                    ON feed.id = staging.feed_id
+            ),
+            inserted_links AS (
+                INSERT INTO rss_source_feeds (source_id, feed_id, published_at)
+                SELECT source_id, feed_id, published_at
+                FROM feed_links
+                ORDER BY feed_id, source_id
+                ON CONFLICT (source_id, feed_id, published_at) DO NOTHING
+                RETURNING feed_id
+            ),
+            new_link_counts AS (
+                SELECT feed_id, COUNT(*) AS new_link_count
+                FROM inserted_links
+                GROUP BY feed_id
+            ),
+            advanced_watermarks AS (
+                INSERT INTO feeds_scraping (feed_id, last_article_published_at, article_count)
+                SELECT
+                    feed_links.feed_id,
+                    MAX(feed_links.published_at),
+                    COALESCE(MAX(new_link_counts.new_link_count), 0)
+                FROM feed_links
+                LEFT JOIN new_link_counts
+                    ON new_link_counts.feed_id = feed_links.feed_id
+                GROUP BY feed_links.feed_id
+                ORDER BY feed_links.feed_id
+                ON CONFLICT (feed_id) DO UPDATE SET
+                    last_article_published_at = GREATEST(
+                        feeds_scraping.last_article_published_at,
+                        EXCLUDED.last_article_published_at
+                    ),
+                    article_count = feeds_scraping.article_count + EXCLUDED.article_count
+            )
+            SELECT
+                feed_links.source_id,
+                feed_links.published_at,
+                (SELECT COUNT(*) FROM inserted_links) AS new_link_count
+            FROM feed_links
+            """
+        )
+    ).mappings().all()
+    linked_source_keys = sorted({(row["source_id"], row["published_at"]) for row in linked_rows})
+    new_link_count = linked_rows[0]["new_link_count"] if linked_rows else 0
+    return linked_source_keys, new_link_count
+
+
+def backfill_feed_article_watermarks(
+    db: Session,
+    *,
+    after_feed_id: int,
+    batch_size: int,
+) -> int | None:
+    last_feed_id = db.execute(
+        text(
+            """
+            WITH feed_batch AS (
+                SELECT id AS feed_id
+                FROM rss_feeds
+                WHERE id > :after_feed_id
+                ORDER BY id
+                LIMIT :batch_size
+            ),
+            feed_articles AS (
+                SELECT
+                    feed_batch.feed_id,
+                    MAX(source_link.published_at) AS last_article_published_at,
+                    COUNT(source_link.source_id) AS article_count
+                FROM feed_batch
+                LEFT JOIN rss_source_feeds AS source_link
+                    ON source_link.feed_id = feed_batch.feed_id
+                GROUP BY feed_batch.feed_id
+            ),
+            upserted AS (
+                INSERT INTO feeds_scraping (feed_id, last_article_published_at, article_count)
+                SELECT feed_id, last_article_published_at, article_count
+                FROM feed_articles
+                ORDER BY feed_id
+                ON CONFLICT (feed_id) DO UPDATE SET
+                    last_article_published_at = EXCLUDED.last_article_published_at,
+                    article_count = EXCLUDED.article_count
+            )
+            SELECT MAX(feed_id)
+            FROM feed_batch
+            """
+        ),
+        {
+            "after_feed_id": after_feed_id,
+            "batch_size": batch_size,
+        },
+    ).scalar_one_or_none()
+    return last_feed_id
+
+
+def refresh_source_listing_rows(
+    db: Session,
+    *,
+    source_keys: list[tuple[int, datetime]],
+) -> None:
+    unique_source_keys = sorted(set(source_keys))
+    if not unique_source_keys:
+        return
+
+    # Company counters follow the listing through the rss_source_listing triggers.
+    db.execute(
+        text("SELECT refresh_rss_source_listing(:source_ids, :published_ats)"),
+        {
+            "source_ids": [source_id for source_id, _ in unique_source_keys],
+            "published_ats": [published_at for _, published_at in unique_source_keys],
+        },
+    )
+
+
+def _advance_feed_article_watermark(
+    db: Session,
+    *,
+    feed_id: int,
+    latest_published_at: datetime,
+    new_article_count: int,
+) -> None:
+    db.execute(
+        text(
+            """
+            INSERT INTO feeds_scraping (feed_id, last_article_published_at, article_count)
+            VALUES (:feed_id, :latest_published_at, :new_article_count)
+            ON CONFLICT (feed_id) DO UPDATE SET
+                last_article_published_at = GREATEST(
+                    feeds_scraping.last_article_published_at,
+                    EXCLUDED.last_article_published_at
+                ),
+                article_count = feeds_scraping.article_count + EXCLUDED.article_count
+            """
+        ),
+        {
+            "feed_id": feed_id,
+            "latest_published_at": latest_published_at,
+            "new_article_count": new_article_count,
+        },
+    )
+
+
+def _copy_rows(
+    db: Session,
+    *,
+    table_name: str,
+    columns: tuple[str, ...],
+    rows: list[tuple],
+) -> None:
+    # CSV reads an unquoted empty field as NULL, which is what None is written as.
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
         )
+    finally:
+        cursor.close()
 
 
 def _normalize_published_at(published_at: datetime | None) -> datetime:
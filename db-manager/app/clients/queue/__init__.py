@@ -4,9 +4,20 @@ from .redis_queue_client import (
     DEFAULT_REDIS_QUEUE_ERRORS,
     DEFAULT_REDIS_GROUP_DB_MANAGER,
     DEFAULT_REDIS_CONSUMER_NAME,
+    DEFAULT_REDIS_QUEUE_DEAD_LETTERS,
     ensure_consumer_groups,
     read_worker_results,
+    read_pending_worker_results,
+    claim_idle_worker_results,
+    read_worker_result_delivery_counts,
+    read_worker_result_range,
+    read_consumer_group_backlog,
     ack_worker_result,
+    dead_letter_worker_result,
+    read_dead_letters,
+    replay_dead_letter,
+    delete_dead_letters,
+    close_redis_client,
 )
 
 __all__ = [
@@ -15,7 +26,18 @@ __all__ = [
     "DEFAULT_REDIS_QUEUE_ERRORS",
     "DEFAULT_REDIS_GROUP_DB_MANAGER",
     "DEFAULT_REDIS_CONSUMER_NAME",
+    "DEFAULT_REDIS_QUEUE_DEAD_LETTERS",
     "ensure_consumer_groups",
     "read_worker_results",
+    "read_pending_worker_results",
+    "claim_idle_worker_results",
+    "read_worker_result_delivery_counts",
+    "read_worker_result_range",
+    "read_consumer_group_backlog",
     "ack_worker_result",
+    "dead_letter_worker_result",
+    "read_dead_letters",
+    "replay_dead_letter",
+    "delete_dead_letters",
+    "close_redis_client",
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 import json
 import os
 from typing import Any, Awaitable, Callable, TypeVar
@@ -9,6 +10,7 @@ from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import ResponseError, TimeoutError as RedisTimeoutError
 
 from app.errors import DBManagerQueueError
+from app.utils import db_manager_metrics
 
 DEFAULT_REDIS_URL = "redis://redis:6379/0"
 DEFAULT_REDIS_QUEUE_CHECK = "rss_check_results"
@@ -16,6 +18,8 @@ DEFAULT_REDIS_QUEUE_INGEST = "rss_ingest_results"
 DEFAULT_REDIS_QUEUE_ERRORS = "error_feeds_parsing"
 DEFAULT_REDIS_GROUP_DB_MANAGER = "db_manager_group"
 DEFAULT_REDIS_CONSUMER_NAME = "db_manager_1"
+DEFAULT_REDIS_QUEUE_DEAD_LETTERS = "rss_dead_letters"
+DEAD_LETTER_STREAM_MAXLEN = 100_000
 
 _redis_client: Redis | None = None
 _REDIS_COMMAND_MAX_ATTEMPTS = 2
@@ -85,18 +89,194 @@ async def read_worker_results(
             payload_raw = fields.get(b"payload") or fields.get("payload")
             if payload_raw is None:
                 continue
-            try:
-                payload_json = (
-                    payload_raw.decode("utf-8")
-                    if isinstance(payload_raw, (bytes, bytearray))
-                    else str(payload_raw)
+            payload = await _decode_result_payload(stream_name, message_id, payload_raw)
+            if payload is not None:
+                results.append((stream_name, message_id, payload))
+    return results
+
+
+async def read_pending_worker_results(
+    *,
+    stream_name: str,
+    after_id: str = "0",
+    count: int = 10,
+) -> tuple[str | None, list[tuple[str, str, dict[str, Any]]]]:
+    try:
+        records = await _run_redis_command(
+            command_name="xreadgroup",
+            command=lambda redis_client: redis_client.xreadgroup(
+                DEFAULT_REDIS_GROUP_DB_MANAGER,
+                DEFAULT_REDIS_CONSUMER_NAME,
+                {stream_name: after_id},
+                count=count,
+                block=None,
+            ),
+        )
+    except ResponseError as exception:
+        if "NOGROUP" in str(exception):
+            return None, []
+        raise DBManagerQueueError(f"Unable to read pending worker results: {exception}") from exception
+
+    messages = records[0][1] if records else []
+    if not messages:
+        return None, []
+    return _decode_redis_value(messages[-1][0]), await _decode_pending_messages(stream_name, messages)
+
+
+async def claim_idle_worker_results(
+    *,
+    stream_name: str,
+    min_idle_ms: int,
+    start_id: str = "0-0",
+    count: int = 10,
+) -> tuple[str, list[tuple[str, str, dict[str, Any]]]]:
+    try:
+        response = await _run_redis_command(
+            command_name="xautoclaim",
+            command=lambda redis_client: redis_client.xautoclaim(
+                stream_name,
+                DEFAULT_REDIS_GROUP_DB_MANAGER,
+                DEFAULT_REDIS_CONSUMER_NAME,
+                min_idle_time=min_idle_ms,
+                start_id=start_id,
+                count=count,
+            ),
+        )
+    except ResponseError as exception:
+        if "NOGROUP" in str(exception):
+            return "0-0", []
+        raise DBManagerQueueError(f"Unable to claim idle worker results: {exception}") from exception
+
+    results = await _decode_pending_messages(stream_name, response[1])
+    return _decode_redis_value(response[0]), results
+
+
+async def read_worker_result_delivery_counts(
+    stream_name: str,
+    message_ids: list[str],
+) -> dict[str, int]:
+    if not message_ids:
+        return {}
+
+    async def _read(redis_client: Redis) -> list[Any]:
+        async with redis_client.pipeline(transaction=False) as pipeline:
+            for message_id in message_ids:
+                pipeline.xpending_range(
+                    stream_name,
+                    DEFAULT_REDIS_GROUP_DB_MANAGER,
+                    min=message_id,
+                    max=message_id,
+                    count=1,
                 )
-                payload = json.loads(payload_json)
-            except Exception as exception:
-                raise DBManagerQueueError(f"Invalid result payload: {exception}") from exception
+            return await pipeline.execute()
 
-            results.append((stream_name, message_id, payload))
-    return results
+    try:
+        responses = await _run_redis_command(command_name="xpending", command=_read)
+    except ResponseError as exception:
+        raise DBManagerQueueError(f"Unable to read delivery counts: {exception}") from exception
+
+    delivery_counts: dict[str, int] = {}
+    for pending_entries in responses:
+        for pending_entry in pending_entries or []:
+            delivery_counts[_decode_redis_value(pending_entry["message_id"])] = int(
+                pending_entry["times_delivered"]
+            )
+    return delivery_counts
+
+
+async def dead_letter_worker_result(
+    *,
+    stream_name: str,
+    message_id: str,
+    payload_raw: str,
+    reason: str,
+    delivery_count: int | None = None,
+) -> None:
+    # The dead letter is written and the result acked atomically, so a result is
+    # never lost between the two nor left in the PEL once dead-lettered.
+    fields = {
+        "source_stream": stream_name,
+        "source_group": DEFAULT_REDIS_GROUP_DB_MANAGER,
+        "message_id": message_id,
+        "payload": payload_raw,
+        "reason": reason[:1000],
+        "delivery_count": str(delivery_count or 1),
+        "failed_at": datetime.now(timezone.utc).isoformat(),
+        "service": "db_manager",
+    }
+
+    async def _dead_letter(redis_client: Redis) -> list[Any]:
+        async with redis_client.pipeline(transaction=True) as pipeline:
+            pipeline.xadd(
+                DEFAULT_REDIS_QUEUE_DEAD_LETTERS,
+                fields,
+                maxlen=DEAD_LETTER_STREAM_MAXLEN,
+                approximate=True,
+            )
+            pipeline.xack(stream_name, DEFAULT_REDIS_GROUP_DB_MANAGER, message_id)
+            return await pipeline.execute()
+
+    try:
+        await _run_redis_command(command_name="dead_letter", command=_dead_letter)
+    except ResponseError as exception:
+        raise DBManagerQueueError(f"Unable to dead-letter worker result {message_id}: {exception}") from exception
+    db_manager_metrics.increment("db_manager_dead_letters_total", reason=reason.split(":", 1)[0])
+
+
+async def read_dead_letters(
+    *,
+    start_id: str = "-",
+    end_id: str = "+",
+    count: int = 100,
+) -> list[tuple[str, dict[str, str]]]:
+    try:
+        entries = await _run_redis_command(
+            command_name="xrange",
+            command=lambda redis_client: redis_client.xrange(
+                DEFAULT_REDIS_QUEUE_DEAD_LETTERS,
+                min=start_id,
+                max=end_id,
+                count=count,
+            ),
+        )
+    except ResponseError as exception:
+        raise DBManagerQueueError(f"Unable to read dead letters: {exception}") from exception
+    return [
+        (
+            _decode_redis_value(entry_id),
+            {_decode_redis_value(name): _decode_redis_value(value) for name, value in fields.items()},
+        )
+        for entry_id, fields in entries
+    ]
+
+
+async def replay_dead_letter(*, entry_id: str, target_stream: str, payload_json: str) -> str:
+    # The replayed message and the removal of its dead letter land together, so a
+    # replay interrupted midway never duplicates nor loses the message.
+    async def _replay(redis_client: Redis) -> list[Any]:
+        async with redis_client.pipeline(transaction=True) as pipeline:
+            pipeline.xadd(target_stream, {"payload": payload_json})
+            pipeline.xdel(DEFAULT_REDIS_QUEUE_DEAD_LETTERS, entry_id)
+            return await pipeline.execute()
+
+    try:
+        message_id, _ = await _run_redis_command(command_name="replay_dead_letter", command=_replay)
+    except ResponseError as exception:
+        raise DBManagerQueueError(f"Unable to replay dead letter {entry_id}: {exception}") from exception
+    return _decode_redis_value(message_id)
+
+
+async def delete_dead_letters(entry_ids: list[str]) -> int:
+    if not entry_ids:
+        return 0
+    try:
+        deleted = await _run_redis_command(
+            command_name="xdel",
+            command=lambda redis_client: redis_client.xdel(DEFAULT_REDIS_QUEUE_DEAD_LETTERS, *entry_ids),
+        )
+    except ResponseError as exception:
+        raise DBManagerQueueError(f"Unable to delete dead letters: {exception}") from exception
+    return int(deleted)
 
 
 async def ack_worker_result(stream_name: str, message_id: str) -> None:
@@ -113,6 +293,109 @@ async def ack_worker_result(stream_name: str, message_id: str) -> None:
         raise DBManagerQueueError(f"Unable to ack worker result {message_id}: {exception}") from exception
 
 
+async def read_worker_result_range(
+    stream_name: str,
+    *,
+    start_id: str = "-",
+    end_id: str = "+",
+    count: int = 500,
+) -> list[tuple[str, dict[str, Any] | None]]:
+    # Reads history outside the consumer group, so nothing is claimed or acked.
+    try:
+        entries = await _run_redis_command(
+            command_name="xrange",
+            command=lambda redis_client: redis_client.xrange(
+                stream_name,
+                min=start_id,
+                max=end_id,
+                count=count,
+            ),
+        )
+    except ResponseError as exception:
+        raise DBManagerQueueError(f"Unable to read {stream_name} range: {exception}") from exception
+
+    results: list[tuple[str, dict[str, Any] | None]] = []
+    for message_id_raw, fields in entries:
+        payload_raw = (fields or {}).get(b"payload") or (fields or {}).get("payload")
+        try:
+            payload = json.loads(_decode_redis_value(payload_raw)) if payload_raw is not None else None
+        except ValueError:
+            payload = None
+        results.append((_decode_redis_value(message_id_raw), payload))
+    return results
+
+
+async def read_consumer_group_backlog(stream_name: str) -> tuple[int | None, int] | None:
+    try:
+        groups = await _run_redis_command(
+            command_name="xinfo_groups",
+            command=lambda redis_client: redis_client.xinfo_groups(stream_name),
+        )
+    except ResponseError as exception:
+        if "no such key" in str(exception).lower():
+            return None
+        raise DBManagerQueueError(
+            f"Unable to read consumer group info for stream {stream_name}: {exception}"
+        ) from exception
+
+    for group in groups:
+        if _decode_redis_value(group.get("name")) != DEFAULT_REDIS_GROUP_DB_MANAGER:
+            continue
+        # Redis < 7 does not report lag; callers fall back to the pending count only.
+        lag = group.get("lag")
+        return (int(lag) if lag is not None else None), int(group.get("pending") or 0)
+    return None
+
+
+async def close_redis_client() -> None:
+    if _redis_client is not None:
+        await _reset_redis_client(_redis_client)
+
+
+async def _decode_pending_messages(
+    stream_name: str,
+    messages: list[tuple[Any, Any]],
+) -> list[tuple[str, str, dict[str, Any]]]:
+    # Pending entries whose message was trimmed from the stream come back without
+    # fields; they can never be persisted, so they are acked right away.
+    results: list[tuple[str, str, dict[str, Any]]] = []
+    for message_id_raw, fields in messages:
+        message_id = _decode_redis_value(message_id_raw)
+        fields = fields or {}
+        payload_raw = fields.get(b"payload") or fields.get("payload")
+        if payload_raw is None:
+            await ack_worker_result(stream_name, message_id)
+            continue
+        payload = await _decode_result_payload(stream_name, message_id, payload_raw)
+        if payload is not None:
+            results.append((stream_name, message_id, payload))
+    return results
+
+
+async def _decode_result_payload(
+    stream_name: str,
+    message_id: str,
+    payload_raw: Any,
+) -> dict[str, Any] | None:
+    payload_json = _decode_redis_value(payload_raw)
+    try:
+        return json.loads(payload_json)
+    except ValueError as exception:
+        await dead_letter_worker_result(
+            stream_name=stream_name,
+            message_id=message_id,
+            payload_raw=payload_json,
+            reason=f"invalid_json: {exception}",
+        )
+        return None
+
+
+def _decode_redis_value(value: Any) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8")
+    return str(value)
+
+
 def _get_redis_client() -> Redis:
     global _redis_client
     if _redis_client is None:
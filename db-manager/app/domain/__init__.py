@@ -1,9 +1,33 @@
 from .result_mapping_domain import resolve_queue_kind
 from .idempotency_domain import build_idempotency_key
+from .dead_letter_domain import (
+    apply_payload_overrides,
+    matches_dead_letter_filters,
+    parse_payload_override,
+)
+from .result_replay_domain import parse_stream_message_id, resolve_stream_message_time
+from .feed_export_domain import normalize_company_host, parse_opml_feed_urls
+from .fetch_schedule_domain import (
+    resolve_feed_fresh_until,
+    resolve_next_fetch_interval_seconds,
+)
 
 __all__ = [
     # RSS
     "resolve_queue_kind",
     # Idempotency
     "build_idempotency_key",
-]
\ No newline at end of file
+    # Fetch schedule
+    "resolve_feed_fresh_until",
+    "resolve_next_fetch_interval_seconds",
+    # Result replay
+    "parse_stream_message_id",
+    "resolve_stream_message_time",
+    # Dead letters
+    "apply_payload_overrides",
+    "matches_dead_letter_filters",
+    "parse_payload_override",
+    # Feed export
+    "normalize_company_host",
+    "parse_opml_feed_urls",
+]
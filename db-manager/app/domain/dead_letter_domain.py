@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import copy
+import json
+from typing import Any
+
+
+def parse_payload_override(raw_override: str) -> tuple[list[str], Any]:
+    path, separator, raw_value = raw_override.partition("=")
+    if not separator or not path.strip():
+        raise ValueError(f"Override must look like path=json_value: {raw_override!r}")
+    try:
+        value = json.loads(raw_value)
+    except ValueError as exception:
+        raise ValueError(f"Override value for {path!r} is not valid JSON: {exception}") from exception
+    return path.strip().split("."), value
+
+
+def apply_payload_overrides(
+    payload: Any,
+    overrides: list[tuple[list[str], Any]],
+) -> Any:
+    updated_payload = copy.deepcopy(payload)
+    for path, value in overrides:
+        container = updated_payload
+        for segment in path[:-1]:
+            container = _resolve_child(container, segment, path=path)
+        _assign_child(container, path[-1], value, path=path)
+    return updated_payload
+
+
+def matches_dead_letter_filters(
+    *,
+    source_stream: str,
+    reason: str,
+    stream_name: str | None,
+    reason_contains: str | None,
+) -> bool:
+    if stream_name is not None and source_stream != stream_name:
+        return False
+    if reason_contains is not None and reason_contains.lower() not in reason.lower():
+        return False
+    return True
+
+
+def _resolve_child(container: Any, segment: str, *, path: list[str]) -> Any:
+    if isinstance(container, list):
+        return container[_resolve_list_index(container, segment, path=path)]
+    if isinstance(container, dict):
+        # Missing intermediate objects are created so a fixup can add nested fields.
+        return container.setdefault(segment, {})
+    raise ValueError(f"Cannot descend into {'.'.join(path)!r} at {segment!r}")
+
+
+def _assign_child(container: Any, segment: str, value: Any, *, path: list[str]) -> None:
+    if isinstance(container, list):
+        container[_resolve_list_index(container, segment, path=path)] = value
+        return
+    if isinstance(container, dict):
+        container[segment] = value
+        return
+    raise ValueError(f"Cannot assign {'.'.join(path)!r} at {segment!r}")
+
+
+def _resolve_list_index(container: list[Any], segment: str, *, path: list[str]) -> int:
+    try:
+        index = int(segment)
+    except ValueError as exception:
+        raise ValueError(f"Expected a list index in {'.'.join(path)!r}, got {segment!r}") from exception
+    if not -len(container) <= index < len(container):
+        raise ValueError(f"List index {index} out of range in {'.'.join(path)!r}")
+    return index
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from urllib.parse import urlsplit
+from xml.etree import ElementTree
+
+
+def parse_opml_feed_urls(content: bytes) -> list[str]:
+    try:
+        root = ElementTree.fromstring(content)
+    except ElementTree.ParseError as exception:
+        raise ValueError(f"Invalid OPML: {exception}") from exception
+
+    feed_urls: list[str] = []
+    seen_urls: set[str] = set()
+    for outline in root.iter("outline"):
+        feed_url = (outline.get("xmlUrl") or "").strip()
+        if feed_url and feed_url not in seen_urls:
+            seen_urls.add(feed_url)
+            feed_urls.append(feed_url)
+    return feed_urls
+
+
+def normalize_company_host(host: str | None) -> str | None:
+    # Same reading as the backend when it builds scrape jobs: a bare host or a URL.
+    if host is None or not host.strip():
+        return None
+    cleaned_host = host.strip()
+    hostname = urlsplit(cleaned_host if "://" in cleaned_host else f"//{cleaned_host}").hostname
+    return hostname or None
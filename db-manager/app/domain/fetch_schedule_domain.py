@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+
+def resolve_next_fetch_interval_seconds(
+    current_interval_seconds: int,
+    *,
+    status: str,
+    new_article_count: int,
+    min_interval_seconds: int,
+    max_interval_seconds: int,
+) -> int:
+    if status == "error":
+        next_interval_seconds = current_interval_seconds * 2
+    elif status == "not_modified" or new_article_count <= 0:
+        next_interval_seconds = current_interval_seconds * 3 // 2
+    elif new_article_count == 1:
+        next_interval_seconds = current_interval_seconds
+    else:
+        # Aim for about one new article per fetch, but never shrink by more than half at once.
+        next_interval_seconds = max(
+            current_interval_seconds // new_article_count,
+            current_interval_seconds // 2,
+        )
+    return min(max(next_interval_seconds, min_interval_seconds), max_interval_seconds)
+
+
+def resolve_feed_fresh_until(
+    *,
+    fetched_at: datetime,
+    ttl_seconds: int | None,
+    skip_hours: list[int],
+    cache_expires_at: datetime | None,
+    max_fresh_seconds: int,
+) -> datetime | None:
+    fresh_until = fetched_at
+    if ttl_seconds is not None and ttl_seconds > 0:
+        fresh_until = max(fresh_until, fetched_at + timedelta(seconds=ttl_seconds))
+    if cache_expires_at is not None:
+        fresh_until = max(fresh_until, cache_expires_at)
+    fresh_until = min(fresh_until, fetched_at + timedelta(seconds=max_fresh_seconds))
+
+    skipped_hours = {hour for hour in skip_hours if 0 <= hour <= 23}
+    if len(skipped_hours) < 24:
+        fresh_until = fresh_until.astimezone(timezone.utc)
+        while fresh_until.hour in skipped_hours:
+            fresh_until = fresh_until.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+
+    if fresh_until <= fetched_at:
+        return None
+    return fresh_until
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+
+def parse_stream_message_id(message_id: str) -> tuple[int, int]:
+    milliseconds, _, sequence = message_id.partition("-")
+    try:
+        return int(milliseconds), int(sequence or 0)
+    except ValueError as exception:
+        raise ValueError(f"Invalid stream message id: {message_id!r}") from exception
+
+
+def resolve_stream_message_time(message_id: str) -> datetime:
+    # Results are published right after the fetch, so the id time stands in for it.
+    milliseconds, _ = parse_stream_message_id(message_id)
+    return datetime.fromtimestamp(milliseconds / 1000, tz=timezone.utc)
@@ -1,5 +1,6 @@
 from .worker_result_schema import WorkerResultSchema, WorkerSourceSchema
 from .worker_error_schema import WorkerErrorSchema
+from .dead_letter_schema import DeadLetterSchema
 
 __all__ = [
     # Worker results
@@ -7,4 +8,6 @@ __all__ = [
     "WorkerSourceSchema",
     # Worker errors
     "WorkerErrorSchema",
+    # Dead letters
+    "DeadLetterSchema",
 ]
\ No newline at end of file
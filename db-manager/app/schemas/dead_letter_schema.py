@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from pydantic import BaseModel, field_validator
+
+
+class DeadLetterSchema(BaseModel):
+    entry_id: str
+    source_stream: str
+    source_group: str | None = None
+    message_id: str | None = None
+    payload: str
+    reason: str = ""
+    delivery_count: int = 1
+    failed_at: str | None = None
+    service: str | None = None
+
+    @field_validator("payload", mode="before")
+    @classmethod
+    def _serialize_payload(cls, value: Any) -> Any:
+        # Exported dead letters carry the payload as JSON so it can be edited in place.
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return value
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+
+from app.clients.queue import (
+    DEFAULT_REDIS_QUEUE_CHECK,
+    DEFAULT_REDIS_QUEUE_ERRORS,
+    DEFAULT_REDIS_QUEUE_INGEST,
+    read_consumer_group_backlog,
+)
+from app.errors import DBManagerQueueError
+from app.utils import db_manager_metrics, resolve_positive_int_env
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_MANAGER_METRICS_PORT = 9200
+DEFAULT_CONSUMER_LAG_INTERVAL_SECONDS = 15.0
+_REQUEST_TIMEOUT_SECONDS = 5.0
+
+
+def resolve_db_manager_metrics_port() -> int:
+    return resolve_positive_int_env("DB_MANAGER_METRICS_PORT", DEFAULT_DB_MANAGER_METRICS_PORT)
+
+
+async def start_db_manager_metrics_server(*, port: int) -> asyncio.AbstractServer | None:
+    try:
+        server = await asyncio.start_server(_handle_metrics_request, host="0.0.0.0", port=port)
+    except OSError as exception:
+        logger.warning("db_manager metrics endpoint unavailable on port %s: %s", port, exception)
+        return None
+    logger.info("db_manager metrics exposed on :%s/metrics", port)
+    return server
+
+
+async def monitor_consumer_lag(
+    *,
+    interval_seconds: float = DEFAULT_CONSUMER_LAG_INTERVAL_SECONDS,
+) -> None:
+    while True:
+        await record_consumer_lag()
+        await asyncio.sleep(interval_seconds)
+
+
+async def record_consumer_lag() -> None:
+    for stream_name in (
+        DEFAULT_REDIS_QUEUE_CHECK,
+        DEFAULT_REDIS_QUEUE_INGEST,
+        DEFAULT_REDIS_QUEUE_ERRORS,
+    ):
+        try:
+            backlog = await read_consumer_group_backlog(stream_name)
+        except DBManagerQueueError as exception:
+            logger.debug("Unable to read consumer lag for %s: %s", stream_name, exception)
+            continue
+        if backlog is None:
+            continue
+        lag, pending = backlog
+        if lag is not None:
+            db_manager_metrics.set_gauge("db_manager_consumer_lag", lag, stream=stream_name)
+        db_manager_metrics.set_gauge("db_manager_consumer_pending", pending, stream=stream_name)
+
+
+async def _handle_metrics_request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=_REQUEST_TIMEOUT_SECONDS)
+        while (await asyncio.wait_for(reader.readline(), timeout=_REQUEST_TIMEOUT_SECONDS)).strip():
+            continue
+
+        method, _, target = request_line.decode("latin-1").partition(" ")
+        path = target.split(" ", 1)[0].split("?", 1)[0]
+        if method == "GET" and path == "/metrics":
+            status_line = "200 OK"
+            body = db_manager_metrics.render().encode("utf-8")
+        else:
+            status_line = "404 Not Found"
+            body = b"not found\n"
+
+        writer.write(
+            (
+                f"HTTP/1.1 {status_line}\r\n"
+                "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("latin-1")
+            + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        return
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from app.clients.queue import (
+    delete_dead_letters,
+    read_dead_letters,
+    replay_dead_letter,
+)
+from app.domain import apply_payload_overrides, matches_dead_letter_filters
+from app.errors import DBManagerError
+from app.schemas import DeadLetterSchema
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEAD_LETTER_LIST_LIMIT = 100
+_DEAD_LETTER_PAGE_SIZE = 500
+
+
+async def list_dead_letters(
+    *,
+    entry_ids: list[str] | None = None,
+    stream_name: str | None = None,
+    reason_contains: str | None = None,
+    limit: int = DEFAULT_DEAD_LETTER_LIST_LIMIT,
+) -> list[DeadLetterSchema]:
+    if limit <= 0:
+        raise DBManagerError("limit must be greater than zero")
+
+    if entry_ids:
+        entries = []
+        for entry_id in entry_ids:
+            entries += await read_dead_letters(start_id=entry_id, end_id=entry_id, count=1)
+        return _select_dead_letters(
+            entries,
+            stream_name=stream_name,
+            reason_contains=reason_contains,
+        )[:limit]
+
+    dead_letters: list[DeadLetterSchema] = []
+    start_id = "-"
+    while len(dead_letters) < limit:
+        entries = await read_dead_letters(start_id=start_id, count=_DEAD_LETTER_PAGE_SIZE)
+        dead_letters += _select_dead_letters(
+            entries,
+            stream_name=stream_name,
+            reason_contains=reason_contains,
+        )
+        if len(entries) < _DEAD_LETTER_PAGE_SIZE:
+            break
+        start_id = f"({entries[-1][0]}"
+    return dead_letters[:limit]
+
+
+def load_dead_letters_file(path: Path) -> list[DeadLetterSchema]:
+    dead_letters: list[DeadLetterSchema] = []
+    with path.open(encoding="utf-8") as dead_letters_file:
+        for line_number, line in enumerate(dead_letters_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                dead_letters.append(DeadLetterSchema.model_validate_json(line))
+            except ValueError as exception:
+                raise DBManagerError(f"Invalid dead letter on line {line_number} of {path}: {exception}") from exception
+    return dead_letters
+
+
+async def drop_missing_dead_letters(dead_letters: list[DeadLetterSchema]) -> list[DeadLetterSchema]:
+    # An exported file can be replayed twice; entries already replayed or purged are skipped.
+    if not dead_letters:
+        return []
+    existing_ids = {
+        dead_letter.entry_id
+        for dead_letter in await list_dead_letters(
+            entry_ids=[dead_letter.entry_id for dead_letter in dead_letters],
+            limit=len(dead_letters),
+        )
+    }
+    return [dead_letter for dead_letter in dead_letters if dead_letter.entry_id in existing_ids]
+
+
+def export_dead_letter(dead_letter: DeadLetterSchema) -> dict[str, Any]:
+    exported = dead_letter.model_dump()
+    try:
+        exported["payload"] = json.loads(dead_letter.payload)
+    except ValueError:
+        # Invalid JSON stays a string so it can be fixed by hand before a replay.
+        pass
+    return exported
+
+
+async def replay_dead_letters(
+    dead_letters: list[DeadLetterSchema],
+    *,
+    overrides: list[tuple[list[str], Any]] | None = None,
+    dry_run: bool = False,
+) -> list[tuple[DeadLetterSchema, str, str | None]]:
+    # Payloads are all rebuilt before anything is published, so a bad fixup aborts
+    # the replay without leaving it half done.
+    replay_plan = [
+        (dead_letter, _build_replay_payload(dead_letter, overrides or []))
+        for dead_letter in dead_letters
+    ]
+    replayed: list[tuple[DeadLetterSchema, str, str | None]] = []
+    for dead_letter, payload_json in replay_plan:
+        if dry_run:
+            replayed.append((dead_letter, payload_json, None))
+            continue
+        message_id = await replay_dead_letter(
+            entry_id=dead_letter.entry_id,
+            target_stream=dead_letter.source_stream,
+            payload_json=payload_json,
+        )
+        logger.info(
+            "Replayed dead letter %s to %s as %s",
+            dead_letter.entry_id,
+            dead_letter.source_stream,
+            message_id,
+        )
+        replayed.append((dead_letter, payload_json, message_id))
+    return replayed
+
+
+async def purge_dead_letters(dead_letters: list[DeadLetterSchema]) -> int:
+    return await delete_dead_letters([dead_letter.entry_id for dead_letter in dead_letters])
+
+
+def _select_dead_letters(
+    entries: list[tuple[str, dict[str, str]]],
+    *,
+    stream_name: str | None,
+    reason_contains: str | None,
+) -> list[DeadLetterSchema]:
+    dead_letters = [DeadLetterSchema(entry_id=entry_id, **fields) for entry_id, fields in entries]
+    return [
+        dead_letter
+        for dead_letter in dead_letters
+        if matches_dead_letter_filters(
+            source_stream=dead_letter.source_stream,
+            reason=dead_letter.reason,
+            stream_name=stream_name,
+            reason_contains=reason_contains,
+        )
+    ]
+
+
+def _build_replay_payload(
+    dead_letter: DeadLetterSchema,
+    overrides: list[tuple[list[str], Any]],
+) -> str:
+    if not overrides:
+        return dead_letter.payload
+    try:
+        payload = json.loads(dead_letter.payload)
+        return json.dumps(apply_payload_overrides(payload, overrides))
+    except ValueError as exception:
+        raise DBManagerError(f"Cannot fix up dead letter {dead_letter.entry_id}: {exception}") from exception
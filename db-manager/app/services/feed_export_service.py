@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+from app.clients.database import list_feeds_for_export
+from app.database import get_db_session
+from app.domain import normalize_company_host, parse_opml_feed_urls
+from app.errors import DBManagerError
+
+logger = logging.getLogger(__name__)
+
+
+def export_feeds(
+    *,
+    opml_path: Path | None = None,
+    enabled_only: bool = True,
+) -> tuple[list[dict[str, Any]], list[str]]:
+    feed_urls = None
+    if opml_path is not None:
+        try:
+            feed_urls = parse_opml_feed_urls(opml_path.read_bytes())
+        except ValueError as exception:
+            raise DBManagerError(f"Cannot read {opml_path}: {exception}") from exception
+        if not feed_urls:
+            return [], []
+
+    db = get_db_session()
+    try:
+        rows = list_feeds_for_export(db, feed_urls=feed_urls, enabled_only=enabled_only)
+    finally:
+        db.close()
+
+    # The worker reads these lines as scrape job feeds.
+    feeds = [
+        {
+            "feed_id": row["feed_id"],
+            "feed_url": row["feed_url"],
+            "company_id": row["company_id"],
+            "host_header": normalize_company_host(row["company_host"]),
+            "fetchprotection": row["fetchprotection"],
+        }
+        for row in rows
+    ]
+    exported_urls = {feed["feed_url"] for feed in feeds}
+    unmatched_urls = [feed_url for feed_url in feed_urls or [] if feed_url not in exported_urls]
+    return feeds, unmatched_urls
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import logging
+
+from app.clients.database import backfill_feed_article_watermarks
+from app.database import get_db_session
+from app.errors import DBManagerError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEED_WATERMARK_BACKFILL_BATCH_SIZE = 500
+
+
+def run_feed_watermark_backfill(
+    *,
+    batch_size: int = DEFAULT_FEED_WATERMARK_BACKFILL_BATCH_SIZE,
+) -> int:
+    if batch_size <= 0:
+        raise DBManagerError("batch_size must be greater than zero")
+
+    backfilled_batches = 0
+    after_feed_id = 0
+    while True:
+        db = get_db_session()
+        try:
+            last_feed_id = backfill_feed_article_watermarks(
+                db,
+                after_feed_id=after_feed_id,
+                batch_size=batch_size,
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        if last_feed_id is None:
+            break
+        backfilled_batches += 1
+        after_feed_id = last_feed_id
+        logger.info("Backfilled feed article watermarks up to feed %s", last_feed_id)
+
+    return backfilled_batches
@@ -1,48 +1,247 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
 import logging
+import signal
+import time
 
 from app.clients.queue.redis_queue_client import (
     ack_worker_result,
+    claim_idle_worker_results,
+    close_redis_client,
+    dead_letter_worker_result,
     DEFAULT_REDIS_QUEUE_CHECK,
     DEFAULT_REDIS_QUEUE_INGEST,
     DEFAULT_REDIS_QUEUE_ERRORS,
     ensure_consumer_groups,
+    read_pending_worker_results,
+    read_worker_result_delivery_counts,
     read_worker_results,
 )
-from app.database import get_db_session
+from sqlalchemy.exc import DBAPIError
+
+from app.database import engine, get_db_session
 from app.domain import resolve_queue_kind
 from app.schemas import WorkerResultSchema
 from app.errors import DBManagerQueueError
+from app.utils import db_manager_metrics, resolve_positive_float_env, resolve_positive_int_env
+from .db_manager_metrics_service import (
+    monitor_consumer_lag,
+    resolve_db_manager_metrics_port,
+    start_db_manager_metrics_server,
+)
 from .result_persistence_service import persist_worker_result
+from .statement_profiling_service import (
+    DEFAULT_STATEMENT_REPORT_INTERVAL_SECONDS,
+    install_default_statement_profiling,
+    log_statement_report,
+    report_statement_profile,
+    statement_profile,
+)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 20.0
+DEFAULT_TRANSACTION_MAX_ATTEMPTS = 3
+DEFAULT_MAX_DELIVERIES = 5
+DEFAULT_PENDING_RETRY_IDLE_MS = 60_000
+DEFAULT_PENDING_RETRY_INTERVAL_SECONDS = 30.0
+_TRANSACTION_RETRY_DELAY_SECONDS = 0.05
+# serialization_failure and deadlock_detected
+_RETRYABLE_SQLSTATES = frozenset({"40001", "40P01"})
+# Last persist failure per pending (stream, message id), reported when the result
+# is finally dead-lettered.
+_failure_reasons: dict[tuple[str, str], str] = {}
 
-async def run_result_consumer() -> None:
+
+async def run_result_consumer(*, stop_event: asyncio.Event | None = None) -> None:
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    if stop_event is None:
+        stop_event = _create_stop_event()
+    drain_timeout_seconds = resolve_positive_float_env(
+        "DB_MANAGER_DRAIN_TIMEOUT_SECONDS",
+        DEFAULT_DRAIN_TIMEOUT_SECONDS,
+    )
+    install_default_statement_profiling(engine)
+    metrics_server = await start_db_manager_metrics_server(port=resolve_db_manager_metrics_port())
+    background_tasks = [
+        asyncio.create_task(monitor_consumer_lag()),
+        asyncio.create_task(
+            report_statement_profile(
+                statement_profile,
+                interval_seconds=resolve_positive_float_env(
+                    "DB_MANAGER_STATEMENT_REPORT_INTERVAL_SECONDS",
+                    DEFAULT_STATEMENT_REPORT_INTERVAL_SECONDS,
+                ),
+            )
+        ),
+    ]
+    max_deliveries = resolve_positive_int_env("DB_MANAGER_MAX_DELIVERIES", DEFAULT_MAX_DELIVERIES)
+    pending_retry_idle_ms = resolve_positive_int_env(
+        "DB_MANAGER_PENDING_RETRY_IDLE_MS",
+        DEFAULT_PENDING_RETRY_IDLE_MS,
+    )
+    pending_retry_interval_seconds = resolve_positive_float_env(
+        "DB_MANAGER_PENDING_RETRY_INTERVAL_SECONDS",
+        DEFAULT_PENDING_RETRY_INTERVAL_SECONDS,
+    )
     await ensure_consumer_groups()
     logger.info("db_manager started")
+    result_streams = (
+        DEFAULT_REDIS_QUEUE_CHECK,
+        DEFAULT_REDIS_QUEUE_INGEST,
+        DEFAULT_REDIS_QUEUE_ERRORS,
+    )
+    # Results read by a previous run but never acked are persisted first. Results
+    # whose persist failed stay pending and are reclaimed periodically, until
+    # they exceed DB_MANAGER_MAX_DELIVERIES and are dead-lettered.
+    pending_after_ids = {stream_name: "0" for stream_name in result_streams}
+    claim_start_ids: dict[str, str] = {}
+    next_pending_retry_at = time.monotonic() + pending_retry_interval_seconds
 
-    while True:
-        try:
-            messages = await read_worker_results(count=10, block_ms=5000)
-            if not messages:
-                continue
-
-            for stream_name, message_id, payload_raw in messages:
-                await _process_result_message(
-                    stream_name=stream_name,
-                    message_id=message_id,
-                    payload_raw=payload_raw,
+    try:
+        while not stop_event.is_set():
+            try:
+                if pending_after_ids:
+                    stream_name, after_id = next(iter(pending_after_ids.items()))
+                    last_message_id, messages = await read_pending_worker_results(
+                        stream_name=stream_name,
+                        after_id=after_id,
+                        count=10,
+                    )
+                    if last_message_id is None:
+                        del pending_after_ids[stream_name]
+                        continue
+                    pending_after_ids[stream_name] = last_message_id
+                    messages = await _dead_letter_exhausted_results(
+                        stream_name,
+                        messages,
+                        max_deliveries=max_deliveries,
+                    )
+                elif claim_start_ids:
+                    stream_name, start_id = next(iter(claim_start_ids.items()))
+                    next_start_id, messages = await claim_idle_worker_results(
+                        stream_name=stream_name,
+                        min_idle_ms=pending_retry_idle_ms,
+                        start_id=start_id,
+                        count=10,
+                    )
+                    if next_start_id == "0-0":
+                        del claim_start_ids[stream_name]
+                    else:
+                        claim_start_ids[stream_name] = next_start_id
+                    messages = await _dead_letter_exhausted_results(
+                        stream_name,
+                        messages,
+                        max_deliveries=max_deliveries,
+                    )
+                    if messages:
+                        logger.info("Retrying %s pending worker results from %s", len(messages), stream_name)
+                elif time.monotonic() >= next_pending_retry_at:
+                    claim_start_ids = {stream_name: "0-0" for stream_name in result_streams}
+                    next_pending_retry_at = time.monotonic() + pending_retry_interval_seconds
+                    continue
+                else:
+                    messages = await read_worker_results(count=10, block_ms=5000)
+                if not messages:
+                    continue
+
+                await _process_result_batch(
+                    messages,
+                    stop_event=stop_event,
+                    drain_timeout_seconds=drain_timeout_seconds,
                 )
-        except DBManagerQueueError as exception:
-            logger.warning("db_manager queue unavailable: %s", exception)
-            await asyncio.sleep(1.0)
-        except Exception as exception:
-            logger.exception("db_manager loop error: %s", exception)
-            await asyncio.sleep(1.0)
+            except DBManagerQueueError as exception:
+                logger.warning("db_manager queue unavailable: %s", exception)
+                await asyncio.sleep(1.0)
+            except Exception as exception:
+                logger.exception("db_manager loop error: %s", exception)
+                await asyncio.sleep(1.0)
+    finally:
+        for task in background_tasks:
+            task.cancel()
+        for task in background_tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if metrics_server is not None:
+            metrics_server.close()
+            await metrics_server.wait_closed()
+        log_statement_report(statement_profile)
+        await close_redis_client()
+        engine.dispose()
+
+    logger.info("db_manager stopped")
+
+
+async def _process_result_batch(
+    messages: list[tuple[str, str, dict]],
+    *,
+    stop_event: asyncio.Event,
+    drain_timeout_seconds: float,
+) -> None:
+    drain_deadline: float | None = None
+    for index, (stream_name, message_id, payload_raw) in enumerate(messages):
+        if stop_event.is_set():
+            if drain_deadline is None:
+                drain_deadline = time.monotonic() + drain_timeout_seconds
+            elif time.monotonic() >= drain_deadline:
+                logger.warning(
+                    "Drain timeout reached, %s worker results stay pending for the next start",
+                    len(messages) - index,
+                )
+                return
+        await _process_result_message(
+            stream_name=stream_name,
+            message_id=message_id,
+            payload_raw=payload_raw,
+        )
+
+
+async def _dead_letter_exhausted_results(
+    stream_name: str,
+    messages: list[tuple[str, str, dict]],
+    *,
+    max_deliveries: int,
+) -> list[tuple[str, str, dict]]:
+    if not messages:
+        return messages
+    delivery_counts = await read_worker_result_delivery_counts(
+        stream_name,
+        [message_id for _, message_id, _ in messages],
+    )
+    remaining_messages: list[tuple[str, str, dict]] = []
+    for message in messages:
+        _, message_id, payload_raw = message
+        delivery_count = delivery_counts.get(message_id, 1)
+        if delivery_count <= max_deliveries:
+            remaining_messages.append(message)
+            continue
+        last_failure = _failure_reasons.pop((stream_name, message_id), None)
+        logger.error(
+            "Dead-lettering worker result %s after %s deliveries: %s",
+            message_id,
+            delivery_count,
+            last_failure or "no failure recorded by this process",
+        )
+        await dead_letter_worker_result(
+            stream_name=stream_name,
+            message_id=message_id,
+            payload_raw=json.dumps(payload_raw),
+            reason=f"max_deliveries_exceeded: {last_failure or f'delivered {delivery_count} times'}",
+            delivery_count=delivery_count,
+        )
+        db_manager_metrics.increment("db_manager_messages_total", stream=stream_name, outcome="dead_lettered")
+    return remaining_messages
+
+
+def _create_stop_event() -> asyncio.Event:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signal_number, stop_event.set)
+    return stop_event
 
 
 async def _process_result_message(
@@ -55,7 +254,13 @@ async def _process_result_message(
         payload = WorkerResultSchema.model_validate(payload_raw)
     except Exception as exception:
         logger.error("Invalid worker result payload for %s: %s", message_id, exception)
-        await ack_worker_result(stream_name, message_id)
+        db_manager_metrics.increment("db_manager_messages_total", stream=stream_name, outcome="invalid")
+        await dead_letter_worker_result(
+            stream_name=stream_name,
+            message_id=message_id,
+            payload_raw=json.dumps(payload_raw),
+            reason=f"invalid_schema: {exception}",
+        )
         return
 
     queue_kind = resolve_queue_kind(
@@ -65,19 +270,60 @@ async def _process_result_message(
         error_stream=DEFAULT_REDIS_QUEUE_ERRORS,
     )
 
-    db = get_db_session()
-    try:
-        persist_worker_result(
-            db,
-            payload=payload,
-            queue_kind=queue_kind,
+    max_attempts = resolve_positive_int_env(
+        "DB_MANAGER_TRANSACTION_MAX_ATTEMPTS",
+        DEFAULT_TRANSACTION_MAX_ATTEMPTS,
+    )
+    attempt = 1
+    while True:
+        db = get_db_session()
+        started_at = time.perf_counter()
+        try:
+            persisted = persist_worker_result(
+                db,
+                payload=payload,
+                queue_kind=queue_kind,
+            )
+            db.commit()
+            break
+        except Exception as exception:
+            db.rollback()
+            retry_sqlstate = _resolve_retryable_sqlstate(exception)
+            if retry_sqlstate is None or attempt >= max_attempts:
+                db_manager_metrics.increment("db_manager_messages_total", stream=stream_name, outcome="failed")
+                logger.exception("Failed to persist worker result %s: %s", message_id, exception)
+                _failure_reasons[(stream_name, message_id)] = f"persist_failed: {exception}"
+                return
+        finally:
+            db.close()
+
+        db_manager_metrics.increment("db_manager_transaction_retries_total", sqlstate=retry_sqlstate)
+        logger.warning(
+            "Retrying worker result %s after SQLSTATE %s (attempt %s/%s)",
+            message_id,
+            retry_sqlstate,
+            attempt,
+            max_attempts,
         )
-        db.commit()
-    except Exception as exception:
-        db.rollback()
-        logger.exception("Failed to persist worker result %s: %s", message_id, exception)
-        return
-    finally:
-        db.close()
+        await asyncio.sleep(_TRANSACTION_RETRY_DELAY_SECONDS * attempt)
+        attempt += 1
 
+    db_manager_metrics.observe(
+        "db_manager_persist_seconds",
+        time.perf_counter() - started_at,
+        queue_kind=queue_kind,
+    )
+    db_manager_metrics.increment(
+        "db_manager_messages_total",
+        stream=stream_name,
+        outcome="persisted" if persisted else "duplicate",
+    )
     await ack_worker_result(stream_name, message_id)
+    _failure_reasons.pop((stream_name, message_id), None)
+
+
+def _resolve_retryable_sqlstate(exception: Exception) -> str | None:
+    if not isinstance(exception, DBAPIError):
+        return None
+    sqlstate = getattr(exception.orig, "pgcode", None)
+    return sqlstate if sqlstate in _RETRYABLE_SQLSTATES else None
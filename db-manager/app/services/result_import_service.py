@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import gzip
+import logging
+from pathlib import Path
+import time
+
+from app.clients.database import disable_synchronous_commit
+from app.database import get_db_session
+from app.errors import DBManagerError
+from app.schemas import WorkerResultSchema
+from .result_persistence_service import (
+    DeferredPersistenceRefreshes,
+    flush_deferred_refreshes,
+    persist_sources_bulk,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESULT_IMPORT_BATCH_SIZE = 500
+
+
+class ResultImportReport:
+    def __init__(self) -> None:
+        self.read_count = 0
+        self.imported_count = 0
+        self.source_count = 0
+        self.new_article_count = 0
+        self.invalid_count = 0
+        self.batch_count = 0
+        self.elapsed_seconds = 0.0
+
+    @property
+    def results_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.read_count / self.elapsed_seconds
+
+    @property
+    def sources_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.source_count / self.elapsed_seconds
+
+    def format_lines(self) -> list[str]:
+        return [
+            f"elapsed: {self.elapsed_seconds:.1f}s, {self.results_per_second:.1f} results/s, "
+            f"{self.sources_per_second:.1f} sources/s",
+            f"results read: {self.read_count} in {self.batch_count} batches",
+            f"imported: {self.imported_count}, sources: {self.source_count}, "
+            f"new articles: {self.new_article_count}, invalid: {self.invalid_count}",
+        ]
+
+
+def run_result_import(
+    path: Path,
+    *,
+    batch_size: int = DEFAULT_RESULT_IMPORT_BATCH_SIZE,
+) -> ResultImportReport:
+    if batch_size <= 0:
+        raise DBManagerError("batch_size must be greater than zero")
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as results_file:
+        return import_result_lines(results_file, batch_size=batch_size)
+
+
+def import_result_lines(
+    lines: Iterable[str],
+    *,
+    batch_size: int = DEFAULT_RESULT_IMPORT_BATCH_SIZE,
+) -> ResultImportReport:
+    if batch_size <= 0:
+        raise DBManagerError("batch_size must be greater than zero")
+
+    report = ResultImportReport()
+    started_at = time.perf_counter()
+    batch: list[WorkerResultSchema] = []
+    for payload in _iter_valid_results(lines, report=report):
+        batch.append(payload)
+        if len(batch) >= batch_size:
+            _import_result_batch(batch, report=report)
+            batch = []
+            report.elapsed_seconds = time.perf_counter() - started_at
+            logger.info(
+                "Imported %s results (%.1f results/s, %.1f sources/s)",
+                report.read_count,
+                report.results_per_second,
+                report.sources_per_second,
+            )
+    if batch:
+        _import_result_batch(batch, report=report)
+
+    report.elapsed_seconds = time.perf_counter() - started_at
+    return report
+
+
+def _iter_valid_results(
+    lines: Iterable[str],
+    *,
+    report: ResultImportReport,
+) -> Iterator[WorkerResultSchema]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        report.read_count += 1
+        try:
+            payload = WorkerResultSchema.model_validate_json(line)
+        except ValueError as exception:
+            logger.warning("Skipping invalid result on line %s: %s", line_number, exception)
+            report.invalid_count += 1
+            continue
+        yield payload
+
+
+def _import_result_batch(batch: list[WorkerResultSchema], *, report: ResultImportReport) -> None:
+    deferred_refreshes = DeferredPersistenceRefreshes()
+    db = get_db_session()
+    try:
+        # The input is the source of truth: an import cut short is simply run again.
+        disable_synchronous_commit(db)
+        new_article_count = persist_sources_bulk(
+            db,
+            payloads=batch,
+            deferred_refreshes=deferred_refreshes,
+        )
+        source_count = len(deferred_refreshes.source_keys)
+        flush_deferred_refreshes(db, deferred_refreshes)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    report.batch_count += 1
+    report.imported_count += len(batch)
+    report.source_count += source_count
+    report.new_article_count += new_article_count
@@ -1,14 +1,38 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import time
+
 from sqlalchemy.orm import Session
 
 from app.clients.database import (
+    copy_sources_for_results,
+    get_feed_fetch_interval_seconds,
     insert_job_result_if_new,
     refresh_rss_scrape_job_status,
+    refresh_source_listing_rows,
+    update_feed_fetch_schedule,
+    update_feed_fresh_until,
     upsert_feed_scraping_state,
     upsert_sources_for_feed,
 )
+from app.domain import resolve_feed_fresh_until, resolve_next_fetch_interval_seconds
 from app.schemas import WorkerResultSchema
+from app.utils import db_manager_metrics, resolve_positive_int_env
+
+DEFAULT_FEED_FETCH_INTERVAL_SECONDS = 3600
+DEFAULT_FEED_FETCH_MIN_INTERVAL_SECONDS = 300
+DEFAULT_FEED_FETCH_MAX_INTERVAL_SECONDS = 86400
+
+
+class DeferredPersistenceRefreshes:
+    """Listing rows and job statuses to refresh once for a whole batch of results."""
+
+    def __init__(self) -> None:
+        self.source_keys: set[tuple[int, datetime]] = set()
+        self.job_ids: set[str] = set()
 
 
 def persist_worker_result(
@@ -16,19 +40,141 @@ def persist_worker_result(
     *,
     payload: WorkerResultSchema,
     queue_kind: str,
+    fetched_at: datetime | None = None,
+    deferred_refreshes: DeferredPersistenceRefreshes | None = None,
 ) -> bool:
-    is_new = insert_job_result_if_new(
-        db,
-        payload=payload,
-        queue_kind=queue_kind,
-    )
+    with _observe_stage("job_result_insert"):
+        is_new = insert_job_result_if_new(
+            db,
+            payload=payload,
+            queue_kind=queue_kind,
+        )
     if not is_new:
         return False
+    db_manager_metrics.increment("db_manager_rows_upserted_total", table="rss_scrape_job_results")
 
-    upsert_feed_scraping_state(db, payload=payload)
+    with _observe_stage("feed_state_upsert"):
+        ttl_seconds, skip_hours = upsert_feed_scraping_state(db, payload=payload)
+        if payload.status != "error":
+            update_feed_fresh_until(
+                db,
+                feed_id=payload.feed_id,
+                fresh_until=resolve_feed_fresh_until(
+                    fetched_at=fetched_at or datetime.now(timezone.utc),
+                    ttl_seconds=ttl_seconds,
+                    skip_hours=skip_hours,
+                    cache_expires_at=payload.cache_expires_at,
+                    max_fresh_seconds=_resolve_max_interval_seconds(),
+                ),
+            )
+    db_manager_metrics.increment("db_manager_rows_upserted_total", table="feeds_scraping")
 
+    new_article_count = 0
     if queue_kind == "ingest":
-        upsert_sources_for_feed(db, payload=payload)
+        with _observe_stage("sources_upsert"):
+            linked_source_keys, new_article_count = upsert_sources_for_feed(db, payload=payload)
+        if deferred_refreshes is not None:
+            deferred_refreshes.source_keys.update(linked_source_keys)
+        else:
+            with _observe_stage("listing_refresh"):
+                refresh_source_listing_rows(db, source_keys=linked_source_keys)
+        db_manager_metrics.increment(
+            "db_manager_rows_upserted_total",
+            len(linked_source_keys),
+            table="rss_sources",
+        )
+        db_manager_metrics.increment(
+            "db_manager_rows_upserted_total",
+            new_article_count,
+            table="rss_source_feeds",
+        )
+
+    if payload.ingest:
+        with _observe_stage("fetch_schedule"):
+            _schedule_next_feed_fetch(db, payload=payload, new_article_count=new_article_count)
 
-    refresh_rss_scrape_job_status(db, job_id=payload.job_id)
+    if deferred_refreshes is not None:
+        deferred_refreshes.job_ids.add(payload.job_id)
+    else:
+        with _observe_stage("status_refresh"):
+            refresh_rss_scrape_job_status(db, job_id=payload.job_id)
     return True
+
+
+def persist_sources_bulk(
+    db: Session,
+    *,
+    payloads: list[WorkerResultSchema],
+    deferred_refreshes: DeferredPersistenceRefreshes,
+) -> int:
+    # Offline results are older than the last real fetch: only their sources are
+    # written, so the feeds' validators, freshness and schedule stay as they are.
+    with _observe_stage("sources_copy"):
+        linked_source_keys, new_article_count = copy_sources_for_results(db, payloads=payloads)
+    deferred_refreshes.source_keys.update(linked_source_keys)
+    db_manager_metrics.increment(
+        "db_manager_rows_upserted_total",
+        len(linked_source_keys),
+        table="rss_sources",
+    )
+    db_manager_metrics.increment(
+        "db_manager_rows_upserted_total",
+        new_article_count,
+        table="rss_source_feeds",
+    )
+    return new_article_count
+
+
+def flush_deferred_refreshes(db: Session, deferred_refreshes: DeferredPersistenceRefreshes) -> None:
+    with _observe_stage("listing_refresh"):
+        refresh_source_listing_rows(db, source_keys=list(deferred_refreshes.source_keys))
+    with _observe_stage("status_refresh"):
+        for job_id in sorted(deferred_refreshes.job_ids):
+            refresh_rss_scrape_job_status(db, job_id=job_id)
+    deferred_refreshes.source_keys.clear()
+    deferred_refreshes.job_ids.clear()
+
+
+def _schedule_next_feed_fetch(
+    db: Session,
+    *,
+    payload: WorkerResultSchema,
+    new_article_count: int,
+) -> None:
+    current_interval_seconds = get_feed_fetch_interval_seconds(db, feed_id=payload.feed_id)
+    min_interval_seconds = resolve_positive_int_env(
+        "FEED_FETCH_MIN_INTERVAL_SECONDS",
+        DEFAULT_FEED_FETCH_MIN_INTERVAL_SECONDS,
+    )
+    max_interval_seconds = max(_resolve_max_interval_seconds(), min_interval_seconds)
+    update_feed_fetch_schedule(
+        db,
+        feed_id=payload.feed_id,
+        fetch_interval_seconds=resolve_next_fetch_interval_seconds(
+            current_interval_seconds or DEFAULT_FEED_FETCH_INTERVAL_SECONDS,
+            status=payload.status,
+            new_article_count=new_article_count,
+            min_interval_seconds=min_interval_seconds,
+            max_interval_seconds=max_interval_seconds,
+        ),
+    )
+
+
+def _resolve_max_interval_seconds() -> int:
+    return resolve_positive_int_env(
+        "FEED_FETCH_MAX_INTERVAL_SECONDS",
+        DEFAULT_FEED_FETCH_MAX_INTERVAL_SECONDS,
+    )
+
+
+@contextmanager
+def _observe_stage(stage: str) -> Iterator[None]:
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        db_manager_metrics.observe(
+            "db_manager_persist_stage_seconds",
+            time.perf_counter() - started_at,
+            stage=stage,
+        )
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from collections import deque
+import logging
+import time
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.clients.database import disable_synchronous_commit, insert_replay_job_if_missing
+from app.clients.queue import (
+    DEFAULT_REDIS_QUEUE_CHECK,
+    DEFAULT_REDIS_QUEUE_ERRORS,
+    DEFAULT_REDIS_QUEUE_INGEST,
+    read_worker_result_range,
+)
+from app.database import get_db_session
+from app.domain import parse_stream_message_id, resolve_queue_kind, resolve_stream_message_time
+from app.errors import DBManagerError
+from app.schemas import WorkerResultSchema
+from .result_persistence_service import (
+    DeferredPersistenceRefreshes,
+    flush_deferred_refreshes,
+    persist_worker_result,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESULT_REPLAY_BATCH_SIZE = 500
+DEFAULT_RESULT_REPLAY_STREAMS = (
+    DEFAULT_REDIS_QUEUE_CHECK,
+    DEFAULT_REDIS_QUEUE_INGEST,
+    DEFAULT_REDIS_QUEUE_ERRORS,
+)
+
+
+class ResultReplayReport:
+    def __init__(self) -> None:
+        self.read_count = 0
+        self.persisted_count = 0
+        self.duplicate_count = 0
+        self.invalid_count = 0
+        self.failed_count = 0
+        self.batch_count = 0
+        self.elapsed_seconds = 0.0
+        self.last_message_ids: dict[str, str] = {}
+
+    @property
+    def results_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.read_count / self.elapsed_seconds
+
+    def format_lines(self) -> list[str]:
+        return [
+            f"elapsed: {self.elapsed_seconds:.1f}s, {self.results_per_second:.1f} results/s",
+            f"results read: {self.read_count} in {self.batch_count} batches",
+            f"persisted: {self.persisted_count}, duplicate: {self.duplicate_count}, "
+            f"invalid: {self.invalid_count}, failed: {self.failed_count}",
+            *[
+                f"last id {stream_name}: {message_id}"
+                for stream_name, message_id in sorted(self.last_message_ids.items())
+            ],
+        ]
+
+
+async def run_result_replay(
+    *,
+    stream_names: tuple[str, ...] = DEFAULT_RESULT_REPLAY_STREAMS,
+    start_id: str = "-",
+    end_id: str = "+",
+    batch_size: int = DEFAULT_RESULT_REPLAY_BATCH_SIZE,
+    create_missing_jobs: bool = True,
+) -> ResultReplayReport:
+    if batch_size <= 0:
+        raise DBManagerError("batch_size must be greater than zero")
+
+    report = ResultReplayReport()
+    started_at = time.perf_counter()
+    buffers: dict[str, deque[tuple[str, dict[str, Any] | None]]] = {
+        stream_name: deque() for stream_name in stream_names
+    }
+    next_start_ids = {stream_name: start_id for stream_name in stream_names}
+    exhausted_streams: set[str] = set()
+
+    while True:
+        for stream_name, buffer in buffers.items():
+            if buffer or stream_name in exhausted_streams:
+                continue
+            entries = await read_worker_result_range(
+                stream_name,
+                start_id=next_start_ids[stream_name],
+                end_id=end_id,
+                count=batch_size,
+            )
+            if len(entries) < batch_size:
+                exhausted_streams.add(stream_name)
+            if entries:
+                next_start_ids[stream_name] = f"({entries[-1][0]}"
+                buffer.extend(entries)
+
+        batch = _take_ordered_batch(buffers, exhausted_streams=exhausted_streams, batch_size=batch_size)
+        if not batch:
+            break
+        _persist_replay_batch(batch, report=report, create_missing_jobs=create_missing_jobs)
+        report.elapsed_seconds = time.perf_counter() - started_at
+        logger.info(
+            "Replayed %s results (%.1f results/s), up to %s",
+            report.read_count,
+            report.results_per_second,
+            ", ".join(f"{name} {message_id}" for name, message_id in sorted(report.last_message_ids.items())),
+        )
+
+    report.elapsed_seconds = time.perf_counter() - started_at
+    return report
+
+
+def _take_ordered_batch(
+    buffers: dict[str, deque[tuple[str, dict[str, Any] | None]]],
+    *,
+    exhausted_streams: set[str],
+    batch_size: int,
+) -> list[tuple[str, str, dict[str, Any] | None]]:
+    # Results are merged across streams in id order, so feed state ends up as it
+    # was after the last fetch. A buffer running dry stops the batch until refilled.
+    batch: list[tuple[str, str, dict[str, Any] | None]] = []
+    while len(batch) < batch_size:
+        if any(not buffer and name not in exhausted_streams for name, buffer in buffers.items()):
+            break
+        heads = [(parse_stream_message_id(buffer[0][0]), name) for name, buffer in buffers.items() if buffer]
+        if not heads:
+            break
+        _, stream_name = min(heads)
+        message_id, payload = buffers[stream_name].popleft()
+        batch.append((stream_name, message_id, payload))
+    return batch
+
+
+def _persist_replay_batch(
+    batch: list[tuple[str, str, dict[str, Any] | None]],
+    *,
+    report: ResultReplayReport,
+    create_missing_jobs: bool,
+) -> None:
+    deferred_refreshes = DeferredPersistenceRefreshes()
+    db = get_db_session()
+    try:
+        # Losing the tail of a replay to a crash is harmless: rerunning it is idempotent.
+        disable_synchronous_commit(db)
+        for stream_name, message_id, payload_raw in batch:
+            report.read_count += 1
+            report.last_message_ids[stream_name] = message_id
+            _persist_replay_result(
+                db,
+                stream_name=stream_name,
+                message_id=message_id,
+                payload_raw=payload_raw,
+                report=report,
+                create_missing_jobs=create_missing_jobs,
+                deferred_refreshes=deferred_refreshes,
+            )
+        flush_deferred_refreshes(db, deferred_refreshes)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    report.batch_count += 1
+
+
+def _persist_replay_result(
+    db: Session,
+    *,
+    stream_name: str,
+    message_id: str,
+    payload_raw: dict[str, Any] | None,
+    report: ResultReplayReport,
+    create_missing_jobs: bool,
+    deferred_refreshes: DeferredPersistenceRefreshes,
+) -> None:
+    try:
+        payload = WorkerResultSchema.model_validate(payload_raw)
+    except Exception as exception:
+        logger.warning("Skipping invalid result %s %s: %s", stream_name, message_id, exception)
+        report.invalid_count += 1
+        return
+
+    fetched_at = resolve_stream_message_time(message_id)
+    result_refreshes = DeferredPersistenceRefreshes()
+    # One savepoint per result: a result for a since-deleted feed fails alone.
+    savepoint = db.begin_nested()
+    try:
+        if create_missing_jobs:
+            insert_replay_job_if_missing(
+                db,
+                job_id=payload.job_id,
+                ingest=payload.ingest,
+                requested_at=fetched_at,
+            )
+        persisted = persist_worker_result(
+            db,
+            payload=payload,
+            queue_kind=resolve_queue_kind(
+                stream_name,
+                check_stream=DEFAULT_REDIS_QUEUE_CHECK,
+                ingest_stream=DEFAULT_REDIS_QUEUE_INGEST,
+                error_stream=DEFAULT_REDIS_QUEUE_ERRORS,
+            ),
+            fetched_at=fetched_at,
+            deferred_refreshes=result_refreshes,
+        )
+        savepoint.commit()
+    except Exception as exception:
+        savepoint.rollback()
+        logger.warning("Failed to replay result %s %s: %s", stream_name, message_id, exception)
+        report.failed_count += 1
+        return
+
+    deferred_refreshes.source_keys.update(result_refreshes.source_keys)
+    deferred_refreshes.job_ids.update(result_refreshes.job_ids)
+    if persisted:
+        report.persisted_count += 1
+    else:
+        report.duplicate_count += 1
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import random
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils import db_manager_metrics, resolve_positive_float_env
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATEMENT_SAMPLE_RATE = 0.1
+DEFAULT_SLOW_STATEMENT_MS = 250.0
+DEFAULT_STATEMENT_REPORT_INTERVAL_SECONDS = 60.0
+DEFAULT_STATEMENT_REPORT_LIMIT = 5
+_STATEMENT_FINGERPRINT_LENGTH = 120
+_STATEMENT_STARTS_KEY = "statement_profile_started_at"
+
+
+class StatementProfile:
+    def __init__(self) -> None:
+        self._statements: dict[str, list[float]] = {}
+
+    def record(self, statement: str, elapsed_seconds: float) -> None:
+        # count, total seconds, max seconds
+        totals = self._statements.setdefault(
+            build_statement_fingerprint(statement),
+            [0.0, 0.0, 0.0],
+        )
+        totals[0] += 1
+        totals[1] += elapsed_seconds
+        totals[2] = max(totals[2], elapsed_seconds)
+
+    def drain_top_statements(self, *, limit: int) -> list[tuple[str, int, float, float]]:
+        top_statements = sorted(
+            self._statements.items(),
+            key=lambda item: item[1][1],
+            reverse=True,
+        )[:limit]
+        self._statements.clear()
+        return [
+            (fingerprint, int(count), total_seconds, max_seconds)
+            for fingerprint, (count, total_seconds, max_seconds) in top_statements
+        ]
+
+
+statement_profile = StatementProfile()
+
+
+def build_statement_fingerprint(statement: str) -> str:
+    return " ".join(statement.split())[:_STATEMENT_FINGERPRINT_LENGTH]
+
+
+def install_statement_profiling(
+    engine: Engine,
+    *,
+    profile: StatementProfile,
+    sample_rate: float,
+    slow_threshold_seconds: float,
+    random_source: Callable[[], float] = random.random,
+) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        started_at = time.perf_counter() if random_source() < sample_rate else None
+        conn.info.setdefault(_STATEMENT_STARTS_KEY, []).append(started_at)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        started_at = _pop_statement_start(conn.info)
+        if started_at is None:
+            return
+        elapsed_seconds = time.perf_counter() - started_at
+        profile.record(statement, elapsed_seconds)
+        db_manager_metrics.observe("db_manager_sampled_statement_seconds", elapsed_seconds)
+        if elapsed_seconds >= slow_threshold_seconds:
+            db_manager_metrics.increment("db_manager_slow_statements_total")
+            logger.warning(
+                "Slow statement (%.0f ms): %s",
+                elapsed_seconds * 1000,
+                build_statement_fingerprint(statement),
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context) -> None:
+        if exception_context.connection is not None:
+            _pop_statement_start(exception_context.connection.info)
+
+
+def install_default_statement_profiling(engine: Engine) -> None:
+    install_statement_profiling(
+        engine,
+        profile=statement_profile,
+        sample_rate=min(
+            resolve_positive_float_env("DB_MANAGER_STATEMENT_SAMPLE_RATE", DEFAULT_STATEMENT_SAMPLE_RATE),
+            1.0,
+        ),
+        slow_threshold_seconds=resolve_positive_float_env(
+            "DB_MANAGER_SLOW_STATEMENT_MS",
+            DEFAULT_SLOW_STATEMENT_MS,
+        )
+        / 1000,
+    )
+
+
+def log_statement_report(
+    profile: StatementProfile,
+    *,
+    limit: int = DEFAULT_STATEMENT_REPORT_LIMIT,
+) -> None:
+    top_statements = profile.drain_top_statements(limit=limit)
+    if not top_statements:
+        return
+    logger.info(
+        "sampled statement report: %s",
+        " | ".join(
+            f"{total_seconds * 1000:.0f}ms total, {count} calls, {max_seconds * 1000:.0f}ms max: {fingerprint}"
+            for fingerprint, count, total_seconds, max_seconds in top_statements
+        ),
+    )
+
+
+async def report_statement_profile(
+    profile: StatementProfile,
+    *,
+    interval_seconds: float,
+) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        log_statement_report(profile)
+
+
+def _pop_statement_start(connection_info: dict[str, Any]) -> float | None:
+    started_at_stack = connection_info.get(_STATEMENT_STARTS_KEY)
+    if not started_at_stack:
+        return None
+    return started_at_stack.pop()
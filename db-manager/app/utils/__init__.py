@@ -0,0 +1,15 @@
+from .env_utils import (
+    resolve_positive_float_env,
+    resolve_positive_int_env,
+)
+from .metrics_utils import (
+    MetricsRegistry,
+    db_manager_metrics,
+)
+
+__all__ = [
+    "resolve_positive_float_env",
+    "resolve_positive_int_env",
+    "MetricsRegistry",
+    "db_manager_metrics",
+]
@@ -0,0 +1,222 @@
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+import sys
+
+from app.clients.queue import close_redis_client
+from app.domain import parse_payload_override
+from app.services.dead_letter_service import (
+    DEFAULT_DEAD_LETTER_LIST_LIMIT,
+    drop_missing_dead_letters,
+    export_dead_letter,
+    list_dead_letters,
+    load_dead_letters_file,
+    purge_dead_letters,
+    replay_dead_letters,
+)
+from app.services.feed_export_service import export_feeds
+from app.services.feed_watermark_backfill_service import (
+    DEFAULT_FEED_WATERMARK_BACKFILL_BATCH_SIZE,
+    run_feed_watermark_backfill,
+)
+from app.services.result_import_service import (
+    DEFAULT_RESULT_IMPORT_BATCH_SIZE,
+    import_result_lines,
+    run_result_import,
+)
+from app.services.result_replay_service import (
+    DEFAULT_RESULT_REPLAY_BATCH_SIZE,
+    DEFAULT_RESULT_REPLAY_STREAMS,
+    ResultReplayReport,
+    run_result_replay,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="db-manager")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backfill_parser = subparsers.add_parser(
+        "backfill-feed-watermarks",
+        help="Recompute feeds_scraping article watermarks and counts from rss_source_feeds",
+    )
+    backfill_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_FEED_WATERMARK_BACKFILL_BATCH_SIZE,
+    )
+
+    replay_results_parser = subparsers.add_parser(
+        "replay-results",
+        help="Persist a range of worker result streams again, e.g. into a restored database",
+    )
+    replay_results_parser.add_argument(
+        "--streams",
+        nargs="+",
+        default=list(DEFAULT_RESULT_REPLAY_STREAMS),
+    )
+    replay_results_parser.add_argument("--from-id", default="-", help="First stream id, inclusive")
+    replay_results_parser.add_argument("--to-id", default="+", help="Last stream id, inclusive")
+    replay_results_parser.add_argument("--batch-size", type=int, default=DEFAULT_RESULT_REPLAY_BATCH_SIZE)
+    replay_results_parser.add_argument(
+        "--skip-missing-jobs",
+        action="store_true",
+        help="Drop results whose job is not in the database instead of creating a placeholder job",
+    )
+
+    import_results_parser = subparsers.add_parser(
+        "import-results",
+        help="Copy the sources of a worker `reparse-archive` or `ingest-feeds` output, leaving feed state untouched",
+    )
+    import_results_parser.add_argument(
+        "--file",
+        required=True,
+        help="JSON lines of worker results, gzipped when the name ends in .gz, or - for stdin",
+    )
+    import_results_parser.add_argument("--batch-size", type=int, default=DEFAULT_RESULT_IMPORT_BATCH_SIZE)
+
+    export_feeds_parser = subparsers.add_parser(
+        "export-feeds",
+        help="Print feeds as JSON lines for the worker `ingest-feeds` command",
+    )
+    export_feeds_parser.add_argument("--opml", type=Path, help="Only the feeds listed in this OPML file")
+    export_feeds_parser.add_argument(
+        "--include-disabled",
+        action="store_true",
+        help="Also export disabled feeds and feeds of disabled companies",
+    )
+
+    dead_letters_parser = subparsers.add_parser(
+        "dead-letters",
+        help="Inspect, replay or purge messages in the rss_dead_letters stream",
+    )
+    dead_letter_subparsers = dead_letters_parser.add_subparsers(dest="dead_letters_command", required=True)
+
+    list_parser = dead_letter_subparsers.add_parser("list", help="Print matching dead letters")
+    _add_dead_letter_filters(list_parser)
+    list_parser.add_argument("--output", choices=("text", "jsonl"), default="text")
+
+    replay_parser = dead_letter_subparsers.add_parser(
+        "replay",
+        help="Publish matching dead letters back to their source stream and remove them",
+    )
+    _add_dead_letter_filters(replay_parser)
+    replay_parser.add_argument(
+        "--from-file",
+        type=Path,
+        help="Replay the dead letters of a `list --output jsonl` export, with their edited payloads",
+    )
+    replay_parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        type=parse_payload_override,
+        default=[],
+        metavar="PATH=JSON",
+        help="Fix up a payload field before replaying, e.g. --set fetchprotection=1",
+    )
+    replay_parser.add_argument("--dry-run", action="store_true")
+
+    purge_parser = dead_letter_subparsers.add_parser("purge", help="Delete matching dead letters")
+    _add_dead_letter_filters(purge_parser)
+    purge_parser.add_argument("--dry-run", action="store_true")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "backfill-feed-watermarks":
+        run_feed_watermark_backfill(batch_size=args.batch_size)
+    elif args.command == "replay-results":
+        report = asyncio.run(_run_result_replay_command(args))
+        for line in report.format_lines():
+            print(line)
+    elif args.command == "import-results":
+        if args.file == "-":
+            report = import_result_lines(sys.stdin, batch_size=args.batch_size)
+        else:
+            report = run_result_import(Path(args.file), batch_size=args.batch_size)
+        for line in report.format_lines():
+            print(line)
+    elif args.command == "export-feeds":
+        feeds, unmatched_urls = export_feeds(
+            opml_path=args.opml,
+            enabled_only=not args.include_disabled,
+        )
+        for feed in feeds:
+            print(json.dumps(feed))
+        for feed_url in unmatched_urls:
+            logging.warning("OPML feed not in rss_feeds: %s", feed_url)
+        logging.info("Exported %s feeds", len(feeds))
+    elif args.command == "dead-letters":
+        if args.dead_letters_command == "purge" and not (args.ids or args.stream or args.reason_contains):
+            parser.error("dead-letters purge needs --ids, --stream or --reason-contains")
+        asyncio.run(_run_dead_letters_command(args))
+
+
+def _add_dead_letter_filters(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--ids", nargs="+", metavar="ENTRY_ID", help="Dead letter entry ids")
+    parser.add_argument("--stream", help="Only dead letters from this source stream")
+    parser.add_argument("--reason-contains", help="Only dead letters whose reason contains this text")
+    parser.add_argument("--limit", type=int, default=DEFAULT_DEAD_LETTER_LIST_LIMIT)
+
+
+async def _run_result_replay_command(args: argparse.Namespace) -> ResultReplayReport:
+    try:
+        return await run_result_replay(
+            stream_names=tuple(args.streams),
+            start_id=args.from_id,
+            end_id=args.to_id,
+            batch_size=args.batch_size,
+            create_missing_jobs=not args.skip_missing_jobs,
+        )
+    finally:
+        await close_redis_client()
+
+
+async def _run_dead_letters_command(args: argparse.Namespace) -> None:
+    try:
+        if getattr(args, "from_file", None) is not None:
+            dead_letters = await drop_missing_dead_letters(load_dead_letters_file(args.from_file))
+        else:
+            dead_letters = await list_dead_letters(
+                entry_ids=args.ids,
+                stream_name=args.stream,
+                reason_contains=args.reason_contains,
+                limit=args.limit,
+            )
+
+        if args.dead_letters_command == "list":
+            for dead_letter in dead_letters:
+                if args.output == "jsonl":
+                    print(json.dumps(export_dead_letter(dead_letter)))
+                else:
+                    print(
+                        f"{dead_letter.entry_id} {dead_letter.source_stream} {dead_letter.message_id} "
+                        f"deliveries={dead_letter.delivery_count} {dead_letter.failed_at} {dead_letter.reason}"
+                    )
+        elif args.dead_letters_command == "replay":
+            replayed = await replay_dead_letters(
+                dead_letters,
+                overrides=args.overrides,
+                dry_run=args.dry_run,
+            )
+            for dead_letter, payload_json, message_id in replayed:
+                target = message_id or "dry-run"
+                print(f"{dead_letter.entry_id} -> {dead_letter.source_stream} {target} {payload_json}")
+            print(f"{len(replayed)} dead letters {'would be ' if args.dry_run else ''}replayed")
+        elif args.dry_run:
+            print(f"{len(dead_letters)} dead letters would be purged")
+        else:
+            print(f"{await purge_dead_letters(dead_letters)} dead letters purged")
+    finally:
+        await close_redis_client()
+
+
+if __name__ == "__main__":
+    main()
@@ -64,9 +64,25 @@ def test_insert_job_result_if_new_query_is_guarded_by_parent_job_existence() ->
     assert "FROM rss_scrape_jobs" in sql_text
 
 
+def test_insert_job_result_if_new_persists_fetch_timings() -> None:
+    db = Mock(spec=Session)
+    db.execute.return_value.scalar_one_or_none.return_value = "job-1"
+
+    rss_scraping_db_client_module.insert_job_result_if_new(
+        db,
+        payload=_build_payload().model_copy(update={"ttfb_ms": 120, "total_ms": 450, "response_bytes": 2048}),
+        queue_kind="ingest",
+    )
+
+    params = db.execute.call_args.args[1]
+    assert (params["ttfb_ms"], params["total_ms"], params["response_bytes"]) == (120, 450, 2048)
+    assert params["connect_ms"] is None
+
+
 def test_upsert_feed_scraping_state_sets_error_flags() -> None:
     db = Mock(spec=Session)
     payload = _build_payload(status="error")
+    db.execute.return_value.mappings.return_value.first.return_value = None
 
     rss_scraping_db_client_module.upsert_feed_scraping_state(db, payload=payload)
 
@@ -78,14 +94,22 @@ def test_upsert_feed_scraping_state_sets_error_flags() -> None:
 
 def test_upsert_feed_scraping_state_clears_error_message_on_success() -> None:
     db = Mock(spec=Session)
-    payload = _build_payload(status="success")
+    payload = _build_payload(status="success").model_copy(update={"ttl_seconds": 1800, "skip_hours": [1, 2]})
+    db.execute.return_value.mappings.return_value.first.return_value = {
+        "ttl_seconds": 1800,
+        "skip_hours": [1, 2],
+    }
 
-    rss_scraping_db_client_module.upsert_feed_scraping_state(db, payload=payload)
+    freshness_hints = rss_scraping_db_client_module.upsert_feed_scraping_state(db, payload=payload)
 
     params = db.execute.call_args.args[1]
     assert params["is_error"] is False
     assert params["error_nbr"] == 0
     assert params["error_msg"] is None
+    assert params["is_parsed"] is True
+    assert params["ttl_seconds"] == 1800
+    assert params["skip_hours"] == [1, 2]
+    assert freshness_hints == (1800, [1, 2])
 
 
 def test_refresh_rss_scrape_job_status_returns_when_job_does_not_exist() -> None:
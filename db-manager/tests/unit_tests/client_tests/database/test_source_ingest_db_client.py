@@ -31,11 +31,13 @@ def _build_payload(*, status: str = "success") -> WorkerResultSchema:
 def test_upsert_sources_for_feed_returns_early_for_non_success_status() -> None:
     db = Mock(spec=Session)
 
-    source_ingest_db_client_module.upsert_sources_for_feed(
+    linked_source_keys, new_article_count = source_ingest_db_client_module.upsert_sources_for_feed(
         db,
         payload=_build_payload(status="error"),
     )
 
+    assert linked_source_keys == []
+    assert new_article_count == 0
     db.execute.assert_not_called()
 
 
@@ -65,11 +67,18 @@ def test_upsert_sources_for_feed_links_source_to_feed() -> None:
         "published_at": source_ingest_db_client_module.SOURCE_PUBLISHED_AT_FALLBACK,
     }
     second_execute = Mock()
-    db.execute.side_effect = [first_execute, second_execute]
+    second_execute.scalar_one_or_none.return_value = 77
+    third_execute = Mock()
+    db.execute.side_effect = [first_execute, second_execute, third_execute]
 
-    source_ingest_db_client_module.upsert_sources_for_feed(db, payload=payload)
+    linked_source_keys, new_article_count = source_ingest_db_client_module.upsert_sources_for_feed(
+        db,
+        payload=payload,
+    )
 
-    assert db.execute.call_count == 2
+    assert db.execute.call_count == 3
+    assert linked_source_keys == [(77, source_ingest_db_client_module.SOURCE_PUBLISHED_AT_FALLBACK)]
+    assert new_article_count == 1
 
     insert_source_params = db.execute.call_args_list[0].args[1]
     assert insert_source_params["published_at"] == source_ingest_db_client_module.SOURCE_PUBLISHED_AT_FALLBACK
@@ -80,3 +89,103 @@ def test_upsert_sources_for_feed_links_source_to_feed() -> None:
         "feed_id": 10,
         "published_at": source_ingest_db_client_module.SOURCE_PUBLISHED_AT_FALLBACK,
     }
+
+    watermark_statement, watermark_params = db.execute.call_args_list[2].args
+    assert "GREATEST(" in str(watermark_statement)
+    assert watermark_params == {
+        "feed_id": 10,
+        "latest_published_at": source_ingest_db_client_module.SOURCE_PUBLISHED_AT_FALLBACK,
+        "new_article_count": 1,
+    }
+
+
+def test_upsert_sources_for_feed_does_not_count_existing_links() -> None:
+    db = Mock(spec=Session)
+    payload = _build_payload(status="success")
+
+    first_execute = Mock()
+    first_execute.mappings.return_value.first.return_value = {
+        "id": 77,
+        "published_at": source_ingest_db_client_module.SOURCE_PUBLISHED_AT_FALLBACK,
+    }
+    second_execute = Mock()
+    second_execute.scalar_one_or_none.return_value = None
+    db.execute.side_effect = [first_execute, second_execute, Mock()]
+
+    _, new_article_count = source_ingest_db_client_module.upsert_sources_for_feed(db, payload=payload)
+
+    watermark_params = db.execute.call_args_list[2].args[1]
+    assert watermark_params["new_article_count"] == 0
+    assert new_article_count == 0
+
+
+def test_refresh_source_listing_rows_skips_empty_keys() -> None:
+    db = Mock(spec=Session)
+
+    source_ingest_db_client_module.refresh_source_listing_rows(db, source_keys=[])
+
+    db.execute.assert_not_called()
+
+
+def test_refresh_source_listing_rows_refreshes_deduplicated_keys() -> None:
+    db = Mock(spec=Session)
+    published_at = datetime(2026, 2, 26, 10, 0, tzinfo=timezone.utc)
+
+    source_ingest_db_client_module.refresh_source_listing_rows(
+        db,
+        source_keys=[(78, published_at), (77, published_at), (78, published_at)],
+    )
+
+    db.execute.assert_called_once()
+    statement, params = db.execute.call_args.args
+    assert "refresh_rss_source_listing(:source_ids, :published_ats)" in str(statement)
+    assert "rss_company_source_counts" not in str(statement)
+    assert params == {
+        "source_ids": [77, 78],
+        "published_ats": [published_at, published_at],
+    }
+
+
+def test_copy_sources_for_results_streams_sources_then_links_them_in_one_statement() -> None:
+    db = Mock(spec=Session)
+    cursor = Mock()
+    copied_rows: list[str] = []
+    cursor.copy_expert.side_effect = lambda statement, buffer: copied_rows.extend(buffer.read().splitlines())
+    db.connection.return_value.connection.cursor.return_value = cursor
+    linked_execute = Mock()
+    linked_execute.mappings.return_value.all.return_value = [
+        {
+            "source_id": 77,
+            "published_at": source_ingest_db_client_module.SOURCE_PUBLISHED_AT_FALLBACK,
+            "new_link_count": 1,
+        },
+    ]
+    db.execute.side_effect = [Mock(), Mock(), linked_execute]
+    payloads = [_build_payload(), _build_payload(status="error")]
+
+    linked_source_keys, new_article_count = source_ingest_db_client_module.copy_sources_for_results(
+        db,
+        payloads=payloads,
+    )
+
+    assert linked_source_keys == [(77, source_ingest_db_client_module.SOURCE_PUBLISHED_AT_FALLBACK)]
+    assert new_article_count == 1
+    assert copied_rows == [
+        "0,10,Article A,summary,author,https://example.com/article-a,1970-01-01T00:00:00+00:00,"
+        "https://example.com/image.jpg"
+    ]
+    assert "FROM STDIN WITH (FORMAT csv)" in cursor.copy_expert.call_args.args[0]
+    cursor.close.assert_called_once()
+    assert db.execute.call_count == 3
+
+
+def test_copy_sources_for_results_skips_results_without_sources() -> None:
+    db = Mock(spec=Session)
+
+    linked_source_keys, new_article_count = source_ingest_db_client_module.copy_sources_for_results(
+        db,
+        payloads=[_build_payload(status="error")],
+    )
+
+    assert (linked_source_keys, new_article_count) == ([], 0)
+    db.execute.assert_not_called()
@@ -6,6 +6,28 @@ from redis.exceptions import ResponseError
 
 import app.clients.queue.redis_queue_client as redis_queue_client_module
 from app.errors.db_manager_exceptions import DBManagerQueueError
+from app.utils import MetricsRegistry
+
+
+class FakePipeline:
+    def __init__(self, redis_client) -> None:
+        self._redis_client = redis_client
+        self._commands: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+
+        return _queue
+
+    async def execute(self) -> list:
+        return [await getattr(self._redis_client, name)(*args, **kwargs) for name, args, kwargs in self._commands]
 
 
 def test_ensure_consumer_groups_ignores_busygroup(monkeypatch) -> None:
@@ -68,22 +90,79 @@ def test_read_worker_results_decodes_records(monkeypatch) -> None:
     ]
 
 
-def test_read_worker_results_raises_on_invalid_json(monkeypatch) -> None:
+def test_read_worker_results_dead_letters_invalid_json(monkeypatch) -> None:
+    dead_letters: list[tuple[str, dict]] = []
+    xack_calls: list[tuple[str, str]] = []
+    metrics = MetricsRegistry()
+
     class FakeRedis:
         async def xreadgroup(self, group_name, consumer_name, streams, count, block):
             return [
-                (b"rss_check_results", [(b"1-0", {b"payload": b"not-json"})]),
+                (
+                    b"rss_check_results",
+                    [
+                        (b"1-0", {b"payload": b"not-json"}),
+                        (b"2-0", {b"payload": b'{"job_id":"job-1"}'}),
+                    ],
+                ),
             ]
 
+        async def xadd(self, name, fields, maxlen, approximate):
+            dead_letters.append((name, fields))
+
+        async def xack(self, stream_name, group_name, message_id):
+            xack_calls.append((stream_name, message_id))
+
+        def pipeline(self, transaction):
+            assert transaction is True
+            return FakePipeline(self)
+
     monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
-    monkeypatch.setattr(redis_queue_client_module, "DEFAULT_REDIS_GROUP_DB_MANAGER", "db_manager_group")
-    monkeypatch.setattr(redis_queue_client_module, "DEFAULT_REDIS_CONSUMER_NAME", "db_manager_1")
-    monkeypatch.setattr(redis_queue_client_module, "DEFAULT_REDIS_QUEUE_CHECK", "rss_check_results")
-    monkeypatch.setattr(redis_queue_client_module, "DEFAULT_REDIS_QUEUE_INGEST", "rss_ingest_results")
-    monkeypatch.setattr(redis_queue_client_module, "DEFAULT_REDIS_QUEUE_ERRORS", "error_feeds_parsing")
+    monkeypatch.setattr(redis_queue_client_module, "db_manager_metrics", metrics)
 
-    with pytest.raises(DBManagerQueueError, match="Invalid result payload"):
-        asyncio.run(redis_queue_client_module.read_worker_results())
+    results = asyncio.run(redis_queue_client_module.read_worker_results())
+
+    assert results == [("rss_check_results", "2-0", {"job_id": "job-1"})]
+    assert xack_calls == [("rss_check_results", "1-0")]
+    stream_name, fields = dead_letters[0]
+    assert stream_name == "rss_dead_letters"
+    assert fields["source_stream"] == "rss_check_results"
+    assert fields["source_group"] == "db_manager_group"
+    assert fields["payload"] == "not-json"
+    assert fields["reason"].startswith("invalid_json: ")
+    assert fields["service"] == "db_manager"
+    assert metrics.get_counter("db_manager_dead_letters_total", reason="invalid_json") == 1
+
+
+def test_read_pending_worker_results_acks_entries_without_payload(monkeypatch) -> None:
+    xack_calls: list[tuple[str, str]] = []
+
+    class FakeRedis:
+        async def xreadgroup(self, group_name, consumer_name, streams, count, block):
+            assert streams == {"rss_check_results": "0"}
+            assert block is None
+            return [
+                (
+                    b"rss_check_results",
+                    [
+                        (b"1-0", None),
+                        (b"2-0", {b"payload": b'{"job_id":"job-1"}'}),
+                    ],
+                )
+            ]
+
+        async def xack(self, stream_name, group_name, message_id):
+            xack_calls.append((stream_name, message_id))
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    last_message_id, results = asyncio.run(
+        redis_queue_client_module.read_pending_worker_results(stream_name="rss_check_results")
+    )
+
+    assert last_message_id == "2-0"
+    assert results == [("rss_check_results", "2-0", {"job_id": "job-1"})]
+    assert xack_calls == [("rss_check_results", "1-0")]
 
 
 def test_ack_worker_result_uses_group_name(monkeypatch) -> None:
@@ -141,3 +220,100 @@ def test_ack_worker_result_retries_after_connection_drop(monkeypatch) -> None:
 
     assert len(xack_attempts) == 2
     assert close_calls == ["closed"]
+
+
+def test_read_consumer_group_backlog_returns_lag_and_pending_for_db_manager_group(monkeypatch) -> None:
+    class FakeRedis:
+        async def xinfo_groups(self, stream_name):
+            return [
+                {"name": b"other_group", "lag": 99, "pending": 99},
+                {"name": b"db_manager_group", "lag": 7, "pending": 2},
+            ]
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+    monkeypatch.setattr(redis_queue_client_module, "DEFAULT_REDIS_GROUP_DB_MANAGER", "db_manager_group")
+
+    backlog = asyncio.run(redis_queue_client_module.read_consumer_group_backlog("rss_check_results"))
+
+    assert backlog == (7, 2)
+
+
+def test_read_consumer_group_backlog_returns_none_for_missing_stream(monkeypatch) -> None:
+    class FakeRedis:
+        async def xinfo_groups(self, stream_name):
+            raise ResponseError("ERR no such key")
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    assert asyncio.run(redis_queue_client_module.read_consumer_group_backlog("rss_check_results")) is None
+
+
+def test_read_worker_result_delivery_counts_reads_each_entry(monkeypatch) -> None:
+    class FakeRedis:
+        async def xpending_range(self, name, groupname, min, max, count):  # noqa: A002
+            assert (name, groupname, min == max, count) == ("rss_ingest_results", "db_manager_group", True, 1)
+            if min == "2-0":
+                return []
+            return [{"message_id": min.encode(), "times_delivered": 4}]
+
+        def pipeline(self, transaction):
+            return FakePipeline(self)
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    delivery_counts = asyncio.run(
+        redis_queue_client_module.read_worker_result_delivery_counts("rss_ingest_results", ["1-0", "2-0"])
+    )
+
+    assert delivery_counts == {"1-0": 4}
+
+
+def test_replay_dead_letter_publishes_payload_and_deletes_entry(monkeypatch) -> None:
+    calls: list[tuple] = []
+
+    class FakeRedis:
+        async def xadd(self, name, fields):
+            calls.append(("xadd", name, fields))
+            return b"9-0"
+
+        async def xdel(self, name, *entry_ids):
+            calls.append(("xdel", name, entry_ids))
+            return 1
+
+        def pipeline(self, transaction):
+            assert transaction is True
+            return FakePipeline(self)
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    message_id = asyncio.run(
+        redis_queue_client_module.replay_dead_letter(
+            entry_id="5-0",
+            target_stream="rss_ingest_results",
+            payload_json='{"job_id":"job-1"}',
+        )
+    )
+
+    assert message_id == "9-0"
+    assert calls == [
+        ("xadd", "rss_ingest_results", {"payload": '{"job_id":"job-1"}'}),
+        ("xdel", "rss_dead_letters", ("5-0",)),
+    ]
+
+
+def test_read_worker_result_range_decodes_payloads_and_keeps_invalid_entries(monkeypatch) -> None:
+    class FakeRedis:
+        async def xrange(self, name, min, max, count):  # noqa: A002
+            assert (name, min, max, count) == ("rss_ingest_results", "(5-0", "+", 2)
+            return [
+                (b"6-0", {b"payload": b'{"job_id":"job-1"}'}),
+                (b"7-0", {b"payload": b"not-json"}),
+            ]
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    entries = asyncio.run(
+        redis_queue_client_module.read_worker_result_range("rss_ingest_results", start_id="(5-0", count=2)
+    )
+
+    assert entries == [("6-0", {"job_id": "job-1"}), ("7-0", None)]
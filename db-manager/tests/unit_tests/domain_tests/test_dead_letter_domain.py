@@ -0,0 +1,62 @@
+import pytest
+
+from app.domain.dead_letter_domain import (
+    apply_payload_overrides,
+    matches_dead_letter_filters,
+    parse_payload_override,
+)
+
+
+def test_parse_payload_override_decodes_json_value() -> None:
+    assert parse_payload_override("sources.0.url=\"https://example.com/a\"") == (
+        ["sources", "0", "url"],
+        "https://example.com/a",
+    )
+    assert parse_payload_override("fetchprotection=1") == (["fetchprotection"], 1)
+    assert parse_payload_override("error_message=null") == (["error_message"], None)
+
+
+def test_parse_payload_override_rejects_invalid_values() -> None:
+    with pytest.raises(ValueError, match="path=json_value"):
+        parse_payload_override("fetchprotection")
+    with pytest.raises(ValueError, match="not valid JSON"):
+        parse_payload_override("status=success")
+
+
+def test_apply_payload_overrides_updates_nested_fields_without_mutating_input() -> None:
+    payload = {"status": "error", "sources": [{"url": "bad"}]}
+
+    updated_payload = apply_payload_overrides(
+        payload,
+        [
+            (["sources", "0", "url"], "https://example.com/a"),
+            (["timings", "fetch_ms"], 12),
+        ],
+    )
+
+    assert updated_payload == {
+        "status": "error",
+        "sources": [{"url": "https://example.com/a"}],
+        "timings": {"fetch_ms": 12},
+    }
+    assert payload == {"status": "error", "sources": [{"url": "bad"}]}
+
+
+def test_apply_payload_overrides_rejects_out_of_range_index() -> None:
+    with pytest.raises(ValueError, match="out of range"):
+        apply_payload_overrides({"sources": []}, [(["sources", "0", "url"], "x")])
+
+
+def test_matches_dead_letter_filters_on_stream_and_reason() -> None:
+    assert matches_dead_letter_filters(
+        source_stream="rss_ingest_results",
+        reason="max_deliveries_exceeded: persist_failed: Timeout",
+        stream_name="rss_ingest_results",
+        reason_contains="timeout",
+    )
+    assert not matches_dead_letter_filters(
+        source_stream="rss_check_results",
+        reason="invalid_schema",
+        stream_name="rss_ingest_results",
+        reason_contains=None,
+    )
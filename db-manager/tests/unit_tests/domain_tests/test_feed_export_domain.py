@@ -0,0 +1,32 @@
+import pytest
+
+from app.domain.feed_export_domain import normalize_company_host, parse_opml_feed_urls
+
+
+def test_parse_opml_feed_urls_reads_nested_outlines_once() -> None:
+    opml = b"""
+    <opml version="2.0">
+      <body>
+        <outline text="News">
+          <outline type="rss" text="A" xmlUrl="https://example.com/a.xml" />
+          <outline type="rss" text="B" xmlUrl=" https://example.com/b.xml " />
+        </outline>
+        <outline type="rss" text="A again" xmlUrl="https://example.com/a.xml" />
+        <outline text="Folder without feed" />
+      </body>
+    </opml>
+    """
+
+    assert parse_opml_feed_urls(opml) == ["https://example.com/a.xml", "https://example.com/b.xml"]
+
+
+def test_parse_opml_feed_urls_rejects_invalid_xml() -> None:
+    with pytest.raises(ValueError):
+        parse_opml_feed_urls(b"<opml><body>")
+
+
+def test_normalize_company_host_accepts_hosts_and_urls() -> None:
+    assert normalize_company_host(" Example.COM ") == "example.com"
+    assert normalize_company_host("https://www.example.com/news") == "www.example.com"
+    assert normalize_company_host("  ") is None
+    assert normalize_company_host(None) is None
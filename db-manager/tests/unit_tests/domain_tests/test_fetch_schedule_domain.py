@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+
+from app.domain.fetch_schedule_domain import (
+    resolve_feed_fresh_until,
+    resolve_next_fetch_interval_seconds,
+)
+
+
+def _resolve(current_interval_seconds: int, *, status: str, new_article_count: int) -> int:
+    return resolve_next_fetch_interval_seconds(
+        current_interval_seconds,
+        status=status,
+        new_article_count=new_article_count,
+        min_interval_seconds=300,
+        max_interval_seconds=86400,
+    )
+
+
+def test_resolve_next_fetch_interval_grows_for_quiet_feeds() -> None:
+    assert _resolve(3600, status="not_modified", new_article_count=0) == 5400
+    assert _resolve(3600, status="success", new_article_count=0) == 5400
+    assert _resolve(3600, status="error", new_article_count=0) == 7200
+
+
+def test_resolve_next_fetch_interval_follows_publish_frequency() -> None:
+    assert _resolve(3600, status="success", new_article_count=1) == 3600
+    assert _resolve(3600, status="success", new_article_count=2) == 1800
+    assert _resolve(3600, status="success", new_article_count=12) == 1800
+
+
+def test_resolve_next_fetch_interval_stays_within_bounds() -> None:
+    assert _resolve(400, status="success", new_article_count=5) == 300
+    assert _resolve(80000, status="not_modified", new_article_count=0) == 86400
+
+
+def test_resolve_feed_fresh_until_uses_longest_declared_window() -> None:
+    fetched_at = datetime(2026, 3, 8, 10, 15, tzinfo=timezone.utc)
+
+    assert resolve_feed_fresh_until(
+        fetched_at=fetched_at,
+        ttl_seconds=1800,
+        skip_hours=[],
+        cache_expires_at=fetched_at + timedelta(hours=2),
+        max_fresh_seconds=86400,
+    ) == fetched_at + timedelta(hours=2)
+    assert resolve_feed_fresh_until(
+        fetched_at=fetched_at,
+        ttl_seconds=10**9,
+        skip_hours=[],
+        cache_expires_at=None,
+        max_fresh_seconds=86400,
+    ) == fetched_at + timedelta(days=1)
+    assert resolve_feed_fresh_until(
+        fetched_at=fetched_at,
+        ttl_seconds=None,
+        skip_hours=[],
+        cache_expires_at=None,
+        max_fresh_seconds=86400,
+    ) is None
+
+
+def test_resolve_feed_fresh_until_skips_declared_hours() -> None:
+    fetched_at = datetime(2026, 3, 8, 22, 40, tzinfo=timezone.utc)
+
+    assert resolve_feed_fresh_until(
+        fetched_at=fetched_at,
+        ttl_seconds=600,
+        skip_hours=[22, 23, 0],
+        cache_expires_at=None,
+        max_fresh_seconds=86400,
+    ) == datetime(2026, 3, 9, 1, 0, tzinfo=timezone.utc)
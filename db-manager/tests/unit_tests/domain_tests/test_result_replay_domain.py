@@ -0,0 +1,22 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.domain.result_replay_domain import parse_stream_message_id, resolve_stream_message_time
+
+
+def test_parse_stream_message_id_orders_by_time_then_sequence() -> None:
+    assert parse_stream_message_id("1700000000000-2") == (1700000000000, 2)
+    assert parse_stream_message_id("1700000000000") == (1700000000000, 0)
+    assert parse_stream_message_id("9-0") < parse_stream_message_id("10-0")
+
+
+def test_parse_stream_message_id_rejects_invalid_ids() -> None:
+    with pytest.raises(ValueError, match="Invalid stream message id"):
+        parse_stream_message_id("abc-1")
+
+
+def test_resolve_stream_message_time_uses_id_milliseconds() -> None:
+    assert resolve_stream_message_time("1700000000500-0") == datetime(
+        2023, 11, 14, 22, 13, 20, 500000, tzinfo=timezone.utc
+    )
@@ -0,0 +1,66 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import app.services.db_manager_metrics_service as db_manager_metrics_service_module
+from app.errors import DBManagerQueueError
+from app.utils import MetricsRegistry
+
+
+def test_db_manager_metrics_server_serves_metrics_and_404(monkeypatch) -> None:
+    registry = MetricsRegistry()
+    registry.increment("db_manager_messages_total", stream="rss_check_results", outcome="persisted")
+    monkeypatch.setattr(db_manager_metrics_service_module, "db_manager_metrics", registry)
+
+    async def request(server_port: int, path: str) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", server_port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("latin-1"))
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    async def run() -> tuple[bytes, bytes]:
+        server = await db_manager_metrics_service_module.start_db_manager_metrics_server(port=0)
+        assert server is not None
+        server_port = server.sockets[0].getsockname()[1]
+        try:
+            return await request(server_port, "/metrics"), await request(server_port, "/other")
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    metrics_response, missing_response = asyncio.run(run())
+
+    assert metrics_response.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert metrics_response.endswith(
+        b'db_manager_messages_total{outcome="persisted",stream="rss_check_results"} 1\n'
+    )
+    assert missing_response.startswith(b"HTTP/1.1 404 Not Found\r\n")
+
+
+def test_record_consumer_lag_sets_gauges_per_stream(monkeypatch) -> None:
+    registry = MetricsRegistry()
+    backlogs = {
+        "rss_check_results": (12, 3),
+        "rss_ingest_results": (None, 4),
+        "error_feeds_parsing": None,
+    }
+
+    async def fake_read_consumer_group_backlog(stream_name: str):
+        if stream_name == "error_feeds_parsing":
+            raise DBManagerQueueError("redis down")
+        return backlogs[stream_name]
+
+    monkeypatch.setattr(db_manager_metrics_service_module, "db_manager_metrics", registry)
+    monkeypatch.setattr(
+        db_manager_metrics_service_module,
+        "read_consumer_group_backlog",
+        AsyncMock(side_effect=fake_read_consumer_group_backlog),
+    )
+
+    asyncio.run(db_manager_metrics_service_module.record_consumer_lag())
+
+    assert registry.get_gauge("db_manager_consumer_lag", stream="rss_check_results") == 12
+    assert registry.get_gauge("db_manager_consumer_pending", stream="rss_check_results") == 3
+    assert registry.get_gauge("db_manager_consumer_pending", stream="rss_ingest_results") == 4
+    assert 'db_manager_consumer_lag{stream="rss_ingest_results"}' not in registry.render()
@@ -0,0 +1,110 @@
+import asyncio
+import json
+
+import pytest
+
+import app.services.dead_letter_service as dead_letter_service_module
+from app.errors import DBManagerError
+from app.schemas import DeadLetterSchema
+
+
+def _dead_letter_fields(source_stream: str, reason: str, payload: str = '{"job_id":"job-1"}') -> dict[str, str]:
+    return {
+        "source_stream": source_stream,
+        "source_group": "db_manager_group",
+        "message_id": "1-0",
+        "payload": payload,
+        "reason": reason,
+        "delivery_count": "6",
+        "failed_at": "2026-10-01T00:00:00+00:00",
+        "service": "db_manager",
+    }
+
+
+def test_list_dead_letters_pages_and_filters(monkeypatch) -> None:
+    read_calls: list[str] = []
+    monkeypatch.setattr(dead_letter_service_module, "_DEAD_LETTER_PAGE_SIZE", 2)
+
+    async def fake_read_dead_letters(*, start_id: str, count: int):
+        read_calls.append(start_id)
+        pages = {
+            "-": [
+                ("1-0", _dead_letter_fields("rss_check_results", "invalid_schema")),
+                ("2-0", _dead_letter_fields("rss_ingest_results", "max_deliveries_exceeded")),
+            ],
+            "(2-0": [("3-0", _dead_letter_fields("rss_ingest_results", "invalid_json"))],
+        }
+        return pages[start_id]
+
+    monkeypatch.setattr(dead_letter_service_module, "read_dead_letters", fake_read_dead_letters)
+
+    dead_letters = asyncio.run(
+        dead_letter_service_module.list_dead_letters(stream_name="rss_ingest_results", limit=10)
+    )
+
+    assert read_calls == ["-", "(2-0"]
+    assert [dead_letter.entry_id for dead_letter in dead_letters] == ["2-0", "3-0"]
+    assert dead_letters[0].delivery_count == 6
+
+
+def test_replay_dead_letters_applies_overrides_before_publishing(monkeypatch) -> None:
+    replayed: list[dict] = []
+
+    async def fake_replay_dead_letter(**kwargs) -> str:
+        replayed.append(kwargs)
+        return "9-0"
+
+    monkeypatch.setattr(dead_letter_service_module, "replay_dead_letter", fake_replay_dead_letter)
+    dead_letter = DeadLetterSchema(
+        entry_id="5-0",
+        **_dead_letter_fields("rss_ingest_results", "invalid_schema", '{"fetchprotection": 7}'),
+    )
+
+    results = asyncio.run(
+        dead_letter_service_module.replay_dead_letters(
+            [dead_letter],
+            overrides=[(["fetchprotection"], 1)],
+        )
+    )
+
+    assert replayed == [
+        {
+            "entry_id": "5-0",
+            "target_stream": "rss_ingest_results",
+            "payload_json": '{"fetchprotection": 1}',
+        }
+    ]
+    assert results == [(dead_letter, '{"fetchprotection": 1}', "9-0")]
+
+
+def test_replay_dead_letters_aborts_before_publishing_when_a_fixup_fails(monkeypatch) -> None:
+    async def fake_replay_dead_letter(**kwargs) -> str:
+        raise AssertionError("nothing must be replayed")
+
+    monkeypatch.setattr(dead_letter_service_module, "replay_dead_letter", fake_replay_dead_letter)
+    dead_letters = [
+        DeadLetterSchema(entry_id="5-0", **_dead_letter_fields("rss_ingest_results", "invalid_schema")),
+        DeadLetterSchema(entry_id="6-0", **_dead_letter_fields("rss_ingest_results", "invalid_json", "not-json")),
+    ]
+
+    with pytest.raises(DBManagerError, match="Cannot fix up dead letter 6-0"):
+        asyncio.run(
+            dead_letter_service_module.replay_dead_letters(
+                dead_letters,
+                overrides=[(["fetchprotection"], 1)],
+            )
+        )
+
+
+def test_load_dead_letters_file_accepts_exported_payload_objects(tmp_path) -> None:
+    dead_letter = DeadLetterSchema(entry_id="5-0", **_dead_letter_fields("rss_ingest_results", "invalid_schema"))
+    export_path = tmp_path / "dead_letters.jsonl"
+    exported = dead_letter_service_module.export_dead_letter(dead_letter)
+    exported["payload"]["job_id"] = "job-2"
+    export_path.write_text(json.dumps(exported) + "\n\n", encoding="utf-8")
+
+    loaded = dead_letter_service_module.load_dead_letters_file(export_path)
+
+    assert len(loaded) == 1
+    assert loaded[0].entry_id == "5-0"
+    assert json.loads(loaded[0].payload) == {"job_id": "job-2"}
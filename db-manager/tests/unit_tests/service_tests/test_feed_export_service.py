@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock, Mock
+
+import app.services.feed_export_service as feed_export_service_module
+
+
+def test_export_feeds_matches_opml_urls_and_reports_unknown_ones(monkeypatch, tmp_path) -> None:
+    opml_path = tmp_path / "feeds.opml"
+    opml_path.write_text(
+        '<opml><body><outline xmlUrl="https://example.com/a.xml" />'
+        '<outline xmlUrl="https://example.com/unknown.xml" /></body></opml>',
+        encoding="utf-8",
+    )
+    db = MagicMock()
+    list_feeds_mock = Mock(
+        return_value=[
+            {
+                "feed_id": 4,
+                "feed_url": "https://example.com/a.xml",
+                "company_id": 2,
+                "company_host": "https://Example.com",
+                "fetchprotection": 2,
+            }
+        ]
+    )
+    monkeypatch.setattr(feed_export_service_module, "get_db_session", Mock(return_value=db))
+    monkeypatch.setattr(feed_export_service_module, "list_feeds_for_export", list_feeds_mock)
+
+    feeds, unmatched_urls = feed_export_service_module.export_feeds(opml_path=opml_path)
+
+    assert feeds == [
+        {
+            "feed_id": 4,
+            "feed_url": "https://example.com/a.xml",
+            "company_id": 2,
+            "host_header": "example.com",
+            "fetchprotection": 2,
+        }
+    ]
+    assert unmatched_urls == ["https://example.com/unknown.xml"]
+    list_feeds_mock.assert_called_once_with(
+        db,
+        feed_urls=["https://example.com/a.xml", "https://example.com/unknown.xml"],
+        enabled_only=True,
+    )
+    db.close.assert_called_once()
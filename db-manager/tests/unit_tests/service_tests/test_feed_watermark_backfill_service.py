@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+import app.services.feed_watermark_backfill_service as backfill_service_module
+from app.errors import DBManagerError
+
+
+def test_run_feed_watermark_backfill_walks_feed_batches(monkeypatch) -> None:
+    sessions: list[Mock] = []
+    calls: list[tuple[int, int]] = []
+    last_feed_ids = iter([25, 40, None])
+
+    def fake_get_db_session():
+        db = Mock(spec=Session)
+        sessions.append(db)
+        return db
+
+    def fake_backfill(db, *, after_feed_id: int, batch_size: int):
+        calls.append((after_feed_id, batch_size))
+        return next(last_feed_ids)
+
+    monkeypatch.setattr(backfill_service_module, "get_db_session", fake_get_db_session)
+    monkeypatch.setattr(backfill_service_module, "backfill_feed_article_watermarks", fake_backfill)
+
+    backfilled_batches = backfill_service_module.run_feed_watermark_backfill(batch_size=25)
+
+    assert backfilled_batches == 2
+    assert calls == [(0, 25), (25, 25), (40, 25)]
+    for db in sessions:
+        db.commit.assert_called_once()
+        db.close.assert_called_once()
+
+
+def test_run_feed_watermark_backfill_rolls_back_failed_batch(monkeypatch) -> None:
+    db = Mock(spec=Session)
+
+    def fake_backfill(db, *, after_feed_id: int, batch_size: int):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(backfill_service_module, "get_db_session", lambda: db)
+    monkeypatch.setattr(backfill_service_module, "backfill_feed_article_watermarks", fake_backfill)
+
+    with pytest.raises(RuntimeError):
+        backfill_service_module.run_feed_watermark_backfill()
+
+    db.rollback.assert_called_once()
+    db.commit.assert_not_called()
+    db.close.assert_called_once()
+
+
+def test_run_feed_watermark_backfill_rejects_invalid_batch_size() -> None:
+    with pytest.raises(DBManagerError):
+        backfill_service_module.run_feed_watermark_backfill(batch_size=0)
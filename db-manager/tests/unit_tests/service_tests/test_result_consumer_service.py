@@ -1,7 +1,11 @@
 import asyncio
-from unittest.mock import Mock
+import itertools
+from unittest.mock import AsyncMock, Mock
+
+from sqlalchemy.exc import OperationalError
 
 import app.services.result_consumer_service as result_consumer_service_module
+from app.utils import MetricsRegistry
 
 
 def _valid_worker_payload() -> dict:
@@ -19,13 +23,17 @@ def _valid_worker_payload() -> dict:
     }
 
 
-def test_process_result_message_acks_invalid_payload(monkeypatch) -> None:
-    acked_messages: list[tuple[str, str]] = []
+def test_process_result_message_dead_letters_invalid_payload(monkeypatch) -> None:
+    dead_letters: list[dict] = []
 
-    async def fake_ack_worker_result(stream_name: str, message_id: str) -> None:
-        acked_messages.append((stream_name, message_id))
+    async def fake_dead_letter_worker_result(**kwargs) -> None:
+        dead_letters.append(kwargs)
 
-    monkeypatch.setattr(result_consumer_service_module, "ack_worker_result", fake_ack_worker_result)
+    monkeypatch.setattr(
+        result_consumer_service_module,
+        "dead_letter_worker_result",
+        fake_dead_letter_worker_result,
+    )
     monkeypatch.setattr(
         result_consumer_service_module,
         "get_db_session",
@@ -40,7 +48,11 @@ def test_process_result_message_acks_invalid_payload(monkeypatch) -> None:
         )
     )
 
-    assert acked_messages == [("rss_check_results", "1-0")]
+    assert len(dead_letters) == 1
+    assert dead_letters[0]["stream_name"] == "rss_check_results"
+    assert dead_letters[0]["message_id"] == "1-0"
+    assert dead_letters[0]["payload_raw"] == '{"invalid": "payload"}'
+    assert dead_letters[0]["reason"].startswith("invalid_schema: ")
 
 
 def test_process_result_message_commits_and_acks_on_success(monkeypatch) -> None:
@@ -109,3 +121,256 @@ def test_process_result_message_rolls_back_without_ack_when_persist_fails(monkey
     db.rollback.assert_called_once()
     db.close.assert_called_once()
     assert acked_messages == []
+    assert result_consumer_service_module._failure_reasons.pop(("error_feeds_parsing", "3-0")) == (
+        "persist_failed: db write failed"
+    )
+
+
+def test_dead_letter_exhausted_results_uses_last_failure_reason(monkeypatch) -> None:
+    dead_letters: list[dict] = []
+    metrics = MetricsRegistry()
+
+    async def fake_read_worker_result_delivery_counts(stream_name: str, message_ids: list[str]):
+        assert message_ids == ["1-0", "2-0"]
+        return {"1-0": 6, "2-0": 2}
+
+    async def fake_dead_letter_worker_result(**kwargs) -> None:
+        dead_letters.append(kwargs)
+
+    monkeypatch.setattr(
+        result_consumer_service_module,
+        "read_worker_result_delivery_counts",
+        fake_read_worker_result_delivery_counts,
+    )
+    monkeypatch.setattr(
+        result_consumer_service_module,
+        "dead_letter_worker_result",
+        fake_dead_letter_worker_result,
+    )
+    monkeypatch.setattr(result_consumer_service_module, "db_manager_metrics", metrics)
+    monkeypatch.setattr(
+        result_consumer_service_module,
+        "_failure_reasons",
+        {("rss_ingest_results", "1-0"): "persist_failed: connection refused"},
+    )
+
+    remaining_messages = asyncio.run(
+        result_consumer_service_module._dead_letter_exhausted_results(
+            "rss_ingest_results",
+            [
+                ("rss_ingest_results", "1-0", {"job_id": "poison"}),
+                ("rss_ingest_results", "2-0", {"job_id": "retry"}),
+            ],
+            max_deliveries=5,
+        )
+    )
+
+    assert remaining_messages == [("rss_ingest_results", "2-0", {"job_id": "retry"})]
+    assert dead_letters == [
+        {
+            "stream_name": "rss_ingest_results",
+            "message_id": "1-0",
+            "payload_raw": '{"job_id": "poison"}',
+            "reason": "max_deliveries_exceeded: persist_failed: connection refused",
+            "delivery_count": 6,
+        }
+    ]
+    assert result_consumer_service_module._failure_reasons == {}
+    assert metrics.get_counter(
+        "db_manager_messages_total",
+        stream="rss_ingest_results",
+        outcome="dead_lettered",
+    ) == 1
+
+
+def test_process_result_batch_leaves_messages_pending_after_drain_timeout(monkeypatch) -> None:
+    processed: list[str] = []
+    monotonic_values = itertools.count(start=0.0, step=5.0)
+
+    async def fake_process_result_message(*, stream_name: str, message_id: str, payload_raw: dict) -> None:
+        processed.append(message_id)
+
+    monkeypatch.setattr(result_consumer_service_module, "_process_result_message", fake_process_result_message)
+    monkeypatch.setattr(result_consumer_service_module.time, "monotonic", lambda: next(monotonic_values))
+
+    async def run() -> None:
+        stop_event = asyncio.Event()
+        stop_event.set()
+        await result_consumer_service_module._process_result_batch(
+            [
+                ("rss_check_results", "1-0", {}),
+                ("rss_check_results", "2-0", {}),
+                ("rss_check_results", "3-0", {}),
+            ],
+            stop_event=stop_event,
+            drain_timeout_seconds=1.0,
+        )
+
+    asyncio.run(run())
+
+    assert processed == ["1-0"]
+
+
+def test_run_result_consumer_resumes_pending_then_closes_clients_when_stopped(monkeypatch) -> None:
+    calls: list[str] = []
+    engine = Mock()
+
+    async def fake_ensure_consumer_groups() -> None:
+        return None
+
+    async def fake_read_pending_worker_results(*, stream_name: str, after_id: str, count: int):
+        calls.append(f"pending:{stream_name}:{after_id}")
+        return None, []
+
+    async def fake_read_worker_results(*, count: int, block_ms: int):
+        calls.append("read")
+        stop_event.set()
+        return []
+
+    async def fake_close_redis_client() -> None:
+        calls.append("closed")
+
+    monkeypatch.setattr(result_consumer_service_module, "ensure_consumer_groups", fake_ensure_consumer_groups)
+    monkeypatch.setattr(
+        result_consumer_service_module,
+        "read_pending_worker_results",
+        fake_read_pending_worker_results,
+    )
+    monkeypatch.setattr(result_consumer_service_module, "read_worker_results", fake_read_worker_results)
+    monkeypatch.setattr(result_consumer_service_module, "close_redis_client", fake_close_redis_client)
+    monkeypatch.setattr(result_consumer_service_module, "engine", engine)
+    monkeypatch.setattr(result_consumer_service_module, "install_default_statement_profiling", Mock())
+    monkeypatch.setattr(result_consumer_service_module, "start_db_manager_metrics_server", AsyncMock(return_value=None))
+    monkeypatch.setattr(result_consumer_service_module, "monitor_consumer_lag", AsyncMock())
+
+    stop_event = asyncio.Event()
+    asyncio.run(result_consumer_service_module.run_result_consumer(stop_event=stop_event))
+
+    assert calls == [
+        "pending:rss_check_results:0",
+        "pending:rss_ingest_results:0",
+        "pending:error_feeds_parsing:0",
+        "read",
+        "closed",
+    ]
+    engine.dispose.assert_called_once()
+
+
+def test_process_result_message_retries_deadlocked_transaction(monkeypatch) -> None:
+    acked_messages: list[tuple[str, str]] = []
+    sessions = [Mock(), Mock()]
+    registry = MetricsRegistry()
+
+    class DeadlockDetected(Exception):
+        pgcode = "40P01"
+
+    async def fake_ack_worker_result(stream_name: str, message_id: str) -> None:
+        acked_messages.append((stream_name, message_id))
+
+    persist_mock = Mock(side_effect=[OperationalError("UPDATE", {}, DeadlockDetected()), True])
+
+    monkeypatch.setattr(result_consumer_service_module, "ack_worker_result", fake_ack_worker_result)
+    monkeypatch.setattr(result_consumer_service_module, "persist_worker_result", persist_mock)
+    monkeypatch.setattr(result_consumer_service_module, "get_db_session", lambda: sessions.pop(0))
+    monkeypatch.setattr(result_consumer_service_module, "resolve_queue_kind", lambda *_args, **_kwargs: "ingest")
+    monkeypatch.setattr(result_consumer_service_module, "db_manager_metrics", registry)
+    monkeypatch.setattr(result_consumer_service_module, "_TRANSACTION_RETRY_DELAY_SECONDS", 0.0)
+
+    asyncio.run(
+        result_consumer_service_module._process_result_message(
+            stream_name="rss_ingest_results",
+            message_id="4-0",
+            payload_raw=_valid_worker_payload(),
+        )
+    )
+
+    assert persist_mock.call_count == 2
+    assert acked_messages == [("rss_ingest_results", "4-0")]
+    assert registry.get_counter("db_manager_transaction_retries_total", sqlstate="40P01") == 1
+    assert registry.get_counter(
+        "db_manager_messages_total",
+        stream="rss_ingest_results",
+        outcome="persisted",
+    ) == 1
+
+
+def test_process_result_message_gives_up_after_max_transaction_attempts(monkeypatch) -> None:
+    acked_messages: list[tuple[str, str]] = []
+    registry = MetricsRegistry()
+
+    class SerializationFailure(Exception):
+        pgcode = "40001"
+
+    async def fake_ack_worker_result(stream_name: str, message_id: str) -> None:
+        acked_messages.append((stream_name, message_id))
+
+    persist_mock = Mock(side_effect=OperationalError("UPDATE", {}, SerializationFailure()))
+
+    monkeypatch.setenv("DB_MANAGER_TRANSACTION_MAX_ATTEMPTS", "2")
+    monkeypatch.setattr(result_consumer_service_module, "ack_worker_result", fake_ack_worker_result)
+    monkeypatch.setattr(result_consumer_service_module, "persist_worker_result", persist_mock)
+    monkeypatch.setattr(result_consumer_service_module, "get_db_session", Mock)
+    monkeypatch.setattr(result_consumer_service_module, "resolve_queue_kind", lambda *_args, **_kwargs: "check")
+    monkeypatch.setattr(result_consumer_service_module, "db_manager_metrics", registry)
+    monkeypatch.setattr(result_consumer_service_module, "_TRANSACTION_RETRY_DELAY_SECONDS", 0.0)
+
+    asyncio.run(
+        result_consumer_service_module._process_result_message(
+            stream_name="rss_check_results",
+            message_id="5-0",
+            payload_raw=_valid_worker_payload(),
+        )
+    )
+
+    assert persist_mock.call_count == 2
+    assert acked_messages == []
+    assert registry.get_counter("db_manager_transaction_retries_total", sqlstate="40001") == 1
+    assert registry.get_counter(
+        "db_manager_messages_total",
+        stream="rss_check_results",
+        outcome="failed",
+    ) == 1
+
+
+def test_run_result_consumer_reclaims_failed_results_periodically(monkeypatch) -> None:
+    calls: list[str] = []
+    monotonic_values = itertools.count(start=0.0, step=20.0)
+
+    async def fake_read_pending_worker_results(*, stream_name: str, after_id: str, count: int):
+        return None, []
+
+    async def fake_read_worker_results(*, count: int, block_ms: int):
+        calls.append("read")
+        return []
+
+    async def fake_claim_idle_worker_results(*, stream_name: str, min_idle_ms: int, start_id: str, count: int):
+        calls.append(f"claim:{stream_name}:{min_idle_ms}")
+        if stream_name == "error_feeds_parsing":
+            stop_event.set()
+        return "0-0", []
+
+    monkeypatch.setenv("DB_MANAGER_PENDING_RETRY_IDLE_MS", "1000")
+    monkeypatch.setattr(result_consumer_service_module, "ensure_consumer_groups", AsyncMock())
+    monkeypatch.setattr(
+        result_consumer_service_module,
+        "read_pending_worker_results",
+        fake_read_pending_worker_results,
+    )
+    monkeypatch.setattr(result_consumer_service_module, "read_worker_results", fake_read_worker_results)
+    monkeypatch.setattr(result_consumer_service_module, "claim_idle_worker_results", fake_claim_idle_worker_results)
+    monkeypatch.setattr(result_consumer_service_module, "close_redis_client", AsyncMock())
+    monkeypatch.setattr(result_consumer_service_module, "engine", Mock())
+    monkeypatch.setattr(result_consumer_service_module, "install_default_statement_profiling", Mock())
+    monkeypatch.setattr(result_consumer_service_module, "start_db_manager_metrics_server", AsyncMock(return_value=None))
+    monkeypatch.setattr(result_consumer_service_module, "monitor_consumer_lag", AsyncMock())
+    monkeypatch.setattr(result_consumer_service_module.time, "monotonic", lambda: next(monotonic_values))
+
+    stop_event = asyncio.Event()
+    asyncio.run(result_consumer_service_module.run_result_consumer(stop_event=stop_event))
+
+    assert calls == [
+        "read",
+        "claim:rss_check_results:1000",
+        "claim:rss_ingest_results:1000",
+        "claim:error_feeds_parsing:1000",
+    ]
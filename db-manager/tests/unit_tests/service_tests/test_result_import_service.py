@@ -0,0 +1,70 @@
+import gzip
+import json
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+import app.services.result_import_service as result_import_service_module
+from app.errors import DBManagerError
+
+
+def _payload(feed_id: int) -> dict:
+    return {
+        "job_id": "reparse",
+        "ingest": True,
+        "feed_id": feed_id,
+        "feed_url": f"https://example.com/{feed_id}.xml",
+        "status": "success",
+        "fetchprotection": 1,
+        "sources": [],
+    }
+
+
+def test_run_result_import_copies_sources_in_batches(monkeypatch, tmp_path) -> None:
+    path = tmp_path / "reparsed.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as results_file:
+        for line in (_payload(1), {"invalid": True}, _payload(2), _payload(3)):
+            results_file.write(json.dumps(line) + "\n")
+    persisted_batches: list[list[int]] = []
+    db = MagicMock()
+
+    def fake_persist_sources_bulk(db_session, *, payloads, deferred_refreshes):
+        persisted_batches.append([payload.feed_id for payload in payloads])
+        deferred_refreshes.source_keys.update((payload.feed_id, None) for payload in payloads)
+        return 2 * len(payloads)
+
+    flush_mock = Mock()
+    monkeypatch.setattr(result_import_service_module, "persist_sources_bulk", fake_persist_sources_bulk)
+    monkeypatch.setattr(result_import_service_module, "flush_deferred_refreshes", flush_mock)
+    monkeypatch.setattr(result_import_service_module, "disable_synchronous_commit", Mock())
+    monkeypatch.setattr(result_import_service_module, "get_db_session", Mock(return_value=db))
+
+    report = result_import_service_module.run_result_import(path, batch_size=2)
+
+    assert persisted_batches == [[1, 2], [3]]
+    assert (report.read_count, report.imported_count, report.invalid_count) == (4, 3, 1)
+    assert (report.source_count, report.new_article_count, report.batch_count) == (3, 6, 2)
+    assert db.commit.call_count == 2
+    assert flush_mock.call_count == 2
+
+
+def test_import_result_lines_rolls_back_a_failed_batch(monkeypatch) -> None:
+    db = MagicMock()
+    monkeypatch.setattr(
+        result_import_service_module,
+        "persist_sources_bulk",
+        Mock(side_effect=RuntimeError("copy failed")),
+    )
+    monkeypatch.setattr(result_import_service_module, "disable_synchronous_commit", Mock())
+    monkeypatch.setattr(result_import_service_module, "get_db_session", Mock(return_value=db))
+
+    with pytest.raises(RuntimeError):
+        result_import_service_module.import_result_lines([json.dumps(_payload(1))])
+
+    db.rollback.assert_called_once()
+    db.close.assert_called_once()
+
+
+def test_run_result_import_rejects_non_positive_batch_size(tmp_path) -> None:
+    with pytest.raises(DBManagerError):
+        result_import_service_module.run_result_import(tmp_path / "results.jsonl", batch_size=0)
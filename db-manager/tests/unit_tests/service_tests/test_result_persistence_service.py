@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 import app.services.result_persistence_service as result_persistence_service_module
 from app.schemas.worker_result_schema import WorkerResultSchema
+from app.utils import MetricsRegistry
 
 
 def _build_payload() -> WorkerResultSchema:
@@ -26,14 +27,22 @@ def test_persist_worker_result_returns_false_for_duplicate_result(monkeypatch) -
     payload = _build_payload()
 
     insert_mock = Mock(return_value=False)
-    upsert_feed_state_mock = Mock()
-    upsert_sources_mock = Mock()
+    upsert_feed_state_mock = Mock(return_value=(None, []))
+    upsert_sources_mock = Mock(return_value=([(77, datetime(2026, 2, 26, 10, 0, tzinfo=timezone.utc))], 1))
+    refresh_listing_mock = Mock()
     refresh_job_mock = Mock()
+    update_fresh_until_mock = Mock()
+    get_interval_mock = Mock(return_value=3600)
+    update_schedule_mock = Mock()
 
     monkeypatch.setattr(result_persistence_service_module, "insert_job_result_if_new", insert_mock)
     monkeypatch.setattr(result_persistence_service_module, "upsert_feed_scraping_state", upsert_feed_state_mock)
     monkeypatch.setattr(result_persistence_service_module, "upsert_sources_for_feed", upsert_sources_mock)
+    monkeypatch.setattr(result_persistence_service_module, "refresh_source_listing_rows", refresh_listing_mock)
     monkeypatch.setattr(result_persistence_service_module, "refresh_rss_scrape_job_status", refresh_job_mock)
+    monkeypatch.setattr(result_persistence_service_module, "update_feed_fresh_until", update_fresh_until_mock)
+    monkeypatch.setattr(result_persistence_service_module, "get_feed_fetch_interval_seconds", get_interval_mock)
+    monkeypatch.setattr(result_persistence_service_module, "update_feed_fetch_schedule", update_schedule_mock)
 
     persisted = result_persistence_service_module.persist_worker_result(
         db,
@@ -49,7 +58,10 @@ def test_persist_worker_result_returns_false_for_duplicate_result(monkeypatch) -
     )
     upsert_feed_state_mock.assert_not_called()
     upsert_sources_mock.assert_not_called()
+    refresh_listing_mock.assert_not_called()
+    update_schedule_mock.assert_not_called()
     refresh_job_mock.assert_not_called()
+    update_schedule_mock.assert_not_called()
 
 
 def test_persist_worker_result_ingest_orchestrates_full_flow(monkeypatch) -> None:
@@ -57,14 +69,24 @@ def test_persist_worker_result_ingest_orchestrates_full_flow(monkeypatch) -> Non
     payload = _build_payload()
 
     insert_mock = Mock(return_value=True)
-    upsert_feed_state_mock = Mock()
-    upsert_sources_mock = Mock()
+    upsert_feed_state_mock = Mock(return_value=(None, []))
+    upsert_sources_mock = Mock(return_value=([(77, datetime(2026, 2, 26, 10, 0, tzinfo=timezone.utc))], 1))
+    refresh_listing_mock = Mock()
     refresh_job_mock = Mock()
+    update_fresh_until_mock = Mock()
+    get_interval_mock = Mock(return_value=3600)
+    update_schedule_mock = Mock()
 
     monkeypatch.setattr(result_persistence_service_module, "insert_job_result_if_new", insert_mock)
     monkeypatch.setattr(result_persistence_service_module, "upsert_feed_scraping_state", upsert_feed_state_mock)
     monkeypatch.setattr(result_persistence_service_module, "upsert_sources_for_feed", upsert_sources_mock)
+    monkeypatch.setattr(result_persistence_service_module, "refresh_source_listing_rows", refresh_listing_mock)
     monkeypatch.setattr(result_persistence_service_module, "refresh_rss_scrape_job_status", refresh_job_mock)
+    monkeypatch.setattr(result_persistence_service_module, "update_feed_fresh_until", update_fresh_until_mock)
+    monkeypatch.setattr(result_persistence_service_module, "get_feed_fetch_interval_seconds", get_interval_mock)
+    monkeypatch.setattr(result_persistence_service_module, "update_feed_fetch_schedule", update_schedule_mock)
+    registry = MetricsRegistry()
+    monkeypatch.setattr(result_persistence_service_module, "db_manager_metrics", registry)
 
     persisted = result_persistence_service_module.persist_worker_result(
         db,
@@ -75,7 +97,18 @@ def test_persist_worker_result_ingest_orchestrates_full_flow(monkeypatch) -> Non
     assert persisted is True
     upsert_feed_state_mock.assert_called_once_with(db, payload=payload)
     upsert_sources_mock.assert_called_once_with(db, payload=payload)
+    refresh_listing_mock.assert_called_once_with(
+        db,
+        source_keys=[(77, datetime(2026, 2, 26, 10, 0, tzinfo=timezone.utc))],
+    )
+    update_fresh_until_mock.assert_called_once_with(db, feed_id=10, fresh_until=None)
+    get_interval_mock.assert_called_once_with(db, feed_id=10)
+    update_schedule_mock.assert_called_once_with(db, feed_id=10, fetch_interval_seconds=3600)
     refresh_job_mock.assert_called_once_with(db, job_id="job-1")
+    for stage in ("job_result_insert", "feed_state_upsert", "sources_upsert", "status_refresh"):
+        assert registry.get_histogram_count("db_manager_persist_stage_seconds", stage=stage) == 1
+    assert registry.get_counter("db_manager_rows_upserted_total", table="rss_sources") == 1
+    assert registry.get_counter("db_manager_rows_upserted_total", table="rss_source_feeds") == 1
 
 
 def test_persist_worker_result_check_skips_source_ingest(monkeypatch) -> None:
@@ -83,16 +116,125 @@ def test_persist_worker_result_check_skips_source_ingest(monkeypatch) -> None:
     payload = _build_payload()
 
     monkeypatch.setattr(result_persistence_service_module, "insert_job_result_if_new", Mock(return_value=True))
-    monkeypatch.setattr(result_persistence_service_module, "upsert_feed_scraping_state", Mock())
+    monkeypatch.setattr(result_persistence_service_module, "upsert_feed_scraping_state", Mock(return_value=(None, [])))
     upsert_sources_mock = Mock()
     monkeypatch.setattr(result_persistence_service_module, "upsert_sources_for_feed", upsert_sources_mock)
+    refresh_listing_mock = Mock()
+    monkeypatch.setattr(result_persistence_service_module, "refresh_source_listing_rows", refresh_listing_mock)
     monkeypatch.setattr(result_persistence_service_module, "refresh_rss_scrape_job_status", Mock())
+    monkeypatch.setattr(result_persistence_service_module, "update_feed_fresh_until", Mock())
+    update_schedule_mock = Mock()
+    monkeypatch.setattr(result_persistence_service_module, "update_feed_fetch_schedule", update_schedule_mock)
 
     persisted = result_persistence_service_module.persist_worker_result(
         db,
-        payload=payload,
+        payload=payload.model_copy(update={"ingest": False}),
         queue_kind="check",
     )
 
     assert persisted is True
     upsert_sources_mock.assert_not_called()
+    refresh_listing_mock.assert_not_called()
+    update_schedule_mock.assert_not_called()
+
+
+def test_persist_worker_result_backs_off_ingest_feed_after_error(monkeypatch) -> None:
+    db = Mock(spec=Session)
+    payload = _build_payload().model_copy(update={"status": "error", "error_message": "timeout"})
+
+    monkeypatch.setattr(result_persistence_service_module, "insert_job_result_if_new", Mock(return_value=True))
+    monkeypatch.setattr(result_persistence_service_module, "upsert_feed_scraping_state", Mock(return_value=(None, [])))
+    monkeypatch.setattr(result_persistence_service_module, "refresh_rss_scrape_job_status", Mock())
+    monkeypatch.setattr(result_persistence_service_module, "update_feed_fresh_until", Mock())
+    monkeypatch.setattr(result_persistence_service_module, "get_feed_fetch_interval_seconds", Mock(return_value=1800))
+    update_schedule_mock = Mock()
+    monkeypatch.setattr(result_persistence_service_module, "update_feed_fetch_schedule", update_schedule_mock)
+    monkeypatch.delenv("FEED_FETCH_MIN_INTERVAL_SECONDS", raising=False)
+    monkeypatch.delenv("FEED_FETCH_MAX_INTERVAL_SECONDS", raising=False)
+
+    persisted = result_persistence_service_module.persist_worker_result(
+        db,
+        payload=payload,
+        queue_kind="error",
+    )
+
+    assert persisted is True
+    update_schedule_mock.assert_called_once_with(db, feed_id=10, fetch_interval_seconds=3600)
+
+
+def test_persist_worker_result_defers_listing_and_status_refreshes(monkeypatch) -> None:
+    db = Mock(spec=Session)
+    source_key = (77, datetime(2026, 2, 26, 10, 0, tzinfo=timezone.utc))
+    fetched_at = datetime(2026, 3, 1, 8, 0, tzinfo=timezone.utc)
+    refresh_listing_mock = Mock()
+    refresh_job_mock = Mock()
+    resolve_fresh_until_mock = Mock(return_value=None)
+
+    monkeypatch.setattr(result_persistence_service_module, "insert_job_result_if_new", Mock(return_value=True))
+    monkeypatch.setattr(result_persistence_service_module, "upsert_feed_scraping_state", Mock(return_value=(None, [])))
+    monkeypatch.setattr(
+        result_persistence_service_module,
+        "upsert_sources_for_feed",
+        Mock(return_value=([source_key], 1)),
+    )
+    monkeypatch.setattr(result_persistence_service_module, "refresh_source_listing_rows", refresh_listing_mock)
+    monkeypatch.setattr(result_persistence_service_module, "refresh_rss_scrape_job_status", refresh_job_mock)
+    monkeypatch.setattr(result_persistence_service_module, "update_feed_fresh_until", Mock())
+    monkeypatch.setattr(result_persistence_service_module, "resolve_feed_fresh_until", resolve_fresh_until_mock)
+    monkeypatch.setattr(result_persistence_service_module, "get_feed_fetch_interval_seconds", Mock(return_value=3600))
+    monkeypatch.setattr(result_persistence_service_module, "update_feed_fetch_schedule", Mock())
+    deferred_refreshes = result_persistence_service_module.DeferredPersistenceRefreshes()
+
+    persisted = result_persistence_service_module.persist_worker_result(
+        db,
+        payload=_build_payload(),
+        queue_kind="ingest",
+        fetched_at=fetched_at,
+        deferred_refreshes=deferred_refreshes,
+    )
+
+    assert persisted is True
+    assert resolve_fresh_until_mock.call_args.kwargs["fetched_at"] == fetched_at
+    refresh_listing_mock.assert_not_called()
+    refresh_job_mock.assert_not_called()
+    assert deferred_refreshes.source_keys == {source_key}
+    assert deferred_refreshes.job_ids == {"job-1"}
+
+    result_persistence_service_module.flush_deferred_refreshes(db, deferred_refreshes)
+
+    refresh_listing_mock.assert_called_once_with(db, source_keys=[source_key])
+    refresh_job_mock.assert_called_once_with(db, job_id="job-1")
+    assert deferred_refreshes.source_keys == set()
+    assert deferred_refreshes.job_ids == set()
+
+
+def test_persist_sources_bulk_only_copies_sources(monkeypatch) -> None:
+    db = Mock(spec=Session)
+    payloads = [_build_payload(), _build_payload()]
+    source_key = (1, datetime(2026, 2, 26, 11, 0, tzinfo=timezone.utc))
+    copy_sources_mock = Mock(return_value=([source_key], 1))
+    insert_mock = Mock()
+    upsert_feed_state_mock = Mock()
+    update_schedule_mock = Mock()
+    refresh_listing_mock = Mock()
+    monkeypatch.setattr(result_persistence_service_module, "copy_sources_for_results", copy_sources_mock)
+    monkeypatch.setattr(result_persistence_service_module, "insert_job_result_if_new", insert_mock)
+    monkeypatch.setattr(result_persistence_service_module, "upsert_feed_scraping_state", upsert_feed_state_mock)
+    monkeypatch.setattr(result_persistence_service_module, "update_feed_fetch_schedule", update_schedule_mock)
+    monkeypatch.setattr(result_persistence_service_module, "refresh_source_listing_rows", refresh_listing_mock)
+    deferred_refreshes = result_persistence_service_module.DeferredPersistenceRefreshes()
+
+    new_article_count = result_persistence_service_module.persist_sources_bulk(
+        db,
+        payloads=payloads,
+        deferred_refreshes=deferred_refreshes,
+    )
+
+    assert new_article_count == 1
+    assert deferred_refreshes.source_keys == {source_key}
+    assert deferred_refreshes.job_ids == set()
+    copy_sources_mock.assert_called_once_with(db, payloads=payloads)
+    insert_mock.assert_not_called()
+    upsert_feed_state_mock.assert_not_called()
+    update_schedule_mock.assert_not_called()
+    refresh_listing_mock.assert_not_called()
@@ -0,0 +1,91 @@
+import asyncio
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+import app.services.result_replay_service as result_replay_service_module
+from app.errors import DBManagerError
+
+
+def _payload(job_id: str, feed_id: int) -> dict:
+    return {
+        "job_id": job_id,
+        "ingest": True,
+        "feed_id": feed_id,
+        "feed_url": f"https://example.com/{feed_id}.xml",
+        "status": "success",
+        "fetchprotection": 1,
+        "sources": [],
+    }
+
+
+def test_run_result_replay_merges_streams_in_id_order_and_reports_outcomes(monkeypatch) -> None:
+    streams = {
+        "rss_check_results": [("1-0", _payload("job-1", 1)), ("4-0", _payload("job-1", 2))],
+        "rss_ingest_results": [("2-0", _payload("job-2", 3)), ("3-0", {"invalid": True}), ("5-0", _payload("job-2", 4))],
+    }
+    read_calls: list[tuple[str, str]] = []
+    persisted_feeds: list[tuple[int, str]] = []
+    db = MagicMock()
+    sessions: list[MagicMock] = []
+
+    async def fake_read_worker_result_range(stream_name: str, *, start_id: str, end_id: str, count: int):
+        read_calls.append((stream_name, start_id))
+        entries = streams[stream_name]
+        if start_id.startswith("("):
+            entries = [entry for entry in entries if entry[0] > start_id[1:]]
+        return entries[:count]
+
+    def fake_persist_worker_result(db_session, *, payload, queue_kind, fetched_at, deferred_refreshes):
+        persisted_feeds.append((payload.feed_id, queue_kind))
+        if payload.feed_id == 2:
+            raise RuntimeError("feed was deleted")
+        deferred_refreshes.job_ids.add(payload.job_id)
+        return payload.feed_id != 4
+
+    def fake_get_db_session():
+        sessions.append(db)
+        return db
+
+    flush_mock = Mock()
+    insert_job_mock = Mock()
+    monkeypatch.setattr(result_replay_service_module, "read_worker_result_range", fake_read_worker_result_range)
+    monkeypatch.setattr(result_replay_service_module, "persist_worker_result", fake_persist_worker_result)
+    monkeypatch.setattr(result_replay_service_module, "flush_deferred_refreshes", flush_mock)
+    monkeypatch.setattr(result_replay_service_module, "insert_replay_job_if_missing", insert_job_mock)
+    monkeypatch.setattr(result_replay_service_module, "disable_synchronous_commit", Mock())
+    monkeypatch.setattr(result_replay_service_module, "get_db_session", fake_get_db_session)
+
+    report = asyncio.run(
+        result_replay_service_module.run_result_replay(
+            stream_names=("rss_check_results", "rss_ingest_results"),
+            batch_size=2,
+        )
+    )
+
+    assert persisted_feeds == [(1, "check"), (3, "ingest"), (2, "check"), (4, "ingest")]
+    assert read_calls == [
+        ("rss_check_results", "-"),
+        ("rss_ingest_results", "-"),
+        ("rss_ingest_results", "(3-0"),
+        ("rss_check_results", "(4-0"),
+    ]
+    assert (report.read_count, report.persisted_count, report.duplicate_count) == (5, 2, 1)
+    assert (report.invalid_count, report.failed_count, report.batch_count) == (1, 1, 4)
+    assert report.last_message_ids == {"rss_check_results": "4-0", "rss_ingest_results": "5-0"}
+    assert insert_job_mock.call_count == 4
+    assert db.commit.call_count == 4
+    assert len(sessions) == 4
+    # The failed result's savepoint is rolled back and its refreshes are dropped.
+    assert db.begin_nested.return_value.rollback.call_count == 1
+    assert [call.args[1].job_ids for call in flush_mock.call_args_list] == [
+        {"job-1", "job-2"},
+        set(),
+        set(),
+        {"job-2"},
+    ]
+
+
+def test_run_result_replay_rejects_non_positive_batch_size() -> None:
+    with pytest.raises(DBManagerError, match="batch_size"):
+        asyncio.run(result_replay_service_module.run_result_replay(batch_size=0))
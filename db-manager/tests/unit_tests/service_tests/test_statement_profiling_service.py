@@ -0,0 +1,43 @@
+import logging
+
+from sqlalchemy import create_engine, text
+
+import app.services.statement_profiling_service as statement_profiling_service_module
+from app.utils import MetricsRegistry
+
+
+def test_install_statement_profiling_records_sampled_and_slow_statements(monkeypatch, caplog) -> None:
+    registry = MetricsRegistry()
+    monkeypatch.setattr(statement_profiling_service_module, "db_manager_metrics", registry)
+    engine = create_engine("sqlite://")
+    profile = statement_profiling_service_module.StatementProfile()
+    statement_profiling_service_module.install_statement_profiling(
+        engine,
+        profile=profile,
+        sample_rate=0.5,
+        slow_threshold_seconds=0.0,
+        random_source=iter([0.1, 0.9, 0.1]).__next__,
+    )
+
+    with caplog.at_level(logging.WARNING, logger=statement_profiling_service_module.__name__):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT   1"))
+            connection.execute(text("SELECT 2"))
+            connection.execute(text("SELECT 1"))
+
+    top_statements = profile.drain_top_statements(limit=5)
+    assert [(fingerprint, count) for fingerprint, count, _, _ in top_statements] == [("SELECT 1", 2)]
+    assert registry.get_counter("db_manager_slow_statements_total") == 2
+    assert "Slow statement" in caplog.text
+    assert profile.drain_top_statements(limit=5) == []
+
+
+def test_statement_profile_orders_report_by_total_time() -> None:
+    profile = statement_profiling_service_module.StatementProfile()
+    profile.record("UPDATE feeds_scraping SET x = 1", 0.2)
+    profile.record("INSERT INTO rss_sources VALUES (1)", 0.1)
+    profile.record("INSERT INTO rss_sources VALUES (1)", 0.3)
+
+    assert profile.drain_top_statements(limit=1) == [
+        ("INSERT INTO rss_sources VALUES (1)", 2, 0.4, 0.3),
+    ]
@@ -178,7 +178,7 @@ export default function AdminRssPage() {
     setChecking(true);
 
     try {
-      const payload = await checkRssFeeds();
+      const payload = await checkRssFeeds(undefined, true);
       showPopInfo(
         "Last check result",
         formatCheckSummary(payload),
@@ -87,6 +87,7 @@ export default function AdminSourcesPage() {
   const [sourcesPage, setSourcesPage] = useState<RssSourcePageRead>({
     items: [],
     total: 0,
+    total_mode: "estimated",
     limit: PAGE_SIZE,
     offset: 0,
   });
@@ -134,6 +135,7 @@ export default function AdminSourcesPage() {
           offset,
           feedId: selectedFeedId,
           companyId: selectedCompanyId,
+          totalMode: "estimated",
         });
         setSourcesPage(payload);
       } catch (error) {
@@ -379,7 +381,11 @@ export default function AdminSourcesPage() {
   }, [loadingSources, sourcesPage.items.length]);
 
   const hasPreviousPage = sourcesPage.offset > 0;
-  const hasNextPage = sourcesPage.offset + sourcesPage.items.length < sourcesPage.total;
+  const isEstimatedTotal = sourcesPage.total_mode === "estimated";
+  const hasNextPage =
+    sourcesPage.offset + sourcesPage.items.length < sourcesPage.total ||
+    (isEstimatedTotal && sourcesPage.items.length === sourcesPage.limit);
+  const totalLabel = `${isEstimatedTotal ? "~" : ""}${sourcesPage.total}`;
   const startIndex = sourcesPage.total === 0 ? 0 : sourcesPage.offset + 1;
   const endIndex = sourcesPage.offset + sourcesPage.items.length;
 
@@ -452,7 +458,7 @@ export default function AdminSourcesPage() {
       <Surface className={styles.actionPanel}>
         <div className={styles.meta}>
           <div className={styles.metaCount}>
-            <strong>{sourcesPage.total}</strong>
+            <strong>{totalLabel}</strong>
             <span>source{sourcesPage.total !== 1 ? "s" : ""}</span>
           </div>
         </div>
@@ -521,7 +527,7 @@ export default function AdminSourcesPage() {
         <div className={styles.gridHeader}>
           <h2>Sources</h2>
           <p>
-            Showing {startIndex}-{endIndex} of {sourcesPage.total}
+            Showing {startIndex}-{endIndex} of {totalLabel}
           </p>
         </div>
 
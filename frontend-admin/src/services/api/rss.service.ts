@@ -39,13 +39,16 @@ export async function syncRssFeeds(force = false): Promise<RssSyncRead> {
   });
 }
 
-export async function checkRssFeeds(feedIds?: number[]): Promise<RssFeedCheckRead> {
+export async function checkRssFeeds(feedIds?: number[], force = false): Promise<RssFeedCheckRead> {
   const searchParams = new URLSearchParams();
   if (feedIds) {
     for (const feedId of feedIds) {
       searchParams.append("feed_ids", String(feedId));
     }
   }
+  if (force) {
+    searchParams.set("force", "true");
+  }
 
   const queryString = searchParams.toString();
   const path = queryString ? `/rss/feeds/check?${queryString}` : "/rss/feeds/check";
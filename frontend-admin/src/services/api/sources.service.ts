@@ -3,6 +3,8 @@ import type {
   RssSourceDetail,
   RssSourceIngestRead,
   RssSourcePageRead,
+  RssSourceSearchPageRead,
+  RssSourceTotalMode,
 } from "@/types/sources";
 
 type ListRssSourcesParams = {
@@ -10,6 +12,13 @@ type ListRssSourcesParams = {
   offset?: number;
   feedId?: number | null;
   companyId?: number | null;
+  totalMode?: RssSourceTotalMode;
+  publishedAfter?: string | null;
+  publishedBefore?: string | null;
+  section?: string | null;
+  country?: string | null;
+  language?: string | null;
+  tags?: string[];
 };
 
 function buildListRssSourcesPath(params?: ListRssSourcesParams): string {
@@ -17,6 +26,7 @@ function buildListRssSourcesPath(params?: ListRssSourcesParams): string {
   const offset = params?.offset ?? 0;
   const feedId = params?.feedId;
   const companyId = params?.companyId;
+  const totalMode = params?.totalMode ?? "exact";
 
   let path = "/sources/";
   if (typeof feedId === "number") {
@@ -28,7 +38,26 @@ function buildListRssSourcesPath(params?: ListRssSourcesParams): string {
   const searchParams = new URLSearchParams({
     limit: String(limit),
     offset: String(offset),
+    total_mode: totalMode,
   });
+  if (params?.publishedAfter) {
+    searchParams.set("published_after", params.publishedAfter);
+  }
+  if (params?.publishedBefore) {
+    searchParams.set("published_before", params.publishedBefore);
+  }
+  if (params?.section) {
+    searchParams.set("section", params.section);
+  }
+  if (params?.country) {
+    searchParams.set("country", params.country);
+  }
+  if (params?.language) {
+    searchParams.set("language", params.language);
+  }
+  for (const tag of params?.tags ?? []) {
+    searchParams.append("tags", tag);
+  }
   return `${path}?${searchParams.toString()}`;
 }
 
@@ -36,6 +65,33 @@ export async function listRssSources(params?: ListRssSourcesParams): Promise<Rss
   return apiRequest<RssSourcePageRead>(buildListRssSourcesPath(params));
 }
 
+type SearchRssSourcesParams = {
+  query: string;
+  limit?: number;
+  publishedAfter?: string | null;
+  publishedBefore?: string | null;
+  cursor?: string | null;
+};
+
+export async function searchRssSources(
+  params: SearchRssSourcesParams,
+): Promise<RssSourceSearchPageRead> {
+  const searchParams = new URLSearchParams({
+    q: params.query,
+    limit: String(params.limit ?? 50),
+  });
+  if (params.publishedAfter) {
+    searchParams.set("published_after", params.publishedAfter);
+  }
+  if (params.publishedBefore) {
+    searchParams.set("published_before", params.publishedBefore);
+  }
+  if (params.cursor) {
+    searchParams.set("cursor", params.cursor);
+  }
+  return apiRequest<RssSourceSearchPageRead>(`/sources/search?${searchParams.toString()}`);
+}
+
 export async function getRssSourceById(sourceId: number): Promise<RssSourceDetail> {
   return apiRequest<RssSourceDetail>(`/sources/${sourceId}`);
 }
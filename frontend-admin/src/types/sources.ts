@@ -9,13 +9,26 @@ export type RssSourceListItem = {
   company_names: string[];
 };
 
+export type RssSourceTotalMode = "exact" | "estimated";
+
 export type RssSourcePageRead = {
   items: RssSourceListItem[];
   total: number;
+  total_mode: RssSourceTotalMode;
   limit: number;
   offset: number;
 };
 
+export type RssSourceSearchItem = RssSourceListItem & {
+  rank: number;
+};
+
+export type RssSourceSearchPageRead = {
+  items: RssSourceSearchItem[];
+  limit: number;
+  next_cursor: string | null;
+};
+
 export type RssSourceDetail = {
   id: number;
   title: string;
@@ -0,0 +1,11 @@
+from .backend_api_client import (
+    enqueue_ingest_job,
+    read_feed_farm_stats,
+    read_job_status,
+)
+
+__all__ = [
+    "enqueue_ingest_job",
+    "read_feed_farm_stats",
+    "read_job_status",
+]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+
+async def enqueue_ingest_job(client: httpx.AsyncClient, *, feed_ids: list[int]) -> str:
+    response = await client.post(
+        "/sources/ingest",
+        params={"feed_ids": feed_ids, "force": "true"},
+    )
+    response.raise_for_status()
+    return str(response.json()["job_id"])
+
+
+async def read_job_status(client: httpx.AsyncClient, *, job_id: str) -> dict[str, Any]:
+    response = await client.get(f"/jobs/{job_id}")
+    response.raise_for_status()
+    return response.json()
+
+
+async def read_feed_farm_stats(client: httpx.AsyncClient, *, farm_base_url: str) -> dict[str, int]:
+    response = await client.get(f"{farm_base_url}/stats")
+    response.raise_for_status()
+    return response.json()
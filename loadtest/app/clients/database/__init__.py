@@ -0,0 +1,13 @@
+from .load_test_db_client import (
+    LOAD_TEST_COMPANY_PREFIX,
+    count_linked_articles,
+    delete_load_test_feeds,
+    seed_load_test_feeds,
+)
+
+__all__ = [
+    "LOAD_TEST_COMPANY_PREFIX",
+    "count_linked_articles",
+    "delete_load_test_feeds",
+    "seed_load_test_feeds",
+]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+LOAD_TEST_COMPANY_PREFIX = "loadtest-h"
+
+
+def seed_load_test_feeds(
+    db: Session,
+    *,
+    feed_urls_by_host: dict[int, list[str]],
+) -> list[int]:
+    feed_ids: list[int] = []
+    for host_index, feed_urls in sorted(feed_urls_by_host.items()):
+        company_id = db.execute(
+            text(
+                """
+                INSERT INTO rss_company (name, fetchprotection, enabled)
+                VALUES (:name, 1, true)
+                ON CONFLICT (name) DO UPDATE SET enabled = true
+                RETURNING id
+                """
+            ),
+            {"name": f"{LOAD_TEST_COMPANY_PREFIX}{host_index}"},
+        ).scalar_one()
+        feed_ids.extend(
+            db.execute(
+                text(
+                    """
+                    INSERT INTO rss_feeds (url, company_id, enabled)
+                    SELECT feed_url, :company_id, true
+                    FROM unnest(CAST(:feed_urls AS VARCHAR[])) AS feed_url
+                    ON CONFLICT (url) DO UPDATE SET
+                        company_id = EXCLUDED.company_id,
+                        enabled = true
+                    RETURNING id
+                    """
+                ),
+                {"company_id": company_id, "feed_urls": feed_urls},
+            ).scalars().all()
+        )
+    return sorted(feed_ids)
+
+
+def count_linked_articles(db: Session, *, feed_ids: list[int]) -> int:
+    return int(
+        db.execute(
+            text("SELECT COUNT(*) FROM rss_source_feeds WHERE feed_id = ANY(:feed_ids)"),
+            {"feed_ids": feed_ids},
+        ).scalar_one()
+    )
+
+
+def delete_load_test_feeds(db: Session) -> int:
+    load_test_feed_ids = list(
+        db.execute(
+            text(
+                """
+                SELECT feed.id
+                FROM rss_feeds AS feed
+                JOIN rss_company AS company
+                    ON company.id = feed.company_id
+                WHERE company.name LIKE :company_pattern
+                """
+            ),
+            {"company_pattern": f"{LOAD_TEST_COMPANY_PREFIX}%"},
+        ).scalars().all()
+    )
+    if load_test_feed_ids:
+        source_keys = db.execute(
+            text(
+                """
+                SELECT DISTINCT source_id, published_at
+                FROM rss_source_feeds
+                WHERE feed_id = ANY(:feed_ids)
+                """
+            ),
+            {"feed_ids": load_test_feed_ids},
+        ).all()
+        db.execute(
+            text("DELETE FROM rss_feeds WHERE id = ANY(:feed_ids)"),
+            {"feed_ids": load_test_feed_ids},
+        )
+        if source_keys:
+            db.execute(
+                text("SELECT refresh_rss_source_listing(:source_ids, :published_ats)"),
+                {
+                    "source_ids": [row.source_id for row in source_keys],
+                    "published_ats": [row.published_at for row in source_keys],
+                },
+            )
+    db.execute(
+        text("DELETE FROM rss_company WHERE name LIKE :company_pattern"),
+        {"company_pattern": f"{LOAD_TEST_COMPANY_PREFIX}%"},
+    )
+    return len(load_test_feed_ids)
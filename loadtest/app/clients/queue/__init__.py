@@ -0,0 +1,5 @@
+from .redis_stats_client import read_pipeline_backlog
+
+__all__ = [
+    "read_pipeline_backlog",
+]
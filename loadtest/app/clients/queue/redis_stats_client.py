@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+REDIS_QUEUE_REQUESTS = "rss_scrape_requests"
+REDIS_QUEUE_REQUESTS_INTERACTIVE = "rss_scrape_requests_interactive"
+REDIS_REQUEST_SHARD_COUNT_KEY = "rss_scrape_request_shards"
+REDIS_RESULT_STREAMS = ("rss_check_results", "rss_ingest_results", "error_feeds_parsing")
+
+
+async def read_pipeline_backlog(redis_client: Redis) -> int:
+    shard_count = await _read_request_shard_count(redis_client)
+    request_streams = [REDIS_QUEUE_REQUESTS, REDIS_QUEUE_REQUESTS_INTERACTIVE]
+    if shard_count > 1:
+        request_streams += [
+            f"{stream_name}:{shard_index}"
+            for stream_name in (REDIS_QUEUE_REQUESTS, REDIS_QUEUE_REQUESTS_INTERACTIVE)
+            for shard_index in range(shard_count)
+        ]
+
+    backlog = 0
+    for stream_name in (*request_streams, *REDIS_RESULT_STREAMS):
+        backlog += await _read_stream_backlog(redis_client, stream_name)
+    return backlog
+
+
+async def _read_request_shard_count(redis_client: Redis) -> int:
+    raw_value = await redis_client.get(REDIS_REQUEST_SHARD_COUNT_KEY)
+    try:
+        return max(int(raw_value), 1) if raw_value is not None else 1
+    except ValueError:
+        return 1
+
+
+async def _read_stream_backlog(redis_client: Redis, stream_name: str) -> int:
+    # Undelivered entries (lag) plus delivered but unacked entries, summed over groups.
+    try:
+        groups = await redis_client.xinfo_groups(stream_name)
+    except ResponseError:
+        return 0
+    return sum(int(group.get("lag") or 0) + int(group.get("pending") or 0) for group in groups)
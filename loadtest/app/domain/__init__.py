@@ -0,0 +1,22 @@
+from .feed_farm_domain import (
+    FeedFarmSettings,
+    build_feed_etag,
+    build_feed_path,
+    build_feed_xml,
+    parse_feed_path,
+    resolve_feed_version,
+)
+from .load_test_report_domain import LoadTestReport, compute_percentile
+
+__all__ = [
+    # Feed farm
+    "FeedFarmSettings",
+    "build_feed_etag",
+    "build_feed_path",
+    "build_feed_xml",
+    "parse_feed_path",
+    "resolve_feed_version",
+    # Report
+    "LoadTestReport",
+    "compute_percentile",
+]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import re
+import zlib
+from xml.sax.saxutils import escape
+
+FEED_PATH_PATTERN = re.compile(r"^/h(?P<host_index>\d+)/f(?P<feed_index>\d+)\.xml$")
+FEED_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FeedFarmSettings:
+    def __init__(
+        self,
+        *,
+        host_count: int,
+        feeds_per_host: int,
+        items_per_feed: int,
+        summary_bytes: int,
+        latency_ms: float,
+        latency_jitter_ms: float,
+        error_rate: float,
+        change_interval_seconds: float,
+        host_max_requests_per_second: float | None,
+    ) -> None:
+        self.host_count = host_count
+        self.feeds_per_host = feeds_per_host
+        self.items_per_feed = items_per_feed
+        self.summary_bytes = summary_bytes
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.change_interval_seconds = change_interval_seconds
+        self.host_max_requests_per_second = host_max_requests_per_second
+
+
+def build_feed_path(host_index: int, feed_index: int) -> str:
+    return f"/h{host_index}/f{feed_index}.xml"
+
+
+def parse_feed_path(path: str) -> tuple[int, int] | None:
+    match = FEED_PATH_PATTERN.match(path)
+    if match is None:
+        return None
+    return int(match.group("host_index")), int(match.group("feed_index"))
+
+
+def resolve_feed_version(
+    host_index: int,
+    feed_index: int,
+    *,
+    now_seconds: float,
+    change_interval_seconds: float,
+) -> int:
+    # Each feed gets a stable offset so versions do not all roll over at once.
+    offset_seconds = zlib.crc32(f"{host_index}:{feed_index}".encode("utf-8")) % max(
+        int(change_interval_seconds),
+        1,
+    )
+    return int((now_seconds - FEED_EPOCH.timestamp() + offset_seconds) // change_interval_seconds)
+
+
+def build_feed_etag(host_index: int, feed_index: int, version: int) -> str:
+    return f'"h{host_index}-f{feed_index}-v{version}"'
+
+
+def build_feed_xml(
+    *,
+    base_url: str,
+    host_index: int,
+    feed_index: int,
+    version: int,
+    item_count: int,
+    summary_bytes: int,
+    change_interval_seconds: float,
+) -> str:
+    # Version n lists items n - item_count + 1 .. n, so every new version adds one article.
+    feed_url = f"{base_url}{build_feed_path(host_index, feed_index)}"
+    summary_padding = "x" * summary_bytes
+    items = []
+    for item_number in range(version, version - item_count, -1):
+        published_at = FEED_EPOCH + timedelta(seconds=item_number * change_interval_seconds)
+        items.append(
+            "<item>"
+            f"<title>Load test h{host_index} f{feed_index} item {item_number}</title>"
+            f"<link>{escape(feed_url)}/items/{item_number}</link>"
+            f"<guid>{escape(feed_url)}/items/{item_number}</guid>"
+            f"<description>{summary_padding}</description>"
+            f"<pubDate>{format_datetime(published_at, usegmt=True)}</pubDate>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0"><channel>'
+        f"<title>Load test feed h{host_index} f{feed_index}</title>"
+        f"<link>{escape(feed_url)}</link>"
+        "<description>Synthetic feed</description>"
+        f"{''.join(items)}"
+        "</channel></rss>"
+    )
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+
+
+class LoadTestReport:
+    def __init__(
+        self,
+        *,
+        elapsed_seconds: float,
+        jobs_total: int,
+        jobs_completed: int,
+        feeds_processed: int,
+        feeds_error: int,
+        articles_linked: int,
+        job_completion_seconds: list[float],
+        queue_lag_samples: list[int],
+    ) -> None:
+        self.elapsed_seconds = elapsed_seconds
+        self.jobs_total = jobs_total
+        self.jobs_completed = jobs_completed
+        self.feeds_processed = feeds_processed
+        self.feeds_error = feeds_error
+        self.articles_linked = articles_linked
+        self.job_completion_seconds = job_completion_seconds
+        self.queue_lag_samples = queue_lag_samples
+
+    @property
+    def feeds_per_second(self) -> float:
+        return _safe_rate(self.feeds_processed, self.elapsed_seconds)
+
+    @property
+    def articles_per_second(self) -> float:
+        return _safe_rate(self.articles_linked, self.elapsed_seconds)
+
+    def format_lines(self) -> list[str]:
+        return [
+            f"elapsed: {self.elapsed_seconds:.1f}s",
+            f"jobs completed: {self.jobs_completed}/{self.jobs_total}",
+            f"feeds processed: {self.feeds_processed} ({self.feeds_error} errors), "
+            f"{self.feeds_per_second:.1f} feeds/s",
+            f"articles linked: {self.articles_linked}, {self.articles_per_second:.1f} articles/s",
+            "job completion: "
+            f"p50 {_format_optional(compute_percentile(self.job_completion_seconds, 0.5))}s, "
+            f"p99 {_format_optional(compute_percentile(self.job_completion_seconds, 0.99))}s",
+            "queue lag (entries): "
+            f"max {max(self.queue_lag_samples, default=0)}, "
+            f"p50 {_format_optional(compute_percentile(self.queue_lag_samples, 0.5))}",
+        ]
+
+
+def compute_percentile(values: list[float] | list[int], fraction: float) -> float | None:
+    if not values:
+        return None
+    ordered_values = sorted(values)
+    # Nearest-rank percentile.
+    rank = max(math.ceil(fraction * len(ordered_values)), 1)
+    return float(ordered_values[rank - 1])
+
+
+def _safe_rate(count: int, elapsed_seconds: float) -> float:
+    if elapsed_seconds <= 0:
+        return 0.0
+    return count / elapsed_seconds
+
+
+def _format_optional(value: float | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value:.1f}"
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Callable
+import contextlib
+import functools
+import json
+import logging
+import math
+import random
+import time
+
+from app.domain import (
+    FeedFarmSettings,
+    build_feed_etag,
+    build_feed_xml,
+    parse_feed_path,
+    resolve_feed_version,
+)
+from app.utils import (
+    resolve_non_negative_float_env,
+    resolve_positive_float_env,
+    resolve_positive_int_env,
+)
+
+logger = logging.getLogger(__name__)
+
+_REQUEST_TIMEOUT_SECONDS = 30.0
+_STATUS_REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+}
+
+
+def resolve_feed_farm_settings() -> FeedFarmSettings:
+    host_max_requests_per_second = resolve_non_negative_float_env(
+        "LOADTEST_FARM_HOST_MAX_RPS",
+        20.0,
+    )
+    return FeedFarmSettings(
+        host_count=resolve_positive_int_env("LOADTEST_FARM_HOSTS", 50),
+        feeds_per_host=resolve_positive_int_env("LOADTEST_FARM_FEEDS_PER_HOST", 100),
+        items_per_feed=resolve_positive_int_env("LOADTEST_FARM_ITEMS_PER_FEED", 30),
+        summary_bytes=resolve_positive_int_env("LOADTEST_FARM_SUMMARY_BYTES", 400),
+        latency_ms=resolve_non_negative_float_env("LOADTEST_FARM_LATENCY_MS", 50.0),
+        latency_jitter_ms=resolve_non_negative_float_env("LOADTEST_FARM_LATENCY_JITTER_MS", 100.0),
+        error_rate=min(resolve_non_negative_float_env("LOADTEST_FARM_ERROR_RATE", 0.01), 1.0),
+        change_interval_seconds=resolve_positive_float_env(
+            "LOADTEST_FARM_CHANGE_INTERVAL_SECONDS",
+            300.0,
+        ),
+        host_max_requests_per_second=host_max_requests_per_second or None,
+    )
+
+
+class HostRateLimiter:
+    def __init__(self, *, max_requests_per_second: float) -> None:
+        self._rate = max_requests_per_second
+        self._capacity = float(max(math.ceil(max_requests_per_second), 1))
+        self._buckets: dict[int, tuple[float, float]] = {}
+
+    def try_acquire(self, host_index: int, *, now: float) -> bool:
+        tokens, updated_at = self._buckets.get(host_index, (self._capacity, now))
+        tokens = min(tokens + (now - updated_at) * self._rate, self._capacity)
+        if tokens < 1.0:
+            self._buckets[host_index] = (tokens, now)
+            return False
+        self._buckets[host_index] = (tokens - 1.0, now)
+        return True
+
+
+async def start_feed_farm_server(
+    *,
+    settings: FeedFarmSettings,
+    host: str,
+    port: int,
+    stats: Counter[str],
+    random_source: Callable[[], float] = random.random,
+) -> asyncio.AbstractServer:
+    rate_limiter = (
+        HostRateLimiter(max_requests_per_second=settings.host_max_requests_per_second)
+        if settings.host_max_requests_per_second
+        else None
+    )
+    server = await asyncio.start_server(
+        functools.partial(
+            _handle_connection,
+            settings=settings,
+            rate_limiter=rate_limiter,
+            stats=stats,
+            random_source=random_source,
+        ),
+        host=host,
+        port=port,
+    )
+    logger.info(
+        "feed farm serving %s hosts x %s feeds on :%s",
+        settings.host_count,
+        settings.feeds_per_host,
+        port,
+    )
+    return server
+
+
+async def run_feed_farm(*, settings: FeedFarmSettings, host: str, port: int) -> None:
+    stats: Counter[str] = Counter()
+    server = await start_feed_farm_server(settings=settings, host=host, port=port, stats=stats)
+    async with server:
+        await server.serve_forever()
+
+
+async def _handle_connection(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    *,
+    settings: FeedFarmSettings,
+    rate_limiter: HostRateLimiter | None,
+    stats: Counter[str],
+    random_source: Callable[[], float],
+) -> None:
+    try:
+        while True:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=_REQUEST_TIMEOUT_SECONDS)
+            if not request_line.strip():
+                return
+            headers: dict[str, str] = {}
+            while True:
+                header_line = await asyncio.wait_for(reader.readline(), timeout=_REQUEST_TIMEOUT_SECONDS)
+                if not header_line.strip():
+                    break
+                name, _, value = header_line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            method, _, target = request_line.decode("latin-1").partition(" ")
+            path = target.split(" ", 1)[0].split("?", 1)[0]
+            status_code, response_headers, body = await _resolve_response(
+                method=method,
+                path=path,
+                headers=headers,
+                settings=settings,
+                rate_limiter=rate_limiter,
+                stats=stats,
+                random_source=random_source,
+            )
+            stats[str(status_code)] += 1
+            stats["bytes_sent"] += len(body)
+            keep_alive = headers.get("connection", "").lower() != "close"
+            writer.write(_build_response(status_code, response_headers, body, keep_alive=keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                return
+    except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError):
+        return
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def _resolve_response(
+    *,
+    method: str,
+    path: str,
+    headers: dict[str, str],
+    settings: FeedFarmSettings,
+    rate_limiter: HostRateLimiter | None,
+    stats: Counter[str],
+    random_source: Callable[[], float],
+) -> tuple[int, dict[str, str], bytes]:
+    if method == "GET" and path == "/stats":
+        return 200, {"Content-Type": "application/json"}, json.dumps(dict(stats)).encode("utf-8")
+
+    feed_key = parse_feed_path(path) if method == "GET" else None
+    if feed_key is None:
+        return 404, {}, b"not found\n"
+    host_index, feed_index = feed_key
+    if host_index >= settings.host_count or feed_index >= settings.feeds_per_host:
+        return 404, {}, b"not found\n"
+
+    if rate_limiter is not None and not rate_limiter.try_acquire(host_index, now=time.monotonic()):
+        return 429, {"Retry-After": "1"}, b"rate limited\n"
+
+    latency_seconds = (
+        settings.latency_ms + settings.latency_jitter_ms * random_source()
+    ) / 1000
+    if latency_seconds > 0:
+        await asyncio.sleep(latency_seconds)
+
+    if random_source() < settings.error_rate:
+        return 500, {}, b"synthetic error\n"
+
+    version = resolve_feed_version(
+        host_index,
+        feed_index,
+        now_seconds=time.time(),
+        change_interval_seconds=settings.change_interval_seconds,
+    )
+    etag = build_feed_etag(host_index, feed_index, version)
+    if headers.get("if-none-match") == etag:
+        return 304, {"ETag": etag}, b""
+
+    body = build_feed_xml(
+        base_url=f"http://{headers.get('host', 'feed-farm')}",
+        host_index=host_index,
+        feed_index=feed_index,
+        version=version,
+        item_count=settings.items_per_feed,
+        summary_bytes=settings.summary_bytes,
+        change_interval_seconds=settings.change_interval_seconds,
+    ).encode("utf-8")
+    return 200, {"Content-Type": "application/rss+xml; charset=utf-8", "ETag": etag}, body
+
+
+def _build_response(
+    status_code: int,
+    headers: dict[str, str],
+    body: bytes,
+    *,
+    keep_alive: bool,
+) -> bytes:
+    header_lines = [f"HTTP/1.1 {status_code} {_STATUS_REASONS[status_code]}"]
+    header_lines += [f"{name}: {value}" for name, value in headers.items()]
+    header_lines.append(f"Content-Length: {len(body)}")
+    header_lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+    return ("\r\n".join(header_lines) + "\r\n\r\n").encode("latin-1") + body
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import time
+
+import httpx
+from redis.asyncio import Redis
+from sqlalchemy.orm import Session
+
+from app.clients.api import enqueue_ingest_job, read_feed_farm_stats, read_job_status
+from app.clients.database import (
+    count_linked_articles,
+    delete_load_test_feeds,
+    seed_load_test_feeds,
+)
+from app.clients.queue import read_pipeline_backlog
+from app.database import get_db_session
+from app.domain import LoadTestReport, build_feed_path
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_JOB_STATUSES = frozenset({"completed", "completed_with_errors", "failed"})
+
+
+class LoadTestSettings:
+    def __init__(
+        self,
+        *,
+        backend_url: str,
+        redis_url: str,
+        farm_base_url: str,
+        host_count: int,
+        feeds_per_host: int,
+        job_size: int,
+        poll_interval_seconds: float,
+        timeout_seconds: float,
+    ) -> None:
+        self.backend_url = backend_url
+        self.redis_url = redis_url
+        self.farm_base_url = farm_base_url
+        self.host_count = host_count
+        self.feeds_per_host = feeds_per_host
+        self.job_size = job_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.timeout_seconds = timeout_seconds
+
+
+def build_feed_urls_by_host(
+    *,
+    farm_base_url: str,
+    host_count: int,
+    feeds_per_host: int,
+) -> dict[int, list[str]]:
+    base_url = farm_base_url.rstrip("/")
+    return {
+        host_index: [
+            f"{base_url}{build_feed_path(host_index, feed_index)}"
+            for feed_index in range(feeds_per_host)
+        ]
+        for host_index in range(host_count)
+    }
+
+
+async def run_load_test(
+    *,
+    settings: LoadTestSettings,
+    db_session_factory: Callable[[], Session] = get_db_session,
+) -> LoadTestReport:
+    feed_urls_by_host = build_feed_urls_by_host(
+        farm_base_url=settings.farm_base_url,
+        host_count=settings.host_count,
+        feeds_per_host=settings.feeds_per_host,
+    )
+    with db_session_factory() as db:
+        feed_ids = seed_load_test_feeds(db, feed_urls_by_host=feed_urls_by_host)
+        db.commit()
+        articles_before = count_linked_articles(db, feed_ids=feed_ids)
+    logger.info("seeded %s load test feeds", len(feed_ids))
+
+    redis_client = Redis.from_url(settings.redis_url, decode_responses=True)
+    try:
+        async with httpx.AsyncClient(base_url=settings.backend_url, timeout=30.0) as client:
+            started_at = time.monotonic()
+            enqueued_at: dict[str, float] = {}
+            for chunk_start in range(0, len(feed_ids), settings.job_size):
+                job_id = await enqueue_ingest_job(
+                    client,
+                    feed_ids=feed_ids[chunk_start : chunk_start + settings.job_size],
+                )
+                enqueued_at[job_id] = time.monotonic()
+            logger.info("enqueued %s ingest jobs", len(enqueued_at))
+
+            job_statuses, job_completion_seconds, queue_lag_samples = await _wait_for_jobs(
+                client,
+                redis_client,
+                enqueued_at=enqueued_at,
+                poll_interval_seconds=settings.poll_interval_seconds,
+                deadline=started_at + settings.timeout_seconds,
+            )
+            elapsed_seconds = time.monotonic() - started_at
+            farm_stats = await read_feed_farm_stats(client, farm_base_url=settings.farm_base_url)
+            logger.info("feed farm responses: %s", farm_stats)
+    finally:
+        await redis_client.aclose()
+
+    with db_session_factory() as db:
+        articles_after = count_linked_articles(db, feed_ids=feed_ids)
+
+    return LoadTestReport(
+        elapsed_seconds=elapsed_seconds,
+        jobs_total=len(enqueued_at),
+        jobs_completed=len(job_completion_seconds),
+        feeds_processed=sum(int(status.get("feeds_processed") or 0) for status in job_statuses.values()),
+        feeds_error=sum(int(status.get("feeds_error") or 0) for status in job_statuses.values()),
+        articles_linked=articles_after - articles_before,
+        job_completion_seconds=job_completion_seconds,
+        queue_lag_samples=queue_lag_samples,
+    )
+
+
+def cleanup_load_test(
+    *,
+    db_session_factory: Callable[[], Session] = get_db_session,
+) -> int:
+    with db_session_factory() as db:
+        deleted_feed_count = delete_load_test_feeds(db)
+        db.commit()
+    logger.info("deleted %s load test feeds", deleted_feed_count)
+    return deleted_feed_count
+
+
+async def _wait_for_jobs(
+    client: httpx.AsyncClient,
+    redis_client: Redis,
+    *,
+    enqueued_at: dict[str, float],
+    poll_interval_seconds: float,
+    deadline: float,
+) -> tuple[dict[str, dict], list[float], list[int]]:
+    job_statuses: dict[str, dict] = {}
+    completed_at: dict[str, float] = {}
+    queue_lag_samples: list[int] = []
+    while len(completed_at) < len(enqueued_at) and time.monotonic() < deadline:
+        queue_lag_samples.append(await read_pipeline_backlog(redis_client))
+        for job_id, job_enqueued_at in enqueued_at.items():
+            if job_id in completed_at:
+                continue
+            job_status = await read_job_status(client, job_id=job_id)
+            job_statuses[job_id] = job_status
+            if job_status.get("status") in TERMINAL_JOB_STATUSES:
+                completed_at[job_id] = time.monotonic() - job_enqueued_at
+        if len(completed_at) < len(enqueued_at):
+            await asyncio.sleep(poll_interval_seconds)
+
+    if len(completed_at) < len(enqueued_at):
+        logger.warning(
+            "load test timed out with %s/%s jobs completed",
+            len(completed_at),
+            len(enqueued_at),
+        )
+    return job_statuses, list(completed_at.values()), queue_lag_samples
@@ -0,0 +1,11 @@
+from .env_utils import (
+    resolve_non_negative_float_env,
+    resolve_positive_float_env,
+    resolve_positive_int_env,
+)
+
+__all__ = [
+    "resolve_non_negative_float_env",
+    "resolve_positive_float_env",
+    "resolve_positive_int_env",
+]
@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import logging
+import os
+
+from app.services.feed_farm_service import resolve_feed_farm_settings, run_feed_farm
+from app.services.load_test_service import (
+    LoadTestSettings,
+    cleanup_load_test,
+    run_load_test,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="loadtest")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser(
+        "serve-feeds",
+        help="Serve synthetic RSS feeds (settings come from LOADTEST_FARM_* env vars)",
+    )
+    serve_parser.add_argument("--host", default="0.0.0.0")
+    serve_parser.add_argument("--port", type=int, default=int(os.getenv("LOADTEST_FARM_PORT", "8080")))
+
+    run_parser = subparsers.add_parser(
+        "run",
+        help="Seed load test feeds, enqueue ingest jobs and report pipeline throughput",
+    )
+    run_parser.add_argument("--backend-url", default=os.getenv("LOADTEST_BACKEND_URL", "http://backend:8000"))
+    run_parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://redis:6379/0"))
+    run_parser.add_argument("--farm-url", default=os.getenv("LOADTEST_FARM_URL", "http://feed_farm:8080"))
+    run_parser.add_argument("--hosts", type=int, default=50)
+    run_parser.add_argument("--feeds-per-host", type=int, default=100)
+    run_parser.add_argument("--job-size", type=int, default=100)
+    run_parser.add_argument("--poll-interval", type=float, default=1.0)
+    run_parser.add_argument("--timeout", type=float, default=1800.0)
+
+    subparsers.add_parser(
+        "cleanup",
+        help="Delete load test feeds and companies and refresh the affected listings",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    args = build_parser().parse_args(argv)
+
+    if args.command == "serve-feeds":
+        asyncio.run(
+            run_feed_farm(settings=resolve_feed_farm_settings(), host=args.host, port=args.port)
+        )
+    elif args.command == "run":
+        report = asyncio.run(
+            run_load_test(
+                settings=LoadTestSettings(
+                    backend_url=args.backend_url,
+                    redis_url=args.redis_url,
+                    farm_base_url=args.farm_url,
+                    host_count=args.hosts,
+                    feeds_per_host=args.feeds_per_host,
+                    job_size=args.job_size,
+                    poll_interval_seconds=args.poll_interval,
+                    timeout_seconds=args.timeout,
+                )
+            )
+        )
+        for line in report.format_lines():
+            print(line)
+    elif args.command == "cleanup":
+        cleanup_load_test()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+import asyncio
+import logging
+import os
+
+from app.services.feed_farm_service import resolve_feed_farm_settings, run_feed_farm
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(
+        run_feed_farm(
+            settings=resolve_feed_farm_settings(),
+            host="0.0.0.0",
+            port=int(os.getenv("LOADTEST_FARM_PORT", "8080")),
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
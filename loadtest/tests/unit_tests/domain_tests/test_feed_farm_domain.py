@@ -0,0 +1,49 @@
+import xml.etree.ElementTree as ElementTree
+
+from app.domain.feed_farm_domain import (
+    FEED_EPOCH,
+    build_feed_etag,
+    build_feed_path,
+    build_feed_xml,
+    parse_feed_path,
+    resolve_feed_version,
+)
+
+
+def test_feed_path_round_trips_and_rejects_unknown_paths() -> None:
+    assert build_feed_path(3, 17) == "/h3/f17.xml"
+    assert parse_feed_path("/h3/f17.xml") == (3, 17)
+    assert parse_feed_path("/h3/f17.json") is None
+    assert parse_feed_path("/stats") is None
+
+
+def test_resolve_feed_version_advances_once_per_change_interval() -> None:
+    now_seconds = FEED_EPOCH.timestamp() + 10_000
+
+    version = resolve_feed_version(1, 2, now_seconds=now_seconds, change_interval_seconds=300)
+    next_version = resolve_feed_version(1, 2, now_seconds=now_seconds + 300, change_interval_seconds=300)
+
+    assert next_version == version + 1
+    assert build_feed_etag(1, 2, version) != build_feed_etag(1, 2, next_version)
+
+
+def test_build_feed_xml_adds_one_new_item_per_version() -> None:
+    def build_item_links(version: int) -> list[str]:
+        feed_xml = build_feed_xml(
+            base_url="http://farm",
+            host_index=0,
+            feed_index=1,
+            version=version,
+            item_count=3,
+            summary_bytes=16,
+            change_interval_seconds=60,
+        )
+        channel = ElementTree.fromstring(feed_xml).find("channel")
+        return [item.findtext("link") for item in channel.findall("item")]
+
+    assert build_item_links(10) == [
+        "http://farm/h0/f1.xml/items/10",
+        "http://farm/h0/f1.xml/items/9",
+        "http://farm/h0/f1.xml/items/8",
+    ]
+    assert build_item_links(11)[1:] == build_item_links(10)[:2]
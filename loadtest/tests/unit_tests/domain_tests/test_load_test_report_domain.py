@@ -0,0 +1,34 @@
+from app.domain.load_test_report_domain import LoadTestReport, compute_percentile
+
+
+def test_compute_percentile_uses_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+
+    assert compute_percentile(values, 0.5) == 50.0
+    assert compute_percentile(values, 0.99) == 99.0
+    assert compute_percentile([7], 0.99) == 7.0
+    assert compute_percentile([], 0.5) is None
+
+
+def test_load_test_report_computes_rates_and_formats_summary() -> None:
+    report = LoadTestReport(
+        elapsed_seconds=20.0,
+        jobs_total=3,
+        jobs_completed=2,
+        feeds_processed=400,
+        feeds_error=4,
+        articles_linked=1000,
+        job_completion_seconds=[4.0, 9.0],
+        queue_lag_samples=[120, 40, 0],
+    )
+
+    assert report.feeds_per_second == 20.0
+    assert report.articles_per_second == 50.0
+    assert report.format_lines() == [
+        "elapsed: 20.0s",
+        "jobs completed: 2/3",
+        "feeds processed: 400 (4 errors), 20.0 feeds/s",
+        "articles linked: 1000, 50.0 articles/s",
+        "job completion: p50 4.0s, p99 9.0s",
+        "queue lag (entries): max 120, p50 40.0",
+    ]
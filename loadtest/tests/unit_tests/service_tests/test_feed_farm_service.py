@@ -0,0 +1,94 @@
+import asyncio
+from collections import Counter
+
+import httpx
+
+from app.domain import FeedFarmSettings
+from app.services.feed_farm_service import HostRateLimiter, start_feed_farm_server
+
+
+def _build_settings(**overrides) -> FeedFarmSettings:
+    values = {
+        "host_count": 2,
+        "feeds_per_host": 3,
+        "items_per_feed": 2,
+        "summary_bytes": 8,
+        "latency_ms": 0.0,
+        "latency_jitter_ms": 0.0,
+        "error_rate": 0.0,
+        "change_interval_seconds": 300.0,
+        "host_max_requests_per_second": None,
+    }
+    values.update(overrides)
+    return FeedFarmSettings(**values)
+
+
+async def _request_paths(
+    settings: FeedFarmSettings,
+    requests: list[tuple[str, dict[str, str]]],
+    *,
+    random_source=lambda: 0.5,
+) -> tuple[list[httpx.Response], Counter]:
+    stats: Counter[str] = Counter()
+    server = await start_feed_farm_server(
+        settings=settings,
+        host="127.0.0.1",
+        port=0,
+        stats=stats,
+        random_source=random_source,
+    )
+    port = server.sockets[0].getsockname()[1]
+    responses = []
+    async with server:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+            for path, headers in requests:
+                responses.append(await client.get(path, headers=headers))
+    return responses, stats
+
+
+def test_feed_farm_serves_feeds_and_honours_etags() -> None:
+    async def scenario() -> tuple[list[httpx.Response], Counter]:
+        first_responses, _ = await _request_paths(_build_settings(), [("/h1/f2.xml", {})])
+        etag = first_responses[0].headers["etag"]
+        responses, stats = await _request_paths(
+            _build_settings(),
+            [
+                ("/h1/f2.xml", {"If-None-Match": etag}),
+                ("/h2/f0.xml", {}),
+                ("/h1/f2.xml", {}),
+            ],
+        )
+        return [first_responses[0], *responses], stats
+
+    responses, stats = asyncio.run(scenario())
+
+    assert [response.status_code for response in responses] == [200, 304, 404, 200]
+    assert responses[0].text.count("<item>") == 2
+    assert responses[1].content == b""
+    assert stats["200"] == 1
+    assert stats["304"] == 1
+    assert stats["404"] == 1
+
+
+def test_feed_farm_applies_error_rate_and_host_rate_limit() -> None:
+    responses, stats = asyncio.run(
+        _request_paths(
+            _build_settings(error_rate=0.5, host_max_requests_per_second=1.0),
+            [("/h0/f0.xml", {}), ("/h0/f1.xml", {}), ("/h1/f0.xml", {})],
+            random_source=lambda: 0.1,
+        )
+    )
+
+    assert [response.status_code for response in responses] == [500, 429, 500]
+    assert responses[1].headers["retry-after"] == "1"
+    assert stats["429"] == 1
+
+
+def test_host_rate_limiter_refills_per_host() -> None:
+    rate_limiter = HostRateLimiter(max_requests_per_second=2.0)
+
+    assert rate_limiter.try_acquire(0, now=0.0) is True
+    assert rate_limiter.try_acquire(0, now=0.0) is True
+    assert rate_limiter.try_acquire(0, now=0.0) is False
+    assert rate_limiter.try_acquire(1, now=0.0) is True
+    assert rate_limiter.try_acquire(0, now=0.5) is True
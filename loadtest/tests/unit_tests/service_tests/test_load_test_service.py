@@ -0,0 +1,56 @@
+import asyncio
+from itertools import count
+
+import app.services.load_test_service as load_test_service_module
+
+
+def test_build_feed_urls_by_host_targets_every_farm_feed() -> None:
+    feed_urls_by_host = load_test_service_module.build_feed_urls_by_host(
+        farm_base_url="http://feed_farm:8080/",
+        host_count=2,
+        feeds_per_host=2,
+    )
+
+    assert feed_urls_by_host == {
+        0: ["http://feed_farm:8080/h0/f0.xml", "http://feed_farm:8080/h0/f1.xml"],
+        1: ["http://feed_farm:8080/h1/f0.xml", "http://feed_farm:8080/h1/f1.xml"],
+    }
+
+
+def test_wait_for_jobs_polls_until_terminal_and_samples_queue_lag(monkeypatch) -> None:
+    job_status_sequences = {
+        "job-a": iter(["processing", "completed"]),
+        "job-b": iter(["completed_with_errors"]),
+    }
+    lag_samples = iter([30, 5])
+
+    async def fake_read_job_status(_client, *, job_id: str) -> dict:
+        return {"status": next(job_status_sequences[job_id]), "feeds_processed": 1}
+
+    async def fake_read_pipeline_backlog(_redis_client) -> int:
+        return next(lag_samples)
+
+    async def fake_sleep(_seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(load_test_service_module, "read_job_status", fake_read_job_status)
+    monkeypatch.setattr(load_test_service_module, "read_pipeline_backlog", fake_read_pipeline_backlog)
+    monkeypatch.setattr(load_test_service_module.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(load_test_service_module.time, "monotonic", count(10).__next__)
+
+    job_statuses, job_completion_seconds, queue_lag_samples = asyncio.run(
+        load_test_service_module._wait_for_jobs(
+            None,
+            None,
+            enqueued_at={"job-a": 0.0, "job-b": 0.0},
+            poll_interval_seconds=1.0,
+            deadline=1000.0,
+        )
+    )
+
+    assert {job_id: status["status"] for job_id, status in job_statuses.items()} == {
+        "job-a": "completed",
+        "job-b": "completed_with_errors",
+    }
+    assert sorted(job_completion_seconds) == [12.0, 14.0]
+    assert queue_lag_samples == [30, 5]
@@ -0,0 +1,19 @@
+from .feed_body_archive_client import (
+    DEFAULT_BODY_ARCHIVE_RETENTION_DAYS,
+    FeedBodyArchiveEntry,
+    iter_feed_body_entries,
+    prune_feed_body_archive,
+    read_feed_body,
+    resolve_feed_body_archive_dir,
+    write_feed_body,
+)
+
+__all__ = [
+    "DEFAULT_BODY_ARCHIVE_RETENTION_DAYS",
+    "FeedBodyArchiveEntry",
+    "iter_feed_body_entries",
+    "prune_feed_body_archive",
+    "read_feed_body",
+    "resolve_feed_body_archive_dir",
+    "write_feed_body",
+]
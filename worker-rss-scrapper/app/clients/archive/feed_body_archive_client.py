@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, time, timedelta, timezone
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+from typing import Any
+
+DEFAULT_BODY_ARCHIVE_RETENTION_DAYS = 30
+_OBJECTS_DIR_NAME = "objects"
+_INDEX_DIR_NAME = "index"
+
+
+class FeedBodyArchiveEntry:
+    def __init__(
+        self,
+        *,
+        feed_id: int,
+        feed_url: str,
+        fetchprotection: int,
+        fetched_at: datetime,
+        sha256: str,
+        encoding: str | None,
+        etag: str | None,
+        last_modified: datetime | None,
+        size: int,
+    ) -> None:
+        self.feed_id = feed_id
+        self.feed_url = feed_url
+        self.fetchprotection = fetchprotection
+        self.fetched_at = fetched_at
+        self.sha256 = sha256
+        self.encoding = encoding
+        self.etag = etag
+        self.last_modified = last_modified
+        self.size = size
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "feed_id": self.feed_id,
+            "feed_url": self.feed_url,
+            "fetchprotection": self.fetchprotection,
+            "fetched_at": self.fetched_at.isoformat(),
+            "sha256": self.sha256,
+            "encoding": self.encoding,
+            "etag": self.etag,
+            "last_modified": self.last_modified.isoformat() if self.last_modified else None,
+            "size": self.size,
+        }
+
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> FeedBodyArchiveEntry:
+        last_modified = values.get("last_modified")
+        return cls(
+            feed_id=int(values["feed_id"]),
+            feed_url=values["feed_url"],
+            fetchprotection=int(values["fetchprotection"]),
+            fetched_at=datetime.fromisoformat(values["fetched_at"]),
+            sha256=values["sha256"],
+            encoding=values.get("encoding"),
+            etag=values.get("etag"),
+            last_modified=datetime.fromisoformat(last_modified) if last_modified else None,
+            size=int(values["size"]),
+        )
+
+
+def resolve_feed_body_archive_dir() -> Path | None:
+    archive_dir = os.getenv("WORKER_BODY_ARCHIVE_DIR", "").strip()
+    return Path(archive_dir) if archive_dir else None
+
+
+def write_feed_body(
+    archive_dir: Path,
+    *,
+    feed_id: int,
+    feed_url: str,
+    fetchprotection: int,
+    body: bytes,
+    encoding: str | None,
+    etag: str | None,
+    last_modified: datetime | None,
+    fetched_at: datetime,
+) -> FeedBodyArchiveEntry:
+    # Bodies are content-addressed, so an unchanged feed served without a 304 is
+    # stored once; the index keeps one line per feed and fetch.
+    sha256 = hashlib.sha256(body).hexdigest()
+    object_path = _resolve_object_path(archive_dir, sha256)
+    if object_path.exists():
+        # A fresh mtime keeps the object past retention while the index refers to it.
+        os.utime(object_path)
+    else:
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = object_path.with_name(f"{object_path.name}.{os.getpid()}.tmp")
+        temporary_path.write_bytes(gzip.compress(body, compresslevel=6))
+        os.replace(temporary_path, object_path)
+
+    entry = FeedBodyArchiveEntry(
+        feed_id=feed_id,
+        feed_url=feed_url,
+        fetchprotection=fetchprotection,
+        fetched_at=fetched_at,
+        sha256=sha256,
+        encoding=encoding,
+        etag=etag,
+        last_modified=last_modified,
+        size=len(body),
+    )
+    index_path = archive_dir / _INDEX_DIR_NAME / fetched_at.strftime("%Y-%m-%d") / f"{feed_id}.jsonl"
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    with index_path.open("a", encoding="utf-8") as index_file:
+        index_file.write(json.dumps(entry.to_dict()) + "\n")
+    return entry
+
+
+def read_feed_body(archive_dir: Path, sha256: str) -> bytes:
+    return gzip.decompress(_resolve_object_path(archive_dir, sha256).read_bytes())
+
+
+def iter_feed_body_entries(
+    archive_dir: Path,
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    feed_ids: set[int] | None = None,
+) -> Iterator[FeedBodyArchiveEntry]:
+    index_root = archive_dir / _INDEX_DIR_NAME
+    if not index_root.is_dir():
+        return
+    for day_dir in sorted(index_root.iterdir()):
+        if since is not None and day_dir.name < since.strftime("%Y-%m-%d"):
+            continue
+        if until is not None and day_dir.name > until.strftime("%Y-%m-%d"):
+            continue
+        for index_path in sorted(day_dir.glob("*.jsonl")):
+            if feed_ids is not None and int(index_path.stem) not in feed_ids:
+                continue
+            with index_path.open(encoding="utf-8") as index_file:
+                for line in index_file:
+                    if not line.strip():
+                        continue
+                    entry = FeedBodyArchiveEntry.from_dict(json.loads(line))
+                    if since is not None and entry.fetched_at < since:
+                        continue
+                    if until is not None and entry.fetched_at > until:
+                        continue
+                    yield entry
+
+
+def prune_feed_body_archive(
+    archive_dir: Path,
+    *,
+    retention_days: int,
+    now: datetime,
+) -> tuple[int, int]:
+    # Whole index days are dropped, and objects untouched since the first kept day,
+    # so every kept index line still finds its body.
+    first_kept_day = (now - timedelta(days=retention_days)).date()
+    object_cutoff = datetime.combine(first_kept_day, time.min, tzinfo=timezone.utc).timestamp()
+
+    removed_days = 0
+    index_root = archive_dir / _INDEX_DIR_NAME
+    if index_root.is_dir():
+        for day_dir in index_root.iterdir():
+            if day_dir.name < first_kept_day.isoformat():
+                shutil.rmtree(day_dir, ignore_errors=True)
+                removed_days += 1
+
+    removed_objects = 0
+    objects_root = archive_dir / _OBJECTS_DIR_NAME
+    if objects_root.is_dir():
+        for object_path in objects_root.glob("*/*.gz"):
+            try:
+                if object_path.stat().st_mtime < object_cutoff:
+                    object_path.unlink()
+                    removed_objects += 1
+            except FileNotFoundError:
+                # Another worker process pruned it first.
+                continue
+    return removed_days, removed_objects
+
+
+def _resolve_object_path(archive_dir: Path, sha256: str) -> Path:
+    return archive_dir / _OBJECTS_DIR_NAME / sha256[:2] / f"{sha256}.gz"
@@ -1,5 +1,7 @@
-from .rss_fetch_networking_client import fetch_feed_result
+from .rss_fetch_networking_client import FeedBody, fetch_feed_body, fetch_feed_result
 
 __all__ = [
+    "FeedBody",
+    "fetch_feed_body",
     "fetch_feed_result",
-]
\ No newline at end of file
+]
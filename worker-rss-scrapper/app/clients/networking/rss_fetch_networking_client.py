@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from email.utils import format_datetime, parsedate_to_datetime
+import logging
+from pathlib import Path
+import time
 
 import httpx
 
+from app.clients.archive import write_feed_body
 from app.domain import normalize_feed_sources, parse_rss_feed_entries
 from app.schemas.scrape_job_schema import ScrapeJobFeedSchema
 from app.schemas.scrape_result_schema import ScrapeResultSchema
+from app.utils import worker_metrics
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT_SECONDS = 15.0
 DEFAULT_MAX_ATTEMPTS = 3
@@ -28,11 +35,81 @@ DEFAULT_RSS_HEADERS = {
 }
 
 
+class FeedFetchTimings:
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.connect_seconds: float | None = None
+        self.ttfb_seconds: float | None = None
+        self.download_seconds: float | None = None
+        self.parse_seconds: float | None = None
+        self.response_bytes: int | None = None
+        self.entries_parsed: int | None = None
+        self.entries_kept: int | None = None
+        self._attempt_started_at = self.started_at
+        self._connect_started_at: float | None = None
+        self._response_headers_at: float | None = None
+
+    def start_attempt(self) -> None:
+        self._attempt_started_at = time.perf_counter()
+        self.connect_seconds = None
+        self.ttfb_seconds = None
+        self.download_seconds = None
+        self._response_headers_at = None
+
+    async def trace(self, event_name: str, info: dict) -> None:
+        # httpcore trace events; redirect hops accumulate into the same attempt.
+        now = time.perf_counter()
+        if event_name.endswith((".connect_tcp.started", ".start_tls.started")):
+            self._connect_started_at = now
+        elif event_name.endswith((".connect_tcp.complete", ".start_tls.complete")):
+            if self._connect_started_at is not None:
+                self.connect_seconds = (self.connect_seconds or 0.0) + now - self._connect_started_at
+                self._connect_started_at = None
+        elif event_name.endswith(".receive_response_headers.complete"):
+            self._response_headers_at = now
+            self.ttfb_seconds = now - self._attempt_started_at
+            if self.connect_seconds is None:
+                self.connect_seconds = 0.0
+        elif event_name.endswith(".receive_response_body.complete"):
+            if self._response_headers_at is not None:
+                self.download_seconds = now - self._response_headers_at
+
+    def to_result_fields(self) -> dict[str, int | None]:
+        return {
+            "connect_ms": _to_milliseconds(self.connect_seconds),
+            "ttfb_ms": _to_milliseconds(self.ttfb_seconds),
+            "download_ms": _to_milliseconds(self.download_seconds),
+            "parse_ms": _to_milliseconds(self.parse_seconds),
+            "total_ms": _to_milliseconds(time.perf_counter() - self.started_at),
+            "response_bytes": self.response_bytes,
+            "entries_parsed": self.entries_parsed,
+            "entries_kept": self.entries_kept,
+        }
+
+
+class FeedBody:
+    def __init__(
+        self,
+        *,
+        status_code: int,
+        content: bytes,
+        encoding: str | None,
+        etag: str | None,
+        last_modified: datetime | None,
+    ) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding
+        self.etag = etag
+        self.last_modified = last_modified
+
+
 async def fetch_feed_result(
     *,
     feed: ScrapeJobFeedSchema,
     ingest: bool,
     http_client: httpx.AsyncClient | None = None,
+    body_archive_dir: Path | None = None,
 ) -> ScrapeResultSchema:
     if feed.fetchprotection == 0:
         return _error_result(
@@ -42,13 +119,54 @@ async def fetch_feed_result(
             error_message="Blocked by fetch protection",
         )
 
+    timings = FeedFetchTimings()
+    result = await _fetch_feed_result(
+        feed=feed,
+        ingest=ingest,
+        http_client=http_client,
+        timings=timings,
+        body_archive_dir=body_archive_dir,
+    )
+    return result.model_copy(update=timings.to_result_fields())
+
+
+async def fetch_feed_body(
+    *,
+    feed: ScrapeJobFeedSchema,
+    http_client: httpx.AsyncClient | None = None,
+) -> FeedBody:
+    response = await _perform_request_with_retry(
+        url=feed.feed_url,
+        headers=_build_request_headers(feed),
+        client=http_client,
+        timings=FeedFetchTimings(),
+    )
+    return FeedBody(
+        status_code=response.status_code,
+        content=response.content,
+        encoding=response.encoding,
+        etag=_clean_header_value(response.headers.get("etag")),
+        last_modified=_parse_http_date(response.headers.get("last-modified")),
+    )
+
+
+async def _fetch_feed_result(
+    *,
+    feed: ScrapeJobFeedSchema,
+    ingest: bool,
+    http_client: httpx.AsyncClient | None,
+    timings: FeedFetchTimings,
+    body_archive_dir: Path | None = None,
+) -> ScrapeResultSchema:
     request_headers = _build_request_headers(feed)
 
+    fetch_started_at = time.perf_counter()
     try:
         response = await _perform_request_with_retry(
             url=feed.feed_url,
             headers=request_headers,
             client=http_client,
+            timings=timings,
         )
     except httpx.TimeoutException:
         return _error_result(
@@ -71,9 +189,18 @@ async def fetch_feed_result(
             feed=feed,
             error_message=f"Unknown fetch error: {exception}",
         )
+    finally:
+        worker_metrics.observe(
+            "worker_stage_duration_seconds",
+            time.perf_counter() - fetch_started_at,
+            stage="fetch",
+        )
+    timings.response_bytes = len(response.content)
+    worker_metrics.increment("worker_downloaded_bytes_total", timings.response_bytes)
 
     response_etag = _clean_header_value(response.headers.get("etag"))
     response_last_modified = _parse_http_date(response.headers.get("last-modified"))
+    cache_expires_at = _resolve_cache_expires_at(response.headers)
     if response.status_code == 304:
         return ScrapeResultSchema(
             job_id="",
@@ -84,6 +211,7 @@ async def fetch_feed_result(
             fetchprotection=feed.fetchprotection,
             new_etag=response_etag,
             new_last_update=response_last_modified,
+            cache_expires_at=cache_expires_at,
             sources=[],
         )
 
@@ -101,12 +229,25 @@ async def fetch_feed_result(
             fetchprotection=feed.fetchprotection,
             new_etag=response_etag,
             new_last_update=response_last_modified,
+            cache_expires_at=cache_expires_at,
             sources=[],
         )
 
+    if body_archive_dir is not None:
+        await _archive_feed_body(
+            body_archive_dir,
+            feed=feed,
+            response=response,
+            response_etag=response_etag,
+            response_last_modified=response_last_modified,
+        )
+
     try:
-        parsed_entries, parsed_last_modified = parse_rss_feed_entries(response.text)
+        parse_started_at = time.perf_counter()
+        parsed_entries, parsed_last_modified, freshness_hints = parse_rss_feed_entries(response.text)
+        normalize_started_at = time.perf_counter()
         normalized_sources = normalize_feed_sources(parsed_entries)
+        normalize_finished_at = time.perf_counter()
     except Exception as exception:
         return _error_result(
             job_id="",
@@ -116,6 +257,21 @@ async def fetch_feed_result(
             etag=response_etag,
             last_update=response_last_modified,
         )
+    worker_metrics.observe(
+        "worker_stage_duration_seconds",
+        normalize_started_at - parse_started_at,
+        stage="parse",
+    )
+    worker_metrics.observe(
+        "worker_stage_duration_seconds",
+        normalize_finished_at - normalize_started_at,
+        stage="normalize",
+    )
+    timings.parse_seconds = normalize_finished_at - parse_started_at
+    timings.entries_parsed = len(parsed_entries)
+    timings.entries_kept = len(normalized_sources)
+    worker_metrics.increment("worker_entries_parsed_total", timings.entries_parsed)
+    worker_metrics.increment("worker_entries_kept_total", timings.entries_kept)
 
     return ScrapeResultSchema(
         job_id="",
@@ -126,10 +282,42 @@ async def fetch_feed_result(
         fetchprotection=feed.fetchprotection,
         new_etag=response_etag,
         new_last_update=response_last_modified or parsed_last_modified,
+        ttl_seconds=freshness_hints["ttl_seconds"],
+        skip_hours=freshness_hints["skip_hours"],
+        cache_expires_at=cache_expires_at,
         sources=normalized_sources,
     )
 
 
+async def _archive_feed_body(
+    body_archive_dir: Path,
+    *,
+    feed: ScrapeJobFeedSchema,
+    response: httpx.Response,
+    response_etag: str | None,
+    response_last_modified: datetime | None,
+) -> None:
+    # The archive is best effort: a full or unmounted disk must not fail the fetch.
+    try:
+        await asyncio.to_thread(
+            write_feed_body,
+            body_archive_dir,
+            feed_id=feed.feed_id,
+            feed_url=feed.feed_url,
+            fetchprotection=feed.fetchprotection,
+            body=response.content,
+            encoding=response.encoding,
+            etag=response_etag,
+            last_modified=response_last_modified,
+            fetched_at=datetime.now(timezone.utc),
+        )
+    except OSError as exception:
+        logger.warning("Could not archive body of feed %s: %s", feed.feed_id, exception)
+        worker_metrics.increment("worker_body_archive_errors_total")
+        return
+    worker_metrics.increment("worker_body_archive_writes_total")
+
+
 def _build_request_headers(feed: ScrapeJobFeedSchema) -> dict[str, str] | None:
     headers: dict[str, str] = {}
     if feed.fetchprotection == 2:
@@ -158,21 +346,33 @@ async def _perform_request_with_retry(
     url: str,
     headers: dict[str, str] | None,
     client: httpx.AsyncClient | None,
+    timings: FeedFetchTimings,
 ) -> httpx.Response:
     attempt = 0
     last_exception: Exception | None = None
 
     while attempt < DEFAULT_MAX_ATTEMPTS:
         attempt += 1
+        if attempt > 1:
+            worker_metrics.increment("worker_fetch_retries_total")
+        timings.start_attempt()
         try:
             if client is None:
                 async with httpx.AsyncClient(
                     timeout=DEFAULT_TIMEOUT_SECONDS,
                     follow_redirects=True,
                 ) as transient_client:
-                    response = await transient_client.get(url, headers=headers)
+                    response = await transient_client.get(
+                        url,
+                        headers=headers,
+                        extensions={"trace": timings.trace},
+                    )
             else:
-                response = await client.get(url, headers=headers)
+                response = await client.get(
+                    url,
+                    headers=headers,
+                    extensions={"trace": timings.trace},
+                )
 
             if response.status_code in {200, 304}:
                 return response
@@ -229,6 +429,27 @@ def _is_same_version(
     return False
 
 
+def _resolve_cache_expires_at(headers: httpx.Headers) -> datetime | None:
+    cache_control = _clean_header_value(headers.get("cache-control"))
+    if cache_control is not None:
+        directives: dict[str, str | None] = {}
+        for raw_directive in cache_control.split(","):
+            name, _, value = raw_directive.strip().partition("=")
+            directives[name.strip().lower()] = value.strip().strip('"') or None
+        if {"no-store", "no-cache"} & directives.keys():
+            return None
+        max_age = directives.get("max-age")
+        if max_age is not None and max_age.isdigit():
+            if int(max_age) <= 0:
+                return None
+            return datetime.now(timezone.utc) + timedelta(seconds=int(max_age))
+
+    expires_at = _parse_http_date(headers.get("expires"))
+    if expires_at is None or expires_at <= datetime.now(timezone.utc):
+        return None
+    return expires_at
+
+
 def _format_http_date(value: datetime) -> str:
     normalized = _normalize_datetime(value)
     return format_datetime(normalized, usegmt=True)
@@ -251,6 +472,12 @@ def _normalize_datetime(value: datetime) -> datetime:
     return value.astimezone(timezone.utc)
 
 
+def _to_milliseconds(seconds: float | None) -> int | None:
+    if seconds is None:
+        return None
+    return max(round(seconds * 1000), 0)
+
+
 def _clean_header_value(value: str | None) -> str | None:
     if value is None:
         return None
@@ -1,17 +1,45 @@
 from .redis_queue_client import (
+    DEFAULT_BULK_LANE_WEIGHT,
+    DEFAULT_INTERACTIVE_LANE_WEIGHT,
+    DEFAULT_MAX_DELIVERIES,
+    REDIS_CONSUMER_NAME,
+    REDIS_QUEUE_REQUESTS,
+    REDIS_QUEUE_REQUESTS_INTERACTIVE,
+    resolve_request_stream_names,
+    resolve_legacy_request_stream_names,
+    read_request_shard_count,
     ensure_worker_consumer_group,
     read_scrape_jobs,
+    claim_idle_scrape_jobs,
+    read_pending_scrape_jobs,
+    resolve_message_queue_wait_ms,
     publish_check_result,
     publish_ingest_result,
     publish_error_result,
     ack_scrape_job,
+    dead_letter_scrape_job,
+    close_redis_client,
 )
 
 __all__ = [
+    "DEFAULT_BULK_LANE_WEIGHT",
+    "DEFAULT_INTERACTIVE_LANE_WEIGHT",
+    "DEFAULT_MAX_DELIVERIES",
+    "REDIS_CONSUMER_NAME",
+    "REDIS_QUEUE_REQUESTS",
+    "REDIS_QUEUE_REQUESTS_INTERACTIVE",
+    "resolve_request_stream_names",
+    "resolve_legacy_request_stream_names",
+    "read_request_shard_count",
     "ensure_worker_consumer_group",
     "read_scrape_jobs",
+    "claim_idle_scrape_jobs",
+    "read_pending_scrape_jobs",
+    "resolve_message_queue_wait_ms",
     "publish_check_result",
     "publish_ingest_result",
     "publish_error_result",
     "ack_scrape_job",
-]
\ No newline at end of file
+    "dead_letter_scrape_job",
+    "close_redis_client",
+]
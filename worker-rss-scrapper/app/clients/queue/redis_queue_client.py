@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 import json
 import os
 from typing import Any, Awaitable, Callable, TypeVar
@@ -9,84 +10,216 @@ from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import ResponseError, TimeoutError as RedisTimeoutError
 
 from app.errors.worker_exceptions import WorkerQueueError
+from app.utils import worker_metrics
 
 DEFAULT_REDIS_URL = "redis://redis:6379/0"
 REDIS_QUEUE_REQUESTS = "rss_scrape_requests"
+REDIS_QUEUE_REQUESTS_INTERACTIVE = "rss_scrape_requests_interactive"
 REDIS_QUEUE_CHECK = "rss_check_results"
 REDIS_QUEUE_INGEST = "rss_ingest_results"
 REDIS_QUEUE_ERRORS = "error_feeds_parsing"
 REDIS_GROUP_WORKER = "worker_rss_scrapper_group"
 REDIS_CONSUMER_NAME = "worker_rss_scrapper_1"
+REDIS_REQUEST_SHARD_COUNT_KEY = "rss_scrape_request_shards"
+REDIS_QUEUE_DEAD_LETTERS = "rss_dead_letters"
+DEAD_LETTER_STREAM_MAXLEN = 100_000
+DEFAULT_MAX_DELIVERIES = 5
+
+DEFAULT_INTERACTIVE_LANE_WEIGHT = 4
+DEFAULT_BULK_LANE_WEIGHT = 1
 
 _redis_client: Redis | None = None
 _REDIS_COMMAND_MAX_ATTEMPTS = 2
 _T = TypeVar("_T")
 
 
-async def ensure_worker_consumer_group() -> None:
+def resolve_request_stream_names(*, shard_index: int = 0, shard_count: int = 1) -> tuple[str, str]:
+    if shard_count <= 1:
+        return REDIS_QUEUE_REQUESTS_INTERACTIVE, REDIS_QUEUE_REQUESTS
+    if shard_index < 0 or shard_index >= shard_count:
+        raise WorkerQueueError(
+            f"Worker shard index {shard_index} is out of range for {shard_count} shards"
+        )
+    return (
+        f"{REDIS_QUEUE_REQUESTS_INTERACTIVE}:{shard_index}",
+        f"{REDIS_QUEUE_REQUESTS}:{shard_index}",
+    )
+
+
+def resolve_legacy_request_stream_names(*, shard_index: int = 0, shard_count: int = 1) -> tuple[str, ...]:
+    # Messages queued before sharding was enabled stay on the unsharded streams; the
+    # first shard keeps draining them.
+    if shard_count <= 1 or shard_index != 0:
+        return ()
+    return REDIS_QUEUE_REQUESTS_INTERACTIVE, REDIS_QUEUE_REQUESTS
+
+
+async def read_request_shard_count() -> int | None:
+    raw_value = await _run_redis_command(
+        command_name="get",
+        command=lambda redis_client: redis_client.get(REDIS_REQUEST_SHARD_COUNT_KEY),
+    )
+    if raw_value is None:
+        return None
     try:
-        await _run_redis_command(
-            command_name="xgroup_create",
-            command=lambda redis_client: redis_client.xgroup_create(
-                REDIS_QUEUE_REQUESTS,
+        return int(_decode_redis_value(raw_value))
+    except ValueError as exception:
+        raise WorkerQueueError(
+            f"Invalid {REDIS_REQUEST_SHARD_COUNT_KEY} value in Redis: {raw_value!r}"
+        ) from exception
+
+
+async def ensure_worker_consumer_group(
+    stream_names: tuple[str, ...] = (REDIS_QUEUE_REQUESTS_INTERACTIVE, REDIS_QUEUE_REQUESTS),
+) -> None:
+    for stream_name in stream_names:
+        try:
+            await _run_redis_command(
+                command_name="xgroup_create",
+                command=lambda redis_client, stream_name=stream_name: redis_client.xgroup_create(
+                    stream_name,
+                    REDIS_GROUP_WORKER,
+                    id="$",
+                    mkstream=True,
+                ),
+            )
+        except ResponseError as exception:
+            if "BUSYGROUP" not in str(exception):
+                raise WorkerQueueError(f"Unable to create worker consumer group: {exception}") from exception
+
+
+async def read_scrape_jobs(
+    *,
+    count: int = 1,
+    block_ms: int = 5000,
+    interactive_weight: int = DEFAULT_INTERACTIVE_LANE_WEIGHT,
+    bulk_weight: int = DEFAULT_BULK_LANE_WEIGHT,
+    interactive_stream: str = REDIS_QUEUE_REQUESTS_INTERACTIVE,
+    bulk_stream: str = REDIS_QUEUE_REQUESTS,
+    legacy_streams: tuple[str, ...] = (),
+    consumer_name: str = REDIS_CONSUMER_NAME,
+) -> list[tuple[str, str, dict[str, Any]]]:
+    interactive_quota = _resolve_interactive_quota(
+        count=count,
+        interactive_weight=interactive_weight,
+        bulk_weight=bulk_weight,
+    )
+
+    # Each lane gets its weighted share first; capacity left unused by one lane goes
+    # to the other so reads stay work-conserving.
+    jobs = await _read_request_streams(
+        {interactive_stream: ">"},
+        count=interactive_quota,
+        block_ms=None,
+        consumer_name=consumer_name,
+    )
+    if jobs is None:
+        return []
+    interactive_lane_full = len(jobs) >= interactive_quota
+    if len(jobs) < count:
+        jobs += await _read_request_streams(
+            {bulk_stream: ">"},
+            count=count - len(jobs),
+            block_ms=None,
+            consumer_name=consumer_name,
+        ) or []
+    if len(jobs) < count and interactive_lane_full:
+        jobs += await _read_request_streams(
+            {interactive_stream: ">"},
+            count=count - len(jobs),
+            block_ms=None,
+            consumer_name=consumer_name,
+        ) or []
+    if len(jobs) < count and legacy_streams:
+        jobs += await _read_request_streams(
+            {stream_name: ">" for stream_name in legacy_streams},
+            count=count - len(jobs),
+            block_ms=None,
+            consumer_name=consumer_name,
+        ) or []
+    if jobs:
+        return jobs
+
+    return await _read_request_streams(
+        {
+            interactive_stream: ">",
+            bulk_stream: ">",
+            **{stream_name: ">" for stream_name in legacy_streams},
+        },
+        count=count,
+        block_ms=block_ms,
+        consumer_name=consumer_name,
+    ) or []
+
+
+async def claim_idle_scrape_jobs(
+    *,
+    stream_name: str,
+    min_idle_ms: int,
+    start_id: str = "0-0",
+    count: int = 1,
+    consumer_name: str = REDIS_CONSUMER_NAME,
+    max_deliveries: int = DEFAULT_MAX_DELIVERIES,
+) -> tuple[str, list[tuple[str, str, dict[str, Any]]]]:
+    try:
+        response = await _run_redis_command(
+            command_name="xautoclaim",
+            command=lambda redis_client: redis_client.xautoclaim(
+                stream_name,
                 REDIS_GROUP_WORKER,
-                id="$",
-                mkstream=True,
+                consumer_name,
+                min_idle_ms,
+                start_id=start_id,
+                count=count,
             ),
         )
     except ResponseError as exception:
-        if "BUSYGROUP" not in str(exception):
-            raise WorkerQueueError(f"Unable to create worker consumer group: {exception}") from exception
+        if "NOGROUP" in str(exception):
+            return "0-0", []
+        raise WorkerQueueError(f"Unable to claim idle scrape jobs: {exception}") from exception
 
+    jobs = await _decode_pending_messages(stream_name, response[1], max_deliveries=max_deliveries)
+    return _decode_redis_value(response[0]), jobs
 
-async def read_scrape_jobs(
+
+async def read_pending_scrape_jobs(
     *,
+    stream_name: str,
+    after_id: str = "0",
     count: int = 1,
-    block_ms: int = 5000,
-) -> list[tuple[str, dict[str, Any]]]:
+    consumer_name: str = REDIS_CONSUMER_NAME,
+    max_deliveries: int = DEFAULT_MAX_DELIVERIES,
+) -> tuple[str | None, list[tuple[str, str, dict[str, Any]]]]:
     try:
         records = await _run_redis_command(
             command_name="xreadgroup",
             command=lambda redis_client: redis_client.xreadgroup(
                 REDIS_GROUP_WORKER,
-                REDIS_CONSUMER_NAME,
-                {REDIS_QUEUE_REQUESTS: ">"},
+                consumer_name,
+                {stream_name: after_id},
                 count=count,
-                block=block_ms,
+                block=None,
             ),
         )
     except ResponseError as exception:
         if "NOGROUP" in str(exception):
-            await ensure_worker_consumer_group()
-            return []
-        raise WorkerQueueError(f"Unable to read scrape jobs: {exception}") from exception
+            return None, []
+        raise WorkerQueueError(f"Unable to read pending scrape jobs: {exception}") from exception
 
-    if not records:
-        return []
+    messages = records[0][1] if records else []
+    if not messages:
+        return None, []
+    jobs = await _decode_pending_messages(stream_name, messages, max_deliveries=max_deliveries)
+    return _decode_redis_value(messages[-1][0]), jobs
 
-    jobs: list[tuple[str, dict[str, Any]]] = []
-    for _, messages in records:
-        for message_id, fields in messages:
-            payload_raw = fields.get(b"payload") or fields.get("payload")
-            if payload_raw is None:
-                continue
-            try:
-                payload_json = (
-                    payload_raw.decode("utf-8")
-                    if isinstance(payload_raw, (bytes, bytearray))
-                    else str(payload_raw)
-                )
-                payload = json.loads(payload_json)
-            except Exception as exception:
-                raise WorkerQueueError(f"Invalid queue payload: {exception}") from exception
-
-            resolved_message_id = (
-                message_id.decode("utf-8")
-                if isinstance(message_id, (bytes, bytearray))
-                else str(message_id)
-            )
-            jobs.append((resolved_message_id, payload))
-    return jobs
+
+def resolve_message_queue_wait_ms(message_id: str, *, now_ms: int) -> int | None:
+    timestamp_part, _, _ = message_id.partition("-")
+    try:
+        published_at_ms = int(timestamp_part)
+    except ValueError:
+        return None
+    return max(now_ms - published_at_ms, 0)
 
 
 async def publish_check_result(payload: dict[str, Any]) -> None:
@@ -101,12 +234,12 @@ async def publish_error_result(payload: dict[str, Any]) -> None:
     await _publish_payload(REDIS_QUEUE_ERRORS, payload)
 
 
-async def ack_scrape_job(message_id: str) -> None:
+async def ack_scrape_job(message_id: str, *, stream_name: str = REDIS_QUEUE_REQUESTS) -> None:
     try:
         await _run_redis_command(
             command_name="xack",
             command=lambda redis_client: redis_client.xack(
-                REDIS_QUEUE_REQUESTS,
+                stream_name,
                 REDIS_GROUP_WORKER,
                 message_id,
             ),
@@ -115,6 +248,47 @@ async def ack_scrape_job(message_id: str) -> None:
         raise WorkerQueueError(f"Unable to ack scrape job {message_id}: {exception}") from exception
 
 
+async def dead_letter_scrape_job(
+    *,
+    stream_name: str,
+    message_id: str,
+    payload_raw: str,
+    reason: str,
+    delivery_count: int | None = None,
+) -> None:
+    # The dead letter is written and the request acked atomically, so a message is
+    # never lost between the two nor left in the PEL once dead-lettered.
+    fields = {
+        "source_stream": stream_name,
+        "source_group": REDIS_GROUP_WORKER,
+        "message_id": message_id,
+        "payload": payload_raw,
+        "reason": reason[:1000],
+        "delivery_count": str(delivery_count or 1),
+        "failed_at": datetime.now(timezone.utc).isoformat(),
+        "service": "worker_rss_scrapper",
+    }
+
+    async def _dead_letter(redis_client: Redis) -> list[Any]:
+        async with redis_client.pipeline(transaction=True) as pipeline:
+            pipeline.xadd(
+                REDIS_QUEUE_DEAD_LETTERS,
+                fields,
+                maxlen=DEAD_LETTER_STREAM_MAXLEN,
+                approximate=True,
+            )
+            pipeline.xack(stream_name, REDIS_GROUP_WORKER, message_id)
+            return await pipeline.execute()
+
+    try:
+        await _run_redis_command(command_name="dead_letter", command=_dead_letter)
+    except ResponseError as exception:
+        raise WorkerQueueError(
+            f"Unable to dead-letter scrape job {message_id}: {exception}"
+        ) from exception
+    worker_metrics.increment("worker_dead_letters_total", reason=reason.split(":", 1)[0])
+
+
 async def _publish_payload(stream_name: str, payload: dict[str, Any]) -> None:
     try:
         await _run_redis_command(
@@ -128,6 +302,177 @@ async def _publish_payload(stream_name: str, payload: dict[str, Any]) -> None:
         raise WorkerQueueError(f"Unable to publish result to {stream_name}: {exception}") from exception
 
 
+async def _read_request_streams(
+    streams: dict[str, str],
+    *,
+    count: int,
+    block_ms: int | None,
+    consumer_name: str = REDIS_CONSUMER_NAME,
+) -> list[tuple[str, str, dict[str, Any]]] | None:
+    try:
+        records = await _run_redis_command(
+            command_name="xreadgroup",
+            command=lambda redis_client: redis_client.xreadgroup(
+                REDIS_GROUP_WORKER,
+                consumer_name,
+                streams,
+                count=count,
+                block=block_ms,
+            ),
+        )
+    except ResponseError as exception:
+        if "NOGROUP" in str(exception):
+            await ensure_worker_consumer_group(tuple(streams))
+            return None
+        raise WorkerQueueError(f"Unable to read scrape jobs: {exception}") from exception
+
+    if not records:
+        return []
+
+    jobs: list[tuple[str, str, dict[str, Any]]] = []
+    for stream_name, messages in records:
+        resolved_stream_name = _decode_redis_value(stream_name)
+        for message_id, fields in messages:
+            payload_raw = fields.get(b"payload") or fields.get("payload")
+            if payload_raw is None:
+                continue
+            payload = await _decode_job_payload(
+                resolved_stream_name,
+                _decode_redis_value(message_id),
+                payload_raw,
+            )
+            if payload is not None:
+                jobs.append((resolved_stream_name, _decode_redis_value(message_id), payload))
+    return jobs
+
+
+async def close_redis_client() -> None:
+    if _redis_client is not None:
+        await _reset_redis_client(_redis_client)
+
+
+async def _decode_pending_messages(
+    stream_name: str,
+    messages: list[tuple[Any, Any]],
+    *,
+    max_deliveries: int,
+) -> list[tuple[str, str, dict[str, Any]]]:
+    # Pending entries whose message was trimmed from the stream come back without
+    # fields; they can never be processed, so they are acked right away.
+    jobs: list[tuple[str, str, dict[str, Any]]] = []
+    empty_message_ids: list[str] = []
+    delivery_counts = await _read_delivery_counts(
+        stream_name,
+        [_decode_redis_value(message_id) for message_id, fields in messages if fields],
+    )
+    for message_id, fields in messages:
+        fields = fields or {}
+        message_id = _decode_redis_value(message_id)
+        payload_raw = fields.get(b"payload") or fields.get("payload")
+        if payload_raw is None:
+            empty_message_ids.append(message_id)
+            continue
+        delivery_count = delivery_counts.get(message_id, 1)
+        # Reading a pending entry again counts as a delivery, so a message that keeps
+        # crashing or stalling the worker ends up here instead of cycling forever.
+        if delivery_count > max_deliveries:
+            await dead_letter_scrape_job(
+                stream_name=stream_name,
+                message_id=message_id,
+                payload_raw=_decode_redis_value(payload_raw),
+                reason=f"max_deliveries_exceeded: delivered {delivery_count} times",
+                delivery_count=delivery_count,
+            )
+            continue
+        payload = await _decode_job_payload(
+            stream_name,
+            message_id,
+            payload_raw,
+            delivery_count=delivery_count,
+        )
+        if payload is not None:
+            jobs.append((stream_name, message_id, payload))
+
+    if empty_message_ids:
+        await _run_redis_command(
+            command_name="xack",
+            command=lambda redis_client: redis_client.xack(
+                stream_name,
+                REDIS_GROUP_WORKER,
+                *empty_message_ids,
+            ),
+        )
+    return jobs
+
+
+async def _decode_job_payload(
+    stream_name: str,
+    message_id: str,
+    payload_raw: Any,
+    *,
+    delivery_count: int = 1,
+) -> dict[str, Any] | None:
+    payload_json = _decode_redis_value(payload_raw)
+    try:
+        payload = json.loads(payload_json)
+    except ValueError as exception:
+        await dead_letter_scrape_job(
+            stream_name=stream_name,
+            message_id=message_id,
+            payload_raw=payload_json,
+            reason=f"invalid_json: {exception}",
+            delivery_count=delivery_count,
+        )
+        return None
+    return payload
+
+
+async def _read_delivery_counts(stream_name: str, message_ids: list[str]) -> dict[str, int]:
+    if not message_ids:
+        return {}
+
+    async def _read(redis_client: Redis) -> list[Any]:
+        async with redis_client.pipeline(transaction=False) as pipeline:
+            for message_id in message_ids:
+                pipeline.xpending_range(
+                    stream_name,
+                    REDIS_GROUP_WORKER,
+                    min=message_id,
+                    max=message_id,
+                    count=1,
+                )
+            return await pipeline.execute()
+
+    delivery_counts: dict[str, int] = {}
+    for pending_entries in await _run_redis_command(command_name="xpending", command=_read):
+        for pending_entry in pending_entries or []:
+            delivery_counts[_decode_redis_value(pending_entry["message_id"])] = int(
+                pending_entry["times_delivered"]
+            )
+    return delivery_counts
+
+
+def _resolve_interactive_quota(
+    *,
+    count: int,
+    interactive_weight: int,
+    bulk_weight: int,
+) -> int:
+    if count <= 1:
+        return count
+    total_weight = max(interactive_weight, 0) + max(bulk_weight, 0)
+    if total_weight <= 0:
+        return count // 2
+    weighted_quota = round(count * max(interactive_weight, 0) / total_weight)
+    return min(max(weighted_quota, 1), count - 1)
+
+
+def _decode_redis_value(value: Any) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8")
+    return str(value)
+
+
 def _get_redis_client() -> Redis:
     global _redis_client
     if _redis_client is None:
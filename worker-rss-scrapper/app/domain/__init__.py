@@ -1,7 +1,9 @@
+from .feed_body_domain import build_feed_body_result
 from .rss_normalize_domain import normalize_feed_sources
 from .rss_parse_domain import parse_rss_feed_entries
 
 __all__ = [
+    "build_feed_body_result",
     "normalize_feed_sources",
     "parse_rss_feed_entries",
 ]
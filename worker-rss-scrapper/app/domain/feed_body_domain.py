@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from app.schemas.scrape_result_schema import ScrapeResultSchema
+from .rss_normalize_domain import normalize_feed_sources
+from .rss_parse_domain import parse_rss_feed_entries
+
+
+def build_feed_body_result(
+    *,
+    job_id: str,
+    feed_id: int,
+    feed_url: str,
+    fetchprotection: int,
+    body: bytes,
+    encoding: str | None,
+    etag: str | None,
+    last_modified: datetime | None,
+) -> ScrapeResultSchema:
+    parsed_entries, parsed_last_modified, freshness_hints = parse_rss_feed_entries(
+        body.decode(encoding or "utf-8", errors="replace")
+    )
+    sources = normalize_feed_sources(parsed_entries)
+    return ScrapeResultSchema(
+        job_id=job_id,
+        ingest=True,
+        feed_id=feed_id,
+        feed_url=feed_url,
+        status="success",
+        fetchprotection=fetchprotection,
+        new_etag=etag,
+        new_last_update=last_modified or parsed_last_modified,
+        ttl_seconds=freshness_hints["ttl_seconds"],
+        skip_hours=freshness_hints["skip_hours"],
+        sources=sources,
+        response_bytes=len(body),
+        entries_parsed=len(parsed_entries),
+        entries_kept=len(sources),
+    )
@@ -17,9 +17,18 @@ _HEIGHT_QUERY_PARAM_NAMES = {"h", "height"}
 _ENTRY_PUBLISHED_AT_FIELDS = ("pubdate", "published", "updated", "date")
 _LAST_MODIFIED_FIELDS = ("updated", "lastbuilddate", "pubdate")
 _RSS_LAST_MODIFIED_FIELDS = ("lastbuilddate", "pubdate", "updated")
-
-
-def parse_rss_feed_entries(content: str) -> tuple[list[dict[str, Any]], datetime | None]:
+_SYNDICATION_UPDATE_PERIOD_SECONDS = {
+    "hourly": 3600,
+    "daily": 86400,
+    "weekly": 604800,
+    "monthly": 2592000,
+    "yearly": 31536000,
+}
+
+
+def parse_rss_feed_entries(
+    content: str,
+) -> tuple[list[dict[str, Any]], datetime | None, dict[str, Any]]:
     if not content or not content.strip():
         raise ValueError("Empty feed content")
 
@@ -34,7 +43,7 @@ def parse_rss_feed_entries(content: str) -> tuple[list[dict[str, Any]], datetime
         for node in _extract_entry_nodes(root)
         if (payload := _extract_entry_payload(node)) is not None
     ]
-    return entries, last_modified
+    return entries, last_modified, _extract_freshness_hints(root)
 
 
 def _extract_entry_nodes(root: ElementTree.Element) -> list[ElementTree.Element]:
@@ -65,6 +74,65 @@ def _extract_last_modified(root: ElementTree.Element) -> datetime | None:
     return _parse_first_datetime(root, _LAST_MODIFIED_FIELDS)
 
 
+def _extract_freshness_hints(root: ElementTree.Element) -> dict[str, Any]:
+    channel = root
+    if _local_name(root.tag) == "rss":
+        channel = _first_child(root, {"channel"})
+        if channel is None:
+            return {"ttl_seconds": None, "skip_hours": []}
+
+    declared_intervals = [
+        interval_seconds
+        for interval_seconds in (
+            _extract_ttl_seconds(channel),
+            _extract_syndication_interval_seconds(channel),
+        )
+        if interval_seconds is not None
+    ]
+    return {
+        "ttl_seconds": max(declared_intervals, default=None),
+        "skip_hours": _extract_skip_hours(channel),
+    }
+
+
+def _extract_ttl_seconds(channel: ElementTree.Element) -> int | None:
+    ttl_minutes = _parse_dimension(_first_text(channel, {"ttl"}))
+    if ttl_minutes is None:
+        return None
+    return ttl_minutes * 60
+
+
+def _extract_syndication_interval_seconds(channel: ElementTree.Element) -> int | None:
+    update_period = _first_text(channel, {"updateperiod"})
+    update_frequency = _first_text(channel, {"updatefrequency"})
+    if update_period is None and update_frequency is None:
+        return None
+
+    period_seconds = _SYNDICATION_UPDATE_PERIOD_SECONDS.get((update_period or "daily").lower())
+    if period_seconds is None:
+        return None
+    frequency = _parse_dimension(update_frequency) or 1
+    return max(period_seconds // frequency, 1)
+
+
+def _extract_skip_hours(channel: ElementTree.Element) -> list[int]:
+    skip_hours_node = _first_child(channel, {"skiphours"})
+    if skip_hours_node is None:
+        return []
+
+    skip_hours: set[int] = set()
+    for hour_node in skip_hours_node:
+        if _local_name(hour_node.tag) != "hour":
+            continue
+        hour_text = _clean_text("".join(hour_node.itertext()))
+        if hour_text is None or not hour_text.isdigit():
+            continue
+        hour = int(hour_text)
+        if 0 <= hour <= 24:
+            skip_hours.add(hour % 24)
+    return sorted(skip_hours)
+
+
 def _extract_entry_payload(entry: ElementTree.Element) -> dict[str, Any] | None:
     title = _first_text(entry, {"title"})
     url = _extract_entry_url(entry)
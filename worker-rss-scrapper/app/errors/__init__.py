@@ -2,10 +2,14 @@ from .worker_exceptions import (
     WorkerError,
     WorkerAuthenticationError,
     WorkerQueueError,
+    WorkerConfigurationError,
+    WorkerFetchCancelledError,
 )
 
 __all__ = [
     "WorkerError",
     "WorkerAuthenticationError",
     "WorkerQueueError",
+    "WorkerConfigurationError",
+    "WorkerFetchCancelledError",
 ]
\ No newline at end of file
@@ -8,3 +8,11 @@ class WorkerAuthenticationError(WorkerError):
 
 class WorkerQueueError(WorkerError):
     """Raised when queue operations fail."""
+
+
+class WorkerConfigurationError(WorkerError):
+    """Raised when the worker configuration does not match the backend."""
+
+
+class WorkerFetchCancelledError(WorkerError):
+    """Raised to callers sharing a feed fetch whose owner was cancelled."""
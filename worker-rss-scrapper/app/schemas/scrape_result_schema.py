@@ -19,4 +19,15 @@ class ScrapeResultSchema(BaseModel):
     new_etag: str | None = None
     new_last_update: datetime | None = None
     fetchprotection: int = Field(ge=0, le=2)
+    ttl_seconds: int | None = Field(default=None, ge=1)
+    skip_hours: list[int] = Field(default_factory=list)
+    cache_expires_at: datetime | None = None
     sources: list[FeedSourceSchema] = Field(default_factory=list)
+    connect_ms: int | None = Field(default=None, ge=0)
+    ttfb_ms: int | None = Field(default=None, ge=0)
+    download_ms: int | None = Field(default=None, ge=0)
+    parse_ms: int | None = Field(default=None, ge=0)
+    total_ms: int | None = Field(default=None, ge=0)
+    response_bytes: int | None = Field(default=None, ge=0)
+    entries_parsed: int | None = Field(default=None, ge=0)
+    entries_kept: int | None = Field(default=None, ge=0)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+import gzip
+import logging
+import os
+from pathlib import Path
+import time
+from typing import TextIO
+
+from app.clients.archive import (
+    FeedBodyArchiveEntry,
+    iter_feed_body_entries,
+    prune_feed_body_archive,
+    read_feed_body,
+)
+from app.domain import build_feed_body_result
+from app.errors.worker_exceptions import WorkerConfigurationError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BODY_ARCHIVE_PRUNE_INTERVAL_SECONDS = 3600.0
+REPARSE_JOB_ID = "reparse"
+_REPARSE_CHUNK_SIZE = 16
+
+
+class FeedBodyReparseReport:
+    def __init__(self) -> None:
+        self.entries_read = 0
+        self.duplicates_skipped = 0
+        self.bodies_parsed = 0
+        self.parse_errors = 0
+        self.sources_written = 0
+        self.elapsed_seconds = 0.0
+
+    @property
+    def bodies_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bodies_parsed / self.elapsed_seconds
+
+    def format_lines(self) -> list[str]:
+        return [
+            f"elapsed: {self.elapsed_seconds:.1f}s, {self.bodies_per_second:.1f} bodies/s",
+            f"index entries read: {self.entries_read}, duplicate bodies skipped: {self.duplicates_skipped}",
+            f"bodies parsed: {self.bodies_parsed}, parse errors: {self.parse_errors}",
+            f"sources written: {self.sources_written}",
+        ]
+
+
+async def run_feed_body_archive_pruning(
+    archive_dir: Path,
+    *,
+    retention_days: int,
+    interval_seconds: float = DEFAULT_BODY_ARCHIVE_PRUNE_INTERVAL_SECONDS,
+) -> None:
+    while True:
+        try:
+            removed_days, removed_objects = await asyncio.to_thread(
+                prune_feed_body_archive,
+                archive_dir,
+                retention_days=retention_days,
+                now=datetime.now(timezone.utc),
+            )
+        except OSError as exception:
+            logger.warning("Feed body archive pruning failed: %s", exception)
+        else:
+            if removed_days or removed_objects:
+                logger.info(
+                    "Pruned %s index days and %s bodies from the feed body archive",
+                    removed_days,
+                    removed_objects,
+                )
+        await asyncio.sleep(interval_seconds)
+
+
+def run_feed_body_reparse(
+    archive_dir: Path,
+    *,
+    output_path: Path,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    feed_ids: set[int] | None = None,
+    processes: int | None = None,
+    latest_only: bool = False,
+) -> FeedBodyReparseReport:
+    if processes is not None and processes <= 0:
+        raise WorkerConfigurationError("processes must be greater than zero")
+    resolved_processes = processes or os.cpu_count() or 1
+
+    report = FeedBodyReparseReport()
+    started_at = time.perf_counter()
+    entries = _select_reparse_entries(
+        iter_feed_body_entries(archive_dir, since=since, until=until, feed_ids=feed_ids),
+        report=report,
+        latest_only=latest_only,
+    )
+    tasks = [(str(archive_dir), entry.to_dict()) for entry in entries]
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(output_path, "wt", encoding="utf-8") as output_file:
+        if resolved_processes == 1:
+            outcomes = map(_reparse_feed_body, tasks)
+            _write_reparse_outcomes(outcomes, output_file=output_file, report=report)
+        else:
+            with ProcessPoolExecutor(max_workers=resolved_processes) as executor:
+                outcomes = executor.map(_reparse_feed_body, tasks, chunksize=_REPARSE_CHUNK_SIZE)
+                _write_reparse_outcomes(outcomes, output_file=output_file, report=report)
+
+    report.elapsed_seconds = time.perf_counter() - started_at
+    return report
+
+
+def _select_reparse_entries(
+    entries: Iterable[FeedBodyArchiveEntry],
+    *,
+    report: FeedBodyReparseReport,
+    latest_only: bool,
+) -> list[FeedBodyArchiveEntry]:
+    # A body fetched again unchanged parses to the same sources, so only the
+    # latest fetch of each (feed, body) pair is kept.
+    selected: dict[tuple[int, str] | int, FeedBodyArchiveEntry] = {}
+    for entry in entries:
+        report.entries_read += 1
+        key = entry.feed_id if latest_only else (entry.feed_id, entry.sha256)
+        current = selected.get(key)
+        if current is not None:
+            report.duplicates_skipped += 1
+            if current.fetched_at >= entry.fetched_at:
+                continue
+        selected[key] = entry
+    return sorted(selected.values(), key=lambda entry: (entry.fetched_at, entry.feed_id))
+
+
+def _write_reparse_outcomes(
+    outcomes: Iterable[tuple[int, str | None, int, str | None]],
+    *,
+    output_file: TextIO,
+    report: FeedBodyReparseReport,
+) -> None:
+    for feed_id, result_json, source_count, error_message in outcomes:
+        if result_json is None:
+            logger.warning("Could not re-parse archived body of feed %s: %s", feed_id, error_message)
+            report.parse_errors += 1
+            continue
+        output_file.write(result_json + "\n")
+        report.bodies_parsed += 1
+        report.sources_written += source_count
+
+
+def _reparse_feed_body(
+    task: tuple[str, dict],
+) -> tuple[int, str | None, int, str | None]:
+    # Runs in a pool process: it reads the body itself so only paths and small
+    # index entries cross the process boundary.
+    archive_dir, entry_values = task
+    entry = FeedBodyArchiveEntry.from_dict(entry_values)
+    try:
+        result = build_feed_body_result(
+            job_id=REPARSE_JOB_ID,
+            feed_id=entry.feed_id,
+            feed_url=entry.feed_url,
+            fetchprotection=entry.fetchprotection,
+            body=read_feed_body(Path(archive_dir), entry.sha256),
+            encoding=entry.encoding,
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+        )
+    except Exception as exception:
+        return entry.feed_id, None, 0, str(exception)
+    return entry.feed_id, result.model_dump_json(), len(result.sources), None
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+import logging
+import os
+from pathlib import Path
+import time
+from typing import TextIO
+
+import httpx
+
+from app.clients.networking import fetch_feed_body
+from app.domain import build_feed_body_result
+from app.errors.worker_exceptions import WorkerConfigurationError
+from app.schemas import ScrapeJobFeedSchema
+from app.services.scrape_job_service import CompanyRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OFFLINE_INGEST_CONCURRENCY = 64
+OFFLINE_INGEST_JOB_ID = "offline_ingest"
+_PROGRESS_LOG_INTERVAL_SECONDS = 10.0
+
+
+class OfflineIngestReport:
+    def __init__(self) -> None:
+        self.feeds_read = 0
+        self.bodies_loaded = 0
+        self.downloaded_bytes = 0
+        self.blocked_count = 0
+        self.fetch_errors = 0
+        self.parse_errors = 0
+        self.results_written = 0
+        self.sources_written = 0
+        self.elapsed_seconds = 0.0
+
+    @property
+    def feeds_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.feeds_read / self.elapsed_seconds
+
+    @property
+    def megabytes_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.downloaded_bytes / 1_000_000 / self.elapsed_seconds
+
+    def format_lines(self) -> list[str]:
+        return [
+            f"elapsed: {self.elapsed_seconds:.1f}s, {self.feeds_per_second:.1f} feeds/s, "
+            f"{self.megabytes_per_second:.2f} MB/s",
+            f"feeds read: {self.feeds_read}, bodies loaded: {self.bodies_loaded} "
+            f"({self.downloaded_bytes} bytes)",
+            f"blocked: {self.blocked_count}, fetch errors: {self.fetch_errors}, parse errors: {self.parse_errors}",
+            f"results written: {self.results_written}, sources written: {self.sources_written}",
+        ]
+
+
+def load_offline_ingest_feeds(lines: Iterable[str]) -> list[ScrapeJobFeedSchema]:
+    feeds: list[ScrapeJobFeedSchema] = []
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            feeds.append(ScrapeJobFeedSchema.model_validate_json(line))
+        except ValueError as exception:
+            raise WorkerConfigurationError(f"Invalid feed on line {line_number}: {exception}") from exception
+    return feeds
+
+
+async def run_offline_ingest(
+    feeds: list[ScrapeJobFeedSchema],
+    *,
+    output_file: TextIO,
+    concurrency: int = DEFAULT_OFFLINE_INGEST_CONCURRENCY,
+    processes: int | None = None,
+    files_dir: Path | None = None,
+    company_max_rps: float | None = None,
+) -> OfflineIngestReport:
+    if concurrency <= 0:
+        raise WorkerConfigurationError("concurrency must be greater than zero")
+    if processes is not None and processes <= 0:
+        raise WorkerConfigurationError("processes must be greater than zero")
+
+    resolved_processes = processes or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=resolved_processes) if resolved_processes > 1 else None
+    try:
+        async with httpx.AsyncClient(
+            timeout=15.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=concurrency),
+        ) as http_client:
+            return await _run_offline_ingest_pool(
+                feeds,
+                output_file=output_file,
+                concurrency=concurrency,
+                executor=executor,
+                files_dir=files_dir,
+                company_max_rps=company_max_rps,
+                http_client=http_client,
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+async def _run_offline_ingest_pool(
+    feeds: list[ScrapeJobFeedSchema],
+    *,
+    output_file: TextIO,
+    concurrency: int,
+    executor: Executor | None,
+    files_dir: Path | None,
+    company_max_rps: float | None,
+    http_client: httpx.AsyncClient,
+) -> OfflineIngestReport:
+    report = OfflineIngestReport()
+    started_at = time.perf_counter()
+    company_rate_limiters: dict[int, CompanyRateLimiter] = {}
+    pending_feeds = iter(feeds)
+    next_progress_at = started_at + _PROGRESS_LOG_INTERVAL_SECONDS
+
+    # A fixed set of fetchers pulls from one iterator: at most `concurrency`
+    # bodies are downloaded or waiting for a parse process at any time.
+    async def run_fetcher() -> None:
+        nonlocal next_progress_at
+        for feed in pending_feeds:
+            report.feeds_read += 1
+            limiter = None
+            if files_dir is None and company_max_rps is not None and feed.company_id is not None:
+                limiter = company_rate_limiters.get(feed.company_id)
+                if limiter is None:
+                    limiter = CompanyRateLimiter(max_requests_per_second=company_max_rps)
+                    company_rate_limiters[feed.company_id] = limiter
+            await _ingest_feed(
+                feed,
+                output_file=output_file,
+                executor=executor,
+                files_dir=files_dir,
+                limiter=limiter,
+                http_client=http_client,
+                report=report,
+            )
+            now = time.perf_counter()
+            if now >= next_progress_at:
+                next_progress_at = now + _PROGRESS_LOG_INTERVAL_SECONDS
+                report.elapsed_seconds = now - started_at
+                logger.info(
+                    "Ingested %s of %s feeds (%.1f feeds/s, %.2f MB/s)",
+                    report.feeds_read,
+                    len(feeds),
+                    report.feeds_per_second,
+                    report.megabytes_per_second,
+                )
+
+    await asyncio.gather(*[run_fetcher() for _ in range(min(concurrency, max(len(feeds), 1)))])
+    report.elapsed_seconds = time.perf_counter() - started_at
+    return report
+
+
+async def _ingest_feed(
+    feed: ScrapeJobFeedSchema,
+    *,
+    output_file: TextIO,
+    executor: Executor | None,
+    files_dir: Path | None,
+    limiter: CompanyRateLimiter | None,
+    http_client: httpx.AsyncClient,
+    report: OfflineIngestReport,
+) -> None:
+    if files_dir is None and feed.fetchprotection == 0:
+        report.blocked_count += 1
+        return
+
+    try:
+        if files_dir is not None:
+            body = await asyncio.to_thread((files_dir / f"{feed.feed_id}.xml").read_bytes)
+            encoding, etag, last_modified = None, None, None
+        else:
+            if limiter is not None:
+                await limiter.acquire()
+            feed_body = await fetch_feed_body(feed=feed, http_client=http_client)
+            body = feed_body.content
+            encoding, etag, last_modified = feed_body.encoding, feed_body.etag, feed_body.last_modified
+    except Exception as exception:
+        logger.warning("Could not load feed %s (%s): %s", feed.feed_id, feed.feed_url, exception)
+        report.fetch_errors += 1
+        return
+    report.bodies_loaded += 1
+    report.downloaded_bytes += len(body)
+
+    task = (feed.model_dump(mode="json"), body, encoding, etag, last_modified)
+    if executor is None:
+        outcome = _parse_feed_body(task)
+    else:
+        outcome = await asyncio.get_running_loop().run_in_executor(executor, _parse_feed_body, task)
+    result_json, source_count, error_message = outcome
+    if result_json is None:
+        logger.warning("Could not parse feed %s (%s): %s", feed.feed_id, feed.feed_url, error_message)
+        report.parse_errors += 1
+        return
+    output_file.write(result_json + "\n")
+    report.results_written += 1
+    report.sources_written += source_count
+
+
+def _parse_feed_body(
+    task: tuple[dict, bytes, str | None, str | None, datetime | None],
+) -> tuple[str | None, int, str | None]:
+    # Runs in a pool process, so parsing never blocks the fetchers' event loop.
+    feed_values, body, encoding, etag, last_modified = task
+    try:
+        result = build_feed_body_result(
+            job_id=OFFLINE_INGEST_JOB_ID,
+            feed_id=feed_values["feed_id"],
+            feed_url=feed_values["feed_url"],
+            fetchprotection=feed_values["fetchprotection"],
+            body=body,
+            encoding=encoding,
+            etag=etag,
+            last_modified=last_modified,
+        )
+    except Exception as exception:
+        return None, 0, str(exception)
+    return result.model_dump_json(), len(result.sources), None
@@ -1,81 +1,356 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable
+import contextlib
+import json
 import logging
+import math
 import os
+from pathlib import Path
+import signal
+import time
+from urllib.parse import urlsplit
+
 import httpx
 
-from app.schemas import ScrapeJobFeedSchema, ScrapeJobRequestSchema
+from app.schemas import ScrapeJobFeedSchema, ScrapeJobRequestSchema, ScrapeResultSchema
 from app.services.worker_auth_service import ensure_worker_authenticated
+from app.clients.archive import DEFAULT_BODY_ARCHIVE_RETENTION_DAYS, resolve_feed_body_archive_dir
 from app.clients.networking import fetch_feed_result
-from app.errors.worker_exceptions import WorkerAuthenticationError, WorkerQueueError
+from app.errors.worker_exceptions import (
+    WorkerAuthenticationError,
+    WorkerConfigurationError,
+    WorkerFetchCancelledError,
+    WorkerQueueError,
+)
 from app.clients.queue import (
+    DEFAULT_BULK_LANE_WEIGHT,
+    DEFAULT_INTERACTIVE_LANE_WEIGHT,
+    DEFAULT_MAX_DELIVERIES,
+    REDIS_CONSUMER_NAME,
+    REDIS_QUEUE_REQUESTS,
     ack_scrape_job,
+    claim_idle_scrape_jobs,
+    close_redis_client,
+    dead_letter_scrape_job,
     ensure_worker_consumer_group,
     publish_check_result,
     publish_error_result,
     publish_ingest_result,
+    read_pending_scrape_jobs,
+    read_request_shard_count,
     read_scrape_jobs,
+    resolve_legacy_request_stream_names,
+    resolve_message_queue_wait_ms,
+    resolve_request_stream_names,
+)
+from app.services.feed_body_archive_service import (
+    DEFAULT_BODY_ARCHIVE_PRUNE_INTERVAL_SECONDS,
+    run_feed_body_archive_pruning,
 )
+from app.services.worker_metrics_service import (
+    monitor_event_loop_lag,
+    resolve_worker_metrics_port,
+    start_worker_metrics_server,
+)
+from app.utils import resolve_positive_float_env, resolve_positive_int_env, worker_metrics
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_QUEUE_READ_COUNT = 20
 DEFAULT_COMPANY_MAX_REQUESTS_PER_SECOND = 4
 DEFAULT_QUEUE_BLOCK_MS = 5000
+QUEUE_WAIT_BUCKETS_MS = (100, 1000, 10000, 60000)
+DEFAULT_FEED_RESULT_CACHE_SECONDS = 30.0
+DEFAULT_WORKER_SHARD_COUNT = 1
+DEFAULT_PENDING_CLAIM_IDLE_MS = 300_000
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 20.0
+
+FeedFetchKey = tuple[str, str | None, str | None, int, str | None]
+
+_worker_stats: Counter[str] = Counter()
 
 
 class CompanyRateLimiter:
-    def __init__(self, *, max_requests_per_second: int) -> None:
-        self._semaphore = asyncio.Semaphore(max_requests_per_second)
+    def __init__(self, *, max_requests_per_second: float) -> None:
+        capacity = max(math.ceil(max_requests_per_second), 1)
+        self._semaphore = asyncio.Semaphore(capacity)
+        self._release_delay_seconds = capacity / max_requests_per_second
 
     async def acquire(self) -> None:
         await self._semaphore.acquire()
-        asyncio.get_running_loop().call_later(1.0, self._semaphore.release)
+        asyncio.get_running_loop().call_later(self._release_delay_seconds, self._semaphore.release)
+
+
+class FeedFetchSingleflight:
+    def __init__(self, *, cache_ttl_seconds: float) -> None:
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._inflight: dict[FeedFetchKey, asyncio.Future[ScrapeResultSchema]] = {}
+        self._cached_results: dict[FeedFetchKey, tuple[float, ScrapeResultSchema]] = {}
+
+    async def fetch(
+        self,
+        key: FeedFetchKey,
+        fetcher: Callable[[], Awaitable[ScrapeResultSchema]],
+    ) -> ScrapeResultSchema:
+        cached = self._cached_results.get(key)
+        if cached is not None:
+            expires_at, cached_result = cached
+            if expires_at > time.monotonic():
+                return cached_result
+            del self._cached_results[key]
+
+        inflight = self._inflight.get(key)
+        while inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except WorkerFetchCancelledError:
+                inflight = self._inflight.get(key)
+
+        future: asyncio.Future[ScrapeResultSchema] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fetcher()
+        except asyncio.CancelledError:
+            # Cancelling the shared future would cancel the callers waiting on it; they
+            # get an error instead and fetch the feed themselves.
+            future.set_exception(WorkerFetchCancelledError(f"Fetch of {key[0]} was cancelled"))
+            future.exception()
+            raise
+        except Exception as exception:
+            future.set_exception(exception)
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        if result.status != "error":
+            self._store(key, result)
+        future.set_result(result)
+        return result
+
+    def _store(self, key: FeedFetchKey, result: ScrapeResultSchema) -> None:
+        now = time.monotonic()
+        expired_keys = [
+            cached_key
+            for cached_key, (expires_at, _) in self._cached_results.items()
+            if expires_at <= now
+        ]
+        for cached_key in expired_keys:
+            del self._cached_results[cached_key]
+        self._cached_results[key] = (now + self._cache_ttl_seconds, result)
+
 
+def get_worker_stats_snapshot() -> dict[str, int]:
+    return dict(_worker_stats)
 
-async def run_scrape_worker() -> None:
+
+async def run_scrape_worker(
+    *,
+    stop_event: asyncio.Event | None = None,
+    consumer_name: str | None = None,
+    process_index: int = 0,
+    process_count: int = 1,
+) -> None:
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
-    await ensure_worker_consumer_group()
-    logger.info("worker_rss_scrapper started")
+    if stop_event is None:
+        stop_event = _create_stop_event()
+    resolved_consumer_name = consumer_name or os.getenv("WORKER_CONSUMER_NAME", REDIS_CONSUMER_NAME)
+    shard_index, shard_count = _resolve_worker_shard()
+    interactive_stream, bulk_stream = resolve_request_stream_names(
+        shard_index=shard_index,
+        shard_count=shard_count,
+    )
+    legacy_streams = resolve_legacy_request_stream_names(
+        shard_index=shard_index,
+        shard_count=shard_count,
+    )
+    await _ensure_request_shard_count_matches(shard_count)
+    await ensure_worker_consumer_group((interactive_stream, bulk_stream, *legacy_streams))
+    interactive_streams = {interactive_stream, *legacy_streams[:1]}
+    logger.info(
+        "worker_rss_scrapper %s started on streams %s",
+        resolved_consumer_name,
+        ", ".join((interactive_stream, bulk_stream, *legacy_streams)),
+    )
 
     queue_read_count = _resolve_queue_read_count()
-    company_max_rps = _resolve_company_max_requests_per_second()
+    interactive_lane_weight = resolve_positive_int_env(
+        "WORKER_INTERACTIVE_LANE_WEIGHT",
+        DEFAULT_INTERACTIVE_LANE_WEIGHT,
+    )
+    bulk_lane_weight = resolve_positive_int_env("WORKER_BULK_LANE_WEIGHT", DEFAULT_BULK_LANE_WEIGHT)
+    # Every process of a supervisor reads the same streams, so each one gets its
+    # share of the per-company budget.
+    company_max_rps = _resolve_company_max_requests_per_second() / process_count
     company_rate_limiters: dict[str, CompanyRateLimiter] = {}
-
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as http_client:
-        while True:
-            try:
-                await ensure_worker_authenticated()
-                jobs = await read_scrape_jobs(
-                    count=queue_read_count,
-                    block_ms=DEFAULT_QUEUE_BLOCK_MS,
-                )
-                if not jobs:
-                    continue
-
-                await asyncio.gather(
-                    *[
-                        _process_job_message(
-                            message_id=message_id,
-                            payload=payload,
-                            http_client=http_client,
-                            company_rate_limiters=company_rate_limiters,
-                            company_max_rps=company_max_rps,
+    feed_fetches = FeedFetchSingleflight(
+        cache_ttl_seconds=resolve_positive_float_env(
+            "WORKER_FEED_RESULT_CACHE_SECONDS",
+            DEFAULT_FEED_RESULT_CACHE_SECONDS,
+        ),
+    )
+    pending_claim_idle_ms = resolve_positive_int_env(
+        "WORKER_PENDING_CLAIM_IDLE_MS",
+        DEFAULT_PENDING_CLAIM_IDLE_MS,
+    )
+    drain_timeout_seconds = resolve_positive_float_env(
+        "WORKER_DRAIN_TIMEOUT_SECONDS",
+        DEFAULT_DRAIN_TIMEOUT_SECONDS,
+    )
+    max_deliveries = resolve_positive_int_env("WORKER_MAX_DELIVERIES", DEFAULT_MAX_DELIVERIES)
+    body_archive_dir = resolve_feed_body_archive_dir()
+    request_streams = (interactive_stream, bulk_stream, *legacy_streams)
+    # Messages this consumer read but never acked (a drain that timed out) are
+    # processed first, then entries left pending by consumers that no longer run
+    # (a crash, or a changed WORKER_PROCESSES renaming the <name>-<i> consumers).
+    pending_after_ids = {stream_name: "0" for stream_name in request_streams}
+    claim_start_ids = {stream_name: "0-0" for stream_name in request_streams}
+
+    metrics_server = await start_worker_metrics_server(port=resolve_worker_metrics_port(process_index))
+    event_loop_lag_monitor = asyncio.create_task(monitor_event_loop_lag())
+    # Processes of a supervisor share the archive, one of them prunes it.
+    body_archive_pruner = (
+        asyncio.create_task(
+            run_feed_body_archive_pruning(
+                body_archive_dir,
+                retention_days=resolve_positive_int_env(
+                    "WORKER_BODY_ARCHIVE_RETENTION_DAYS",
+                    DEFAULT_BODY_ARCHIVE_RETENTION_DAYS,
+                ),
+                interval_seconds=resolve_positive_float_env(
+                    "WORKER_BODY_ARCHIVE_PRUNE_INTERVAL_SECONDS",
+                    DEFAULT_BODY_ARCHIVE_PRUNE_INTERVAL_SECONDS,
+                ),
+            )
+        )
+        if body_archive_dir is not None and process_index == 0
+        else None
+    )
+    try:
+        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as http_client:
+            while not stop_event.is_set():
+                try:
+                    await ensure_worker_authenticated()
+                    if pending_after_ids:
+                        stream_name, after_id = next(iter(pending_after_ids.items()))
+                        last_message_id, jobs = await read_pending_scrape_jobs(
+                            stream_name=stream_name,
+                            after_id=after_id,
+                            count=queue_read_count,
+                            consumer_name=resolved_consumer_name,
+                            max_deliveries=max_deliveries,
+                        )
+                        if last_message_id is None:
+                            del pending_after_ids[stream_name]
+                            continue
+                        pending_after_ids[stream_name] = last_message_id
+                        if not jobs:
+                            continue
+                        logger.info("Resuming %s pending scrape jobs from %s", len(jobs), stream_name)
+                    elif claim_start_ids:
+                        stream_name, start_id = next(iter(claim_start_ids.items()))
+                        next_start_id, jobs = await claim_idle_scrape_jobs(
+                            stream_name=stream_name,
+                            min_idle_ms=pending_claim_idle_ms,
+                            start_id=start_id,
+                            count=queue_read_count,
+                            consumer_name=resolved_consumer_name,
+                            max_deliveries=max_deliveries,
                         )
-                        for message_id, payload in jobs
-                    ]
-                )
-            except WorkerAuthenticationError as exception:
-                logger.warning("Worker authentication unavailable: %s", exception)
-                await asyncio.sleep(1.0)
-            except WorkerQueueError as exception:
-                logger.warning("Worker queue unavailable: %s", exception)
-                await asyncio.sleep(1.0)
-            except Exception as exception:
-                logger.exception("Worker loop error: %s", exception)
-                await asyncio.sleep(1.0)
+                        if next_start_id == "0-0":
+                            del claim_start_ids[stream_name]
+                        else:
+                            claim_start_ids[stream_name] = next_start_id
+                        if not jobs:
+                            continue
+                        logger.info("Claimed %s idle scrape jobs from %s", len(jobs), stream_name)
+                    else:
+                        jobs = await read_scrape_jobs(
+                            count=queue_read_count,
+                            block_ms=DEFAULT_QUEUE_BLOCK_MS,
+                            interactive_weight=interactive_lane_weight,
+                            bulk_weight=bulk_lane_weight,
+                            interactive_stream=interactive_stream,
+                            bulk_stream=bulk_stream,
+                            legacy_streams=legacy_streams,
+                            consumer_name=resolved_consumer_name,
+                        )
+                        if not jobs:
+                            continue
+                        _record_lane_queue_waits(jobs, interactive_streams=interactive_streams)
+
+                    await _run_job_batch(
+                        asyncio.gather(
+                            *[
+                                _process_job_message(
+                                    message_id=message_id,
+                                    payload=payload,
+                                    http_client=http_client,
+                                    company_rate_limiters=company_rate_limiters,
+                                    company_max_rps=company_max_rps,
+                                    feed_fetches=feed_fetches,
+                                    stream_name=stream_name,
+                                    body_archive_dir=body_archive_dir,
+                                )
+                                for stream_name, message_id, payload in jobs
+                            ]
+                        ),
+                        stop_event=stop_event,
+                        drain_timeout_seconds=drain_timeout_seconds,
+                    )
+                except WorkerAuthenticationError as exception:
+                    logger.warning("Worker authentication unavailable: %s", exception)
+                    await asyncio.sleep(1.0)
+                except WorkerQueueError as exception:
+                    logger.warning("Worker queue unavailable: %s", exception)
+                    await asyncio.sleep(1.0)
+                except Exception as exception:
+                    logger.exception("Worker loop error: %s", exception)
+                    await asyncio.sleep(1.0)
+    finally:
+        event_loop_lag_monitor.cancel()
+        if body_archive_pruner is not None:
+            body_archive_pruner.cancel()
+        if metrics_server is not None:
+            metrics_server.close()
+        await close_redis_client()
+
+    logger.info("worker_rss_scrapper %s stopped", resolved_consumer_name)
+
+
+async def _run_job_batch(
+    batch: asyncio.Future[list[None]],
+    *,
+    stop_event: asyncio.Event,
+    drain_timeout_seconds: float,
+) -> None:
+    stop_waiter = asyncio.ensure_future(stop_event.wait())
+    try:
+        await asyncio.wait({batch, stop_waiter}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        stop_waiter.cancel()
+
+    if not batch.done():
+        logger.info("Stop requested, draining in-flight scrape jobs for up to %ss", drain_timeout_seconds)
+        await asyncio.wait({batch}, timeout=drain_timeout_seconds)
+    if not batch.done():
+        batch.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await batch
+        logger.warning("In-flight scrape jobs did not finish in time, they stay pending for the next start")
+        return
+    await batch
+
+
+def _create_stop_event() -> asyncio.Event:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signal_number, stop_event.set)
+    return stop_event
 
 
 async def _process_job_message(
@@ -84,13 +359,22 @@ async def _process_job_message(
     payload: dict,
     http_client: httpx.AsyncClient,
     company_rate_limiters: dict[str, CompanyRateLimiter],
-    company_max_rps: int,
+    company_max_rps: float,
+    feed_fetches: FeedFetchSingleflight,
+    stream_name: str = REDIS_QUEUE_REQUESTS,
+    body_archive_dir: Path | None = None,
 ) -> None:
     try:
         scrape_job = ScrapeJobRequestSchema.model_validate(payload)
     except Exception as exception:
         logger.error("Invalid scrape job payload for message %s: %s", message_id, exception)
-        await ack_scrape_job(message_id)
+        await dead_letter_scrape_job(
+            stream_name=stream_name,
+            message_id=message_id,
+            payload_raw=json.dumps(payload),
+            reason=f"invalid_schema: {exception}",
+        )
+        _worker_stats["jobs_invalid"] += 1
         return
 
     feeds_by_company = _group_feeds_by_company(scrape_job.feeds)
@@ -103,12 +387,15 @@ async def _process_job_message(
                 http_client=http_client,
                 company_rate_limiters=company_rate_limiters,
                 company_max_rps=company_max_rps,
+                feed_fetches=feed_fetches,
+                body_archive_dir=body_archive_dir,
             )
             for company_key, company_feeds in feeds_by_company.items()
         ]
     )
 
-    await ack_scrape_job(message_id)
+    await ack_scrape_job(message_id, stream_name=stream_name)
+    _worker_stats["jobs_processed"] += 1
 
 
 async def _process_company_feed_pool(
@@ -118,7 +405,9 @@ async def _process_company_feed_pool(
     company_key: str,
     http_client: httpx.AsyncClient,
     company_rate_limiters: dict[str, CompanyRateLimiter],
-    company_max_rps: int,
+    company_max_rps: float,
+    feed_fetches: FeedFetchSingleflight,
+    body_archive_dir: Path | None = None,
 ) -> None:
     limiter = _get_or_create_company_rate_limiter(
         company_key=company_key,
@@ -132,6 +421,8 @@ async def _process_company_feed_pool(
                 feed=feed,
                 http_client=http_client,
                 limiter=limiter,
+                feed_fetches=feed_fetches,
+                body_archive_dir=body_archive_dir,
             )
             for feed in feeds
         ]
@@ -144,25 +435,87 @@ async def _process_feed(
     feed: ScrapeJobFeedSchema,
     http_client: httpx.AsyncClient,
     limiter: CompanyRateLimiter,
+    feed_fetches: FeedFetchSingleflight,
+    body_archive_dir: Path | None = None,
 ) -> None:
-    await limiter.acquire()
-
-    result = await fetch_feed_result(
-        feed=feed,
-        ingest=scrape_job.ingest,
-        http_client=http_client,
+    async def fetch_once() -> ScrapeResultSchema:
+        limiter_started_at = time.perf_counter()
+        await limiter.acquire()
+        worker_metrics.observe(
+            "worker_stage_duration_seconds",
+            time.perf_counter() - limiter_started_at,
+            stage="rate_limit",
+        )
+        return await fetch_feed_result(
+            feed=feed,
+            ingest=scrape_job.ingest,
+            http_client=http_client,
+            body_archive_dir=body_archive_dir,
+        )
+
+    worker_metrics.add_gauge("worker_inflight_feeds", 1)
+    try:
+        result = await feed_fetches.fetch(_build_feed_fetch_key(feed), fetch_once)
+        result = result.model_copy(update={"job_id": scrape_job.job_id, "ingest": scrape_job.ingest})
+        result_payload = result.model_dump(mode="json")
+        _worker_stats[f"feeds_{result.status}"] += 1
+        worker_metrics.increment(
+            "worker_feed_results_total",
+            host=_resolve_feed_host(feed),
+            status=result.status,
+        )
+
+        publish_started_at = time.perf_counter()
+        if result.status == "error":
+            await publish_error_result(result_payload)
+        elif scrape_job.ingest:
+            await publish_ingest_result(result_payload)
+        else:
+            await publish_check_result(result_payload)
+        worker_metrics.observe(
+            "worker_stage_duration_seconds",
+            time.perf_counter() - publish_started_at,
+            stage="publish",
+        )
+    finally:
+        worker_metrics.add_gauge("worker_inflight_feeds", -1)
+
+
+async def _ensure_request_shard_count_matches(shard_count: int) -> None:
+    published_shard_count = await read_request_shard_count()
+    if published_shard_count is None:
+        logger.warning("Backend request shard count is not published yet, assuming %s", shard_count)
+        return
+    if published_shard_count != shard_count:
+        raise WorkerConfigurationError(
+            f"WORKER_SHARD_COUNT={shard_count} does not match the backend "
+            f"RSS_SCRAPE_REQUEST_SHARDS={published_shard_count}"
+        )
+
+
+def _build_feed_fetch_key(feed: ScrapeJobFeedSchema) -> FeedFetchKey:
+    return (
+        feed.feed_url,
+        feed.etag,
+        feed.last_update.isoformat() if feed.last_update is not None else None,
+        feed.fetchprotection,
+        feed.host_header,
     )
-    result = result.model_copy(update={"job_id": scrape_job.job_id, "ingest": scrape_job.ingest})
-    result_payload = result.model_dump(mode="json")
 
-    if result.status == "error":
-        await publish_error_result(result_payload)
-        return
 
-    if scrape_job.ingest:
-        await publish_ingest_result(result_payload)
-    else:
-        await publish_check_result(result_payload)
+def _record_lane_queue_waits(jobs: list[tuple[str, str, dict]], *, interactive_streams: set[str]) -> None:
+    now_ms = int(time.time() * 1000)
+    for stream_name, message_id, _ in jobs:
+        queue_wait_ms = resolve_message_queue_wait_ms(message_id, now_ms=now_ms)
+        if queue_wait_ms is None:
+            continue
+        lane = "interactive" if stream_name in interactive_streams else "bulk"
+        worker_metrics.observe("worker_queue_wait_seconds", queue_wait_ms / 1000, lane=lane)
+        _worker_stats[f"queue_wait_{lane}_messages"] += 1
+        _worker_stats[f"queue_wait_{lane}_ms_total"] += queue_wait_ms
+        for bucket_ms in QUEUE_WAIT_BUCKETS_MS:
+            if queue_wait_ms <= bucket_ms:
+                _worker_stats[f"queue_wait_{lane}_ms_le_{bucket_ms}"] += 1
 
 
 def _group_feeds_by_company(feeds: list[ScrapeJobFeedSchema]) -> dict[str, list[ScrapeJobFeedSchema]]:
@@ -173,6 +526,11 @@ def _group_feeds_by_company(feeds: list[ScrapeJobFeedSchema]) -> dict[str, list[
     return feeds_by_company
 
 
+def _resolve_feed_host(feed: ScrapeJobFeedSchema) -> str:
+    host = feed.host_header or urlsplit(feed.feed_url).hostname or "unknown"
+    return host.strip().lower()
+
+
 def _resolve_company_key(feed: ScrapeJobFeedSchema) -> str:
     if isinstance(feed.company_id, int) and feed.company_id > 0:
         return f"company:{feed.company_id}"
@@ -183,7 +541,7 @@ def _get_or_create_company_rate_limiter(
     *,
     company_key: str,
     company_rate_limiters: dict[str, CompanyRateLimiter],
-    company_max_rps: int,
+    company_max_rps: float,
 ) -> CompanyRateLimiter:
     limiter = company_rate_limiters.get(company_key)
     if limiter is None:
@@ -192,26 +550,22 @@ def _get_or_create_company_rate_limiter(
     return limiter
 
 
+
 def _resolve_queue_read_count() -> int:
-    raw_value = os.getenv("WORKER_QUEUE_READ_COUNT", str(DEFAULT_QUEUE_READ_COUNT))
+    return resolve_positive_int_env("WORKER_QUEUE_READ_COUNT", DEFAULT_QUEUE_READ_COUNT)
+
+
+def _resolve_worker_shard() -> tuple[int, int]:
+    shard_count = resolve_positive_int_env("WORKER_SHARD_COUNT", DEFAULT_WORKER_SHARD_COUNT)
     try:
-        parsed = int(raw_value)
+        shard_index = int(os.getenv("WORKER_SHARD_INDEX", "0"))
     except (TypeError, ValueError):
-        return DEFAULT_QUEUE_READ_COUNT
-    if parsed <= 0:
-        return DEFAULT_QUEUE_READ_COUNT
-    return parsed
+        shard_index = 0
+    return shard_index, shard_count
 
 
 def _resolve_company_max_requests_per_second() -> int:
-    raw_value = os.getenv(
+    return resolve_positive_int_env(
         "WORKER_COMPANY_MAX_REQUESTS_PER_SECOND",
-        str(DEFAULT_COMPANY_MAX_REQUESTS_PER_SECOND),
+        DEFAULT_COMPANY_MAX_REQUESTS_PER_SECOND,
     )
-    try:
-        parsed = int(raw_value)
-    except (TypeError, ValueError):
-        return DEFAULT_COMPANY_MAX_REQUESTS_PER_SECOND
-    if parsed <= 0:
-        return DEFAULT_COMPANY_MAX_REQUESTS_PER_SECOND
-    return parsed
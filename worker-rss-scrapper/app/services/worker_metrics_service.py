@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+
+from app.utils import resolve_positive_int_env, worker_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKER_METRICS_PORT = 9100
+DEFAULT_EVENT_LOOP_LAG_INTERVAL_SECONDS = 0.5
+_REQUEST_TIMEOUT_SECONDS = 5.0
+
+
+def resolve_worker_metrics_port(process_index: int = 0) -> int:
+    return resolve_positive_int_env("WORKER_METRICS_PORT", DEFAULT_WORKER_METRICS_PORT) + process_index
+
+
+async def start_worker_metrics_server(*, port: int) -> asyncio.AbstractServer | None:
+    try:
+        server = await asyncio.start_server(_handle_metrics_request, host="0.0.0.0", port=port)
+    except OSError as exception:
+        logger.warning("Worker metrics endpoint unavailable on port %s: %s", port, exception)
+        return None
+    logger.info("Worker metrics exposed on :%s/metrics", port)
+    return server
+
+
+async def monitor_event_loop_lag(
+    *,
+    interval_seconds: float = DEFAULT_EVENT_LOOP_LAG_INTERVAL_SECONDS,
+) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        started_at = loop.time()
+        await asyncio.sleep(interval_seconds)
+        lag_seconds = max(loop.time() - started_at - interval_seconds, 0.0)
+        worker_metrics.observe("worker_event_loop_lag_seconds", lag_seconds)
+
+
+async def _handle_metrics_request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=_REQUEST_TIMEOUT_SECONDS)
+        while (await asyncio.wait_for(reader.readline(), timeout=_REQUEST_TIMEOUT_SECONDS)).strip():
+            continue
+
+        method, _, target = request_line.decode("latin-1").partition(" ")
+        path = target.split(" ", 1)[0].split("?", 1)[0]
+        if method == "GET" and path == "/metrics":
+            status_line = "200 OK"
+            body = worker_metrics.render().encode("utf-8")
+        else:
+            status_line = "404 Not Found"
+            body = b"not found\n"
+
+        writer.write(
+            (
+                f"HTTP/1.1 {status_line}\r\n"
+                "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("latin-1")
+            + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        return
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
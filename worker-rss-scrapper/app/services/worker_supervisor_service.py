@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Callable
+import logging
+import multiprocessing
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+import os
+import queue
+import signal
+import threading
+import time
+
+from app.clients.queue import REDIS_CONSUMER_NAME
+from app.services.scrape_job_service import get_worker_stats_snapshot, run_scrape_worker
+from app.utils import resolve_positive_float_env, resolve_positive_int_env
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKER_PROCESSES = 1
+DEFAULT_WORKER_RESTART_DELAY_SECONDS = 1.0
+DEFAULT_WORKER_MAX_RESTART_DELAY_SECONDS = 60.0
+DEFAULT_WORKER_MAX_RESTART_ATTEMPTS = 5
+DEFAULT_WORKER_STABLE_RUN_SECONDS = 60.0
+DEFAULT_WORKER_SHUTDOWN_TIMEOUT_SECONDS = 30.0
+DEFAULT_WORKER_STATS_INTERVAL_SECONDS = 60.0
+_SUPERVISOR_POLL_SECONDS = 0.5
+
+WorkerStatsMessage = tuple[int, dict[str, int]]
+
+
+class WorkerProcessSlot:
+    def __init__(self, *, process_index: int, consumer_name: str) -> None:
+        self.process_index = process_index
+        self.consumer_name = consumer_name
+        self.process: BaseProcess | None = None
+        self.restart_at = 0.0
+        self.started_at = 0.0
+        self.failed_restarts = 0
+        self.gave_up = False
+
+
+class WorkerRestartPolicy:
+    def __init__(
+        self,
+        *,
+        delay_seconds: float,
+        max_delay_seconds: float,
+        max_attempts: int,
+        stable_run_seconds: float,
+    ) -> None:
+        self.delay_seconds = delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.max_attempts = max_attempts
+        self.stable_run_seconds = stable_run_seconds
+
+    def resolve_delay_seconds(self, failed_restarts: int) -> float:
+        return min(self.delay_seconds * 2 ** (failed_restarts - 1), self.max_delay_seconds)
+
+
+def resolve_worker_process_count() -> int:
+    return resolve_positive_int_env("WORKER_PROCESSES", DEFAULT_WORKER_PROCESSES)
+
+
+def run_worker_supervisor(*, process_count: int) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    context = multiprocessing.get_context("spawn")
+    stats_queue: Queue[WorkerStatsMessage] = context.Queue()
+    stop_requested = threading.Event()
+    base_consumer_name = os.getenv("WORKER_CONSUMER_NAME", REDIS_CONSUMER_NAME)
+    restart_policy = WorkerRestartPolicy(
+        delay_seconds=resolve_positive_float_env(
+            "WORKER_RESTART_DELAY_SECONDS",
+            DEFAULT_WORKER_RESTART_DELAY_SECONDS,
+        ),
+        max_delay_seconds=resolve_positive_float_env(
+            "WORKER_MAX_RESTART_DELAY_SECONDS",
+            DEFAULT_WORKER_MAX_RESTART_DELAY_SECONDS,
+        ),
+        max_attempts=resolve_positive_int_env(
+            "WORKER_MAX_RESTART_ATTEMPTS",
+            DEFAULT_WORKER_MAX_RESTART_ATTEMPTS,
+        ),
+        stable_run_seconds=DEFAULT_WORKER_STABLE_RUN_SECONDS,
+    )
+    shutdown_timeout_seconds = resolve_positive_float_env(
+        "WORKER_SHUTDOWN_TIMEOUT_SECONDS",
+        DEFAULT_WORKER_SHUTDOWN_TIMEOUT_SECONDS,
+    )
+    stats_interval_seconds = resolve_positive_float_env(
+        "WORKER_STATS_INTERVAL_SECONDS",
+        DEFAULT_WORKER_STATS_INTERVAL_SECONDS,
+    )
+
+    for signal_number in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signal_number, lambda *_: stop_requested.set())
+
+    def start_process(slot: WorkerProcessSlot) -> BaseProcess:
+        process = context.Process(
+            target=_run_worker_process,
+            name=slot.consumer_name,
+            kwargs={
+                "process_index": slot.process_index,
+                "consumer_name": slot.consumer_name,
+                "process_count": process_count,
+                "stats_queue": stats_queue,
+                "stats_interval_seconds": stats_interval_seconds,
+            },
+        )
+        process.start()
+        logger.info("Started worker process %s (pid=%s)", slot.consumer_name, process.pid)
+        return process
+
+    slots = [
+        WorkerProcessSlot(
+            process_index=process_index,
+            consumer_name=build_process_consumer_name(base_consumer_name, process_index),
+        )
+        for process_index in range(process_count)
+    ]
+    stats_by_process: dict[int, dict[str, int]] = {}
+    retired_stats: Counter[str] = Counter()
+    next_stats_log_at = time.monotonic() + stats_interval_seconds
+
+    exit_code = 0
+    logger.info("worker supervisor started with %s processes", process_count)
+    while not stop_requested.is_set():
+        _drain_stats_queue(stats_queue, stats_by_process)
+        restart_dead_processes(
+            slots,
+            start_process=start_process,
+            restart_policy=restart_policy,
+            stats_by_process=stats_by_process,
+            retired_stats=retired_stats,
+            now=time.monotonic(),
+        )
+        if all(slot.gave_up for slot in slots):
+            logger.error("Every worker process keeps failing, stopping the supervisor")
+            exit_code = 1
+            break
+        if time.monotonic() >= next_stats_log_at:
+            _log_worker_stats(aggregate_worker_stats(stats_by_process, retired_stats))
+            next_stats_log_at = time.monotonic() + stats_interval_seconds
+        stop_requested.wait(_SUPERVISOR_POLL_SECONDS)
+
+    logger.info("worker supervisor stopping, draining %s processes", process_count)
+    _stop_processes(slots, timeout_seconds=shutdown_timeout_seconds)
+    _drain_stats_queue(stats_queue, stats_by_process)
+    _log_worker_stats(aggregate_worker_stats(stats_by_process, retired_stats))
+    return exit_code
+
+
+def build_process_consumer_name(base_consumer_name: str, process_index: int) -> str:
+    return f"{base_consumer_name}-{process_index}"
+
+
+def restart_dead_processes(
+    slots: list[WorkerProcessSlot],
+    *,
+    start_process: Callable[[WorkerProcessSlot], BaseProcess],
+    restart_policy: WorkerRestartPolicy,
+    stats_by_process: dict[int, dict[str, int]],
+    retired_stats: Counter[str],
+    now: float,
+) -> None:
+    for slot in slots:
+        if slot.gave_up:
+            continue
+        process = slot.process
+        if process is not None and process.is_alive():
+            continue
+        if process is not None:
+            retired_stats.update(stats_by_process.pop(slot.process_index, {}))
+            slot.process = None
+            if now - slot.started_at >= restart_policy.stable_run_seconds:
+                slot.failed_restarts = 0
+            slot.failed_restarts += 1
+            if slot.failed_restarts > restart_policy.max_attempts:
+                logger.error(
+                    "Worker process %s exited with code %s %s times in a row, giving up",
+                    slot.consumer_name,
+                    process.exitcode,
+                    slot.failed_restarts,
+                )
+                slot.gave_up = True
+                continue
+            restart_delay_seconds = restart_policy.resolve_delay_seconds(slot.failed_restarts)
+            logger.warning(
+                "Worker process %s exited with code %s, restarting in %.1fs",
+                slot.consumer_name,
+                process.exitcode,
+                restart_delay_seconds,
+            )
+            slot.restart_at = now + restart_delay_seconds
+            retired_stats["process_restarts"] += 1
+        if now < slot.restart_at:
+            continue
+        slot.process = start_process(slot)
+        slot.started_at = now
+
+
+def aggregate_worker_stats(
+    stats_by_process: dict[int, dict[str, int]],
+    retired_stats: Counter[str],
+) -> dict[str, int]:
+    total: Counter[str] = Counter(retired_stats)
+    for process_stats in stats_by_process.values():
+        total.update(process_stats)
+    return dict(sorted(total.items()))
+
+
+def _run_worker_process(
+    *,
+    process_index: int,
+    consumer_name: str,
+    process_count: int,
+    stats_queue: Queue[WorkerStatsMessage],
+    stats_interval_seconds: float,
+) -> None:
+    asyncio.run(
+        _run_worker_process_async(
+            process_index=process_index,
+            consumer_name=consumer_name,
+            process_count=process_count,
+            stats_queue=stats_queue,
+            stats_interval_seconds=stats_interval_seconds,
+        )
+    )
+
+
+async def _run_worker_process_async(
+    *,
+    process_index: int,
+    consumer_name: str,
+    process_count: int,
+    stats_queue: Queue[WorkerStatsMessage],
+    stats_interval_seconds: float,
+) -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signal_number, stop_event.set)
+
+    stats_reporter = asyncio.create_task(
+        _report_worker_stats(
+            process_index=process_index,
+            stats_queue=stats_queue,
+            stats_interval_seconds=stats_interval_seconds,
+        )
+    )
+    try:
+        await run_scrape_worker(
+            stop_event=stop_event,
+            consumer_name=consumer_name,
+            process_index=process_index,
+            process_count=process_count,
+        )
+    finally:
+        stats_reporter.cancel()
+        stats_queue.put((process_index, get_worker_stats_snapshot()))
+
+
+async def _report_worker_stats(
+    *,
+    process_index: int,
+    stats_queue: Queue[WorkerStatsMessage],
+    stats_interval_seconds: float,
+) -> None:
+    while True:
+        await asyncio.sleep(min(stats_interval_seconds, 5.0))
+        stats_queue.put((process_index, get_worker_stats_snapshot()))
+
+
+def _drain_stats_queue(
+    stats_queue: Queue[WorkerStatsMessage],
+    stats_by_process: dict[int, dict[str, int]],
+) -> None:
+    while True:
+        try:
+            process_index, process_stats = stats_queue.get_nowait()
+        except queue.Empty:
+            return
+        stats_by_process[process_index] = process_stats
+
+
+def _stop_processes(slots: list[WorkerProcessSlot], *, timeout_seconds: float) -> None:
+    running_processes = [
+        slot.process
+        for slot in slots
+        if slot.process is not None and slot.process.is_alive()
+    ]
+    for process in running_processes:
+        process.terminate()
+
+    deadline = time.monotonic() + timeout_seconds
+    for process in running_processes:
+        process.join(max(deadline - time.monotonic(), 0.0))
+        if process.is_alive():
+            logger.warning("Worker process %s did not drain in time, killing it", process.name)
+            process.kill()
+            process.join()
+
+
+def _log_worker_stats(stats: dict[str, int]) -> None:
+    if not stats:
+        return
+    logger.info(
+        "worker stats: %s",
+        " ".join(f"{name}={value}" for name, value in stats.items()),
+    )
+
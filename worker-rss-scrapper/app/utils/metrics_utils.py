@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import defaultdict
+
+DEFAULT_LATENCY_BUCKETS_SECONDS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+MetricLabels = tuple[tuple[str, str], ...]
+
+
+class MetricsRegistry:
+    def __init__(self, *, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_SECONDS) -> None:
+        self._buckets = buckets
+        self._counters: dict[str, dict[MetricLabels, float]] = defaultdict(lambda: defaultdict(float))
+        self._gauges: dict[str, dict[MetricLabels, float]] = defaultdict(lambda: defaultdict(float))
+        self._histograms: dict[str, dict[MetricLabels, list[float]]] = defaultdict(dict)
+
+    def increment(self, name: str, value: float = 1.0, **labels: str) -> None:
+        self._counters[name][_build_labels(labels)] += value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        self._gauges[name][_build_labels(labels)] = value
+
+    def add_gauge(self, name: str, delta: float, **labels: str) -> None:
+        self._gauges[name][_build_labels(labels)] += delta
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        # One slot per bucket, then +Inf, sum and count.
+        series = self._histograms[name].setdefault(
+            _build_labels(labels),
+            [0.0] * (len(self._buckets) + 3),
+        )
+        series[bisect_left(self._buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def get_counter(self, name: str, **labels: str) -> float:
+        return self._counters.get(name, {}).get(_build_labels(labels), 0.0)
+
+    def get_gauge(self, name: str, **labels: str) -> float:
+        return self._gauges.get(name, {}).get(_build_labels(labels), 0.0)
+
+    def get_histogram_count(self, name: str, **labels: str) -> int:
+        series = self._histograms.get(name, {}).get(_build_labels(labels))
+        return int(series[-1]) if series is not None else 0
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name in sorted(self._counters):
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in sorted(self._counters[name].items()):
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for name in sorted(self._gauges):
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in sorted(self._gauges[name].items()):
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for name in sorted(self._histograms):
+            lines.append(f"# TYPE {name} histogram")
+            for labels, series in sorted(self._histograms[name].items()):
+                cumulative = 0.0
+                for bucket, bucket_count in zip(self._buckets, series):
+                    cumulative += bucket_count
+                    bucket_labels = labels + (("le", _format_value(bucket)),)
+                    lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}")
+                cumulative += series[len(self._buckets)]
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {_format_value(cumulative)}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(series[-2])}")
+                lines.append(f"{name}_count{_format_labels(labels)} {_format_value(series[-1])}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        self._counters.clear()
+        self._gauges.clear()
+        self._histograms.clear()
+
+
+def _build_labels(labels: dict[str, str]) -> MetricLabels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(labels: MetricLabels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+worker_metrics = MetricsRegistry()
@@ -0,0 +1,167 @@
+import argparse
+import asyncio
+from contextlib import ExitStack
+from datetime import datetime, timezone
+import gzip
+import logging
+from pathlib import Path
+import sys
+from typing import TextIO
+
+from app.clients.archive import (
+    DEFAULT_BODY_ARCHIVE_RETENTION_DAYS,
+    prune_feed_body_archive,
+    resolve_feed_body_archive_dir,
+)
+from app.services.feed_body_archive_service import run_feed_body_reparse
+from app.services.offline_ingest_service import (
+    DEFAULT_OFFLINE_INGEST_CONCURRENCY,
+    load_offline_ingest_feeds,
+    run_offline_ingest,
+)
+from app.services.scrape_job_service import DEFAULT_COMPANY_MAX_REQUESTS_PER_SECOND
+from app.utils import resolve_positive_float_env, resolve_positive_int_env
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="worker-rss-scrapper")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reparse_parser = subparsers.add_parser(
+        "reparse-archive",
+        help="Parse archived feed bodies with the current parser, without any network access",
+    )
+    reparse_parser.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+        help="Gzipped JSON lines of scrape results, for `db-manager import-results`",
+    )
+    reparse_parser.add_argument("--since", type=_parse_datetime, help="First fetch time, ISO 8601")
+    reparse_parser.add_argument("--until", type=_parse_datetime, help="Last fetch time, ISO 8601")
+    reparse_parser.add_argument("--feed-ids", nargs="+", type=int, metavar="FEED_ID")
+    reparse_parser.add_argument("--processes", type=int, help="Parse processes, defaults to the CPU count")
+    reparse_parser.add_argument(
+        "--latest-only",
+        action="store_true",
+        help="Only re-parse the last archived body of each feed",
+    )
+
+    prune_parser = subparsers.add_parser(
+        "prune-archive",
+        help="Delete archived feed bodies older than the retention",
+    )
+    prune_parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=resolve_positive_int_env(
+            "WORKER_BODY_ARCHIVE_RETENTION_DAYS",
+            DEFAULT_BODY_ARCHIVE_RETENTION_DAYS,
+        ),
+    )
+
+    ingest_parser = subparsers.add_parser(
+        "ingest-feeds",
+        help="Fetch and parse a list of feeds in-process, without the Redis streams",
+    )
+    ingest_parser.add_argument(
+        "--feeds",
+        required=True,
+        help="JSON lines of feeds from `db-manager export-feeds`, or - for stdin",
+    )
+    ingest_parser.add_argument(
+        "--output",
+        required=True,
+        help="JSON lines of scrape results for `db-manager import-results`, gzipped for .gz, or - for stdout",
+    )
+    ingest_parser.add_argument(
+        "--files-dir",
+        type=Path,
+        help="Read <feed_id>.xml from this directory instead of fetching each feed",
+    )
+    ingest_parser.add_argument("--concurrency", type=int, default=DEFAULT_OFFLINE_INGEST_CONCURRENCY)
+    ingest_parser.add_argument("--processes", type=int, help="Parse processes, defaults to the CPU count")
+    ingest_parser.add_argument(
+        "--company-max-rps",
+        type=float,
+        default=resolve_positive_float_env(
+            "WORKER_COMPANY_MAX_REQUESTS_PER_SECOND",
+            DEFAULT_COMPANY_MAX_REQUESTS_PER_SECOND,
+        ),
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "ingest-feeds":
+        if args.concurrency <= 0 or (args.processes is not None and args.processes <= 0):
+            parser.error("--concurrency and --processes must be greater than zero")
+        _run_ingest_feeds_command(args)
+        return
+
+    archive_dir = resolve_feed_body_archive_dir()
+    if archive_dir is None:
+        parser.error("WORKER_BODY_ARCHIVE_DIR is not set")
+
+    if args.command == "reparse-archive":
+        if args.processes is not None and args.processes <= 0:
+            parser.error("--processes must be greater than zero")
+        report = run_feed_body_reparse(
+            archive_dir,
+            output_path=args.output,
+            since=args.since,
+            until=args.until,
+            feed_ids=set(args.feed_ids) if args.feed_ids else None,
+            processes=args.processes,
+            latest_only=args.latest_only,
+        )
+        for line in report.format_lines():
+            print(line)
+    elif args.command == "prune-archive":
+        removed_days, removed_objects = prune_feed_body_archive(
+            archive_dir,
+            retention_days=args.retention_days,
+            now=datetime.now(timezone.utc),
+        )
+        print(f"{removed_days} index days and {removed_objects} bodies pruned")
+
+
+def _run_ingest_feeds_command(args: argparse.Namespace) -> None:
+    with ExitStack() as stack:
+        feeds_file = sys.stdin if args.feeds == "-" else stack.enter_context(_open_text(args.feeds, "rt"))
+        feeds = load_offline_ingest_feeds(feeds_file)
+        output_file = sys.stdout if args.output == "-" else stack.enter_context(_open_text(args.output, "wt"))
+        report = asyncio.run(
+            run_offline_ingest(
+                feeds,
+                output_file=output_file,
+                concurrency=args.concurrency,
+                processes=args.processes,
+                files_dir=args.files_dir,
+                company_max_rps=args.company_max_rps,
+            )
+        )
+    # Results may be going to stdout, so the report goes to stderr.
+    for line in report.format_lines():
+        print(line, file=sys.stderr)
+
+
+def _open_text(path: str, mode: str) -> TextIO:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode.replace("t", ""), encoding="utf-8")
+
+
+def _parse_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+if __name__ == "__main__":
+    main()
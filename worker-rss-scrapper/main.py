@@ -1,9 +1,16 @@
 import asyncio
 
 from app.services.scrape_job_service import run_scrape_worker
+from app.services.worker_supervisor_service import (
+    resolve_worker_process_count,
+    run_worker_supervisor,
+)
 
 
 def main() -> None:
+    process_count = resolve_worker_process_count()
+    if process_count > 1:
+        raise SystemExit(run_worker_supervisor(process_count=process_count))
     asyncio.run(run_scrape_worker())
 
 
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+import os
+
+import app.clients.archive.feed_body_archive_client as feed_body_archive_client_module
+
+
+def _write(archive_dir, *, feed_id: int, body: bytes, fetched_at: datetime):
+    return feed_body_archive_client_module.write_feed_body(
+        archive_dir,
+        feed_id=feed_id,
+        feed_url=f"https://example.com/{feed_id}.xml",
+        fetchprotection=1,
+        body=body,
+        encoding="utf-8",
+        etag='"v1"',
+        last_modified=None,
+        fetched_at=fetched_at,
+    )
+
+
+def test_write_feed_body_stores_identical_bodies_once(tmp_path) -> None:
+    fetched_at = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+    first = _write(tmp_path, feed_id=1, body=b"<rss>same</rss>", fetched_at=fetched_at)
+    second = _write(tmp_path, feed_id=1, body=b"<rss>same</rss>", fetched_at=fetched_at + timedelta(hours=1))
+
+    assert first.sha256 == second.sha256
+    assert len(list((tmp_path / "objects").glob("*/*.gz"))) == 1
+    assert feed_body_archive_client_module.read_feed_body(tmp_path, first.sha256) == b"<rss>same</rss>"
+    entries = list(feed_body_archive_client_module.iter_feed_body_entries(tmp_path))
+    assert [entry.fetched_at for entry in entries] == [fetched_at, fetched_at + timedelta(hours=1)]
+    assert entries[0].size == len(b"<rss>same</rss>")
+
+
+def test_iter_feed_body_entries_filters_by_time_and_feed(tmp_path) -> None:
+    day = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    _write(tmp_path, feed_id=1, body=b"a", fetched_at=day)
+    _write(tmp_path, feed_id=2, body=b"b", fetched_at=day)
+    _write(tmp_path, feed_id=1, body=b"c", fetched_at=day + timedelta(days=2))
+
+    entries = list(
+        feed_body_archive_client_module.iter_feed_body_entries(
+            tmp_path,
+            since=day + timedelta(hours=1),
+            feed_ids={1},
+        )
+    )
+
+    assert [(entry.feed_id, entry.fetched_at) for entry in entries] == [(1, day + timedelta(days=2))]
+
+
+def test_prune_feed_body_archive_drops_old_days_and_untouched_bodies(tmp_path) -> None:
+    now = datetime(2026, 3, 31, 12, 0, tzinfo=timezone.utc)
+    old_entry = _write(tmp_path, feed_id=1, body=b"old", fetched_at=now - timedelta(days=40))
+    kept_entry = _write(tmp_path, feed_id=1, body=b"kept", fetched_at=now - timedelta(days=1))
+    old_timestamp = (now - timedelta(days=40)).timestamp()
+    old_object_path = tmp_path / "objects" / old_entry.sha256[:2] / f"{old_entry.sha256}.gz"
+    os.utime(old_object_path, (old_timestamp, old_timestamp))
+
+    removed = feed_body_archive_client_module.prune_feed_body_archive(
+        tmp_path,
+        retention_days=30,
+        now=now,
+    )
+
+    assert removed == (1, 1)
+    assert not old_object_path.exists()
+    entries = list(feed_body_archive_client_module.iter_feed_body_entries(tmp_path))
+    assert [entry.sha256 for entry in entries] == [kept_entry.sha256]
+    assert feed_body_archive_client_module.read_feed_body(tmp_path, kept_entry.sha256) == b"kept"
@@ -1,11 +1,13 @@
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import httpx
 
 import app.clients.networking.rss_fetch_networking_client as rss_fetch_networking_client_module
+from app.clients.archive import iter_feed_body_entries, read_feed_body
 from app.schemas.feed_source_schema import FeedSourceSchema
 from app.schemas.scrape_job_schema import ScrapeJobFeedSchema
+from app.utils import worker_metrics
 
 
 def test_build_request_headers_includes_host_and_conditionals_for_fetchprotection_2() -> None:
@@ -54,7 +56,7 @@ def test_fetch_feed_result_returns_not_modified_on_304(monkeypatch) -> None:
         fetchprotection=1,
     )
 
-    async def fake_perform_request_with_retry(*, url, headers, client):
+    async def fake_perform_request_with_retry(*, url, headers, client, timings):
         request = httpx.Request("GET", url)
         return httpx.Response(
             status_code=304,
@@ -93,7 +95,7 @@ def test_fetch_feed_result_returns_success_with_normalized_sources(monkeypatch)
         fetchprotection=2,
     )
 
-    async def fake_perform_request_with_retry(*, url, headers, client):
+    async def fake_perform_request_with_retry(*, url, headers, client, timings):
         request = httpx.Request("GET", url)
         return httpx.Response(
             status_code=200,
@@ -110,7 +112,11 @@ def test_fetch_feed_result_returns_success_with_normalized_sources(monkeypatch)
     monkeypatch.setattr(
         rss_fetch_networking_client_module,
         "parse_rss_feed_entries",
-        lambda _content: ([{"title": "A", "url": "https://example.com/a"}], parsed_last_modified),
+        lambda _content: (
+            [{"title": "A", "url": "https://example.com/a"}],
+            parsed_last_modified,
+            {"ttl_seconds": 1800, "skip_hours": [2]},
+        ),
     )
     monkeypatch.setattr(
         rss_fetch_networking_client_module,
@@ -128,5 +134,172 @@ def test_fetch_feed_result_returns_success_with_normalized_sources(monkeypatch)
 
     assert result.status == "success"
     assert result.new_etag == "etag-200"
+    assert result.ttl_seconds == 1800
+    assert result.skip_hours == [2]
     assert result.new_last_update == parsed_last_modified
     assert [source.url for source in result.sources] == ["https://example.com/a"]
+    assert result.response_bytes == len("<rss/>")
+    assert (result.entries_parsed, result.entries_kept) == (1, 1)
+    assert result.parse_ms is not None
+    assert result.total_ms is not None
+
+
+def test_fetch_feed_result_archives_body_before_parsing(monkeypatch, tmp_path) -> None:
+    feed = ScrapeJobFeedSchema(
+        feed_id=5,
+        feed_url="https://example.com/rss.xml",
+        fetchprotection=1,
+    )
+
+    async def fake_perform_request_with_retry(*, url, headers, client, timings):
+        return httpx.Response(
+            status_code=200,
+            request=httpx.Request("GET", url),
+            headers={"etag": "etag-archived"},
+            text="<rss>unparseable",
+        )
+
+    monkeypatch.setattr(
+        rss_fetch_networking_client_module,
+        "_perform_request_with_retry",
+        fake_perform_request_with_retry,
+    )
+
+    result = asyncio.run(
+        rss_fetch_networking_client_module.fetch_feed_result(
+            feed=feed,
+            ingest=True,
+            body_archive_dir=tmp_path,
+        )
+    )
+
+    assert result.status == "error"
+    entries = list(iter_feed_body_entries(tmp_path))
+    assert [(entry.feed_id, entry.etag) for entry in entries] == [(5, "etag-archived")]
+    assert read_feed_body(tmp_path, entries[0].sha256) == b"<rss>unparseable"
+
+
+def test_fetch_feed_result_ignores_body_archive_errors(monkeypatch, tmp_path) -> None:
+    feed = ScrapeJobFeedSchema(
+        feed_id=6,
+        feed_url="https://example.com/rss.xml",
+        fetchprotection=1,
+    )
+
+    async def fake_perform_request_with_retry(*, url, headers, client, timings):
+        return httpx.Response(status_code=200, request=httpx.Request("GET", url), text="<rss/>")
+
+    def failing_write_feed_body(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(
+        rss_fetch_networking_client_module,
+        "_perform_request_with_retry",
+        fake_perform_request_with_retry,
+    )
+    monkeypatch.setattr(rss_fetch_networking_client_module, "write_feed_body", failing_write_feed_body)
+    monkeypatch.setattr(
+        rss_fetch_networking_client_module,
+        "parse_rss_feed_entries",
+        lambda _content: ([], None, {"ttl_seconds": None, "skip_hours": []}),
+    )
+    errors_before = worker_metrics.get_counter("worker_body_archive_errors_total")
+
+    result = asyncio.run(
+        rss_fetch_networking_client_module.fetch_feed_result(
+            feed=feed,
+            ingest=True,
+            body_archive_dir=tmp_path,
+        )
+    )
+
+    assert result.status == "success"
+    assert worker_metrics.get_counter("worker_body_archive_errors_total") == errors_before + 1
+
+
+def test_fetch_feed_body_returns_raw_body_and_validators(monkeypatch) -> None:
+    feed = ScrapeJobFeedSchema(
+        feed_id=7,
+        feed_url="https://example.com/rss.xml",
+        fetchprotection=1,
+    )
+
+    async def fake_perform_request_with_retry(*, url, headers, client, timings):
+        return httpx.Response(
+            status_code=200,
+            request=httpx.Request("GET", url),
+            headers={"etag": " etag-7 ", "last-modified": "Thu, 26 Feb 2026 12:00:00 GMT"},
+            content=b"<rss/>",
+        )
+
+    monkeypatch.setattr(
+        rss_fetch_networking_client_module,
+        "_perform_request_with_retry",
+        fake_perform_request_with_retry,
+    )
+
+    feed_body = asyncio.run(rss_fetch_networking_client_module.fetch_feed_body(feed=feed))
+
+    assert (feed_body.status_code, feed_body.content) == (200, b"<rss/>")
+    assert feed_body.etag == "etag-7"
+    assert feed_body.last_modified == datetime(2026, 2, 26, 12, 0, tzinfo=timezone.utc)
+
+
+def test_feed_fetch_timings_splits_connect_ttfb_and_download(monkeypatch) -> None:
+    perf_counter_values = iter([0.0, 1.0, 1.010, 1.030, 1.050, 1.080, 1.200, 1.500, 2.0])
+    monkeypatch.setattr(rss_fetch_networking_client_module.time, "perf_counter", lambda: next(perf_counter_values))
+
+    async def run() -> dict:
+        timings = rss_fetch_networking_client_module.FeedFetchTimings()
+        timings.start_attempt()
+        for event_name in (
+            "connection.connect_tcp.started",
+            "connection.connect_tcp.complete",
+            "connection.start_tls.started",
+            "connection.start_tls.complete",
+            "http11.receive_response_headers.complete",
+            "http11.receive_response_body.complete",
+        ):
+            await timings.trace(event_name, {})
+        return timings.to_result_fields()
+
+    fields = asyncio.run(run())
+
+    assert fields["connect_ms"] == 50
+    assert fields["ttfb_ms"] == 200
+    assert fields["download_ms"] == 300
+    assert fields["total_ms"] == 2000
+
+
+def test_resolve_cache_expires_at_prefers_max_age_over_expires() -> None:
+    before = datetime.now(timezone.utc)
+
+    cache_expires_at = rss_fetch_networking_client_module._resolve_cache_expires_at(
+        httpx.Headers(
+            {
+                "cache-control": "public, max-age=600",
+                "expires": "Thu, 01 Jan 2099 00:00:00 GMT",
+            }
+        )
+    )
+
+    assert cache_expires_at is not None
+    assert before + timedelta(seconds=600) <= cache_expires_at <= datetime.now(timezone.utc) + timedelta(seconds=600)
+
+
+def test_resolve_cache_expires_at_ignores_no_cache_and_past_expires() -> None:
+    assert (
+        rss_fetch_networking_client_module._resolve_cache_expires_at(
+            httpx.Headers({"cache-control": "no-cache, max-age=600"})
+        )
+        is None
+    )
+    assert (
+        rss_fetch_networking_client_module._resolve_cache_expires_at(
+            httpx.Headers({"expires": "Thu, 01 Jan 2015 00:00:00 GMT"})
+        )
+        is None
+    )
+    assert rss_fetch_networking_client_module._resolve_cache_expires_at(
+        httpx.Headers({"expires": "Thu, 01 Jan 2099 00:00:00 GMT"})
+    ) == datetime(2099, 1, 1, tzinfo=timezone.utc)
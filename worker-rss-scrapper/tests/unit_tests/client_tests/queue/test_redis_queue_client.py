@@ -6,6 +6,28 @@ from redis.exceptions import ResponseError
 
 import app.clients.queue.redis_queue_client as redis_queue_client_module
 from app.errors.worker_exceptions import WorkerQueueError
+from app.utils import MetricsRegistry
+
+
+class FakePipeline:
+    def __init__(self, redis_client) -> None:
+        self._redis_client = redis_client
+        self._commands: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+
+        return _queue
+
+    async def execute(self) -> list:
+        return [await getattr(self._redis_client, name)(*args, **kwargs) for name, args, kwargs in self._commands]
 
 
 def test_ensure_worker_consumer_group_ignores_busygroup(monkeypatch) -> None:
@@ -18,11 +40,19 @@ def test_ensure_worker_consumer_group_ignores_busygroup(monkeypatch) -> None:
 
     monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
     monkeypatch.setattr(redis_queue_client_module, "REDIS_QUEUE_REQUESTS", "rss_scrape_requests")
+    monkeypatch.setattr(
+        redis_queue_client_module,
+        "REDIS_QUEUE_REQUESTS_INTERACTIVE",
+        "rss_scrape_requests_interactive",
+    )
     monkeypatch.setattr(redis_queue_client_module, "REDIS_GROUP_WORKER", "worker_rss_scrapper_group")
 
     asyncio.run(redis_queue_client_module.ensure_worker_consumer_group())
 
-    assert calls == [("rss_scrape_requests", "worker_rss_scrapper_group", "$", True)]
+    assert calls == [
+        ("rss_scrape_requests_interactive", "worker_rss_scrapper_group", "$", True),
+        ("rss_scrape_requests", "worker_rss_scrapper_group", "$", True),
+    ]
 
 
 def test_ensure_worker_consumer_group_raises_on_non_busygroup(monkeypatch) -> None:
@@ -39,30 +69,113 @@ def test_ensure_worker_consumer_group_raises_on_non_busygroup(monkeypatch) -> No
 def test_read_scrape_jobs_decodes_records(monkeypatch) -> None:
     class FakeRedis:
         async def xreadgroup(self, group_name, consumer_name, streams, count, block):
-            return [
-                (b"rss_scrape_requests", [(b"1-0", {b"payload": b'{"job_id":"job-1","feeds":[]}'})]),
-                ("rss_scrape_requests", [("2-0", {"payload": '{"job_id":"job-2","feeds":[]} '})]),
-            ]
+            if "rss_scrape_requests_interactive" in streams:
+                return [
+                    (
+                        b"rss_scrape_requests_interactive",
+                        [(b"1-0", {b"payload": b'{"job_id":"job-1","feeds":[]}'})],
+                    ),
+                ]
+            return [("rss_scrape_requests", [("2-0", {"payload": '{"job_id":"job-2","feeds":[]} '})])]
 
     monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
 
     jobs = asyncio.run(redis_queue_client_module.read_scrape_jobs(count=5, block_ms=2000))
 
     assert jobs == [
-        ("1-0", {"job_id": "job-1", "feeds": []}),
-        ("2-0", {"job_id": "job-2", "feeds": []}),
+        ("rss_scrape_requests_interactive", "1-0", {"job_id": "job-1", "feeds": []}),
+        ("rss_scrape_requests", "2-0", {"job_id": "job-2", "feeds": []}),
     ]
 
 
+def test_read_scrape_jobs_applies_lane_weights_without_blocking(monkeypatch) -> None:
+    reads: list[tuple[tuple[str, ...], int, int | None]] = []
+
+    class FakeRedis:
+        async def xreadgroup(self, group_name, consumer_name, streams, count, block):
+            reads.append((tuple(streams), count, block))
+            stream_name = next(iter(streams))
+            return [
+                (
+                    stream_name,
+                    [
+                        (f"{index}-0", {"payload": '{"job_id":"job","feeds":[]}'})
+                        for index in range(1, count + 1)
+                    ],
+                )
+            ]
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    jobs = asyncio.run(
+        redis_queue_client_module.read_scrape_jobs(
+            count=10,
+            block_ms=2000,
+            interactive_weight=4,
+            bulk_weight=1,
+        )
+    )
+
+    assert len(jobs) == 10
+    assert reads == [
+        (("rss_scrape_requests_interactive",), 8, None),
+        (("rss_scrape_requests",), 2, None),
+    ]
+
+
+def test_read_scrape_jobs_gives_unused_share_to_other_lane(monkeypatch) -> None:
+    reads: list[tuple[tuple[str, ...], int, int | None]] = []
+
+    class FakeRedis:
+        async def xreadgroup(self, group_name, consumer_name, streams, count, block):
+            reads.append((tuple(streams), count, block))
+            if tuple(streams) == ("rss_scrape_requests",):
+                return [("rss_scrape_requests", [("1-0", {"payload": '{"job_id":"job","feeds":[]}'})])]
+            if block is not None:
+                raise AssertionError("blocking read must not happen when jobs are available")
+            return []
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    jobs = asyncio.run(redis_queue_client_module.read_scrape_jobs(count=10, block_ms=2000))
+
+    assert [job[0] for job in jobs] == ["rss_scrape_requests"]
+    assert reads == [
+        (("rss_scrape_requests_interactive",), 8, None),
+        (("rss_scrape_requests",), 10, None),
+    ]
+
+
+def test_read_scrape_jobs_blocks_on_both_lanes_when_idle(monkeypatch) -> None:
+    reads: list[tuple[tuple[str, ...], int, int | None]] = []
+
+    class FakeRedis:
+        async def xreadgroup(self, group_name, consumer_name, streams, count, block):
+            reads.append((tuple(streams), count, block))
+            return []
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    jobs = asyncio.run(redis_queue_client_module.read_scrape_jobs(count=4, block_ms=2000))
+
+    assert jobs == []
+    assert reads[-1] == (("rss_scrape_requests_interactive", "rss_scrape_requests"), 4, 2000)
+
+
+def test_resolve_message_queue_wait_ms_uses_stream_id_timestamp() -> None:
+    assert redis_queue_client_module.resolve_message_queue_wait_ms("1000-3", now_ms=1250) == 250
+    assert redis_queue_client_module.resolve_message_queue_wait_ms("invalid", now_ms=1250) is None
+
+
 def test_read_scrape_jobs_recreates_group_on_nogroup(monkeypatch) -> None:
-    ensure_calls: list[str] = []
+    ensure_calls: list[tuple[str, ...]] = []
 
     class FakeRedis:
         async def xreadgroup(self, group_name, consumer_name, streams, count, block):
             raise ResponseError("NOGROUP No such key")
 
-    async def fake_ensure_worker_consumer_group() -> None:
-        ensure_calls.append("called")
+    async def fake_ensure_worker_consumer_group(stream_names: tuple[str, ...]) -> None:
+        ensure_calls.append(stream_names)
 
     monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
     monkeypatch.setattr(
@@ -71,10 +184,142 @@ def test_read_scrape_jobs_recreates_group_on_nogroup(monkeypatch) -> None:
         fake_ensure_worker_consumer_group,
     )
 
-    jobs = asyncio.run(redis_queue_client_module.read_scrape_jobs())
+    jobs = asyncio.run(
+        redis_queue_client_module.read_scrape_jobs(
+            interactive_stream="rss_scrape_requests_interactive:1",
+            bulk_stream="rss_scrape_requests:1",
+        )
+    )
 
     assert jobs == []
-    assert ensure_calls == ["called"]
+    assert ensure_calls == [("rss_scrape_requests_interactive:1",)]
+
+
+def test_resolve_request_stream_names_uses_shard_suffix() -> None:
+    assert redis_queue_client_module.resolve_request_stream_names() == (
+        "rss_scrape_requests_interactive",
+        "rss_scrape_requests",
+    )
+    assert redis_queue_client_module.resolve_request_stream_names(shard_index=2, shard_count=4) == (
+        "rss_scrape_requests_interactive:2",
+        "rss_scrape_requests:2",
+    )
+    with pytest.raises(WorkerQueueError, match="out of range"):
+        redis_queue_client_module.resolve_request_stream_names(shard_index=4, shard_count=4)
+
+
+def test_resolve_legacy_request_stream_names_only_for_first_shard() -> None:
+    assert redis_queue_client_module.resolve_legacy_request_stream_names() == ()
+    assert redis_queue_client_module.resolve_legacy_request_stream_names(shard_index=0, shard_count=4) == (
+        "rss_scrape_requests_interactive",
+        "rss_scrape_requests",
+    )
+    assert redis_queue_client_module.resolve_legacy_request_stream_names(shard_index=1, shard_count=4) == ()
+
+
+def test_read_scrape_jobs_drains_legacy_streams(monkeypatch) -> None:
+    reads: list[tuple[tuple[str, ...], int, int | None]] = []
+
+    class FakeRedis:
+        async def xreadgroup(self, group_name, consumer_name, streams, count, block):
+            reads.append((tuple(streams), count, block))
+            if "rss_scrape_requests" in streams:
+                return [("rss_scrape_requests", [("1-0", {"payload": '{"job_id":"job","feeds":[]}'})])]
+            return []
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    jobs = asyncio.run(
+        redis_queue_client_module.read_scrape_jobs(
+            count=10,
+            block_ms=2000,
+            interactive_stream="rss_scrape_requests_interactive:0",
+            bulk_stream="rss_scrape_requests:0",
+            legacy_streams=("rss_scrape_requests_interactive", "rss_scrape_requests"),
+        )
+    )
+
+    assert [job[0] for job in jobs] == ["rss_scrape_requests"]
+    assert reads[-1] == (("rss_scrape_requests_interactive", "rss_scrape_requests"), 10, None)
+
+
+def test_read_request_shard_count_parses_published_value(monkeypatch) -> None:
+    values = iter([b"4", None, b"four"])
+
+    class FakeRedis:
+        async def get(self, key):
+            assert key == "rss_scrape_request_shards"
+            return next(values)
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    assert asyncio.run(redis_queue_client_module.read_request_shard_count()) == 4
+    assert asyncio.run(redis_queue_client_module.read_request_shard_count()) is None
+    with pytest.raises(WorkerQueueError, match="Invalid rss_scrape_request_shards"):
+        asyncio.run(redis_queue_client_module.read_request_shard_count())
+
+
+def test_claim_idle_scrape_jobs_decodes_and_acks_empty_entries(monkeypatch) -> None:
+    acked: list[tuple[str, tuple[str, ...]]] = []
+
+    class FakeRedis:
+        async def xautoclaim(self, name, groupname, consumername, min_idle_time, start_id, count):
+            assert (consumername, min_idle_time, start_id, count) == ("worker-1", 60000, "0-0", 10)
+            return [
+                b"5-0",
+                [
+                    (b"1-0", {b"payload": b'{"job_id":"job","feeds":[]}'}),
+                    (b"2-0", None),
+                ],
+                [],
+            ]
+
+        async def xack(self, name, groupname, *message_ids):
+            acked.append((name, message_ids))
+
+        async def xpending_range(self, name, groupname, min, max, count):
+            return [{"message_id": min, "times_delivered": 2}]
+
+        def pipeline(self, transaction):
+            return FakePipeline(self)
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    next_start_id, jobs = asyncio.run(
+        redis_queue_client_module.claim_idle_scrape_jobs(
+            stream_name="rss_scrape_requests",
+            min_idle_ms=60000,
+            count=10,
+            consumer_name="worker-1",
+        )
+    )
+
+    assert next_start_id == "5-0"
+    assert jobs == [("rss_scrape_requests", "1-0", {"job_id": "job", "feeds": []})]
+    assert acked == [("rss_scrape_requests", ("2-0",))]
+
+
+def test_read_pending_scrape_jobs_advances_past_entries_without_payload(monkeypatch) -> None:
+    acked: list[tuple[str, tuple[str, ...]]] = []
+
+    class FakeRedis:
+        async def xreadgroup(self, group_name, consumer_name, streams, count, block):
+            assert streams == {"rss_scrape_requests": "0"}
+            assert block is None
+            return [("rss_scrape_requests", [(b"1-0", None), (b"2-0", {})])]
+
+        async def xack(self, name, groupname, *message_ids):
+            acked.append((name, message_ids))
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    last_message_id, jobs = asyncio.run(
+        redis_queue_client_module.read_pending_scrape_jobs(stream_name="rss_scrape_requests", count=10)
+    )
+
+    assert last_message_id == "2-0"
+    assert jobs == []
+    assert acked == [("rss_scrape_requests", ("1-0", "2-0"))]
 
 
 def test_ack_scrape_job_retries_after_connection_drop(monkeypatch) -> None:
@@ -98,3 +343,95 @@ def test_ack_scrape_job_retries_after_connection_drop(monkeypatch) -> None:
 
     assert len(xack_attempts) == 2
     assert close_calls == ["closed"]
+
+
+def test_claim_idle_scrape_jobs_dead_letters_entries_over_max_deliveries(monkeypatch) -> None:
+    dead_letters: list[tuple[str, dict]] = []
+    acked: list[tuple[str, tuple[str, ...]]] = []
+    metrics = MetricsRegistry()
+    monkeypatch.setattr(redis_queue_client_module, "worker_metrics", metrics)
+
+    class FakeRedis:
+        async def xautoclaim(self, name, groupname, consumername, min_idle_time, start_id, count):
+            return [
+                b"0-0",
+                [
+                    (b"1-0", {b"payload": b'{"job_id":"poison","feeds":[]}'}),
+                    (b"2-0", {b"payload": b'{"job_id":"retry","feeds":[]}'}),
+                ],
+                [],
+            ]
+
+        async def xpending_range(self, name, groupname, min, max, count):
+            return [{"message_id": min.encode(), "times_delivered": 6 if min == "1-0" else 3}]
+
+        async def xadd(self, name, fields, maxlen, approximate):
+            dead_letters.append((name, fields))
+
+        async def xack(self, name, groupname, *message_ids):
+            acked.append((name, message_ids))
+
+        def pipeline(self, transaction):
+            return FakePipeline(self)
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    _, jobs = asyncio.run(
+        redis_queue_client_module.claim_idle_scrape_jobs(
+            stream_name="rss_scrape_requests",
+            min_idle_ms=60000,
+            max_deliveries=5,
+        )
+    )
+
+    assert jobs == [("rss_scrape_requests", "2-0", {"job_id": "retry", "feeds": []})]
+    assert acked == [("rss_scrape_requests", ("1-0",))]
+    assert len(dead_letters) == 1
+    stream_name, fields = dead_letters[0]
+    assert stream_name == "rss_dead_letters"
+    assert fields["source_stream"] == "rss_scrape_requests"
+    assert fields["message_id"] == "1-0"
+    assert fields["payload"] == '{"job_id":"poison","feeds":[]}'
+    assert fields["delivery_count"] == "6"
+    assert fields["reason"].startswith("max_deliveries_exceeded")
+    assert metrics.get_counter("worker_dead_letters_total", reason="max_deliveries_exceeded") == 1
+
+
+def test_read_scrape_jobs_dead_letters_invalid_json(monkeypatch) -> None:
+    dead_letters: list[dict] = []
+    acked: list[tuple[str, tuple[str, ...]]] = []
+
+    class FakeRedis:
+        async def xreadgroup(self, group_name, consumer_name, streams, count, block):
+            return [
+                (
+                    b"rss_scrape_requests",
+                    [
+                        (b"1-0", {b"payload": b"{not json"}),
+                        (b"2-0", {b"payload": b'{"job_id":"job","feeds":[]}'}),
+                    ],
+                )
+            ]
+
+        async def xadd(self, name, fields, maxlen, approximate):
+            dead_letters.append(fields)
+
+        async def xack(self, name, groupname, *message_ids):
+            acked.append((name, message_ids))
+
+        def pipeline(self, transaction):
+            return FakePipeline(self)
+
+    monkeypatch.setattr(redis_queue_client_module, "_get_redis_client", lambda: FakeRedis())
+
+    jobs = asyncio.run(
+        redis_queue_client_module.read_scrape_jobs(
+            interactive_stream="rss_scrape_requests",
+            bulk_stream="rss_scrape_requests_bulk",
+        )
+    )
+
+    assert [message_id for _, message_id, _ in jobs] == ["2-0"]
+    assert acked == [("rss_scrape_requests", ("1-0",))]
+    assert dead_letters[0]["payload"] == "{not json"
+    assert dead_letters[0]["reason"].startswith("invalid_json: ")
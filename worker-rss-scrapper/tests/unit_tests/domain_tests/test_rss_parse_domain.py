@@ -19,7 +19,7 @@ def test_parse_rss_feed_entries_parses_rss_item_and_last_modified() -> None:
     </rss>
     """.strip()
 
-    entries, last_modified = parse_rss_feed_entries(xml_payload)
+    entries, last_modified, freshness_hints = parse_rss_feed_entries(xml_payload)
 
     assert len(entries) == 1
     assert entries[0]["title"] == "Article A"
@@ -28,3 +28,38 @@ def test_parse_rss_feed_entries_parses_rss_item_and_last_modified() -> None:
     assert entries[0]["author"] == "Newsroom"
     assert entries[0]["published_at"] == datetime(2026, 2, 26, 11, 45, tzinfo=timezone.utc)
     assert last_modified == datetime(2026, 2, 26, 12, 0, tzinfo=timezone.utc)
+    assert freshness_hints == {"ttl_seconds": None, "skip_hours": []}
+
+
+def test_parse_rss_feed_entries_extracts_freshness_hints() -> None:
+    xml_payload = """
+    <rss version="2.0" xmlns:sy="http://purl.org/rss/1.0/modules/syndication/">
+      <channel>
+        <ttl>30</ttl>
+        <sy:updatePeriod>hourly</sy:updatePeriod>
+        <sy:updateFrequency>2</sy:updateFrequency>
+        <skipHours>
+          <hour>24</hour>
+          <hour>3</hour>
+          <hour>invalid</hour>
+        </skipHours>
+      </channel>
+    </rss>
+    """.strip()
+
+    _, _, freshness_hints = parse_rss_feed_entries(xml_payload)
+
+    assert freshness_hints == {"ttl_seconds": 1800, "skip_hours": [0, 3]}
+
+
+def test_parse_rss_feed_entries_reads_syndication_period_on_atom_feed() -> None:
+    xml_payload = """
+    <feed xmlns="http://www.w3.org/2005/Atom" xmlns:sy="http://purl.org/rss/1.0/modules/syndication/">
+      <sy:updatePeriod>daily</sy:updatePeriod>
+      <sy:updateFrequency>4</sy:updateFrequency>
+    </feed>
+    """.strip()
+
+    _, _, freshness_hints = parse_rss_feed_entries(xml_payload)
+
+    assert freshness_hints == {"ttl_seconds": 21600, "skip_hours": []}
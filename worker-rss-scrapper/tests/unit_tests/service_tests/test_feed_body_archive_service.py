@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+import gzip
+import json
+
+from app.clients.archive import write_feed_body
+import app.services.feed_body_archive_service as feed_body_archive_service_module
+
+FETCHED_AT = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _build_feed_body(*urls: str) -> bytes:
+    items = "".join(
+        f"<item><title>{url}</title><link>{url}</link>"
+        "<pubDate>Sun, 01 Mar 2026 11:00:00 GMT</pubDate></item>"
+        for url in urls
+    )
+    return f"<rss version=\"2.0\"><channel>{items}</channel></rss>".encode("utf-8")
+
+
+def _archive(archive_dir, *, feed_id: int, body: bytes, fetched_at: datetime) -> None:
+    write_feed_body(
+        archive_dir,
+        feed_id=feed_id,
+        feed_url=f"https://example.com/{feed_id}.xml",
+        fetchprotection=1,
+        body=body,
+        encoding="utf-8",
+        etag=None,
+        last_modified=None,
+        fetched_at=fetched_at,
+    )
+
+
+def _read_output(path) -> list[dict]:
+    with gzip.open(path, "rt", encoding="utf-8") as output_file:
+        return [json.loads(line) for line in output_file]
+
+
+def test_run_feed_body_reparse_parses_each_distinct_body_once(tmp_path) -> None:
+    archive_dir = tmp_path / "archive"
+    _archive(archive_dir, feed_id=1, body=_build_feed_body("https://example.com/a"), fetched_at=FETCHED_AT)
+    _archive(
+        archive_dir,
+        feed_id=1,
+        body=_build_feed_body("https://example.com/a"),
+        fetched_at=FETCHED_AT + timedelta(hours=1),
+    )
+    _archive(
+        archive_dir,
+        feed_id=2,
+        body=_build_feed_body("https://example.com/b", "https://example.com/c"),
+        fetched_at=FETCHED_AT,
+    )
+    _archive(archive_dir, feed_id=3, body=b"<rss>broken", fetched_at=FETCHED_AT)
+    output_path = tmp_path / "reparsed.jsonl.gz"
+
+    report = feed_body_archive_service_module.run_feed_body_reparse(
+        archive_dir,
+        output_path=output_path,
+        processes=1,
+    )
+
+    results = _read_output(output_path)
+    assert sorted(result["feed_id"] for result in results) == [1, 2]
+    assert {result["job_id"] for result in results} == {"reparse"}
+    assert all(result["ingest"] and result["status"] == "success" for result in results)
+    assert (report.entries_read, report.duplicates_skipped) == (4, 1)
+    assert (report.bodies_parsed, report.parse_errors, report.sources_written) == (2, 1, 3)
+
+
+def test_run_feed_body_reparse_keeps_latest_body_per_feed_across_processes(tmp_path) -> None:
+    archive_dir = tmp_path / "archive"
+    _archive(archive_dir, feed_id=1, body=_build_feed_body("https://example.com/old"), fetched_at=FETCHED_AT)
+    _archive(
+        archive_dir,
+        feed_id=1,
+        body=_build_feed_body("https://example.com/new"),
+        fetched_at=FETCHED_AT + timedelta(days=1),
+    )
+    output_path = tmp_path / "reparsed.jsonl.gz"
+
+    report = feed_body_archive_service_module.run_feed_body_reparse(
+        archive_dir,
+        output_path=output_path,
+        processes=2,
+        latest_only=True,
+    )
+
+    results = _read_output(output_path)
+    assert [[source["url"] for source in result["sources"]] for result in results] == [["https://example.com/new"]]
+    assert report.bodies_parsed == 1
@@ -0,0 +1,98 @@
+import asyncio
+import io
+import json
+
+import httpx
+import pytest
+
+from app.clients.networking import FeedBody
+from app.errors.worker_exceptions import WorkerConfigurationError
+from app.schemas import ScrapeJobFeedSchema
+import app.services.offline_ingest_service as offline_ingest_service_module
+
+FEED_BODY = (
+    b'<rss version="2.0"><channel><item><title>A</title><link>https://example.com/a</link>'
+    b"<pubDate>Sun, 01 Mar 2026 11:00:00 GMT</pubDate></item></channel></rss>"
+)
+
+
+def _feed(feed_id: int, *, fetchprotection: int = 1, company_id: int | None = None) -> ScrapeJobFeedSchema:
+    return ScrapeJobFeedSchema(
+        feed_id=feed_id,
+        feed_url=f"https://example.com/{feed_id}.xml",
+        fetchprotection=fetchprotection,
+        company_id=company_id,
+    )
+
+
+def test_run_offline_ingest_reads_local_feed_files(tmp_path) -> None:
+    (tmp_path / "1.xml").write_bytes(FEED_BODY)
+    (tmp_path / "2.xml").write_bytes(b"<rss")
+    output_file = io.StringIO()
+
+    report = asyncio.run(
+        offline_ingest_service_module.run_offline_ingest(
+            [_feed(1), _feed(2), _feed(3)],
+            output_file=output_file,
+            concurrency=2,
+            processes=1,
+            files_dir=tmp_path,
+        )
+    )
+
+    results = [json.loads(line) for line in output_file.getvalue().splitlines()]
+    assert [(result["feed_id"], result["job_id"]) for result in results] == [(1, "offline_ingest")]
+    assert [source["url"] for source in results[0]["sources"]] == ["https://example.com/a"]
+    assert (report.feeds_read, report.bodies_loaded, report.downloaded_bytes) == (3, 2, len(FEED_BODY) + 4)
+    assert (report.fetch_errors, report.parse_errors) == (1, 1)
+    assert (report.results_written, report.sources_written) == (1, 1)
+
+
+def test_run_offline_ingest_fetches_feeds_and_skips_blocked_ones(monkeypatch) -> None:
+    fetched_feed_ids: list[int] = []
+    acquired_limiters: list[int] = []
+
+    async def fake_fetch_feed_body(*, feed, http_client):
+        fetched_feed_ids.append(feed.feed_id)
+        if feed.feed_id == 3:
+            raise httpx.ConnectError("connection refused")
+        return FeedBody(status_code=200, content=FEED_BODY, encoding="utf-8", etag='"v1"', last_modified=None)
+
+    class FakeCompanyRateLimiter:
+        def __init__(self, *, max_requests_per_second: float) -> None:
+            self.max_requests_per_second = max_requests_per_second
+
+        async def acquire(self) -> None:
+            acquired_limiters.append(id(self))
+
+    monkeypatch.setattr(offline_ingest_service_module, "fetch_feed_body", fake_fetch_feed_body)
+    monkeypatch.setattr(offline_ingest_service_module, "CompanyRateLimiter", FakeCompanyRateLimiter)
+    output_file = io.StringIO()
+
+    report = asyncio.run(
+        offline_ingest_service_module.run_offline_ingest(
+            [_feed(1, company_id=7), _feed(2, fetchprotection=0), _feed(3, company_id=7), _feed(4)],
+            output_file=output_file,
+            concurrency=4,
+            processes=1,
+            company_max_rps=2.0,
+        )
+    )
+
+    results = [json.loads(line) for line in output_file.getvalue().splitlines()]
+    assert sorted(fetched_feed_ids) == [1, 3, 4]
+    assert sorted(result["feed_id"] for result in results) == [1, 4]
+    assert {result["new_etag"] for result in results} == {'"v1"'}
+    # Feeds of one company share one limiter; feeds without a company are not limited.
+    assert len(acquired_limiters) == 2 and len(set(acquired_limiters)) == 1
+    assert (report.blocked_count, report.fetch_errors, report.results_written) == (1, 1, 2)
+
+
+def test_load_offline_ingest_feeds_rejects_invalid_lines() -> None:
+    feeds = offline_ingest_service_module.load_offline_ingest_feeds(
+        ['{"feed_id": 1, "feed_url": "https://example.com/1.xml"}\n', "\n"]
+    )
+    assert [feed.feed_id for feed in feeds] == [1]
+
+    with pytest.raises(WorkerConfigurationError):
+        offline_ingest_service_module.load_offline_ingest_feeds(['{"feed_id": 0}\n'])
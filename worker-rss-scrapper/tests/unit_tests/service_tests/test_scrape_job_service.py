@@ -1,17 +1,21 @@
 import asyncio
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
+
+import pytest
 
 import app.services.scrape_job_service as scrape_job_service_module
+from app.errors import WorkerConfigurationError
 from app.schemas.scrape_result_schema import ScrapeResultSchema
+from app.utils import MetricsRegistry
 
 
-def test_process_job_message_acks_invalid_payload(monkeypatch) -> None:
-    acked_messages: list[str] = []
+def test_process_job_message_dead_letters_invalid_payload(monkeypatch) -> None:
+    dead_letters: list[dict] = []
 
-    async def fake_ack_scrape_job(message_id: str) -> None:
-        acked_messages.append(message_id)
+    async def fake_dead_letter_scrape_job(**kwargs) -> None:
+        dead_letters.append(kwargs)
 
-    monkeypatch.setattr(scrape_job_service_module, "ack_scrape_job", fake_ack_scrape_job)
+    monkeypatch.setattr(scrape_job_service_module, "dead_letter_scrape_job", fake_dead_letter_scrape_job)
 
     asyncio.run(
         scrape_job_service_module._process_job_message(
@@ -20,18 +24,23 @@ def test_process_job_message_acks_invalid_payload(monkeypatch) -> None:
             http_client=Mock(),
             company_rate_limiters={},
             company_max_rps=4,
+            feed_fetches=scrape_job_service_module.FeedFetchSingleflight(cache_ttl_seconds=30.0),
         )
     )
 
-    assert acked_messages == ["1-0"]
+    assert len(dead_letters) == 1
+    assert dead_letters[0]["message_id"] == "1-0"
+    assert dead_letters[0]["stream_name"] == "rss_scrape_requests"
+    assert dead_letters[0]["payload_raw"] == '{"invalid": "payload"}'
+    assert dead_letters[0]["reason"].startswith("invalid_schema: ")
 
 
 def test_process_job_message_routes_check_and_error_results(monkeypatch) -> None:
     check_payloads: list[dict] = []
     error_payloads: list[dict] = []
-    acked_messages: list[str] = []
+    acked_messages: list[tuple[str, str]] = []
 
-    async def fake_fetch_feed_result(*, feed, ingest, http_client):
+    async def fake_fetch_feed_result(*, feed, ingest, http_client, body_archive_dir):
         if feed.feed_id == 1:
             return ScrapeResultSchema(
                 job_id="",
@@ -62,14 +71,16 @@ def test_process_job_message_routes_check_and_error_results(monkeypatch) -> None
     async def fake_publish_ingest_result(payload: dict) -> None:
         raise AssertionError("publish_ingest_result must not be called for ingest=false")
 
-    async def fake_ack_scrape_job(message_id: str) -> None:
-        acked_messages.append(message_id)
+    async def fake_ack_scrape_job(message_id: str, *, stream_name: str) -> None:
+        acked_messages.append((stream_name, message_id))
 
     monkeypatch.setattr(scrape_job_service_module, "fetch_feed_result", fake_fetch_feed_result)
     monkeypatch.setattr(scrape_job_service_module, "publish_check_result", fake_publish_check_result)
     monkeypatch.setattr(scrape_job_service_module, "publish_error_result", fake_publish_error_result)
     monkeypatch.setattr(scrape_job_service_module, "publish_ingest_result", fake_publish_ingest_result)
     monkeypatch.setattr(scrape_job_service_module, "ack_scrape_job", fake_ack_scrape_job)
+    metrics = MetricsRegistry()
+    monkeypatch.setattr(scrape_job_service_module, "worker_metrics", metrics)
 
     payload = {
         "job_id": "job-1",
@@ -89,6 +100,8 @@ def test_process_job_message_routes_check_and_error_results(monkeypatch) -> None
             http_client=Mock(),
             company_rate_limiters={},
             company_max_rps=4,
+            feed_fetches=scrape_job_service_module.FeedFetchSingleflight(cache_ttl_seconds=30.0),
+            stream_name="rss_scrape_requests_interactive",
         )
     )
 
@@ -96,13 +109,17 @@ def test_process_job_message_routes_check_and_error_results(monkeypatch) -> None
     assert check_payloads[0]["feed_id"] == 1
     assert len(error_payloads) == 1
     assert error_payloads[0]["feed_id"] == 2
-    assert acked_messages == ["2-0"]
+    assert acked_messages == [("rss_scrape_requests_interactive", "2-0")]
+    assert metrics.get_counter("worker_feed_results_total", host="example.com", status="success") == 1
+    assert metrics.get_counter("worker_feed_results_total", host="example.com", status="error") == 1
+    assert metrics.get_histogram_count("worker_stage_duration_seconds", stage="publish") == 2
+    assert metrics.get_gauge("worker_inflight_feeds") == 0
 
 
 def test_process_job_message_routes_ingest_results(monkeypatch) -> None:
     ingest_payloads: list[dict] = []
 
-    async def fake_fetch_feed_result(*, feed, ingest, http_client):
+    async def fake_fetch_feed_result(*, feed, ingest, http_client, body_archive_dir):
         return ScrapeResultSchema(
             job_id="",
             ingest=ingest,
@@ -122,7 +139,7 @@ def test_process_job_message_routes_ingest_results(monkeypatch) -> None:
     async def fake_publish_error_result(payload: dict) -> None:
         raise AssertionError("publish_error_result must not be called on success")
 
-    async def fake_ack_scrape_job(message_id: str) -> None:
+    async def fake_ack_scrape_job(message_id: str, *, stream_name: str) -> None:
         return None
 
     monkeypatch.setattr(scrape_job_service_module, "fetch_feed_result", fake_fetch_feed_result)
@@ -148,6 +165,7 @@ def test_process_job_message_routes_ingest_results(monkeypatch) -> None:
             http_client=Mock(),
             company_rate_limiters={},
             company_max_rps=4,
+            feed_fetches=scrape_job_service_module.FeedFetchSingleflight(cache_ttl_seconds=30.0),
         )
     )
 
@@ -167,10 +185,12 @@ def test_process_job_message_starts_one_flow_per_company(monkeypatch) -> None:
         http_client,
         company_rate_limiters,
         company_max_rps,
+        feed_fetches,
+        body_archive_dir,
     ):
         called_company_flows.append((company_key, [feed.feed_id for feed in feeds]))
 
-    async def fake_ack_scrape_job(message_id: str) -> None:
+    async def fake_ack_scrape_job(message_id: str, *, stream_name: str) -> None:
         acked_messages.append(message_id)
 
     monkeypatch.setattr(scrape_job_service_module, "_process_company_feed_pool", fake_process_company_feed_pool)
@@ -210,6 +230,7 @@ def test_process_job_message_starts_one_flow_per_company(monkeypatch) -> None:
             http_client=Mock(),
             company_rate_limiters={},
             company_max_rps=4,
+            feed_fetches=scrape_job_service_module.FeedFetchSingleflight(cache_ttl_seconds=30.0),
         )
     )
 
@@ -237,3 +258,173 @@ def test_company_rate_limiter_schedules_release_after_one_second(monkeypatch) ->
     asyncio.run(run())
 
     assert scheduled_delays == [1.0, 1.0]
+
+
+def test_company_rate_limiter_spreads_fractional_rate_over_longer_window(monkeypatch) -> None:
+    scheduled_delays: list[float] = []
+
+    class FakeLoop:
+        def call_later(self, delay: float, callback) -> None:
+            scheduled_delays.append(delay)
+
+    monkeypatch.setattr(scrape_job_service_module.asyncio, "get_running_loop", lambda: FakeLoop())
+    limiter = scrape_job_service_module.CompanyRateLimiter(max_requests_per_second=4 / 3)
+
+    async def run() -> None:
+        await limiter.acquire()
+        await limiter.acquire()
+
+    asyncio.run(run())
+
+    assert scheduled_delays == [1.5, 1.5]
+
+
+def test_feed_fetch_singleflight_shares_inflight_fetch_and_caches_result() -> None:
+    fetch_calls: list[int] = []
+
+    async def fetcher() -> ScrapeResultSchema:
+        fetch_calls.append(1)
+        await asyncio.sleep(0.01)
+        return ScrapeResultSchema(
+            job_id="",
+            ingest=False,
+            feed_id=1,
+            feed_url="https://example.com/rss.xml",
+            status="success",
+            fetchprotection=1,
+            sources=[],
+        )
+
+    async def run() -> list[ScrapeResultSchema]:
+        feed_fetches = scrape_job_service_module.FeedFetchSingleflight(cache_ttl_seconds=30.0)
+        key = ("https://example.com/rss.xml", None, None, 1, None)
+        concurrent_results = await asyncio.gather(
+            feed_fetches.fetch(key, fetcher),
+            feed_fetches.fetch(key, fetcher),
+        )
+        cached_result = await feed_fetches.fetch(key, fetcher)
+        return [*concurrent_results, cached_result]
+
+    results = asyncio.run(run())
+
+    assert len(fetch_calls) == 1
+    assert results[0] is results[1] is results[2]
+
+
+def test_feed_fetch_singleflight_follower_refetches_when_leader_is_cancelled() -> None:
+    fetch_calls: list[int] = []
+
+    async def fetcher() -> ScrapeResultSchema:
+        fetch_calls.append(1)
+        await asyncio.sleep(0.01)
+        return ScrapeResultSchema(
+            job_id="",
+            ingest=False,
+            feed_id=1,
+            feed_url="https://example.com/rss.xml",
+            status="success",
+            fetchprotection=1,
+            sources=[],
+        )
+
+    async def run() -> ScrapeResultSchema:
+        feed_fetches = scrape_job_service_module.FeedFetchSingleflight(cache_ttl_seconds=30.0)
+        key = ("https://example.com/rss.xml", None, None, 1, None)
+        leader = asyncio.create_task(feed_fetches.fetch(key, fetcher))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(feed_fetches.fetch(key, fetcher))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    result = asyncio.run(run())
+
+    assert result.status == "success"
+    assert len(fetch_calls) == 2
+
+
+def test_feed_fetch_singleflight_does_not_cache_error_results() -> None:
+    fetch_calls: list[int] = []
+
+    async def fetcher() -> ScrapeResultSchema:
+        fetch_calls.append(1)
+        return ScrapeResultSchema(
+            job_id="",
+            ingest=False,
+            feed_id=1,
+            feed_url="https://example.com/rss.xml",
+            status="error",
+            error_message="timeout",
+            fetchprotection=1,
+            sources=[],
+        )
+
+    async def run() -> None:
+        feed_fetches = scrape_job_service_module.FeedFetchSingleflight(cache_ttl_seconds=30.0)
+        key = ("https://example.com/rss.xml", None, None, 1, None)
+        await feed_fetches.fetch(key, fetcher)
+        await feed_fetches.fetch(key, fetcher)
+
+    asyncio.run(run())
+
+    assert len(fetch_calls) == 2
+
+
+def test_record_lane_queue_waits_counts_per_lane_buckets(monkeypatch) -> None:
+    monkeypatch.setattr(scrape_job_service_module, "_worker_stats", scrape_job_service_module.Counter())
+    monkeypatch.setattr(scrape_job_service_module.time, "time", lambda: 100.0)
+
+    scrape_job_service_module._record_lane_queue_waits(
+        [
+            ("rss_scrape_requests_interactive", "99950-0", {}),
+            ("rss_scrape_requests", "95000-0", {}),
+            ("rss_scrape_requests", "invalid", {}),
+        ],
+        interactive_streams={"rss_scrape_requests_interactive"},
+    )
+
+    stats = scrape_job_service_module.get_worker_stats_snapshot()
+    assert stats["queue_wait_interactive_messages"] == 1
+    assert stats["queue_wait_interactive_ms_total"] == 50
+    assert stats["queue_wait_interactive_ms_le_100"] == 1
+    assert stats["queue_wait_bulk_messages"] == 1
+    assert stats["queue_wait_bulk_ms_total"] == 5000
+    assert "queue_wait_bulk_ms_le_1000" not in stats
+    assert stats["queue_wait_bulk_ms_le_10000"] == 1
+
+
+def test_ensure_request_shard_count_matches_refuses_mismatch(monkeypatch) -> None:
+    monkeypatch.setattr(
+        scrape_job_service_module,
+        "read_request_shard_count",
+        AsyncMock(side_effect=[4, None, 2]),
+    )
+
+    with pytest.raises(WorkerConfigurationError, match="WORKER_SHARD_COUNT=2"):
+        asyncio.run(scrape_job_service_module._ensure_request_shard_count_matches(2))
+    asyncio.run(scrape_job_service_module._ensure_request_shard_count_matches(2))
+    asyncio.run(scrape_job_service_module._ensure_request_shard_count_matches(2))
+
+
+def test_run_job_batch_cancels_jobs_still_running_after_drain_timeout() -> None:
+    cancelled: list[bool] = []
+
+    async def slow_job() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def run() -> None:
+        stop_event = asyncio.Event()
+        stop_event.set()
+        await scrape_job_service_module._run_job_batch(
+            asyncio.gather(slow_job()),
+            stop_event=stop_event,
+            drain_timeout_seconds=0.01,
+        )
+
+    asyncio.run(run())
+
+    assert cancelled == [True]
@@ -0,0 +1,71 @@
+import asyncio
+
+import app.services.worker_metrics_service as worker_metrics_service_module
+from app.utils import MetricsRegistry
+
+
+def test_metrics_registry_renders_counters_gauges_and_cumulative_histograms() -> None:
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.increment("worker_feed_results_total", host="example.com", status="success")
+    registry.increment("worker_feed_results_total", host="example.com", status="success")
+    registry.add_gauge("worker_inflight_feeds", 3)
+    registry.add_gauge("worker_inflight_feeds", -1)
+    registry.observe("worker_stage_duration_seconds", 0.05, stage="fetch")
+    registry.observe("worker_stage_duration_seconds", 0.5, stage="fetch")
+    registry.observe("worker_stage_duration_seconds", 5.0, stage="fetch")
+
+    assert registry.render().splitlines() == [
+        "# TYPE worker_feed_results_total counter",
+        'worker_feed_results_total{host="example.com",status="success"} 2',
+        "# TYPE worker_inflight_feeds gauge",
+        "worker_inflight_feeds 2",
+        "# TYPE worker_stage_duration_seconds histogram",
+        'worker_stage_duration_seconds_bucket{stage="fetch",le="0.1"} 1',
+        'worker_stage_duration_seconds_bucket{stage="fetch",le="1"} 2',
+        'worker_stage_duration_seconds_bucket{stage="fetch",le="+Inf"} 3',
+        'worker_stage_duration_seconds_sum{stage="fetch"} 5.55',
+        'worker_stage_duration_seconds_count{stage="fetch"} 3',
+    ]
+
+
+def test_metrics_registry_escapes_label_values() -> None:
+    registry = MetricsRegistry()
+    registry.increment("worker_feed_results_total", host='bad"host\\')
+
+    assert 'host="bad\\"host\\\\"' in registry.render()
+
+
+def test_worker_metrics_server_serves_metrics_and_404(monkeypatch) -> None:
+    registry = MetricsRegistry()
+    registry.increment("worker_fetch_retries_total")
+    monkeypatch.setattr(worker_metrics_service_module, "worker_metrics", registry)
+
+    async def request(server_port: int, path: str) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", server_port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("latin-1"))
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    async def run() -> tuple[bytes, bytes]:
+        server = await worker_metrics_service_module.start_worker_metrics_server(port=0)
+        assert server is not None
+        server_port = server.sockets[0].getsockname()[1]
+        try:
+            return await request(server_port, "/metrics"), await request(server_port, "/other")
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    metrics_response, missing_response = asyncio.run(run())
+
+    assert metrics_response.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert metrics_response.endswith(b"worker_fetch_retries_total 1\n")
+    assert missing_response.startswith(b"HTTP/1.1 404 Not Found\r\n")
+
+
+def test_resolve_worker_metrics_port_offsets_by_process_index(monkeypatch) -> None:
+    monkeypatch.setenv("WORKER_METRICS_PORT", "9200")
+
+    assert worker_metrics_service_module.resolve_worker_metrics_port(2) == 9202
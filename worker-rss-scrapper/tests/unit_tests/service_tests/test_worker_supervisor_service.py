@@ -0,0 +1,169 @@
+import asyncio
+from collections import Counter
+from unittest.mock import AsyncMock
+
+import app.services.scrape_job_service as scrape_job_service_module
+import app.services.worker_supervisor_service as worker_supervisor_service_module
+
+
+class FakeProcess:
+    def __init__(self, *, alive: bool, exitcode: int | None = None) -> None:
+        self._alive = alive
+        self.exitcode = exitcode
+
+    def is_alive(self) -> bool:
+        return self._alive
+
+
+def test_restart_dead_processes_retires_stats_and_waits_restart_delay() -> None:
+    started: list[int] = []
+    slots = [
+        worker_supervisor_service_module.WorkerProcessSlot(process_index=0, consumer_name="worker-0"),
+        worker_supervisor_service_module.WorkerProcessSlot(process_index=1, consumer_name="worker-1"),
+    ]
+    slots[0].process = FakeProcess(alive=True)
+    slots[1].process = FakeProcess(alive=False, exitcode=1)
+    stats_by_process = {0: {"feeds_success": 2}, 1: {"feeds_success": 3, "jobs_processed": 1}}
+    retired_stats: Counter[str] = Counter()
+
+    def start_process(slot):
+        started.append(slot.process_index)
+        return FakeProcess(alive=True)
+
+    for now in (10.0, 10.5, 11.0):
+        worker_supervisor_service_module.restart_dead_processes(
+            slots,
+            start_process=start_process,
+            restart_policy=_build_restart_policy(),
+            stats_by_process=stats_by_process,
+            retired_stats=retired_stats,
+            now=now,
+        )
+
+    assert started == [1]
+    assert stats_by_process == {0: {"feeds_success": 2}}
+    assert worker_supervisor_service_module.aggregate_worker_stats(stats_by_process, retired_stats) == {
+        "feeds_success": 5,
+        "jobs_processed": 1,
+        "process_restarts": 1,
+    }
+
+
+def test_restart_dead_processes_backs_off_then_gives_up() -> None:
+    started_at: list[float] = []
+    slot = worker_supervisor_service_module.WorkerProcessSlot(process_index=0, consumer_name="worker-0")
+
+    def start_process(slot):
+        started_at.append(now)
+        return FakeProcess(alive=False, exitcode=1)
+
+    for now in (0.0, 0.5, 1.5, 2.0, 4.0, 4.5):
+        worker_supervisor_service_module.restart_dead_processes(
+            [slot],
+            start_process=start_process,
+            restart_policy=_build_restart_policy(max_attempts=2),
+            stats_by_process={},
+            retired_stats=Counter(),
+            now=now,
+        )
+
+    assert started_at == [0.0, 1.5, 4.0]
+    assert slot.gave_up is True
+    assert slot.process is None
+
+
+def test_restart_dead_processes_resets_backoff_after_stable_run() -> None:
+    slot = worker_supervisor_service_module.WorkerProcessSlot(process_index=0, consumer_name="worker-0")
+    slot.process = FakeProcess(alive=False, exitcode=1)
+    slot.started_at = 0.0
+    slot.failed_restarts = 2
+
+    worker_supervisor_service_module.restart_dead_processes(
+        [slot],
+        start_process=lambda slot: FakeProcess(alive=True),
+        restart_policy=_build_restart_policy(max_attempts=2),
+        stats_by_process={},
+        retired_stats=Counter(),
+        now=120.0,
+    )
+
+    assert slot.failed_restarts == 1
+    assert slot.restart_at == 121.0
+    assert slot.gave_up is False
+
+
+def test_build_process_consumer_name_is_stable_per_index() -> None:
+    assert (
+        worker_supervisor_service_module.build_process_consumer_name("worker_rss_scrapper_1", 2)
+        == "worker_rss_scrapper_1-2"
+    )
+
+
+def test_run_scrape_worker_resumes_pending_jobs_then_exits_when_stopped(monkeypatch) -> None:
+    reads: list[str] = []
+
+    async def fake_ensure_worker_consumer_group(stream_names) -> None:
+        return None
+
+    async def fake_ensure_worker_authenticated() -> str:
+        return "token"
+
+    async def fake_read_pending_scrape_jobs(**kwargs):
+        reads.append(f"pending:{kwargs['stream_name']}:{kwargs['after_id']}")
+        return None, []
+
+    async def fake_claim_idle_scrape_jobs(**kwargs):
+        reads.append(f"claim:{kwargs['stream_name']}")
+        return "0-0", []
+
+    async def fake_read_scrape_jobs(**kwargs):
+        reads.append(kwargs["consumer_name"])
+        stop_event.set()
+        return []
+
+    async def fake_close_redis_client() -> None:
+        reads.append("closed")
+
+    monkeypatch.setattr(
+        scrape_job_service_module,
+        "ensure_worker_consumer_group",
+        fake_ensure_worker_consumer_group,
+    )
+    monkeypatch.setattr(
+        scrape_job_service_module,
+        "ensure_worker_authenticated",
+        fake_ensure_worker_authenticated,
+    )
+    monkeypatch.setattr(scrape_job_service_module, "read_pending_scrape_jobs", fake_read_pending_scrape_jobs)
+    monkeypatch.setattr(scrape_job_service_module, "claim_idle_scrape_jobs", fake_claim_idle_scrape_jobs)
+    monkeypatch.setattr(scrape_job_service_module, "close_redis_client", fake_close_redis_client)
+    monkeypatch.setattr(scrape_job_service_module, "read_scrape_jobs", fake_read_scrape_jobs)
+    monkeypatch.setattr(scrape_job_service_module, "read_request_shard_count", AsyncMock(return_value=1))
+    monkeypatch.setattr(scrape_job_service_module, "start_worker_metrics_server", AsyncMock(return_value=None))
+
+    async def run() -> None:
+        await scrape_job_service_module.run_scrape_worker(
+            stop_event=stop_event,
+            consumer_name="worker_rss_scrapper_1-0",
+        )
+
+    stop_event = asyncio.Event()
+    asyncio.run(run())
+
+    assert reads == [
+        "pending:rss_scrape_requests_interactive:0",
+        "pending:rss_scrape_requests:0",
+        "claim:rss_scrape_requests_interactive",
+        "claim:rss_scrape_requests",
+        "worker_rss_scrapper_1-0",
+        "closed",
+    ]
+
+
+def _build_restart_policy(*, max_attempts: int = 5) -> worker_supervisor_service_module.WorkerRestartPolicy:
+    return worker_supervisor_service_module.WorkerRestartPolicy(
+        delay_seconds=1.0,
+        max_delay_seconds=60.0,
+        max_attempts=max_attempts,
+        stable_run_seconds=60.0,
+    )